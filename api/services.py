@@ -219,21 +219,37 @@ def scan_edges(
     only_positive_ev: bool = False,
     limit: int = 100,
 ) -> dict:
-    lines = es.fetch_latest_prop_lines(
+    # The hourly update keeps the default profiles materialized in
+    # ``scored_edges``; filtering + ranking is then one SQL read. Any other
+    # profile (or a stale table) scores live.
+    materialized = es.fetch_scored_edges(
         db_path, books=books, stat_types=stats, since_hours=since_hours,
+        n_games=n_games, model_mode=model_mode, rolling_window=rolling_window,
+        min_p_over=min_p_over, min_edge=min_edge,
+        only_positive_ev=only_positive_ev, limit=limit,
     )
-    n_lines = 0 if lines is None or lines.empty else int(len(lines))
+    if materialized is not None:
+        top = materialized["scored"]
+        n_lines = materialized["n_lines"]
+        n_scored = materialized["n_scored"]
+    else:
+        lines = es.fetch_latest_prop_lines(
+            db_path, books=books, stat_types=stats, since_hours=since_hours,
+        )
+        n_lines = 0 if lines is None or lines.empty else int(len(lines))
 
-    scored = es.score_prop_edges(
-        lines, db_path=db_path, n_games=n_games,
-        model_mode=model_mode, rolling_window=rolling_window,
-    )
-    n_scored = 0 if scored is None or scored.empty else int(len(scored))
+        scored = es.score_prop_edges(
+            lines, db_path=db_path, n_games=n_games,
+            # Serial on purpose: no process pools inside the threaded server.
+            # The hourly refresh fans full mode out and materializes it.
+            model_mode=model_mode, rolling_window=rolling_window,
+        )
+        n_scored = 0 if scored is None or scored.empty else int(len(scored))
 
-    top = es.top_edges(
-        scored, min_p_over=min_p_over, min_edge=min_edge,
-        only_positive_ev=only_positive_ev, limit=limit,
-    )
+        top = es.top_edges(
+            scored, min_p_over=min_p_over, min_edge=min_edge,
+            only_positive_ev=only_positive_ev, limit=limit,
+        )
     rows = _edge_rows(top)
 
     with DatabaseManager(db_path=db_path) as db:
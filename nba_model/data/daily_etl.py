@@ -6,12 +6,15 @@ import logging
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from nba_model.data.data_loader import DataLoader
 from typing import Callable, Optional
 
 from nba_api.stats.static import players as nba_players
 
 from nba_model.data.database.db_manager import DatabaseManager
+from nba_model.data.nba_results_ingestion import (
+    current_season,
+    refresh_player_game_logs_incremental,
+)
 from nba_model.data.team_defense_ingestion import (
     build_team_defense_validation_report,
     populate_team_defense,
@@ -21,6 +24,7 @@ from nba_model.evaluation.market_reverse_engineering import (
     run_market_reverse_engineering_continuous,
 )
 from nba_model.model.odds_ingestion import (
+    DEFAULT_ODDS_CACHE_DIR,
     DEFAULT_REQUEST_RETRIES,
     DEFAULT_REQUEST_RETRY_BACKOFF,
     DEFAULT_REQUEST_RETRY_DELAY_SECONDS,
@@ -209,13 +213,6 @@ def configure_logging(log_dir: str = DEFAULT_LOG_DIR, level: int = logging.INFO)
     return str(log_path or "")
 
 
-def _default_nba_season(reference_time: Optional[datetime] = None) -> str:
-    """Infer NBA season string from current date."""
-    ts = reference_time or datetime.now(timezone.utc)
-    start_year = ts.year if ts.month >= 10 else ts.year - 1
-    return f"{start_year}-{str(start_year + 1)[-2:]}"
-
-
 def _serialize_error(exc: Exception) -> dict:
     """Serialize exception into a compact dict for reporting."""
     return {
@@ -510,57 +507,62 @@ def resolve_players(
     return selected
 
 
+def _resolve_player_ids(player_names: list[str]) -> dict[str, Optional[int]]:
+    """Map names to NBA player ids (exact static-catalog match, then fuzzy)."""
+    exact = {
+        str(player.get("full_name", "")).strip().lower(): player.get("id")
+        for player in nba_players.get_players()
+    }
+    resolved: dict[str, Optional[int]] = {}
+    for name in player_names:
+        normalized_name = str(name).strip()
+        player_id = exact.get(normalized_name.lower())
+        if player_id is None:
+            candidates = nba_players.find_players_by_full_name(normalized_name)
+            player_id = candidates[0].get("id") if candidates else None
+        try:
+            resolved[name] = int(player_id) if player_id is not None else None
+        except (TypeError, ValueError):
+            resolved[name] = None
+    return resolved
+
+
 def _refresh_game_logs_for_players(
     players: list[str],
     db_path: str,
-    n_games: int,
-    force_refresh: bool,
-    retries: int,
-    retry_delay_seconds: float,
-    retry_backoff: float,
+    season: str,
 ) -> dict:
-    """Refresh player game logs and return per-player status summary."""
-    loader = DataLoader(db_path=db_path)
-    player_results = []
-    success_count = 0
+    """Refresh game logs for ``players`` and return per-player status summary.
 
-    try:
-        for player_name in players:
-            def _load_player():
-                df = loader.load_player_data(
-                    player_name=player_name,
-                    n_games=int(n_games),
-                    force_refresh=bool(force_refresh),
-                )
-                return {
-                    "rows_loaded": int(len(df)),
-                }
+    All players share one league-wide, date-bounded ``playergamelogs``
+    request (see ``refresh_player_game_logs_incremental``); a player only
+    fails here when their name does not resolve to an NBA player id.
+    """
+    player_ids = _resolve_player_ids(players)
+    wanted = {pid for pid in player_ids.values() if pid is not None}
+    refresh = {"requests": 0, "inserted": 0, "rows_by_player": {}}
+    if wanted:
+        refresh = refresh_player_game_logs_incremental(
+            seasons=[season], db_path=db_path, player_ids=wanted,
+        )
 
-            player_step = run_with_retry(
-                step_name=f"game_logs:{player_name}",
-                func=_load_player,
-                retries=retries,
-                retry_delay_seconds=retry_delay_seconds,
-                retry_backoff=retry_backoff,
-            )
-            if player_step["status"] == "success":
-                success_count += 1
-            player_results.append(
-                {
-                    "player_name": player_name,
-                    "status": player_step["status"],
-                    "attempts": player_step["attempts"],
-                    "elapsed_ms": player_step["elapsed_ms"],
-                    "rows_loaded": player_step.get("result", {}).get("rows_loaded", 0),
-                    "error": player_step.get("error"),
-                }
-            )
-    finally:
-        close = getattr(loader, "db", None)
-        close_method = getattr(close, "close", None)
-        if callable(close_method):
-            close_method()
+    player_results = []
+    for player_name in players:
+        player_id = player_ids.get(player_name)
+        player_results.append(
+            {
+                "player_name": player_name,
+                "player_id": player_id,
+                "status": "success" if player_id is not None else "failed",
+                "rows_loaded": int(refresh["rows_by_player"].get(player_id, 0)),
+                "error": (
+                    None if player_id is not None
+                    else {"type": "ValueError", "message": f"Player '{player_name}' not found"}
+                ),
+            }
+        )
 
+    success_count = sum(1 for result in player_results if result["status"] == "success")
     failed_count = len(player_results) - success_count
     status = "success"
     if success_count == 0:
@@ -573,6 +575,8 @@ def _refresh_game_logs_for_players(
         "requested_players": len(players),
         "refreshed_players": success_count,
         "failed_players": failed_count,
+        "api_requests": int(refresh["requests"]),
+        "rows_inserted": int(refresh["inserted"]),
         "players": player_results,
     }
 
@@ -624,6 +628,7 @@ def _run_odds_step(
         request_retries=request_retries,
         request_retry_delay_seconds=request_retry_delay_seconds,
         request_retry_backoff=request_retry_backoff,
+        cache_dir=DEFAULT_ODDS_CACHE_DIR,
     )
     summary["status"] = "success"
     summary["poll_executed"] = True
@@ -761,14 +766,16 @@ def run_daily_etl(
     skip_game_logs: bool = False,
     # When false, the bulk leaguegamefinder + playergamelogs pass runs first
     # to populate the games + game_logs tables for the configured seasons.
-    # Subsequent per-player retries still run after it (covers any active
-    # player the bulk pass missed).
+    # The incremental game-log refresh still runs after it (covers games
+    # that went final since the bulk pass).
     skip_bulk_results_ingest: bool = False,
     bulk_results_seasons: Optional[list[str]] = None,
     skip_team_defense: bool = False,
     skip_odds: bool = False,
     skip_browser_parser: bool = False,
     skip_reverse_engineering: bool = False,
+    # Accepted for existing invocations; the incremental league-wide
+    # refresh has no per-player window or cache to bypass.
     game_log_games: int = 120,
     game_log_force_refresh: bool = True,
     season: Optional[str] = None,
@@ -830,7 +837,7 @@ def run_daily_etl(
     write_report: bool = True,
 ) -> dict:
     """Run end-to-end daily ETL flow and return structured report."""
-    season = season or _default_nba_season()
+    season = season or current_season()
     selected_players, player_selection_summary = _build_player_selection(
         explicit_players=players,
         include_db_players=include_db_players,
@@ -846,9 +853,9 @@ def run_daily_etl(
     steps = {}
 
     # ---- Bulk NBA-API results ingest (games + league-wide player logs) ----
-    # This runs BEFORE the per-player game-log refresh so the heavy bulk
-    # endpoint populates the table once; the per-player step then only has
-    # to backfill anything specific (active-roster gaps, recent games).
+    # This runs BEFORE the incremental game-log refresh so the heavy bulk
+    # endpoint populates the table once; the incremental step then only
+    # pulls games at or after the latest stored date.
     if skip_bulk_results_ingest:
         steps["bulk_results_ingest"] = {
             "status": "skipped", "reason": "Step disabled by flag.",
@@ -877,11 +884,7 @@ def run_daily_etl(
             return _refresh_game_logs_for_players(
                 players=selected_players,
                 db_path=db_path,
-                n_games=game_log_games,
-                force_refresh=game_log_force_refresh,
-                retries=retries,
-                retry_delay_seconds=retry_delay_seconds,
-                retry_backoff=retry_backoff,
+                season=season,
             )
 
         game_logs_step = run_with_retry(
@@ -1227,18 +1230,21 @@ def _build_parser() -> argparse.ArgumentParser:
         "--bulk-results-seasons", nargs="+", default=None,
         help=(
             "Seasons to ingest in the bulk pass (e.g. 2025-26 2024-25). "
-            "Defaults to the single season computed by `_default_nba_season`."
+            "Defaults to the single season computed by `current_season`."
         ),
     )
     parser.add_argument("--skip-team-defense", action="store_true")
     parser.add_argument("--skip-odds", action="store_true")
     parser.add_argument("--skip-browser-parser", action="store_true")
     parser.add_argument("--skip-reverse-engineering", action="store_true")
-    parser.add_argument("--game-log-games", type=int, default=120)
+    parser.add_argument(
+        "--game-log-games", type=int, default=120,
+        help="Deprecated: game logs refresh incrementally league-wide.",
+    )
     parser.add_argument(
         "--use-cache-for-game-logs",
         action="store_true",
-        help="Use cached data when available instead of force-refreshing NBA API data.",
+        help="Deprecated: game logs refresh incrementally league-wide.",
     )
     parser.add_argument("--season", default=None,
                         help="NBA season string (e.g., 2024-25). Defaults from current date.")
@@ -1,21 +1,38 @@
-"""Load NBA game logs with DB, file cache, and NBA API."""
-import json
+"""Load NBA game logs with DB, file cache, and NBA API.
+
+The file cache is one uncompressed Feather (Arrow IPC) file per player,
+newest game first, with ``fetched_at_utc`` and the season range in the schema
+metadata. Reads memory-map the file and convert only the first ``n_games``
+rows, and caches older than ``cache_max_age_hours`` are not served.
+"""
+import os
+import threading
 import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
 from nba_api.stats.endpoints import playergamelogs
 from nba_api.stats.static import players
 
 from nba_model.data.database.db_manager import DatabaseManager
 
+CACHE_FORMAT_VERSION = "1"
+DEFAULT_CACHE_MAX_AGE_HOURS = 24.0
+
 
 class DataLoader:
     """Load NBA data with local caching."""
 
-    def __init__(self, cache_dir='data/raw', db_path='data/database/nba_data.db'):
+    def __init__(self, cache_dir='data/raw', db_path='data/database/nba_data.db',
+                 cache_max_age_hours=DEFAULT_CACHE_MAX_AGE_HOURS):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # None serves file caches regardless of age.
+        self.cache_max_age_hours = cache_max_age_hours
         self.db = DatabaseManager(db_path=db_path)  # ← Pass the path
 
     def get_player_id(self, player_name):
@@ -50,14 +67,11 @@ class DataLoader:
                 return df
 
         # Check file cache
-        cache_file = self.cache_dir / f"{player_id}_gamelogs.json"
-        if cache_file.exists() and not force_refresh:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                df = pd.DataFrame(data)
-                if len(df) >= n_games:
-                    print(f"[OK] Loaded {len(df)} games from cache")
-                    return df.head(n_games)
+        if not force_refresh:
+            df = self.read_cached_games(player_id, n_games)
+            if df is not None:
+                print(f"[OK] Loaded {len(df)} games from cache")
+                return df
 
         # Fetch from API
         print(f"Fetching fresh data from NBA API for {player_name}...")
@@ -73,7 +87,7 @@ class DataLoader:
         df = self._clean_game_logs(df, player_id)
 
         # Save to file cache
-        df.to_json(cache_file, orient='records', date_format='iso')
+        self.write_cached_games(player_id, df)
 
         # Save to database
         self.db.insert_game_logs(df)
@@ -81,6 +95,113 @@ class DataLoader:
         print(f"[OK] Fetched and cached {len(df)} games")
         return df.head(n_games)
 
+    def cache_path(self, player_id):
+        """Columnar cache file for ``player_id``."""
+        return self.cache_dir / f"{player_id}_gamelogs.feather"
+
+    @contextmanager
+    def _open_cache(self, player_id):
+        """Memory-mapped ``(reader, metadata)`` of the cache, or None.
+
+        The map is closed when the ``with`` block exits, so callers convert
+        what they need inside it and an open map never outlives the read
+        (it would also block ``os.replace`` of that file on Windows).
+        """
+        path = self.cache_path(player_id)
+        if not path.exists():
+            yield None
+            return
+        try:
+            source = pa.memory_map(str(path), 'r')
+        except (OSError, pa.ArrowException):
+            yield None
+            return
+        with source:
+            try:
+                reader = pa.ipc.open_file(source)
+            except (OSError, pa.ArrowException):
+                reader = None
+            meta = {} if reader is None else {
+                k.decode(): v.decode() for k, v in (reader.schema.metadata or {}).items()
+            }
+            if meta.get('format_version') != CACHE_FORMAT_VERSION:
+                yield None
+                return
+            yield reader, meta
+
+    def cache_info(self, player_id):
+        """
+        Metadata of the cached game logs, without converting any rows.
+
+        Returns:
+            dict with ``rows``, ``fetched_at_utc``, ``season_min`` and
+            ``season_max``, or None when there is no readable cache.
+        """
+        with self._open_cache(player_id) as opened:
+            if opened is None:
+                return None
+            reader, meta = opened
+            # Batch headers only; the column buffers are never touched.
+            rows = sum(
+                reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+        return {
+            'rows': int(rows),
+            'fetched_at_utc': meta.get('fetched_at_utc'),
+            'season_min': meta.get('season_min') or None,
+            'season_max': meta.get('season_max') or None,
+        }
+
+    def _cache_is_fresh(self, fetched_at_utc):
+        if self.cache_max_age_hours is None:
+            return True
+        try:
+            fetched_at = datetime.fromisoformat(str(fetched_at_utc))
+        except (TypeError, ValueError):
+            return False
+        age = datetime.now(timezone.utc) - fetched_at
+        return age.total_seconds() <= float(self.cache_max_age_hours) * 3600
+
+    def read_cached_games(self, player_id, n_games):
+        """
+        Most recent ``n_games`` rows from the file cache.
+
+        Only those rows are materialized from the memory-mapped file.
+
+        Returns:
+            pd.DataFrame, or None when the cache is missing, stale or holds
+            fewer than ``n_games`` games.
+        """
+        with self._open_cache(player_id) as opened:
+            if opened is None:
+                return None
+            reader, meta = opened
+            if not self._cache_is_fresh(meta.get('fetched_at_utc')):
+                return None
+            # Zero-copy: column buffers stay on disk until rows are converted.
+            table = reader.read_all()
+            if table.num_rows < n_games:
+                return None
+            return table.slice(0, n_games).to_pandas()
+
+    def write_cached_games(self, player_id, df, fetched_at=None):
+        """Write ``df`` (newest game first) to the file cache atomically."""
+        fetched_at = fetched_at or datetime.now(timezone.utc)
+        seasons = sorted(df['season'].dropna().astype(str)) if 'season' in df.columns else []
+        table = pa.Table.from_pandas(df.reset_index(drop=True), preserve_index=False)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            'format_version': CACHE_FORMAT_VERSION,
+            'fetched_at_utc': fetched_at.isoformat(),
+            'season_min': seasons[0] if seasons else '',
+            'season_max': seasons[-1] if seasons else '',
+        })
+        path = self.cache_path(player_id)
+        # Per-process and per-thread name: loaders run from process and thread pools.
+        tmp_path = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        # Uncompressed so reads can memory-map the column buffers directly.
+        feather.write_feather(table, str(tmp_path), compression='uncompressed')
+        os.replace(tmp_path, path)
+
     def _clean_game_logs(self, df, player_id):
         """Standardize game log format for database."""
         # Map API columns to database columns
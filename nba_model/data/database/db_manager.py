@@ -1,7 +1,11 @@
 """SQLite database manager for NBA data, betting lines, and predictions."""
+import hashlib
+import json
 import logging
+import re
 import sqlite3
-from datetime import datetime, timezone
+import zlib
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
 
@@ -64,6 +68,37 @@ def _implied_prob_to_american(prob):
     return int(round(-100.0 * p / (1.0 - p)))
 
 
+# Seconds a connection waits on another writer's lock before raising
+# "database is locked". The hourly runner executes independent steps on
+# parallel threads, each with its own manager, so writes can briefly queue.
+_BUSY_TIMEOUT_SECONDS = 30.0
+
+# zlib level for web_text_blobs. Page text compresses ~8-10x at 6; higher
+# levels buy a few percent for several times the CPU on the hourly insert.
+_WEB_TEXT_ZLIB_LEVEL = 6
+
+
+def _compress_web_text(text):
+    """Return ``(blob_sha256, codec, payload)`` for a page text.
+
+    The key is the sha256 of the UTF-8 text itself (never a caller-supplied
+    hash) so two rows can only share a blob when their texts are identical.
+    """
+    raw = str(text).encode("utf-8")
+    return (
+        hashlib.sha256(raw).hexdigest(),
+        "zlib",
+        zlib.compress(raw, _WEB_TEXT_ZLIB_LEVEL),
+    )
+
+
+def _decompress_web_text(codec, payload):
+    """Inverse of ``_compress_web_text``; raises on an unknown codec."""
+    if codec == "zlib":
+        return zlib.decompress(payload).decode("utf-8")
+    raise ValueError(f"unknown web_text_blobs codec: {codec!r}")
+
+
 # Map a canonical ``stat_type`` → the SQL expression that recovers the realized
 # value from a ``game_logs`` row. PRA / RA are derived from raw columns. Shared
 # by ``backfill_predictions_outcomes`` (predictions) and ``settle_bet_log``
@@ -86,6 +121,50 @@ _GAMELOG_STAT_EXPR = {
 }
 
 
+# Raw ``game_logs`` stat columns behind ``_GAMELOG_STAT_EXPR``. Their
+# per-player totals go into ``game_log_marks`` so an in-place box-score
+# correction moves the mark even when the game count and dates do not.
+_GAME_LOG_MARK_COLUMNS = (
+    "minutes", "points", "rebounds", "assists", "fg3m", "fgm",
+    "steals", "blocks", "turnovers",
+)
+
+# Player ids per ``IN (...)`` batch, under SQLite's bound-parameter limit.
+_SQL_PARAM_CHUNK = 500
+
+
+def _gamelog_stat_case_sql(stat_col):
+    """``CASE`` over ``_GAMELOG_STAT_EXPR`` keyed on a stat_type column.
+
+    Lets the set-based settlement UPDATEs pick each row's realized value from
+    the joined ``game_logs g`` row; unsupported stats read as NULL."""
+    whens = " ".join(
+        f"WHEN '{stat}' THEN {expr}" for stat, expr in _GAMELOG_STAT_EXPR.items()
+    )
+    return f"CAST(CASE lower(trim({stat_col})) {whens} END AS REAL)"
+
+
+def _american_implied_sql(odds_col):
+    """SQL twin of ``odds.american_to_implied_prob`` (NULL odds → NULL)."""
+    o = f"CAST({odds_col} AS INTEGER)"
+    return (
+        f"CASE WHEN {odds_col} IS NULL THEN NULL "
+        f"WHEN {o} > 0 THEN 100.0 / ({o} + 100.0) "
+        f"ELSE -{o} / (-{o} + 100.0) END"
+    )
+
+
+# SQL twin of ``_grade_bet_side`` over ``actual`` / ``line`` / ``side``.
+_GRADE_BET_SIDE_SQL = """
+    CASE
+        WHEN {actual} = {line} THEN 'push'
+        WHEN lower(trim({side})) = 'over'
+            THEN CASE WHEN {actual} > {line} THEN 'won' ELSE 'lost' END
+        ELSE CASE WHEN {actual} > {line} THEN 'lost' ELSE 'won' END
+    END
+"""
+
+
 def _grade_bet_side(side, actual, line):
     """Grade a paper bet given the realized value and the line it was staked at.
 
@@ -108,12 +187,32 @@ def _grade_bet_side(side, actual, line):
 class DatabaseManager:
     """Manages all database operations for NBA data."""
 
-    def __init__(self, db_path='data/database/nba_data.db'):
+    def __init__(self, db_path='data/database/nba_data.db', archive_dir=None,
+                 read_only=False):
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.read_only = bool(read_only)
+        if not self.read_only:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Per-season cold archives of the line-history tables (see
+        # ``line_history_source`` / ``nba_model.data.line_archive``).
+        self.archive_dir = (
+            Path(archive_dir) if archive_dir else self.db_path.parent / "archive"
+        )
+        self._attached_archives = {}
         self.conn = None
         self._initialize_database()
 
+    # Line-history tables the archival job tiers into per-season files, each
+    # mapped to the column that decides a row's age and season.
+    # ``betting_line_snapshots`` tiers on game_date so one slate's whole
+    # open→close timeline always lands in the same file.
+    LINE_ARCHIVE_TABLES = {
+        "web_prop_cards": "observed_at_utc",
+        "web_team_lines": "observed_at_utc",
+        "betting_line_snapshots": "game_date",
+        "web_text_snapshots": "fetched_at_utc",
+    }
+
     # Tables that gain a ``sport`` discriminator for the multi-sport rollout
     # (NFL first). Added via idempotent migration rather than editing every
     # CREATE TABLE so existing DBs upgrade in place. Default 'nba' keeps all
@@ -124,8 +223,16 @@ class DatabaseManager:
     )
 
     def _initialize_database(self):
-        """Create database and tables if they don't exist."""
-        self.conn = sqlite3.connect(self.db_path)
+        """Create database and tables if they don't exist.
+
+        ``read_only`` managers (worker processes fanning out reads) open the
+        existing file with ``mode=ro`` and skip the schema / migration pass,
+        so they never take a write lock."""
+        if self.read_only:
+            self.conn = sqlite3.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True)
+            return
+        self.conn = sqlite3.connect(self.db_path, timeout=_BUSY_TIMEOUT_SECONDS)
 
         # Read and execute schema
         schema_path = Path(__file__).parent / "schema.sql"
@@ -134,6 +241,10 @@ class DatabaseManager:
 
         self._ensure_sport_columns()
         self._ensure_betting_lines_source_column()
+        self._ensure_web_text_blob_column()
+        self._ensure_scored_edges_line_count_column()
+        self._ensure_predictions_key_index()
+        self._ensure_game_logs_updated_at_column()
 
         logger.info("Database initialized at %s", self.db_path)
 
@@ -158,6 +269,75 @@ class DatabaseManager:
             self.conn.execute("ALTER TABLE betting_lines ADD COLUMN source TEXT")
             self.conn.commit()
 
+    def _ensure_web_text_blob_column(self):
+        """Add the nullable ``blob_sha256`` reference to ``web_text_snapshots``.
+
+        New snapshots keep their page text in the content-addressed
+        ``web_text_blobs`` table and store ``''`` inline; rows written before
+        the column existed (``blob_sha256`` NULL) keep reading their inline
+        ``text_content`` until ``compact_web_text_snapshots`` moves them.
+        Idempotent."""
+        try:
+            cols = {
+                r[1] for r in self.conn.execute(
+                    "PRAGMA table_info(web_text_snapshots)").fetchall()
+            }
+        except sqlite3.OperationalError:
+            return
+        if cols and "blob_sha256" not in cols:
+            self.conn.execute(
+                "ALTER TABLE web_text_snapshots ADD COLUMN blob_sha256 TEXT")
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_web_text_snapshots_blob "
+            "ON web_text_snapshots(blob_sha256)"
+        )
+        self.conn.commit()
+
+    def _ensure_scored_edges_line_count_column(self):
+        """Add ``n_lines`` (per-side lines behind each row) to ``scored_edges``.
+
+        Rows materialized before the column existed get the default 1 and
+        the profile stamp is cleared, so readers score live until the next
+        refresh rewrites the counts. Idempotent."""
+        cols = {
+            r[1] for r in self.conn.execute(
+                "PRAGMA table_info(scored_edges)").fetchall()
+        }
+        if cols and "n_lines" not in cols:
+            self.conn.execute(
+                "ALTER TABLE scored_edges ADD COLUMN n_lines INTEGER NOT NULL DEFAULT 1")
+            self.conn.execute("DELETE FROM scored_edges_profiles")
+            self.conn.commit()
+
+    def _ensure_game_logs_updated_at_column(self):
+        """Add the nullable ``updated_at`` stamp to ``game_logs``.
+
+        ``insert_game_logs(upsert=True)`` sets it when a re-pulled box score
+        changes a stored row; rows that were never corrected keep NULL.
+        Idempotent."""
+        cols = {
+            r[1] for r in self.conn.execute(
+                "PRAGMA table_info(game_logs)").fetchall()
+        }
+        if cols and "updated_at" not in cols:
+            self.conn.execute("ALTER TABLE game_logs ADD COLUMN updated_at TIMESTAMP")
+            self.conn.commit()
+
+    def _ensure_predictions_key_index(self):
+        """Index ``predictions`` on (player, game_date, stat, sport) for lookups.
+
+        Created here rather than in ``schema.sql`` because ``sport`` is added
+        by ``_ensure_sport_columns`` on older DBs. Deliberately not unique:
+        backtests append one row per run and config. A DB that briefly carried
+        the unique ``uq_predictions_key`` gets it swapped for this index.
+        Idempotent."""
+        self.conn.execute("DROP INDEX IF EXISTS uq_predictions_key")
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_predictions_key "
+            "ON predictions(player_id, game_date, stat_type, sport)"
+        )
+        self.conn.commit()
+
     def _ensure_sport_columns(self):
         """Add ``sport TEXT NOT NULL DEFAULT 'nba'`` to the multi-sport tables
         when missing. Idempotent; table names come from a hardcoded tuple
@@ -178,6 +358,85 @@ class DatabaseManager:
             )
         self.conn.commit()
 
+    def _attach_line_archive(self, season, archive_file):
+        """ATTACH one season's archive file (once per connection).
+
+        Returns the schema alias, or ``None`` when the file is missing or the
+        season label is malformed (the alias is built from it)."""
+        if not re.fullmatch(r"\d{4}-\d{2}", str(season)):
+            return None
+        alias = "line_archive_" + str(season).replace("-", "_")
+        if alias in self._attached_archives:
+            return alias
+        path = self.archive_dir / str(archive_file)
+        if not path.exists():
+            logger.warning("Line archive %s listed in manifest but missing", path)
+            return None
+        self.conn.execute(f"ATTACH DATABASE ? AS {alias}", (str(path),))
+        self._attached_archives[alias] = str(path)
+        return alias
+
+    def line_history_source(self, table, since=None, since_hours=None):
+        """FROM-clause source for a line-history table over ``since``..now.
+
+        Returns the bare table name while every archived season lies wholly
+        before ``since`` (the common, hot-only case). Otherwise the needed
+        per-season archives are ATTACHed and a ``UNION ALL`` subquery over the
+        hot table plus those archives is returned, with the hot table's column
+        list (columns an older archive lacks read as NULL). ``since`` is a
+        date/timestamp string; ``since_hours`` is relative to now; neither
+        means "all history". Archives are matched on the table's range column
+        (``LINE_ARCHIVE_TABLES``) with one day of slack, so a snapshot taken
+        just after its game_date still counts.
+
+        ATTACH is not allowed inside an open transaction, so writers that read
+        history mid-transaction must resolve the source first.
+        """
+        if table not in self.LINE_ARCHIVE_TABLES:
+            raise ValueError(f"not an archived line-history table: {table!r}")
+        if since is None and since_hours is not None:
+            hours = _safe_float(since_hours)
+            if hours is not None and hours > 0:
+                since = (
+                    datetime.now(timezone.utc) - timedelta(hours=hours)
+                ).strftime("%Y-%m-%d %H:%M:%S")
+        rows = self.conn.execute(
+            """
+            SELECT season, archive_file
+            FROM line_archive_manifest
+            WHERE table_name = ?
+              AND row_count > 0
+              AND (? IS NULL OR datetime(max_value, '+1 day') >= datetime(?))
+            ORDER BY season
+            """,
+            (table, since, since),
+        ).fetchall()
+        if not rows:
+            return table
+
+        columns = [
+            r[1] for r in self.conn.execute(
+                f"PRAGMA main.table_info({table})").fetchall()
+        ]
+        selects = [f"SELECT {', '.join(columns)} FROM main.{table}"]
+        for season, archive_file in rows:
+            alias = self._attach_line_archive(season, archive_file)
+            if alias is None:
+                continue
+            archived_cols = {
+                r[1] for r in self.conn.execute(
+                    f"PRAGMA {alias}.table_info({table})").fetchall()
+            }
+            if not archived_cols:
+                continue
+            select_cols = ", ".join(
+                c if c in archived_cols else f"NULL AS {c}" for c in columns
+            )
+            selects.append(f"SELECT {select_cols} FROM {alias}.{table}")
+        if len(selects) == 1:
+            return table
+        return "(" + " UNION ALL ".join(selects) + ")"
+
     def get_team_recent_avg_total(
         self,
         team_abbrev: str,
@@ -360,73 +619,61 @@ class DatabaseManager:
     def backfill_predictions_outcomes(self):
         """Settle every pending ``predictions`` row whose game now has logs.
 
-        Looks up each pending prediction's ``(player_id, game_date)`` in
-        ``game_logs``, computes ``actual_result`` for the stat the
-        prediction was made on (points / rebounds / assists / pra / ra /
-        three_pointers_made / field_goals_made / minutes), then assigns
-        ``outcome`` ∈ {'over', 'under', 'push'} based on ``line_value``.
+        One ``UPDATE ... FROM`` joins the pending predictions to their
+        ``(player_id, game_date)`` row in ``game_logs``, takes ``actual_result``
+        for the stat the prediction was made on (points / rebounds / assists /
+        pra / ra / three_pointers_made / field_goals_made / minutes, via the
+        shared ``_GAMELOG_STAT_EXPR``), and assigns ``outcome`` ∈ {'over',
+        'under', 'push'} against ``line_value``.
 
         Returns counts of how many were settled and how many remain pending.
         Idempotent — re-running just settles any new games that landed
         since the last call.
         """
-        # Map stat_type → SQL expression against game_logs columns (shared with
-        # settle_bet_log). PRA / RA are computed from raw columns, others direct.
-        stat_expr = _GAMELOG_STAT_EXPR
-
-        update_stmt = """
-            UPDATE predictions
-               SET actual_result = ?,
-                   outcome = ?
-             WHERE prediction_id = ?
-        """
-
-        settled = 0
-        scanned = 0
-        unsupported_stats: set[str] = set()
-
-        # Pull pending rows up front so the UPDATEs don't fight a live cursor.
-        pending = self.conn.execute(
+        pending_stats = self.conn.execute(
             """
-            SELECT prediction_id, player_id, game_date, stat_type, line_value
+            SELECT lower(trim(COALESCE(stat_type, ''))), COUNT(*)
             FROM predictions
             WHERE actual_result IS NULL
+            GROUP BY 1
             """
         ).fetchall()
+        scanned = sum(int(n) for _, n in pending_stats)
+        unsupported_stats = {
+            stat or "<empty>" for stat, _ in pending_stats
+            if stat not in _GAMELOG_STAT_EXPR
+        }
 
-        for pred_id, player_id, game_date, stat_type, line_value in pending:
-            scanned += 1
-            stat = (stat_type or "").strip().lower()
-            expr = stat_expr.get(stat)
-            if expr is None:
-                unsupported_stats.add(stat or "<empty>")
-                continue
-            row = self.conn.execute(
-                f"""
-                SELECT {expr} AS actual
-                FROM game_logs g
-                WHERE g.player_id = ?
-                  AND DATE(g.game_date) = DATE(?)
-                LIMIT 1
-                """,
-                (int(player_id), str(game_date)),
-            ).fetchone()
-            if not row or row[0] is None:
-                continue
-            actual = float(row[0])
-            if line_value is None:
-                outcome = None
-            else:
-                lv = float(line_value)
-                if actual > lv:
-                    outcome = "over"
-                elif actual < lv:
-                    outcome = "under"
-                else:
-                    outcome = "push"
-            self.conn.execute(update_stmt, (actual, outcome, int(pred_id)))
-            settled += 1
-
+        cursor = self.conn.execute(
+            f"""
+            UPDATE predictions
+               SET actual_result = s.actual,
+                   outcome = CASE
+                       WHEN s.line_value IS NULL THEN NULL
+                       WHEN s.actual > s.line_value THEN 'over'
+                       WHEN s.actual < s.line_value THEN 'under'
+                       ELSE 'push'
+                   END
+              FROM (
+                  SELECT
+                      p.prediction_id,
+                      p.line_value,
+                      {_gamelog_stat_case_sql("p.stat_type")} AS actual,
+                      ROW_NUMBER() OVER (
+                          PARTITION BY p.prediction_id ORDER BY g.game_log_id
+                      ) AS rn
+                  FROM predictions p
+                  JOIN game_logs g
+                    ON g.player_id = p.player_id
+                   AND DATE(g.game_date) = DATE(p.game_date)
+                  WHERE p.actual_result IS NULL
+              ) AS s
+             WHERE predictions.prediction_id = s.prediction_id
+               AND s.rn = 1
+               AND s.actual IS NOT NULL
+            """
+        )
+        settled = max(int(cursor.rowcount), 0)
         self.conn.commit()
         result = {
             "scanned": int(scanned),
@@ -504,104 +751,127 @@ class DatabaseManager:
         logger.info("Inserted %s bet_log rows", inserted)
         return {"inserted": int(inserted), "attempted": int(len(payload))}
 
-    def _closing_clv_delta(self, player_id, game_date, stat_type, side,
-                           entry_implied):
-        """CLV delta for one pick from the latest line snapshot, or ``None``.
-
-        Reuses ``clv_proxy`` odds→implied conversion. Returns
-        ``closing_side_implied − entry_implied`` (positive = the market closed
-        toward the bet's side vs the entry price). ``None`` when there's no
-        snapshot, no odds on that side, or no entry implied prob."""
-        entry = _safe_float(entry_implied)
-        if entry is None or player_id is None:
-            return None
-        row = self.conn.execute(
-            """
-            SELECT over_odds, under_odds
-            FROM betting_line_snapshots
-            WHERE player_id = ?
-              AND DATE(game_date) = DATE(?)
-              AND lower(stat_type) = lower(?)
-            ORDER BY snapshot_ts_utc DESC
-            LIMIT 1
-            """,
-            (int(player_id), str(game_date), str(stat_type)),
-        ).fetchone()
-        if not row:
-            return None
-        from nba_model.evaluation.clv_proxy import _safe_implied_prob
-        close_odds = row[0] if str(side).strip().lower() == "over" else row[1]
-        close_implied = _safe_implied_prob(close_odds)
-        if close_implied is None:
-            return None
-        return float(close_implied - entry)
-
     def settle_bet_log(self, fill_clv=True):
         """Grade every pending ``bet_log`` row whose game now has logs.
 
-        Mirrors ``backfill_predictions_outcomes``: look up the pick's realized
-        stat in ``game_logs`` (via the shared ``_GAMELOG_STAT_EXPR``), set
-        ``status`` ∈ {won, lost, push} for the staked side, and stamp
-        ``settled_at_utc`` + ``actual_value``. When ``fill_clv`` and a closing
-        ``betting_line_snapshots`` row exists, fill ``clv_delta`` too.
+        Mirrors ``backfill_predictions_outcomes``: pending picks are joined to
+        their realized stat in ``game_logs`` (via the shared
+        ``_GAMELOG_STAT_EXPR``) and graded with the ``_grade_bet_side`` rules
+        to ``status`` ∈ {won, lost, push}, stamping ``settled_at_utc`` +
+        ``actual_value``. When ``fill_clv``, the same statement joins the
+        latest ``betting_line_snapshots`` row per (player, game_date, stat) —
+        the close — and fills ``clv_delta`` as close-implied minus entry-implied
+        on the bet's side.
+        The graded set is staged in a temp table, then applied with a single
+        ``UPDATE ... FROM``.
 
         Idempotent — only touches ``status = 'pending'`` rows, so re-running
         just settles games that have since landed. Returns settle counts."""
         now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        pending = self.conn.execute(
+        pending_stats = self.conn.execute(
             """
-            SELECT log_id, player_id, game_date, stat_type, line, side, implied_prob
+            SELECT lower(trim(COALESCE(stat_type, ''))), player_id IS NULL,
+                   COUNT(*), MIN(game_date)
             FROM bet_log
             WHERE status = 'pending'
+            GROUP BY 1, 2
             """
         ).fetchall()
+        scanned = sum(int(n) for _, _, n, _ in pending_stats)
+        unsupported_stats = {
+            stat or "<empty>" for stat, no_player, _, _ in pending_stats
+            if no_player or stat not in _GAMELOG_STAT_EXPR
+        }
 
-        update_stmt = """
+        closing_cte = ""
+        closing_join = ""
+        clv_sql = "NULL"
+        if fill_clv and scanned:
+            # Resolved (and any archive ATTACHed) before the temp-table write
+            # opens a transaction — ATTACH is refused inside one.
+            source = self.line_history_source(
+                "betting_line_snapshots",
+                since=min(str(row[3]) for row in pending_stats),
+            )
+            closing_cte = f""",
+            closing AS (
+                SELECT
+                    s.player_id,
+                    DATE(s.game_date) AS game_day,
+                    lower(s.stat_type) AS stat,
+                    s.over_odds,
+                    s.under_odds,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY s.player_id, DATE(s.game_date), lower(s.stat_type)
+                        ORDER BY s.snapshot_ts_utc DESC, s.snapshot_id DESC
+                    ) AS rn
+                FROM {source} s
+                WHERE s.player_id IN (SELECT player_id FROM pending)
+            )"""
+            closing_join = """
+                LEFT JOIN closing c
+                  ON c.rn = 1
+                 AND c.player_id = gr.player_id
+                 AND c.game_day = DATE(gr.game_date)
+                 AND c.stat = gr.stat"""
+            close_odds = (
+                "CASE WHEN lower(trim(gr.side)) = 'over' "
+                "THEN c.over_odds ELSE c.under_odds END"
+            )
+            clv_sql = f"({_american_implied_sql(close_odds)}) - gr.implied_prob"
+
+        grade_sql = _GRADE_BET_SIDE_SQL.format(
+            actual="gr.actual", line="gr.line", side="gr.side",
+        )
+        self.conn.execute("DROP TABLE IF EXISTS temp.bet_log_settlement")
+        self.conn.execute(
+            f"""
+            CREATE TEMP TABLE bet_log_settlement AS
+            WITH pending AS (
+                SELECT log_id, player_id, game_date,
+                       lower(trim(stat_type)) AS stat, line, side, implied_prob
+                FROM bet_log
+                WHERE status = 'pending' AND player_id IS NOT NULL
+            ),
+            graded AS (
+                SELECT
+                    pd.*,
+                    {_gamelog_stat_case_sql("pd.stat")} AS actual,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY pd.log_id ORDER BY g.game_log_id
+                    ) AS rn
+                FROM pending pd
+                JOIN game_logs g
+                  ON g.player_id = pd.player_id
+                 AND DATE(g.game_date) = DATE(pd.game_date)
+            ){closing_cte}
+            SELECT
+                gr.log_id,
+                gr.actual,
+                {grade_sql} AS status,
+                {clv_sql} AS clv
+            FROM graded gr{closing_join}
+            WHERE gr.rn = 1
+              AND gr.actual IS NOT NULL
+              AND gr.line IS NOT NULL
+            """
+        )
+        settled, clv_filled = self.conn.execute(
+            "SELECT COUNT(*), COUNT(clv) FROM temp.bet_log_settlement"
+        ).fetchone()
+        self.conn.execute(
+            """
             UPDATE bet_log
-               SET status = ?,
+               SET status = s.status,
                    settled_at_utc = ?,
-                   actual_value = ?,
-                   clv_delta = COALESCE(?, clv_delta)
-             WHERE log_id = ?
-        """
-
-        settled = 0
-        scanned = 0
-        clv_filled = 0
-        unsupported_stats: set[str] = set()
-
-        for log_id, player_id, game_date, stat_type, line, side, implied_prob in pending:
-            scanned += 1
-            stat = (stat_type or "").strip().lower()
-            expr = _GAMELOG_STAT_EXPR.get(stat)
-            if expr is None or player_id is None:
-                unsupported_stats.add(stat or "<empty>")
-                continue
-            row = self.conn.execute(
-                f"""
-                SELECT {expr} AS actual
-                FROM game_logs g
-                WHERE g.player_id = ?
-                  AND DATE(g.game_date) = DATE(?)
-                LIMIT 1
-                """,
-                (int(player_id), str(game_date)),
-            ).fetchone()
-            if not row or row[0] is None:
-                continue
-            actual = float(row[0])
-            status = _grade_bet_side(side, actual, line)
-            if status is None:
-                continue
-            clv = self._closing_clv_delta(
-                player_id, game_date, stat, side, implied_prob
-            ) if fill_clv else None
-            if clv is not None:
-                clv_filled += 1
-            self.conn.execute(
-                update_stmt, (status, now, actual, clv, int(log_id)))
-            settled += 1
-
+                   actual_value = s.actual,
+                   clv_delta = COALESCE(s.clv, bet_log.clv_delta)
+              FROM temp.bet_log_settlement AS s
+             WHERE bet_log.log_id = s.log_id
+            """,
+            (now,),
+        )
+        self.conn.execute("DROP TABLE temp.bet_log_settlement")
         self.conn.commit()
         result = {
             "scanned": int(scanned),
@@ -786,7 +1056,9 @@ class DatabaseManager:
                 player_id, game_date, book, stat_type, line_value, over_odds, under_odds
 
         Returns:
-            dict: Insert summary with keys inserted, duplicates_ignored, attempted.
+            dict: Insert summary with keys inserted, duplicates_ignored, attempted
+            and changed_props, the ``(player_id, lower(stat_type), game_date)``
+            props that gained a line (for ``arb_events.detect_line_events``).
         """
         if not records:
             return {
@@ -853,10 +1125,24 @@ class DatabaseManager:
                 "attempted": 0,
             }
 
+        # line_id is AUTOINCREMENT, so rows above the current max are exactly
+        # this batch's inserts (plus any a concurrent writer slipped in).
+        last_line_id = self.conn.execute(
+            "SELECT COALESCE(MAX(line_id), 0) FROM betting_lines"
+        ).fetchone()[0]
         before_changes = self.conn.total_changes
         self.conn.executemany(query, payload)
-        self.conn.commit()
         inserted = self.conn.total_changes - before_changes
+        changed_props = self.conn.execute(
+            """
+            SELECT DISTINCT player_id, lower(stat_type), game_date
+            FROM betting_lines
+            WHERE line_id > ?
+            ORDER BY 1, 2, 3
+            """,
+            (int(last_line_id),),
+        ).fetchall() if inserted else []
+        self.conn.commit()
         ignored = len(payload) - inserted
         if rejected_implausible:
             logger.warning(
@@ -874,6 +1160,7 @@ class DatabaseManager:
             "duplicates_ignored": int(ignored),
             "rejected_implausible": int(rejected_implausible),
             "attempted": int(len(payload)),
+            "changed_props": [tuple(row) for row in changed_props],
         }
 
     def insert_betting_line_snapshots(self, records):
@@ -949,15 +1236,26 @@ class DatabaseManager:
         """
         Insert raw text snapshots fetched from direct web URLs.
 
+        The page text is stored once per distinct content in
+        ``web_text_blobs`` (zlib-compressed, keyed by its sha256); the
+        snapshot row only references it. An unchanged re-fetch therefore
+        adds one small snapshot row and no text. Reads go through
+        ``iter_web_text_snapshots`` / ``get_recent_web_text_snapshots``,
+        which decompress transparently.
+
         Args:
             records: Iterable of dicts with keys:
                 source_url, fetched_at_utc, http_status, content_type,
                 text_content, text_length, content_sha256
+
+        Returns:
+            dict: Insert summary with keys inserted, attempted, blobs_inserted.
         """
         if not records:
             return {
                 "inserted": 0,
                 "attempted": 0,
+                "blobs_inserted": 0,
             }
 
         query = """
@@ -968,40 +1266,132 @@ class DatabaseManager:
                 content_type,
                 text_content,
                 text_length,
-                content_sha256
+                content_sha256,
+                blob_sha256
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, '', ?, ?, ?)
         """
 
         payload = []
+        blobs = {}
         for rec in records:
-            row = (
-                rec.get("source_url"),
-                rec.get("fetched_at_utc"),
-                rec.get("http_status"),
-                rec.get("content_type"),
-                rec.get("text_content"),
-                rec.get("text_length"),
-                rec.get("content_sha256"),
-            )
-            if not row[0] or not row[1] or not row[4]:
+            source_url = rec.get("source_url")
+            fetched_at_utc = rec.get("fetched_at_utc")
+            text_content = rec.get("text_content")
+            if not source_url or not fetched_at_utc or not text_content:
                 continue
-            payload.append(row)
+            blob_sha256, codec, compressed = _compress_web_text(text_content)
+            blobs.setdefault(
+                blob_sha256,
+                (blob_sha256, codec, compressed, len(str(text_content))),
+            )
+            payload.append(
+                (
+                    source_url,
+                    fetched_at_utc,
+                    rec.get("http_status"),
+                    rec.get("content_type"),
+                    rec.get("text_length"),
+                    rec.get("content_sha256"),
+                    blob_sha256,
+                )
+            )
 
         if not payload:
             return {
                 "inserted": 0,
                 "attempted": 0,
+                "blobs_inserted": 0,
             }
 
+        before_changes = self.conn.total_changes
+        self.conn.executemany(
+            """
+            INSERT OR IGNORE INTO web_text_blobs
+                (blob_sha256, codec, payload, raw_length)
+            VALUES (?, ?, ?, ?)
+            """,
+            list(blobs.values()),
+        )
+        blobs_inserted = self.conn.total_changes - before_changes
         before_changes = self.conn.total_changes
         self.conn.executemany(query, payload)
         self.conn.commit()
         inserted = self.conn.total_changes - before_changes
-        logger.info("Inserted %s web_text_snapshots rows", inserted)
+        logger.info(
+            "Inserted %s web_text_snapshots rows (%s new text blobs)",
+            inserted, blobs_inserted,
+        )
         return {
             "inserted": int(inserted),
             "attempted": int(len(payload)),
+            "blobs_inserted": int(blobs_inserted),
+        }
+
+    def compact_web_text_snapshots(self, batch_size=200, vacuum=False):
+        """
+        Move legacy inline ``text_content`` into ``web_text_blobs``.
+
+        Snapshots written before blob storage existed still carry their full
+        text inline. This rewrites them ``batch_size`` rows per transaction
+        (bounded memory, short write locks) to reference a compressed blob
+        and blanks the inline copy. Optionally ``VACUUM`` afterwards so the
+        freed pages actually shrink the file. Idempotent.
+
+        Returns:
+            dict: rows_compacted, blobs_inserted, inline_chars_freed, vacuumed.
+        """
+        size = max(1, int(batch_size))
+        rows_compacted = 0
+        blobs_inserted = 0
+        chars_freed = 0
+        while True:
+            rows = self.conn.execute(
+                """
+                SELECT snapshot_id, text_content
+                FROM web_text_snapshots
+                WHERE blob_sha256 IS NULL AND text_content <> ''
+                ORDER BY snapshot_id
+                LIMIT ?
+                """,
+                (size,),
+            ).fetchall()
+            if not rows:
+                break
+            updates = []
+            for snapshot_id, text_content in rows:
+                blob_sha256, codec, compressed = _compress_web_text(text_content)
+                before_changes = self.conn.total_changes
+                self.conn.execute(
+                    """
+                    INSERT OR IGNORE INTO web_text_blobs
+                        (blob_sha256, codec, payload, raw_length)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (blob_sha256, codec, compressed, len(text_content)),
+                )
+                blobs_inserted += self.conn.total_changes - before_changes
+                chars_freed += len(text_content)
+                updates.append((blob_sha256, int(snapshot_id)))
+            self.conn.executemany(
+                "UPDATE web_text_snapshots SET text_content = '', blob_sha256 = ? "
+                "WHERE snapshot_id = ?",
+                updates,
+            )
+            self.conn.commit()
+            rows_compacted += len(updates)
+
+        if vacuum:
+            self.conn.execute("VACUUM")
+        logger.info(
+            "Compacted %s web_text_snapshots rows into %s new blobs",
+            rows_compacted, blobs_inserted,
+        )
+        return {
+            "rows_compacted": int(rows_compacted),
+            "blobs_inserted": int(blobs_inserted),
+            "inline_chars_freed": int(chars_freed),
+            "vacuumed": bool(vacuum),
         }
 
     def get_latest_web_text_fetch_times(self, source_urls):
@@ -1036,14 +1426,113 @@ class DatabaseManager:
             if row and row[0] is not None and row[1] is not None
         }
 
-    def get_recent_web_text_snapshots(
+    def get_web_fetch_validators(self, source_urls):
+        """
+        Return the stored HTTP validators per URL, for conditional requests.
+
+        Only validators whose text is still stored are returned (with the
+        newest ``snapshot_id`` holding it), so a 304 can always be served
+        from ``web_text_snapshots``.
+
+        Args:
+            source_urls: iterable of URLs
+
+        Returns:
+            dict[str, dict]: source_url -> {etag, last_modified,
+            content_sha256, snapshot_id}
+        """
+        urls = sorted({str(url).strip() for url in (source_urls or []) if str(url).strip()})
+        if not urls:
+            return {}
+        placeholders = ", ".join(["?"] * len(urls))
+        rows = self.conn.execute(
+            f"""
+            SELECT v.source_url, v.etag, v.last_modified, v.content_sha256,
+                   (
+                       SELECT MAX(s.snapshot_id)
+                       FROM web_text_snapshots s
+                       WHERE s.source_url = v.source_url
+                         AND s.content_sha256 = v.content_sha256
+                   ) AS snapshot_id
+            FROM web_fetch_validators v
+            WHERE v.source_url IN ({placeholders})
+            """,
+            tuple(urls),
+        ).fetchall()
+        return {
+            str(row[0]): {
+                "etag": row[1],
+                "last_modified": row[2],
+                "content_sha256": str(row[3]),
+                "snapshot_id": int(row[4]),
+            }
+            for row in rows
+            if row[4] is not None and (row[1] or row[2])
+        }
+
+    def upsert_web_fetch_validators(self, records):
+        """
+        Store the HTTP validators each URL was last fetched with.
+
+        A record without ``etag`` or ``last_modified`` removes the URL's row,
+        so a server that stops sending validators is fetched in full.
+
+        Args:
+            records: iterable of dicts with source_url, content_sha256 and the
+                optional etag / last_modified response headers.
+
+        Returns:
+            dict: ``{"upserted": n, "deleted": n}``
+        """
+        updated_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        upserts, deletes = [], []
+        for rec in records or []:
+            source_url = str(rec.get("source_url", "")).strip()
+            if not source_url:
+                continue
+            etag = rec.get("etag") or None
+            last_modified = rec.get("last_modified") or None
+            if (etag or last_modified) and rec.get("content_sha256"):
+                upserts.append(
+                    (source_url, etag, last_modified, str(rec["content_sha256"]), updated_at)
+                )
+            else:
+                deletes.append((source_url,))
+        if upserts:
+            self.conn.executemany(
+                """
+                INSERT INTO web_fetch_validators (
+                    source_url, etag, last_modified, content_sha256, updated_at_utc
+                )
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (source_url) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    content_sha256 = excluded.content_sha256,
+                    updated_at_utc = excluded.updated_at_utc
+                """,
+                upserts,
+            )
+        if deletes:
+            self.conn.executemany(
+                "DELETE FROM web_fetch_validators WHERE source_url = ?", deletes,
+            )
+        self.conn.commit()
+        return {"upserted": len(upserts), "deleted": len(deletes)}
+
+    def get_recent_web_text_snapshot_refs(
         self,
         source_urls=None,
         max_snapshots_per_url=1,
         limit_total=250,
     ):
         """
-        Return recent web-text snapshots for parser ingestion.
+        Return the newest snapshot metadata per URL, without page text.
+
+        The per-URL window is applied in SQL (``ROW_NUMBER()`` over the
+        ``(source_url, fetched_at_utc DESC)`` index), so only the selected
+        rows ever leave SQLite and no ``text_content`` is read. Pair with
+        ``iter_web_text_snapshots`` to stream the texts one at a time.
 
         Args:
             source_urls: optional iterable of URL filters.
@@ -1058,48 +1547,424 @@ class DatabaseManager:
             if str(url).strip()
         ]
 
+        where = "TRIM(COALESCE(source_url, '')) <> ''"
+        params: list = []
         if urls:
             placeholders = ", ".join(["?"] * len(urls))
-            query = f"""
-                SELECT snapshot_id, source_url, fetched_at_utc, text_content, text_length, content_sha256
+            where += f" AND source_url IN ({placeholders})"
+            params.extend(urls)
+        query = f"""
+            SELECT snapshot_id, source_url, fetched_at_utc, text_length, content_sha256
+            FROM (
+                SELECT snapshot_id, source_url, fetched_at_utc, text_length, content_sha256,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY source_url
+                           ORDER BY fetched_at_utc DESC, snapshot_id DESC
+                       ) AS url_rank
                 FROM web_text_snapshots
-                WHERE source_url IN ({placeholders})
-                ORDER BY source_url ASC, fetched_at_utc DESC, snapshot_id DESC
-            """
-            rows = self.conn.execute(query, tuple(urls)).fetchall()
-        else:
-            rows = self.conn.execute(
+                WHERE {where}
+            )
+            WHERE url_rank <= ?
+            ORDER BY source_url ASC, fetched_at_utc DESC, snapshot_id DESC
+            LIMIT ?
+        """
+        params.extend([per_url_limit, total_limit])
+        rows = self.conn.execute(query, tuple(params)).fetchall()
+        return [
+            {
+                "snapshot_id": int(row[0]),
+                "source_url": str(row[1]).strip(),
+                "fetched_at_utc": str(row[2]),
+                "text_length": int(row[3]) if row[3] is not None else None,
+                "content_sha256": str(row[4]) if row[4] is not None else None,
+            }
+            for row in rows
+        ]
+
+    def iter_web_text_snapshots(self, snapshot_refs):
+        """
+        Yield each snapshot ref with its ``text_content`` loaded lazily.
+
+        One primary-key lookup per ref, in the order given, so a caller that
+        processes and drops each snapshot holds a single page text in memory
+        no matter how many refs it walks. Refs whose row has since vanished
+        are skipped. Blob-backed text is decompressed here, so callers never
+        see the storage format.
+
+        Args:
+            snapshot_refs: iterable of dicts from
+                ``get_recent_web_text_snapshot_refs``.
+        """
+        for ref in snapshot_refs or []:
+            row = self.conn.execute(
                 """
-                SELECT snapshot_id, source_url, fetched_at_utc, text_content, text_length, content_sha256
+                SELECT s.text_content, b.codec, b.payload
+                FROM web_text_snapshots s
+                LEFT JOIN web_text_blobs b ON b.blob_sha256 = s.blob_sha256
+                WHERE s.snapshot_id = ?
+                """,
+                (int(ref["snapshot_id"]),),
+            ).fetchone()
+            if row is None:
+                continue
+            snapshot = dict(ref)
+            if row[2] is not None:
+                snapshot["text_content"] = _decompress_web_text(row[1], row[2])
+            else:
+                snapshot["text_content"] = str(row[0]) if row[0] is not None else ""
+            yield snapshot
+
+    def get_recent_web_text_snapshots(
+        self,
+        source_urls=None,
+        max_snapshots_per_url=1,
+        limit_total=250,
+    ):
+        """
+        Return recent web-text snapshots (with text) for parser ingestion.
+
+        Materializes ``iter_web_text_snapshots`` over
+        ``get_recent_web_text_snapshot_refs``; the parsers stream instead.
+
+        Args:
+            source_urls: optional iterable of URL filters.
+            max_snapshots_per_url: max snapshots returned per URL.
+            limit_total: hard cap for total snapshots returned.
+        """
+        refs = self.get_recent_web_text_snapshot_refs(
+            source_urls=source_urls,
+            max_snapshots_per_url=max_snapshots_per_url,
+            limit_total=limit_total,
+        )
+        return list(self.iter_web_text_snapshots(refs))
+
+    def get_parse_ledger_heads(self, parser, parser_version, source_urls):
+        """
+        Return the newest content each URL was parsed with, per parser version.
+
+        A snapshot whose ``content_sha256`` equals its URL's head has nothing
+        new to parse; anything else (new text, or text reverting to an older
+        version of the page) is parsed again. Heads are ordered by the parsed
+        snapshot's ``fetched_at_utc``, so backlog parses of old snapshots never
+        displace a newer head.
+
+        Args:
+            parser: ledger consumer name (e.g. ``'prop_cards'``).
+            parser_version: the parser's ``PARSER_VERSION``.
+            source_urls: iterable of URLs to look up.
+
+        Returns:
+            dict[str, str]: source_url -> content_sha256
+        """
+        urls = sorted({str(url).strip() for url in (source_urls or []) if str(url).strip()})
+        if not urls:
+            return {}
+        placeholders = ", ".join(["?"] * len(urls))
+        rows = self.conn.execute(
+            f"""
+            SELECT source_url, content_sha256
+            FROM (
+                SELECT source_url, content_sha256,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY source_url
+                           ORDER BY fetched_at_utc DESC, snapshot_id DESC
+                       ) AS url_rank
+                FROM parse_ledger
+                WHERE parser = ? AND parser_version = ?
+                  AND source_url IN ({placeholders})
+            )
+            WHERE url_rank = 1
+            """,
+            (str(parser), str(parser_version), *urls),
+        ).fetchall()
+        return {str(row[0]): str(row[1]) for row in rows}
+
+    def get_parse_backlog_refs(
+        self, parser, parser_version, limit, source_urls=None, exclude_sha256=(),
+    ):
+        """
+        Return snapshot refs whose text this parser version has never parsed.
+
+        One ref per distinct ``content_sha256`` (its first snapshot), oldest
+        first, capped at ``limit`` so a ``PARSER_VERSION`` bump drains in
+        bounded batches. Legacy snapshots without a content hash are never
+        part of the backlog. Same shape as ``get_recent_web_text_snapshot_refs``.
+
+        Args:
+            parser: ledger consumer name.
+            parser_version: the parser's ``PARSER_VERSION``.
+            limit: max refs returned.
+            source_urls: optional iterable of URL filters.
+            exclude_sha256: hashes already being parsed by the caller.
+        """
+        limit = int(limit)
+        if limit <= 0:
+            return []
+        excluded = {str(sha) for sha in (exclude_sha256 or ()) if sha}
+        urls = [str(url).strip() for url in (source_urls or []) if str(url).strip()]
+        where = "content_sha256 IS NOT NULL AND TRIM(COALESCE(source_url, '')) <> ''"
+        params: list = []
+        if urls:
+            where += f" AND source_url IN ({', '.join(['?'] * len(urls))})"
+            params.extend(urls)
+        params.extend([str(parser), str(parser_version), limit + len(excluded)])
+        rows = self.conn.execute(
+            f"""
+            SELECT s.snapshot_id, s.source_url, s.fetched_at_utc, s.text_length,
+                   s.content_sha256
+            FROM web_text_snapshots s
+            JOIN (
+                SELECT MIN(snapshot_id) AS snapshot_id
                 FROM web_text_snapshots
-                ORDER BY source_url ASC, fetched_at_utc DESC, snapshot_id DESC
-                """
-            ).fetchall()
+                WHERE {where}
+                GROUP BY content_sha256
+            ) first_seen ON first_seen.snapshot_id = s.snapshot_id
+            WHERE NOT EXISTS (
+                SELECT 1 FROM parse_ledger l
+                WHERE l.content_sha256 = s.content_sha256
+                  AND l.parser = ? AND l.parser_version = ?
+            )
+            ORDER BY s.fetched_at_utc ASC, s.snapshot_id ASC
+            LIMIT ?
+            """,
+            tuple(params),
+        ).fetchall()
+        refs = [
+            {
+                "snapshot_id": int(row[0]),
+                "source_url": str(row[1]).strip(),
+                "fetched_at_utc": str(row[2]),
+                "text_length": int(row[3]) if row[3] is not None else None,
+                "content_sha256": str(row[4]),
+            }
+            for row in rows
+            if str(row[4]) not in excluded
+        ]
+        return refs[:limit]
 
-        selected = []
-        per_url_counts = {}
-        for row in rows:
-            source_url = str(row[1]).strip() if row and row[1] is not None else ""
-            if not source_url:
-                continue
-            seen_for_url = per_url_counts.get(source_url, 0)
-            if seen_for_url >= per_url_limit:
+    def record_parse_ledger(self, parser, parser_version, entries):
+        """
+        Upsert ``parse_ledger`` rows for snapshots a parser has handled.
+
+        Call after the parsed records are stored, so a failed run leaves its
+        snapshots unrecorded and they are parsed again next time. Entries
+        without a ``content_sha256`` are ignored. A re-parse of known text
+        moves its row to the newer snapshot.
+
+        Args:
+            parser: ledger consumer name.
+            parser_version: the parser's ``PARSER_VERSION``.
+            entries: iterable of dicts with ``content_sha256``, ``source_url``,
+                ``snapshot_id``, ``fetched_at_utc``, ``status`` and the
+                optional ``records_extracted`` / ``records_retained`` counts.
+        """
+        parsed_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        payload = [
+            (
+                str(entry["content_sha256"]),
+                str(parser),
+                str(parser_version),
+                str(entry.get("source_url", "")).strip(),
+                int(entry["snapshot_id"]),
+                str(entry.get("fetched_at_utc", "")),
+                str(entry.get("status", "parsed")),
+                int(entry.get("records_extracted", 0) or 0),
+                int(entry.get("records_retained", 0) or 0),
+                parsed_at,
+            )
+            for entry in (entries or [])
+            if entry.get("content_sha256")
+        ]
+        if not payload:
+            return {"recorded": 0}
+        self.conn.executemany(
+            """
+            INSERT INTO parse_ledger (
+                content_sha256, parser, parser_version, source_url, snapshot_id,
+                fetched_at_utc, status, records_extracted, records_retained,
+                parsed_at_utc
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (content_sha256, parser, parser_version) DO UPDATE SET
+                source_url = excluded.source_url,
+                snapshot_id = excluded.snapshot_id,
+                fetched_at_utc = excluded.fetched_at_utc,
+                status = excluded.status,
+                records_extracted = excluded.records_extracted,
+                records_retained = excluded.records_retained,
+                parsed_at_utc = excluded.parsed_at_utc
+            WHERE excluded.fetched_at_utc >= parse_ledger.fetched_at_utc
+            """,
+            payload,
+        )
+        self.conn.commit()
+        return {"recorded": len(payload)}
+
+    def get_parse_scan_states(self, scanner_key, source_urls):
+        """
+        Return the stored candidate scan per URL for one scanner fingerprint.
+
+        Args:
+            scanner_key: the parser's scan fingerprint (patterns, mode, version).
+            source_urls: iterable of URLs to look up.
+
+        Returns:
+            dict[str, dict]: source_url -> decoded scan state
+        """
+        urls = sorted({str(url).strip() for url in (source_urls or []) if str(url).strip()})
+        if not urls:
+            return {}
+        placeholders = ", ".join(["?"] * len(urls))
+        rows = self.conn.execute(
+            f"""
+            SELECT source_url, codec, payload
+            FROM parse_scan_state
+            WHERE scanner_key = ? AND source_url IN ({placeholders})
+            """,
+            (str(scanner_key), *urls),
+        ).fetchall()
+        return {str(row[0]): json.loads(_decompress_web_text(row[1], row[2])) for row in rows}
+
+    def upsert_parse_scan_states(self, scanner_key, records):
+        """
+        Store each URL's newest candidate scan, replacing older ones.
+
+        A state from an older snapshot than the stored one (a backlog parse)
+        is ignored, and states of other scanner keys for the URL are dropped.
+
+        Args:
+            scanner_key: the parser's scan fingerprint.
+            records: iterable of dicts with ``source_url``, ``snapshot_id``,
+                ``fetched_at_utc`` and the JSON-serializable ``state``.
+        """
+        updated_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        payload = []
+        for rec in records or []:
+            source_url = str(rec.get("source_url", "")).strip()
+            if not source_url or rec.get("state") is None:
                 continue
-            selected.append(
-                {
-                    "snapshot_id": int(row[0]),
-                    "source_url": source_url,
-                    "fetched_at_utc": str(row[2]),
-                    "text_content": str(row[3]) if row[3] is not None else "",
-                    "text_length": int(row[4]) if row[4] is not None else None,
-                    "content_sha256": str(row[5]) if row[5] is not None else None,
-                }
+            _, codec, blob = _compress_web_text(json.dumps(rec["state"], separators=(",", ":")))
+            payload.append((
+                source_url, str(scanner_key), int(rec["snapshot_id"]),
+                str(rec.get("fetched_at_utc", "")), codec, blob, updated_at,
+            ))
+        if not payload:
+            return {"stored": 0}
+        self.conn.executemany(
+            "DELETE FROM parse_scan_state WHERE source_url = ? AND scanner_key <> ?",
+            [(row[0], row[1]) for row in payload],
+        )
+        self.conn.executemany(
+            """
+            INSERT INTO parse_scan_state (
+                source_url, scanner_key, snapshot_id, fetched_at_utc, codec,
+                payload, updated_at_utc
             )
-            per_url_counts[source_url] = seen_for_url + 1
-            if len(selected) >= total_limit:
-                break
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (source_url, scanner_key) DO UPDATE SET
+                snapshot_id = excluded.snapshot_id,
+                fetched_at_utc = excluded.fetched_at_utc,
+                codec = excluded.codec,
+                payload = excluded.payload,
+                updated_at_utc = excluded.updated_at_utc
+            WHERE excluded.fetched_at_utc >= parse_scan_state.fetched_at_utc
+            """,
+            payload,
+        )
+        self.conn.commit()
+        return {"stored": len(payload)}
+
+    def game_log_marks(self, player_ids):
+        """
+        Return a change fingerprint of each player's ``game_logs`` rows.
+
+        The mark joins the newest game date, the game count, the newest
+        ``created_at`` / ``updated_at`` stamps and the stat-column totals,
+        so a new game, a re-inserted game or a corrected box score all move
+        it. Players without game logs are absent.
+
+        Returns:
+            dict[int, str]: player_id -> mark
+        """
+        ids = sorted({int(pid) for pid in player_ids})
+        totals = ", ".join(f"TOTAL({col})" for col in _GAME_LOG_MARK_COLUMNS)
+        marks = {}
+        for start in range(0, len(ids), _SQL_PARAM_CHUNK):
+            chunk = ids[start:start + _SQL_PARAM_CHUNK]
+            rows = self.conn.execute(
+                f"""
+                SELECT player_id, MAX(game_date), COUNT(*), MAX(created_at),
+                       MAX(updated_at), {totals}
+                FROM game_logs
+                WHERE player_id IN ({", ".join("?" * len(chunk))})
+                GROUP BY player_id
+                """,
+                chunk,
+            ).fetchall()
+            for row in rows:
+                marks[int(row[0])] = "|".join(str(value) for value in row[1:])
+        return marks
+
+    def get_prediction_watermarks(self, game_date):
+        """
+        Return the stored recompute watermarks for one slate date.
+
+        Returns:
+            dict[tuple, tuple]: (player_id, stat_type) ->
+                (logs_mark, lines_mark, prior_mark)
+        """
+        rows = self.conn.execute(
+            """
+            SELECT player_id, stat_type, logs_mark, lines_mark, prior_mark
+            FROM prediction_watermarks
+            WHERE game_date = ?
+            """,
+            (str(game_date)[:10],),
+        ).fetchall()
+        return {(int(row[0]), str(row[1])): tuple(row[2:]) for row in rows}
 
-        return selected
+    def upsert_prediction_watermarks(self, game_date, records):
+        """
+        Store the watermarks a slate's predictions were computed from.
+
+        Older slate dates are dropped in the same transaction; only the
+        current slate is ever compared against.
+
+        Args:
+            game_date: slate date the records belong to.
+            records: iterable of dicts with ``player_id``, ``stat_type``,
+                ``logs_mark``, ``lines_mark`` and ``prior_mark``.
+        """
+        game_date = str(game_date)[:10]
+        computed_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        payload = [
+            (
+                int(rec["player_id"]), game_date, str(rec["stat_type"]),
+                str(rec["logs_mark"]), str(rec["lines_mark"]), str(rec["prior_mark"]),
+                computed_at,
+            )
+            for rec in records or []
+        ]
+        self.conn.execute(
+            "DELETE FROM prediction_watermarks WHERE game_date < ?", (game_date,),
+        )
+        self.conn.executemany(
+            """
+            INSERT INTO prediction_watermarks (
+                player_id, game_date, stat_type, logs_mark, lines_mark,
+                prior_mark, computed_at_utc
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (player_id, game_date, stat_type) DO UPDATE SET
+                logs_mark = excluded.logs_mark,
+                lines_mark = excluded.lines_mark,
+                prior_mark = excluded.prior_mark,
+                computed_at_utc = excluded.computed_at_utc
+            """,
+            payload,
+        )
+        self.conn.commit()
+        return {"stored": len(payload)}
 
     def upsert_active_players_reference(self, records):
         """
@@ -1223,6 +2088,10 @@ class DatabaseManager:
 
         Args:
             records: Iterable[dict] with parser output fields.
+
+        Returns:
+            dict: inserted, attempted, skipped_unchanged and changed_props, the
+            ``(lower(player_name), stat_type)`` active-NBA props whose line moved.
         """
         if not records:
             return {
@@ -1322,10 +2191,16 @@ class DatabaseManager:
             inserted,
             skipped_unchanged,
         )
+        # Payload rows are line changes by construction (unchanged cards were
+        # skipped above), so their props are the ones that moved.
+        changed_props = sorted(
+            {(row[4].lower(), row[6]) for row in payload if row[5] == "active_nba"}
+        ) if inserted else []
         return {
             "inserted": int(inserted),
             "attempted": int(len(payload)),
             "skipped_unchanged": int(skipped_unchanged),
+            "changed_props": changed_props,
         }
 
     def get_consensus_prop_lines(
@@ -1372,6 +2247,7 @@ class DatabaseManager:
                 )
                 params.append(f"-{hours} hours")
         where_sql = " AND ".join(clauses) if clauses else "1=1"
+        source = self.line_history_source("web_prop_cards", since_hours=since_hours)
 
         query = f"""
             WITH latest_per_book AS (
@@ -1386,7 +2262,7 @@ class DatabaseManager:
                         PARTITION BY lower(player_name), lower(stat_type), lower(side), lower(book)
                         ORDER BY observed_at_utc DESC, card_id DESC
                     ) AS rn
-                FROM web_prop_cards
+                FROM {source}
                 WHERE {where_sql}
             )
             SELECT
@@ -1562,6 +2438,7 @@ class DatabaseManager:
                 clauses.append("observed_at_utc >= datetime('now', ?)")
                 params.append(f"-{hours} hours")
         where_sql = (" AND ".join(clauses)) if clauses else "1=1"
+        source = self.line_history_source("web_team_lines", since_hours=since_hours)
 
         # Pull the latest line per (game, market, side, book) and aggregate
         # in Python so we can convert odds → implied probability → mean →
@@ -1578,7 +2455,7 @@ class DatabaseManager:
                                      lower(market_type), lower(side), lower(book)
                         ORDER BY observed_at_utc DESC, line_id DESC
                     ) AS rn
-                FROM web_team_lines
+                FROM {source}
                 WHERE {where_sql}
             )
             SELECT
@@ -1833,12 +2710,16 @@ class DatabaseManager:
         return [dict(zip(cols, row))
                 for row in self.conn.execute(query, tuple(params)).fetchall()]
 
-    def insert_game_logs(self, game_logs_df):
+    def insert_game_logs(self, game_logs_df, upsert=False):
         """
         Bulk insert game logs from DataFrame.
 
         Returns the number of newly-inserted rows (existing duplicates are
-        skipped via ``INSERT OR IGNORE``).
+        skipped via ``INSERT OR IGNORE``). With ``upsert=True`` existing
+        ``(player_id, game_id)`` rows are overwritten instead, so re-pulled
+        box scores pick up stat corrections; a row whose values actually
+        change gets ``updated_at`` stamped, identical re-pulls leave it
+        alone. Either way the batch is one transaction.
         """
         try:
             if game_logs_df is None or game_logs_df.empty:
@@ -1854,7 +2735,7 @@ class DatabaseManager:
                 row[1]
                 for row in self.conn.execute("PRAGMA table_info(game_logs)").fetchall()
             }
-            blocked_columns = {'game_log_id', 'created_at'}
+            blocked_columns = {'game_log_id', 'created_at', 'updated_at'}
             columns = [
                 col for col in game_logs_df.columns
                 if col in table_columns and col not in blocked_columns
@@ -1865,19 +2746,34 @@ class DatabaseManager:
 
             payload = game_logs_df[columns].where(
                 pd.notna(game_logs_df[columns]), None)
-            query = f"""
-                INSERT OR IGNORE INTO game_logs ({", ".join(columns)})
-                VALUES ({", ".join(["?"] * len(columns))})
-            """
+            updates = [c for c in columns if c not in ('player_id', 'game_id')]
+            if upsert and updates:
+                query = f"""
+                    INSERT INTO game_logs ({", ".join(columns)})
+                    VALUES ({", ".join(["?"] * len(columns))})
+                    ON CONFLICT(player_id, game_id) DO UPDATE SET
+                        {", ".join(f"{c} = excluded.{c}" for c in updates)},
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE {" OR ".join(
+                        f"game_logs.{c} IS NOT excluded.{c}" for c in updates)}
+                """
+            else:
+                query = f"""
+                    INSERT OR IGNORE INTO game_logs ({", ".join(columns)})
+                    VALUES ({", ".join(["?"] * len(columns))})
+                """
 
-            before_changes = self.conn.total_changes
+            # total_changes counts updated rows too, so count rows instead.
+            count_sql = "SELECT COUNT(*) FROM game_logs"
+            before_rows = self.conn.execute(count_sql).fetchone()[0]
             self.conn.executemany(
                 query, payload.itertuples(index=False, name=None))
             self.conn.commit()
-            inserted = self.conn.total_changes - before_changes
-            ignored = len(payload) - inserted
+            inserted = self.conn.execute(count_sql).fetchone()[0] - before_rows
+            existing = len(payload) - inserted
             logger.info(
-                "Inserted %s game logs (%s duplicates ignored)", inserted, ignored
+                "Inserted %s game logs (%s duplicates %s)", inserted, existing,
+                "updated" if upsert else "ignored",
             )
             return int(inserted)
         except Exception as e:
@@ -1987,27 +2883,18 @@ class DatabaseManager:
         """
         return pd.read_sql_query(query, self.conn, params=(player_id, start_date, end_date))
 
-    def insert_prediction(self, prediction_data):
-        """
-        Insert a prediction record.
+    _PREDICTION_COLUMNS = (
+        "player_id, game_date, stat_type, sport, predicted_mean, predicted_std, "
+        "prob_over, line_value, book_odds, expected_value"
+    )
 
-        Args:
-            prediction_data: dict with keys:
-                player_id, game_date, stat_type, predicted_mean,
-                predicted_std, prob_over, line_value, expected_value,
-                optional model_config_json
-        """
-        # noinspection SqlNoDataSourceInspection
-        query = """
-            INSERT INTO predictions
-            (player_id, game_date, stat_type, predicted_mean, predicted_std,
-             prob_over, line_value, book_odds, expected_value)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        values = (
+    @staticmethod
+    def _prediction_values(prediction_data):
+        return (
             prediction_data['player_id'],
             prediction_data['game_date'],
             prediction_data['stat_type'],
+            prediction_data.get('sport') or 'nba',
             prediction_data['predicted_mean'],
             prediction_data['predicted_std'],
             prediction_data['prob_over'],
@@ -2015,7 +2902,23 @@ class DatabaseManager:
             prediction_data.get('book_odds'),
             prediction_data.get('expected_value')
         )
-        cursor = self.conn.execute(query, values)
+
+    def insert_prediction(self, prediction_data):
+        """
+        Insert a prediction record (append-only).
+
+        Args:
+            prediction_data: dict with keys:
+                player_id, game_date, stat_type, predicted_mean,
+                predicted_std, prob_over, line_value, expected_value,
+                optional sport (default 'nba'), optional model_config_json
+        """
+        # noinspection SqlNoDataSourceInspection
+        cursor = self.conn.execute(
+            f"INSERT INTO predictions ({self._PREDICTION_COLUMNS}) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            self._prediction_values(prediction_data),
+        )
 
         model_config_json = prediction_data.get("model_config_json")
         if model_config_json:
@@ -2028,6 +2931,130 @@ class DatabaseManager:
             )
         self.conn.commit()
 
+    def upsert_predictions(self, rows):
+        """Write the hourly slate's predictions in one transaction.
+
+        Only slate rows are touched: those without a ``prediction_configs``
+        entry (``insert_prediction`` callers such as the backtester attach
+        their model config, and their rows are never rewritten here). Per
+        (player_id, game_date, stat_type, sport) an ungraded slate row is
+        updated in place, keeping its ``prediction_id``; a key without one
+        gets a new row; a key whose slate row is already graded is left
+        alone. The batch is staged in a temp table and applied with one
+        ``UPDATE ... FROM`` and one ``INSERT ... SELECT``; the last row wins
+        for a key repeated in ``rows``. Rows missing a key column are skipped.
+
+        Returns:
+            dict: {"upserted", "attempted"} — upserted counts updated plus
+            inserted keys.
+        """
+        rows = list(rows or [])
+        payload = []
+        for row in rows:
+            try:
+                values = self._prediction_values(row)
+            except KeyError:
+                continue
+            if any(v is None for v in values[:3]):
+                continue
+            payload.append(values)
+        if not payload:
+            return {"upserted": 0, "attempted": len(rows)}
+
+        slate_row = """
+            p.player_id = s.player_id AND p.game_date = s.game_date
+            AND p.stat_type = s.stat_type AND p.sport = s.sport
+            AND NOT EXISTS (
+                SELECT 1 FROM prediction_configs c WHERE c.prediction_id = p.prediction_id
+            )
+        """
+        self.conn.execute("DROP TABLE IF EXISTS temp.prediction_upsert")
+        self.conn.execute(
+            f"CREATE TEMP TABLE prediction_upsert ({self._PREDICTION_COLUMNS})"
+        )
+        self.conn.executemany(
+            "INSERT INTO temp.prediction_upsert VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            payload,
+        )
+        self.conn.execute(
+            """
+            DELETE FROM temp.prediction_upsert WHERE rowid NOT IN (
+                SELECT MAX(rowid) FROM temp.prediction_upsert
+                GROUP BY player_id, game_date, stat_type, sport
+            )
+            """
+        )
+        updated = self.conn.execute(
+            f"""
+            SELECT COUNT(*) FROM temp.prediction_upsert s
+            WHERE EXISTS (
+                SELECT 1 FROM predictions p WHERE {slate_row} AND p.outcome IS NULL
+            )
+            """
+        ).fetchone()[0]
+        self.conn.execute(
+            f"""
+            UPDATE predictions AS p
+               SET predicted_mean = s.predicted_mean,
+                   predicted_std = s.predicted_std,
+                   prob_over = s.prob_over,
+                   line_value = s.line_value,
+                   book_odds = s.book_odds,
+                   expected_value = s.expected_value,
+                   created_at = CURRENT_TIMESTAMP
+              FROM temp.prediction_upsert AS s
+             WHERE {slate_row} AND p.outcome IS NULL
+            """
+        )
+        inserted = self.conn.execute(
+            f"""
+            INSERT INTO predictions ({self._PREDICTION_COLUMNS})
+            SELECT * FROM temp.prediction_upsert s
+            WHERE NOT EXISTS (SELECT 1 FROM predictions p WHERE {slate_row})
+            """
+        ).rowcount
+        self.conn.execute("DROP TABLE temp.prediction_upsert")
+        self.conn.commit()
+        upserted = int(updated) + int(inserted)
+        logger.info(
+            "Upserted %s predictions rows (%s updated, %s inserted)",
+            upserted, updated, inserted,
+        )
+        return {"upserted": upserted, "attempted": len(rows)}
+
+    def collapse_duplicate_predictions(self):
+        """Keep one hourly slate row per prediction key (one-off cleanup).
+
+        The old per-row delete-then-insert hourly write could leave several
+        config-less rows for one (player_id, game_date, stat_type, sport);
+        ``upsert_predictions`` would then update all of them. This keeps the
+        graded one if any, else the newest, and deletes the rest. Backtest
+        rows (those with a ``prediction_configs`` entry) are never touched.
+        Returns the row count removed. Idempotent."""
+        cursor = self.conn.execute(
+            """
+            DELETE FROM predictions WHERE prediction_id IN (
+                SELECT prediction_id FROM (
+                    SELECT p.prediction_id,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY p.player_id, p.game_date, p.stat_type, p.sport
+                               ORDER BY p.outcome IS NULL, p.prediction_id DESC
+                           ) AS rn
+                    FROM predictions p
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM prediction_configs c
+                        WHERE c.prediction_id = p.prediction_id
+                    )
+                )
+                WHERE rn > 1
+            )
+            """
+        )
+        self.conn.commit()
+        removed = int(cursor.rowcount)
+        logger.info("Collapsed %s duplicate hourly predictions rows", removed)
+        return removed
+
     def delete_nonfinite_predictions(self):
         """Delete predictions with a non-finite projected moment (one-off cleanup).
 
@@ -37,6 +37,7 @@ CREATE TABLE IF NOT EXISTS game_logs (
     turnovers INTEGER,
     plus_minus INTEGER,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP,  -- set when an upsert corrects the row in place
     FOREIGN KEY (player_id) REFERENCES players(player_id),
     UNIQUE(player_id, game_id)
 );
@@ -136,12 +137,35 @@ CREATE TABLE IF NOT EXISTS web_text_snapshots (
     fetched_at_utc   TIMESTAMP NOT NULL,
     http_status      INTEGER,
     content_type     TEXT,
-    text_content     TEXT NOT NULL,
+    text_content     TEXT NOT NULL,  -- '' when the text lives in web_text_blobs
     text_length      INTEGER,
     content_sha256   TEXT,
+    blob_sha256      TEXT,           -- web_text_blobs key; NULL = legacy inline text
     created_at       TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Content-addressed, compressed page text for web_text_snapshots. One row per
+-- distinct text (keyed by the sha256 of the UTF-8 text), so an unchanged
+-- re-fetch of the same page costs one snapshot row and no new text.
+CREATE TABLE IF NOT EXISTS web_text_blobs (
+    blob_sha256      TEXT PRIMARY KEY,
+    codec            TEXT NOT NULL,  -- 'zlib'
+    payload          BLOB NOT NULL,
+    raw_length       INTEGER,
+    created_at       TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- HTTP cache validators from the last requests-mode fetch of each URL. They
+-- are sent back as If-None-Match / If-Modified-Since, so an unchanged page
+-- answers 304 and its stored text is reused instead of re-downloaded.
+CREATE TABLE IF NOT EXISTS web_fetch_validators (
+    source_url       TEXT PRIMARY KEY,
+    etag             TEXT,
+    last_modified    TEXT,
+    content_sha256   TEXT NOT NULL,  -- text the validators describe
+    updated_at_utc   TIMESTAMP NOT NULL
+);
+
 -- Active NBA players reference (used for parser filtering/classification)
 CREATE TABLE IF NOT EXISTS nba_active_players_ref (
     player_id      INTEGER PRIMARY KEY,
@@ -293,7 +317,142 @@ CREATE TABLE IF NOT EXISTS mlb_game_logs (
     UNIQUE(player_id, game_pk, stat_type)
 );
 
+-- Cold-tier line history written by nba_model.data.line_archive: one row per
+-- (table, season) archive file, with the bounds of the archived rows' range
+-- column. Readers ATTACH an archive only when a query's time range reaches it.
+CREATE TABLE IF NOT EXISTS line_archive_manifest (
+    table_name       TEXT NOT NULL,
+    season           TEXT NOT NULL,   -- e.g. "2025-26"
+    archive_file     TEXT NOT NULL,   -- file name under the DB's archive/ dir
+    min_value        TEXT,            -- MIN/MAX of the table's range column
+    max_value        TEXT,
+    row_count        INTEGER NOT NULL DEFAULT 0,
+    archived_at_utc  TIMESTAMP NOT NULL,
+    PRIMARY KEY (table_name, season)
+);
+
+-- Materialized Book Edge Scanner output, refreshed incrementally by the hourly
+-- update (edge_scanner.refresh_scored_edges). One row per scored
+-- (player, canonical stat, book) for each model profile; the model columns
+-- stay NULL when the player/stat can't be fitted so cross-book consensus
+-- still sees every line. ``fit_watermark`` fingerprints the player's game-log
+-- inputs: a row is rescored only when its line or its watermark changes.
+CREATE TABLE IF NOT EXISTS scored_edges (
+    model_mode       TEXT NOT NULL,
+    n_games          INTEGER NOT NULL,
+    rolling_window   INTEGER NOT NULL,
+    player_key       TEXT NOT NULL,     -- lower(player_name)
+    stat_type        TEXT NOT NULL,     -- canonical stat (pc._canonical_stat_type)
+    book_key         TEXT NOT NULL,     -- lower(book)
+    book             TEXT NOT NULL,
+    player_name      TEXT NOT NULL,
+    player_id        INTEGER,
+    book_line        REAL NOT NULL,
+    observed_at_utc  TEXT,
+    n_lines          INTEGER NOT NULL DEFAULT 1,  -- per-side lines collapsed into the row
+    model_mu         REAL,
+    model_sigma      REAL,
+    line_vs_mu       REAL,
+    p_over           REAL,
+    p_under          REAL,
+    best_side        TEXT,
+    model_edge       REAL,
+    ev_best          REAL,
+    n_games_used     INTEGER,
+    distribution     TEXT,
+    fit_watermark    TEXT NOT NULL,
+    scored_at_utc    TEXT NOT NULL,
+    PRIMARY KEY (model_mode, n_games, rolling_window, player_key, stat_type, book_key)
+);
+
+-- One row per materialized scored_edges profile: readers only trust the table
+-- for a profile refreshed recently enough and over a wide enough lookback.
+CREATE TABLE IF NOT EXISTS scored_edges_profiles (
+    model_mode        TEXT NOT NULL,
+    n_games           INTEGER NOT NULL,
+    rolling_window    INTEGER NOT NULL,
+    since_hours       REAL NOT NULL,
+    refreshed_at_utc  TEXT NOT NULL,
+    row_count         INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (model_mode, n_games, rolling_window)
+);
+
+-- Cross-book opportunities detected at write time (nba_model.model.arb_events):
+-- the line insert paths re-evaluate each prop whose line changed and append
+-- TRUE arbs (real two-way prices) and middle candidates here. ``event_key``
+-- fingerprints the legs + prices so an unchanged opportunity is kept once.
+CREATE TABLE IF NOT EXISTS arb_events (
+    event_id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_key          TEXT NOT NULL UNIQUE,
+    detected_at_utc    TEXT NOT NULL,
+    event_type         TEXT NOT NULL,   -- 'arb' | 'middle_candidate'
+    source_table       TEXT NOT NULL,   -- 'betting_lines' | 'web_prop_cards'
+    player_id          INTEGER,
+    player_name        TEXT,
+    stat_type          TEXT NOT NULL,   -- canonical stat
+    game_date          DATE,            -- NULL for DFS cards
+    over_book          TEXT NOT NULL,
+    over_line          REAL NOT NULL,
+    over_odds          INTEGER,
+    under_book         TEXT NOT NULL,
+    under_line         REAL NOT NULL,
+    under_odds         INTEGER,
+    line_gap           REAL,
+    combined_implied   REAL,            -- arbs only
+    guaranteed_margin  REAL,            -- arbs only
+    legs               TEXT
+);
+
+-- One row per snapshot text a parser has already handled, so an unchanged
+-- re-fetch is skipped instead of re-extracted. ``parser`` names the consumer
+-- ('prop_cards', 'team_lines', 'team_lines:mlb'); a PARSER_VERSION bump has no
+-- rows yet, which is the reparse backlog. ``source_url`` / ``snapshot_id`` /
+-- ``fetched_at_utc`` are the newest snapshot parsed with this text.
+CREATE TABLE IF NOT EXISTS parse_ledger (
+    content_sha256     TEXT NOT NULL,
+    parser             TEXT NOT NULL,
+    parser_version     TEXT NOT NULL,
+    source_url         TEXT NOT NULL,
+    snapshot_id        INTEGER NOT NULL,
+    fetched_at_utc     TEXT NOT NULL,
+    status             TEXT NOT NULL,   -- 'parsed' | 'login_wall'
+    records_extracted  INTEGER NOT NULL DEFAULT 0,
+    records_retained   INTEGER NOT NULL DEFAULT 0,
+    parsed_at_utc      TEXT NOT NULL,
+    PRIMARY KEY (content_sha256, parser, parser_version)
+);
+
+-- Newest candidate scan per URL for incremental prop-card parsing: the
+-- preprocessed text and its match items (zlib JSON), keyed by the parser's
+-- scanner fingerprint so a pattern or active-name change starts over.
+CREATE TABLE IF NOT EXISTS parse_scan_state (
+    source_url       TEXT NOT NULL,
+    scanner_key      TEXT NOT NULL,
+    snapshot_id      INTEGER NOT NULL,
+    fetched_at_utc   TEXT NOT NULL,
+    codec            TEXT NOT NULL,
+    payload          BLOB NOT NULL,
+    updated_at_utc   TEXT NOT NULL,
+    PRIMARY KEY (source_url, scanner_key)
+);
+
+-- Inputs behind each hourly-recomputed prediction: the player's game-log
+-- watermark, the (player, stat) line set and the team prior. The recompute
+-- only re-scores keys whose marks moved since the stored projection.
+CREATE TABLE IF NOT EXISTS prediction_watermarks (
+    player_id        INTEGER NOT NULL,
+    game_date        DATE NOT NULL,
+    stat_type        TEXT NOT NULL,
+    logs_mark        TEXT NOT NULL,
+    lines_mark       TEXT NOT NULL,
+    prior_mark       TEXT NOT NULL,
+    computed_at_utc  TEXT NOT NULL,
+    PRIMARY KEY (player_id, game_date, stat_type)
+);
+
 -- Indexes for fast queries
+CREATE INDEX IF NOT EXISTS idx_arb_events_detected ON arb_events(detected_at_utc DESC, event_type);
+CREATE INDEX IF NOT EXISTS idx_scored_edges_edge ON scored_edges(model_mode, n_games, rolling_window, model_edge DESC);
 CREATE INDEX IF NOT EXISTS idx_mlb_game_logs_player_stat ON mlb_game_logs(player_id, stat_type, game_date DESC);
 CREATE INDEX IF NOT EXISTS idx_mlb_game_logs_date ON mlb_game_logs(game_date DESC, game_pk);
 CREATE INDEX IF NOT EXISTS idx_game_logs_player_date ON game_logs(player_id, game_date DESC);
@@ -307,6 +466,8 @@ CREATE INDEX IF NOT EXISTS idx_snapshots_player_date ON betting_line_snapshots(p
 CREATE INDEX IF NOT EXISTS idx_snapshots_event_book ON betting_line_snapshots(event_id, book, market_key, snapshot_ts_utc);
 CREATE INDEX IF NOT EXISTS idx_odds_poll_runs_polled_at ON odds_poll_runs(polled_at_utc DESC);
 CREATE INDEX IF NOT EXISTS idx_web_text_snapshots_url_time ON web_text_snapshots(source_url, fetched_at_utc DESC);
+CREATE INDEX IF NOT EXISTS idx_web_text_snapshots_sha ON web_text_snapshots(content_sha256);
+CREATE INDEX IF NOT EXISTS idx_parse_ledger_url ON parse_ledger(parser, parser_version, source_url, fetched_at_utc DESC);
 CREATE INDEX IF NOT EXISTS idx_active_players_ref_name ON nba_active_players_ref(player_name);
 CREATE INDEX IF NOT EXISTS idx_web_prop_cards_snapshot ON web_prop_cards(snapshot_id, observed_at_utc DESC);
 CREATE INDEX IF NOT EXISTS idx_web_prop_cards_player_stat ON web_prop_cards(player_name, stat_type, observed_at_utc DESC);
@@ -105,6 +105,9 @@ def backfill_betting_lines_from_web_prop_cards(
 
     Returns a summary dict with candidate / resolved / inserted counts.
     """
+    # Backfilled rows are re-dated DFS history with assumed -110 prices, not
+    # fresh quotes, so they go straight to the writer, skipping the write-time
+    # arb/middle detector (``arb_events.insert_betting_lines``).
     with DatabaseManager(db_path=db_path) as db:
         name_to_id = _build_name_to_player_id(db)
         candidates = _latest_web_prop_lines(db, lookback_hours, books)
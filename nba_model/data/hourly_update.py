@@ -6,7 +6,7 @@ sportsbook scraping path needs a residential Chrome on
 DataDome TLS fingerprinting, so this runner is intentionally local-host
 only — it will not run in a container or in GitHub Actions.
 
-Pipeline (in order, each step writes to the JSON report):
+Pipeline (each step writes to the JSON report):
     1. Preflight: Playwright importable + Chrome CDP reachable on :9222
     2. Web-text ingestion (CDP) over data/config/web_text_urls.txt
     3. Browser prop parser (prizepicks / underdog / pick6 / parlayplay)
@@ -16,6 +16,11 @@ Pipeline (in order, each step writes to the JSON report):
     7. Settle prediction outcomes (idempotent backfill)
     8. Write timestamped JSON report under nba_model/data/artifacts/hourly/
 
+After preflight, steps 2-7 (plus recompute / edge refresh) run as the
+``STEP_DEPENDENCIES`` DAG: the scrape branch (2 -> 3, 4 -> 6) and the game-log
+branch (5 -> 7) overlap on a thread pool, so a run takes about its longest
+chain. The report's ``schedule`` block records the critical path.
+
 Idempotency / overlap safety:
     Acquires an fcntl flock on a lockfile so two overlapping runs can't
     stomp each other (e.g. an 02:00 run that hangs past 03:00). The
@@ -26,6 +31,7 @@ Idempotency / overlap safety:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import math
 import os
@@ -38,6 +44,7 @@ try:  # POSIX (the dev Mac / launchd host) — preferred path.
 except ImportError:  # pragma: no cover - Windows dev box has no fcntl.
     fcntl = None
     import msvcrt
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
@@ -54,6 +61,35 @@ DEFAULT_REPORT_DIR = "nba_model/data/artifacts/hourly"
 DEFAULT_LOG_DIR = "nba_model/data/logs"
 DEFAULT_LOCKFILE = "/tmp/nba_hourly_update.lock"
 DEFAULT_CHROME_PORT = 9222
+# Older snapshot texts each parser reparses per run after a PARSER_VERSION bump
+# (parse_ledger backlog); bounded so the backlog drains over several runs.
+PARSE_BACKLOG_BATCH = 25
+# Threads for independent steps; only web_text drives Chrome, the rest are
+# nba_api / SQLite I/O, so a few workers cover the widest DAG level.
+DEFAULT_MAX_STEP_WORKERS = 4
+
+# Step -> steps whose DB output it reads (or whose rows it rewrites). A step
+# starts once all of these have finished, failed or not, exactly as in the
+# old fixed order; anything not connected runs concurrently. Dependencies on
+# steps disabled for the run are dropped.
+STEP_DEPENDENCIES = {
+    "web_text": (),
+    "browser_prop_parser": ("web_text",),
+    "team_line_parser": ("web_text",),
+    "game_log_refresh": (),
+    "players_table_sync": ("game_log_refresh",),
+    "reverse_engineering": ("team_line_parser",),
+    "outcome_settlement": ("game_log_refresh",),
+    "prediction_recompute": (
+        "browser_prop_parser", "players_table_sync", "reverse_engineering",
+        "outcome_settlement",
+    ),
+    "scored_edges_refresh": (
+        "browser_prop_parser", "team_line_parser", "players_table_sync",
+        "reverse_engineering", "prediction_recompute",
+    ),
+    "bet_log_settlement": ("browser_prop_parser", "team_line_parser", "game_log_refresh"),
+}
 
 EXIT_OK = 0
 EXIT_LOCKED = 75            # EX_TEMPFAIL — try again next interval
@@ -175,6 +211,75 @@ def _record_step(report: dict, name: str, fn, *args, **kwargs) -> bool:
         return False
 
 
+def _critical_path(deps: dict, timing: dict) -> list[str]:
+    """Chain of steps that gated the run, in execution order.
+
+    Walks back from the last step to finish; each step's predecessor on the
+    path is the dependency that finished last, i.e. the one it waited for.
+    """
+    if not timing:
+        return []
+    name = max(timing, key=lambda n: timing[n][1])
+    path = [name]
+    while True:
+        waited_on = [d for d in deps[name] if d in timing]
+        if not waited_on:
+            return path[::-1]
+        name = max(waited_on, key=lambda d: timing[d][1])
+        path.append(name)
+
+
+def _run_step_dag(report: dict, steps: dict, max_workers: int) -> dict:
+    """Run ``steps`` (name -> ``(depends_on, fn, args)``) as a dependency DAG.
+
+    Ready steps are submitted in declaration order to a thread pool; each is
+    recorded through ``_record_step`` plus its start/end offsets from the DAG
+    start. Returns the schedule summary (wall time, summed step time and
+    critical path) for the report.
+    """
+    deps = {name: tuple(d for d in spec[0] if d in steps) for name, spec in steps.items()}
+    origin = time.monotonic()
+    timing: dict[str, tuple[float, float]] = {}
+
+    def _timed(name: str) -> None:
+        _, fn, args = steps[name]
+        started = time.monotonic() - origin
+        _record_step(report, name, fn, *args)
+        timing[name] = (started, time.monotonic() - origin)
+        report["steps"][name].update({
+            "depends_on": list(deps[name]),
+            "start_offset_s": round(timing[name][0], 3),
+            "end_offset_s": round(timing[name][1], 3),
+        })
+
+    pending = dict(deps)
+    running: dict = {}
+    with ThreadPoolExecutor(
+        max_workers=max(1, int(max_workers)), thread_name_prefix="hourly-step",
+    ) as pool:
+        while pending or running:
+            for name in [n for n, d in pending.items() if all(x in timing for x in d)]:
+                del pending[name]
+                running[pool.submit(_timed, name)] = name
+            if not running:
+                raise ValueError(f"step dependency cycle among {sorted(pending)}")
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                running.pop(future)
+                future.result()
+
+    path = _critical_path(deps, timing)
+    return {
+        "max_workers": max(1, int(max_workers)),
+        "wall_s": round(time.monotonic() - origin, 3),
+        "steps_total_s": round(sum(end - start for start, end in timing.values()), 3),
+        "critical_path": path,
+        "critical_path_s": round(
+            sum(timing[n][1] - timing[n][0] for n in path), 3,
+        ),
+    }
+
+
 def _run_preflight(
     chrome_port: int,
     chrome_host: str,
@@ -249,6 +354,9 @@ def _run_browser_prop_parser(db_path: str) -> dict:
         max_snapshots_per_url=1,
         max_total_snapshots=20,
         min_parse_confidence=0.2,
+        backlog_limit=PARSE_BACKLOG_BATCH,
+        # Consecutive hourly captures differ in a few cards; re-scan only those.
+        incremental=True,
     )
 
 
@@ -259,45 +367,35 @@ def _run_team_line_parser(db_path: str) -> dict:
         db_path=db_path,
         max_snapshots_per_url=1,
         max_total_snapshots=20,
+        backlog_limit=PARSE_BACKLOG_BATCH,
     )
 
 
-def _run_game_log_refresh(db_path: str, max_players: int) -> dict:
+def _run_game_log_refresh(db_path: str, max_players: Optional[int] = None) -> dict:
     """Refresh recent NBA game logs for tracked players.
 
-    Touches the lightweight nba_api endpoint; rate-limited to avoid the
-    20-req-per-minute soft cap.
+    One league-wide ``playergamelogs`` request for the current season,
+    bounded to games at or after the latest stored ``game_date``; rows are
+    kept for players that already have history (at most ``max_players``).
     """
-    from nba_model.data.data_loader import DataLoader
     from nba_model.data.database.db_manager import DatabaseManager
+    from nba_model.data.nba_results_ingestion import refresh_player_game_logs_incremental
 
-    db = DatabaseManager(db_path=db_path)
     # Players that already have history in the DB — same set the daily ETL uses.
-    # game_logs is keyed by player_id (no name column), so resolve the name via
-    # the scraper-synced active-players ref, falling back to the players table.
-    rows = db.conn.execute(
-        """
-        SELECT DISTINCT COALESCE(r.player_name, p.name) AS name
-        FROM game_logs gl
-        LEFT JOIN nba_active_players_ref r ON r.player_id = gl.player_id
-        LEFT JOIN players p ON p.player_id = gl.player_id
-        WHERE COALESCE(r.player_name, p.name) IS NOT NULL
-        ORDER BY name
-        LIMIT ?
-        """,
-        (int(max_players),),
-    ).fetchall()
-    loader = DataLoader()
-    refreshed = 0
-    failed: list[dict] = []
-    for (name,) in rows:
-        try:
-            loader.load_player_data(name, n_games=10, force_refresh=True)
-            refreshed += 1
-            time.sleep(0.6)
-        except Exception as exc:  # noqa: BLE001 — single-player failures shouldn't kill the run
-            failed.append({"player": name, "error": str(exc)})
-    return {"players_refreshed": refreshed, "failures": failed}
+    with DatabaseManager(db_path=db_path) as db:
+        rows = db.conn.execute(
+            "SELECT DISTINCT player_id FROM game_logs ORDER BY player_id LIMIT ?",
+            (-1 if max_players is None else int(max_players),),
+        ).fetchall()
+    player_ids = [int(pid) for (pid,) in rows]
+    if not player_ids:
+        return {"players_refreshed": 0, "requests": 0, "rows_inserted": 0}
+    refresh = refresh_player_game_logs_incremental(db_path=db_path, player_ids=player_ids)
+    return {
+        "players_refreshed": len(refresh["rows_by_player"]),
+        "requests": refresh["requests"],
+        "rows_inserted": refresh["inserted"],
+    }
 
 
 def _run_players_table_sync(db_path: str) -> dict:
@@ -332,11 +430,50 @@ def _run_outcome_settlement(db_path: str) -> dict:
     return db.backfill_predictions_outcomes()
 
 
+def _prediction_watermarks(db, rows, team_priors_map: dict, config_mark: str) -> dict:
+    """``{(player_id, stat_type): (logs_mark, lines_mark, prior_mark)}`` for a slate.
+
+    ``logs_mark`` is the player's ``DatabaseManager.game_log_marks`` entry,
+    which also moves on an in-place stat correction (plus the history window
+    config); ``lines_mark``
+    hashes the (player, stat) line set, so a re-scrape of identical lines is
+    not a change; ``prior_mark`` is the team's ``blend_team_prior`` inputs.
+    ``team_priors.computed_at_utc`` is not used: the hourly re-derivation
+    bumps it even when the prior is unchanged.
+    """
+    logs = {
+        pid: f"{config_mark}|{mark}"
+        for pid, mark in db.game_log_marks(rows["player_id"].unique()).items()
+    }
+    line_sets: dict = {}
+    teams: dict = {}
+    for r in rows.itertuples(index=False):
+        key = (int(r.player_id), str(r.stat_type))
+        team = str(r.team or "").upper()
+        teams[key] = team
+        line_sets.setdefault(key, []).append(
+            (str(r.book), float(r.line_value), str(r.over_odds), str(r.under_odds), team)
+        )
+    marks = {}
+    for key, line_set in line_sets.items():
+        lines_mark = hashlib.sha1(repr(sorted(line_set)).encode("utf-8")).hexdigest()
+        prior = team_priors_map.get(teams[key]) if teams[key] else None
+        marks[key] = (
+            logs.get(key[0], f"{config_mark}|no_games"),
+            lines_mark,
+            json.dumps(prior, sort_keys=True, default=str),
+        )
+    return marks
+
+
 def _run_prediction_recompute(db_path: str) -> dict:
-    """Re-score every distinct (player, stat_type) currently quoted in
-    ``betting_lines`` for today's game date against the latest model — so the
-    deployed model is genuinely "updated every hour."
+    """Re-score the (player, stat_type) keys quoted in ``betting_lines`` for
+    today's game date whose inputs moved since their stored projection, so
+    the deployed model is genuinely "updated every hour."
 
+    A key is recomputed when its player's game logs, its line set or its
+    team prior changed (see ``_prediction_watermarks``); every other key keeps
+    its stored prediction, so a quiet hour costs a few aggregate queries.
     Returns counts; per-prediction errors are aggregated, not raised.
     """
     from nba_model.data.database.db_manager import DatabaseManager
@@ -360,8 +497,36 @@ def _run_prediction_recompute(db_path: str) -> dict:
     if rows.empty:
         return {"scored": 0, "target_date": today, "skipped": "no betting_lines for today"}
 
+    # Blend the cross-book team priors (pace + implied team total) for the
+    # whole slate so the hourly-refreshed projections share the market signal.
+    with DatabaseManager(db_path=db_path) as db:
+        team_priors_map = db.get_team_prior_inputs_map()
+        marks = _prediction_watermarks(
+            db, rows, team_priors_map, f"{DEFAULT_N_GAMES}:{DEFAULT_ROLLING_WINDOW}",
+        )
+        stored = db.get_prediction_watermarks(today)
+
+    reasons = {"new": 0, "game_logs": 0, "lines": 0, "team_prior": 0}
+    dirty = set()
+    for key, mark in marks.items():
+        previous = stored.get(key)
+        if previous == mark:
+            continue
+        dirty.add(key)
+        if previous is None:
+            reasons["new"] += 1
+            continue
+        for reason, old, new in zip(("game_logs", "lines", "team_prior"), previous, mark):
+            reasons[reason] += int(old != new)
+
+    row_keys = list(zip(rows["player_id"].astype(int), rows["stat_type"].astype(str)))
+    rows = rows.loc[[key in dirty for key in row_keys]]
+
     histories: dict = {}
     history_failures: list[dict] = []
+    # Insufficient history / unknown player is a stable answer for these
+    # marks; anything else (API, network) is retried next hour.
+    settled_players: set = set()
     for player_name in sorted(rows["player_name"].unique()):
         try:
             histories[player_name] = _build_player_history(
@@ -370,13 +535,11 @@ def _run_prediction_recompute(db_path: str) -> dict:
                 rolling_window=DEFAULT_ROLLING_WINDOW,
                 db_path=db_path,
             )
+            settled_players.add(player_name)
         except Exception as exc:  # noqa: BLE001 — single-player failure shouldn't kill the run
             history_failures.append({"player": player_name, "error": str(exc)})
-
-    # Blend the cross-book team priors (pace + implied team total) for the
-    # whole slate so the hourly-refreshed projections share the market signal.
-    with DatabaseManager(db_path=db_path) as db:
-        team_priors_map = db.get_team_prior_inputs_map()
+            if isinstance(exc, ValueError):
+                settled_players.add(player_name)
 
     board_lines = _build_board_lines(
         rows=rows,
@@ -395,6 +558,15 @@ def _run_prediction_recompute(db_path: str) -> dict:
         name_to_id.setdefault(str(r.player_name), int(r.player_id))
     persisted = _persist_predictions(db_path, board_lines, name_to_id, today)
 
+    settled_ids = {name_to_id[name] for name in settled_players}
+    with DatabaseManager(db_path=db_path) as db:
+        db.upsert_prediction_watermarks(today, [
+            {"player_id": pid, "stat_type": stat, "logs_mark": logs_mark,
+             "lines_mark": lines_mark, "prior_mark": prior_mark}
+            for (pid, stat), (logs_mark, lines_mark, prior_mark) in marks.items()
+            if (pid, stat) in dirty and pid in settled_ids
+        ])
+
     return {
         "scored": len(board_lines),
         "predictions_persisted": persisted,
@@ -402,9 +574,28 @@ def _run_prediction_recompute(db_path: str) -> dict:
         "history_failures": history_failures,
         "players": len(histories),
         "teams_with_priors": len(team_priors_map),
+        "keys": len(marks),
+        "recomputed": len(dirty),
+        "reused": len(marks) - len(dirty),
+        "recompute_reasons": reasons,
     }
 
 
+def _run_scored_edges_refresh(db_path: str) -> dict:
+    """Incrementally refresh the materialized Book Edge Scanner table.
+
+    Runs after the parsers, game-log refresh and team priors have landed, so
+    only lines that moved and players with new game logs are rescored; the
+    Streamlit scanner, cross-book view and ``/api/slate/edges`` then read the
+    ranked slate straight from ``scored_edges``."""
+    from nba_model.model.edge_scanner import (
+        DEFAULT_FULL_MODE_WORKERS,
+        refresh_scored_edges,
+    )
+
+    return refresh_scored_edges(db_path, workers=DEFAULT_FULL_MODE_WORKERS)
+
+
 def _run_bet_log_settlement(db_path: str, calibration_source: str = "bet_log") -> dict:
     """Settle pending ``bet_log`` rows and refresh the calibration artifact.
 
@@ -422,52 +613,52 @@ def _run_bet_log_settlement(db_path: str, calibration_source: str = "bet_log") -
 
 
 def _persist_predictions(db_path, board_lines, name_to_id, target_date) -> int:
-    """Write board lines into the predictions table (idempotent per slate)."""
+    """Write board lines into the predictions table (idempotent per slate).
+
+    The whole slate is one ``upsert_predictions`` transaction keyed on
+    (player_id, game_date, stat_type, sport), so a re-run rewrites the
+    ungraded slate rows in place; backtest rows and graded rows are kept."""
     if not board_lines:
         return 0
     from nba_model.data.database.db_manager import DatabaseManager
-    persisted = 0
-    with DatabaseManager(db_path=db_path) as db:
-        for line in board_lines:
-            pid = name_to_id.get(line.player_name)
-            if pid is None:
-                continue
-            # Defense in depth: never persist a NaN/inf projection. The root fix
-            # lives in prop_board.build_history_from_games (NULL-in-window μ/σ is
-            # recomputed over the surviving games), so this normally only fires
-            # when too few valid games remained and the moment stays NaN. A NaN
-            # REAL is stored by SQLite as NULL, which would then read back as a
-            # bogus prediction, so drop the row instead.
-            if not (
-                math.isfinite(line.mu)
-                and math.isfinite(line.sigma)
-                and math.isfinite(line.prob_over)
-            ):
-                logger.warning(
-                    "skipping non-finite prediction for %s %s (mu=%s sigma=%s "
-                    "prob_over=%s)",
-                    line.player_name, line.stat_type,
-                    line.mu, line.sigma, line.prob_over,
-                )
-                continue
-            db.conn.execute(
-                "DELETE FROM predictions WHERE player_id = ? "
-                "AND date(game_date) = date(?) AND lower(stat_type) = lower(?)",
-                (int(pid), target_date, str(line.stat_type)),
+    rows = []
+    for line in board_lines:
+        pid = name_to_id.get(line.player_name)
+        if pid is None:
+            continue
+        # Defense in depth: never persist a NaN/inf projection. The root fix
+        # lives in prop_board.build_history_from_games (NULL-in-window μ/σ is
+        # recomputed over the surviving games), so this normally only fires
+        # when too few valid games remained and the moment stays NaN. A NaN
+        # REAL is stored by SQLite as NULL, which would then read back as a
+        # bogus prediction, so drop the row instead.
+        if not (
+            math.isfinite(line.mu)
+            and math.isfinite(line.sigma)
+            and math.isfinite(line.prob_over)
+        ):
+            logger.warning(
+                "skipping non-finite prediction for %s %s (mu=%s sigma=%s "
+                "prob_over=%s)",
+                line.player_name, line.stat_type,
+                line.mu, line.sigma, line.prob_over,
             )
-            db.insert_prediction({
-                "player_id": int(pid),
-                "game_date": target_date,
-                "stat_type": str(line.stat_type),
-                "predicted_mean": float(line.mu),
-                "predicted_std": float(line.sigma),
-                "prob_over": float(line.prob_over),
-                "line_value": float(line.line_value),
-                "book_odds": line.over_odds,
-                "expected_value": line.ev_over,
-            })
-            persisted += 1
-    return persisted
+            continue
+        rows.append({
+            "player_id": int(pid),
+            "game_date": target_date,
+            "stat_type": str(line.stat_type),
+            "predicted_mean": float(line.mu),
+            "predicted_std": float(line.sigma),
+            "prob_over": float(line.prob_over),
+            "line_value": float(line.line_value),
+            "book_odds": line.over_odds,
+            "expected_value": line.ev_over,
+        })
+    if not rows:
+        return 0
+    with DatabaseManager(db_path=db_path) as db:
+        return int(db.upsert_predictions(rows)["upserted"])
 
 
 def run_hourly_update(
@@ -478,13 +669,17 @@ def run_hourly_update(
     chrome_port: int = DEFAULT_CHROME_PORT,
     chrome_host: str = "127.0.0.1",
     browser_auth_state_file: Optional[str] = None,
-    max_players: int = 25,
+    max_players: Optional[int] = None,
     require_playwright: bool = True,
     skip_recompute: bool = False,
     settle_bet_log: bool = False,
     alert_webhook_url: Optional[str] = None,
+    max_workers: int = DEFAULT_MAX_STEP_WORKERS,
 ) -> dict:
-    """Execute the hourly pipeline and return the JSON report dict."""
+    """Execute the hourly pipeline and return the JSON report dict.
+
+    ``max_workers=1`` runs the steps one at a time in dependency order.
+    """
     from nba_model.data.etl_alerts import build_alert, maybe_send_alert
     report = {
         "started_at": _utc_now_iso(),
@@ -513,24 +708,36 @@ def run_hourly_update(
         logger.error("preflight failed: %s", exc)
         return report
 
-    # Steps run in order; later steps depend on earlier outputs landing in DB.
-    _record_step(
-        report, "web_text",
-        _run_web_text, db_path, urls_file, chrome_port, browser_auth_state_file,
+    # Later steps read earlier outputs from the DB; STEP_DEPENDENCIES orders
+    # them and independent branches (scrape vs. game logs) overlap.
+    step_calls = {
+        "web_text": (
+            _run_web_text, (db_path, urls_file, chrome_port, browser_auth_state_file),
+        ),
+        "browser_prop_parser": (_run_browser_prop_parser, (db_path,)),
+        "team_line_parser": (_run_team_line_parser, (db_path,)),
+        "game_log_refresh": (_run_game_log_refresh, (db_path, max_players)),
+        "players_table_sync": (_run_players_table_sync, (db_path,)),
+        "reverse_engineering": (_run_reverse_engineering, (db_path,)),
+        "outcome_settlement": (_run_outcome_settlement, (db_path,)),
+        "prediction_recompute": (_run_prediction_recompute, (db_path,)),
+        "scored_edges_refresh": (_run_scored_edges_refresh, (db_path,)),
+        # Optional paper-trading maintenance (default OFF): settle bet_log +
+        # refresh the calibration artifact. Kept out of the default hourly
+        # path so it can't slow or destabilize the core ETL until enabled.
+        "bet_log_settlement": (_run_bet_log_settlement, (db_path,)),
+    }
+    if skip_recompute:
+        del step_calls["prediction_recompute"]
+    if not settle_bet_log:
+        del step_calls["bet_log_settlement"]
+    report["schedule"] = _run_step_dag(
+        report,
+        {name: (STEP_DEPENDENCIES[name], fn, args) for name, (fn, args) in step_calls.items()},
+        max_workers,
     )
-    _record_step(report, "browser_prop_parser", _run_browser_prop_parser, db_path)
-    _record_step(report, "team_line_parser", _run_team_line_parser, db_path)
-    _record_step(report, "game_log_refresh", _run_game_log_refresh, db_path, max_players)
-    _record_step(report, "players_table_sync", _run_players_table_sync, db_path)
-    _record_step(report, "reverse_engineering", _run_reverse_engineering, db_path)
-    _record_step(report, "outcome_settlement", _run_outcome_settlement, db_path)
-    if not skip_recompute:
-        _record_step(report, "prediction_recompute", _run_prediction_recompute, db_path)
-    # Optional paper-trading maintenance (default OFF): settle bet_log +
-    # refresh the calibration artifact. Kept out of the default hourly path so
-    # it can't slow or destabilize the core ETL until explicitly enabled.
-    if settle_bet_log:
-        _record_step(report, "bet_log_settlement", _run_bet_log_settlement, db_path)
+    # Completion order varies between runs; report failures in step order.
+    report["failed_steps"].sort(key=list(step_calls).index)
 
     report["ended_at"] = _utc_now_iso()
     report["ok"] = not report["failed_steps"]
@@ -551,13 +758,20 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--chrome-port", type=int, default=DEFAULT_CHROME_PORT)
     parser.add_argument("--chrome-host", default="127.0.0.1")
     parser.add_argument("--browser-auth-state-file", default=None)
-    parser.add_argument("--max-players", type=int, default=25)
+    parser.add_argument(
+        "--max-players", type=int, default=None,
+        help="Cap on tracked players kept by the game-log refresh (default: all).",
+    )
     parser.add_argument(
         "--no-require-playwright",
         action="store_true",
         help="Skip the Playwright preflight (useful for unit tests; do NOT use in prod).",
     )
     parser.add_argument("--skip-recompute", action="store_true")
+    parser.add_argument(
+        "--max-workers", type=int, default=DEFAULT_MAX_STEP_WORKERS,
+        help="Threads for independent steps (1 = run steps one at a time).",
+    )
     parser.add_argument(
         "--settle-bet-log", action="store_true",
         help="Also settle pending bet_log rows + refresh the calibration "
@@ -591,6 +805,7 @@ def main(argv: Optional[list[str]] = None) -> int:
             skip_recompute=args.skip_recompute,
             settle_bet_log=args.settle_bet_log,
             alert_webhook_url=args.alert_webhook_url,
+            max_workers=args.max_workers,
         )
 
     logger.info(
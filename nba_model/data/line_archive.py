@@ -0,0 +1,319 @@
+"""Hot/cold tiering for the line-history tables.
+
+``web_prop_cards``, ``web_team_lines``, ``betting_line_snapshots`` and
+``web_text_snapshots`` grow every hour and would otherwise live forever in the
+single ``nba_data.db`` that every UI reads and ``publish_db`` ships. This job
+moves rows older than a horizon into one archive file per NBA season under the
+DB's ``archive/`` directory (``line_history_2025-26.db``, ...), with the same
+table + index DDL as the hot DB, and records each file's range-column bounds in
+``line_archive_manifest``.
+
+Readers never open archives themselves: ``DatabaseManager.line_history_source``
+consults the manifest and ATTACHes only the seasons a query's time range
+reaches, so the consensus / CLV / line-movement queries return the same rows
+before and after archiving while the common recent-window reads stay hot-only.
+
+Safety rails:
+    * Each (table, season) move is one transaction spanning both files:
+      ``INSERT OR IGNORE`` into the archive, then ``DELETE`` from hot with the
+      identical predicate — a crash leaves the rows in exactly one place (or,
+      under WAL, at worst in both, which the next run's OR IGNORE absorbs).
+    * Snapshot text blobs follow their snapshots; a blob is only dropped from
+      the hot DB once no hot snapshot references it.
+    * ``--dry-run`` reports per-table / per-season counts and touches nothing.
+
+The change-only insert paths compare against the latest *hot* row, so the
+first scrape after a long-unchanged line is archived re-inserts one row; that
+re-establishes the current line in the hot tier and is intended.
+
+CLI::
+
+    .venv/bin/python3 -m nba_model.data.line_archive \\
+        --db-path data/database/nba_data.db --horizon-days 30
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional, Sequence
+
+from nba_model.data.database.db_manager import DatabaseManager
+from nba_model.logging_utils import configure_logging, get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_DB_PATH = "data/database/nba_data.db"
+DEFAULT_HORIZON_DAYS = 30
+ARCHIVE_FILE_TEMPLATE = "line_history_{season}.db"
+_MOVE_ALIAS = "line_archive_move"
+
+
+def season_for_month(year_month: str) -> Optional[str]:
+    """NBA season label for a ``YYYY-MM`` string (October starts a season).
+
+    Same convention as ``nba_results_ingestion.current_season``: 2025-10 and 2026-04
+    are both "2025-26"."""
+    try:
+        year, month = (int(part) for part in str(year_month).split("-")[:2])
+    except (TypeError, ValueError):
+        return None
+    start_year = year if month >= 10 else year - 1
+    return f"{start_year}-{str(start_year + 1)[-2:]}"
+
+
+def _table_ddl(conn: sqlite3.Connection, table: str) -> list[str]:
+    """``CREATE ... IF NOT EXISTS`` DDL for ``table`` and its explicit indexes."""
+    rows = conn.execute(
+        """
+        SELECT type, sql FROM main.sqlite_master
+        WHERE tbl_name = ? AND sql IS NOT NULL AND type IN ('table', 'index')
+        ORDER BY type DESC
+        """,
+        (table,),
+    ).fetchall()
+    ddl = []
+    for kind, sql in rows:
+        prefix = "CREATE TABLE" if kind == "table" else "CREATE INDEX"
+        if sql.upper().startswith(prefix) and "IF NOT EXISTS" not in sql.upper()[:40]:
+            sql = prefix + " IF NOT EXISTS" + sql[len(prefix):]
+        ddl.append(sql)
+    return ddl
+
+
+def _prepare_archive(hot: sqlite3.Connection, path: Path, table: str) -> None:
+    """Create/upgrade ``table`` (plus blobs for snapshots) in the archive file.
+
+    Columns the hot table gained through a migration since the archive was
+    first written are added, so ``INSERT ... SELECT`` by name always lines up.
+    """
+    tables = [table]
+    if table == "web_text_snapshots":
+        tables.append("web_text_blobs")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    archive = sqlite3.connect(str(path))
+    try:
+        for name in tables:
+            for sql in _table_ddl(hot, name):
+                archive.execute(sql)
+            archived_cols = {
+                r[1] for r in archive.execute(f"PRAGMA table_info({name})").fetchall()
+            }
+            for _, col, col_type, *_ in hot.execute(
+                    f"PRAGMA main.table_info({name})").fetchall():
+                if col not in archived_cols:
+                    archive.execute(f"ALTER TABLE {name} ADD COLUMN {col} {col_type}")
+        archive.commit()
+    finally:
+        archive.close()
+
+
+def _pending_by_season(db: DatabaseManager, table: str, cutoff: str) -> dict:
+    """``{season: {"months": [...], "rows": n}}`` for rows older than ``cutoff``."""
+    column = DatabaseManager.LINE_ARCHIVE_TABLES[table]
+    rows = db.conn.execute(
+        f"""
+        SELECT strftime('%Y-%m', {column}) AS ym, COUNT(*)
+        FROM main.{table}
+        WHERE datetime({column}) < datetime(?)
+        GROUP BY ym
+        """,
+        (cutoff,),
+    ).fetchall()
+    out: dict = defaultdict(lambda: {"months": [], "rows": 0})
+    for year_month, n in rows:
+        season = season_for_month(year_month)
+        if season is None:
+            continue
+        out[season]["months"].append(year_month)
+        out[season]["rows"] += int(n)
+    return dict(out)
+
+
+def _move_season(
+    db: DatabaseManager,
+    table: str,
+    season: str,
+    months: Sequence[str],
+    cutoff: str,
+    archive_dir: Path,
+) -> int:
+    """Move one season's aged rows of ``table`` into its archive. Returns rows moved."""
+    column = DatabaseManager.LINE_ARCHIVE_TABLES[table]
+    archive_file = ARCHIVE_FILE_TEMPLATE.format(season=season)
+    path = archive_dir / archive_file
+    _prepare_archive(db.conn, path, table)
+
+    columns = ", ".join(
+        r[1] for r in db.conn.execute(f"PRAGMA main.table_info({table})").fetchall()
+    )
+    placeholders = ", ".join("?" * len(months))
+    where = (
+        f"datetime({column}) < datetime(?) "
+        f"AND strftime('%Y-%m', {column}) IN ({placeholders})"
+    )
+    params = (cutoff, *months)
+
+    db.conn.commit()  # ATTACH is refused inside an open transaction.
+    db.conn.execute(f"ATTACH DATABASE ? AS {_MOVE_ALIAS}", (str(path),))
+    try:
+        if table == "web_text_snapshots":
+            db.conn.execute(
+                f"""
+                INSERT OR IGNORE INTO {_MOVE_ALIAS}.web_text_blobs
+                SELECT * FROM main.web_text_blobs
+                WHERE blob_sha256 IN (
+                    SELECT blob_sha256 FROM main.web_text_snapshots WHERE {where}
+                )
+                """,
+                params,
+            )
+        db.conn.execute(
+            f"INSERT OR IGNORE INTO {_MOVE_ALIAS}.{table} ({columns}) "
+            f"SELECT {columns} FROM main.{table} WHERE {where}",
+            params,
+        )
+        moved = db.conn.execute(
+            f"DELETE FROM main.{table} WHERE {where}", params,
+        ).rowcount
+        if table == "web_text_snapshots":
+            db.conn.execute(
+                """
+                DELETE FROM main.web_text_blobs
+                WHERE blob_sha256 NOT IN (
+                    SELECT blob_sha256 FROM main.web_text_snapshots
+                    WHERE blob_sha256 IS NOT NULL
+                )
+                """
+            )
+        min_value, max_value, row_count = db.conn.execute(
+            f"SELECT MIN({column}), MAX({column}), COUNT(*) "
+            f"FROM {_MOVE_ALIAS}.{table}"
+        ).fetchone()
+        db.conn.execute(
+            """
+            INSERT INTO line_archive_manifest
+                (table_name, season, archive_file, min_value, max_value,
+                 row_count, archived_at_utc)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(table_name, season) DO UPDATE SET
+                archive_file = excluded.archive_file,
+                min_value = excluded.min_value,
+                max_value = excluded.max_value,
+                row_count = excluded.row_count,
+                archived_at_utc = excluded.archived_at_utc
+            """,
+            (
+                table, season, archive_file, min_value, max_value,
+                int(row_count or 0),
+                datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            ),
+        )
+        db.conn.commit()
+    except Exception:
+        db.conn.rollback()
+        raise
+    finally:
+        db.conn.execute(f"DETACH DATABASE {_MOVE_ALIAS}")
+    return int(moved)
+
+
+def archive_line_history(
+    db_path: str = DEFAULT_DB_PATH,
+    horizon_days: float = DEFAULT_HORIZON_DAYS,
+    archive_dir: Optional[str] = None,
+    tables: Optional[Sequence[str]] = None,
+    dry_run: bool = False,
+    vacuum: bool = True,
+    now: Optional[datetime] = None,
+) -> dict:
+    """Move line-history rows older than ``horizon_days`` into season archives.
+
+    ``archive_dir`` defaults to ``<db dir>/archive`` (where
+    ``DatabaseManager`` looks for them). ``vacuum`` compacts the hot file
+    afterwards so the freed pages actually leave the published DB. Returns a
+    summary with per-table / per-season moved counts.
+    """
+    horizon = max(0.0, float(horizon_days))
+    cutoff = (
+        (now or datetime.now(timezone.utc)) - timedelta(days=horizon)
+    ).strftime("%Y-%m-%d %H:%M:%S")
+    wanted = list(tables or DatabaseManager.LINE_ARCHIVE_TABLES)
+    unknown = [t for t in wanted if t not in DatabaseManager.LINE_ARCHIVE_TABLES]
+    if unknown:
+        raise ValueError(f"not archivable line-history tables: {unknown}")
+
+    summary: dict = {
+        "db_path": str(db_path),
+        "cutoff_utc": cutoff,
+        "horizon_days": horizon,
+        "dry_run": bool(dry_run),
+        "tables": {},
+        "rows_moved": 0,
+        "vacuumed": False,
+    }
+    with DatabaseManager(db_path=db_path, archive_dir=archive_dir) as db:
+        summary["archive_dir"] = str(db.archive_dir)
+        for table in wanted:
+            per_season = _pending_by_season(db, table, cutoff)
+            table_summary = {}
+            for season in sorted(per_season):
+                info = per_season[season]
+                if dry_run:
+                    moved = info["rows"]
+                else:
+                    moved = _move_season(
+                        db, table, season, info["months"], cutoff, db.archive_dir,
+                    )
+                    summary["rows_moved"] += moved
+                table_summary[season] = moved
+                logger.info(
+                    "%s %s rows of %s into season %s",
+                    "would move" if dry_run else "moved", moved, table, season,
+                )
+            summary["tables"][table] = table_summary
+        if vacuum and not dry_run and summary["rows_moved"]:
+            db.conn.execute("VACUUM")
+            summary["vacuumed"] = True
+    return summary
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Move aged line-history rows into per-season archive DBs.",
+    )
+    p.add_argument("--db-path", default=DEFAULT_DB_PATH)
+    p.add_argument("--horizon-days", type=float, default=DEFAULT_HORIZON_DAYS,
+                   help="keep rows newer than this many days in the hot DB")
+    p.add_argument("--archive-dir", default=None,
+                   help="archive directory (default: <db dir>/archive)")
+    p.add_argument("--tables", nargs="*", default=None,
+                   choices=sorted(DatabaseManager.LINE_ARCHIVE_TABLES),
+                   help="subset of line-history tables to archive (default: all)")
+    p.add_argument("--no-vacuum", action="store_true",
+                   help="skip the VACUUM that shrinks the hot DB afterwards")
+    p.add_argument("--dry-run", action="store_true",
+                   help="report what would move; write nothing")
+    return p.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    configure_logging()
+    summary = archive_line_history(
+        db_path=args.db_path,
+        horizon_days=args.horizon_days,
+        archive_dir=args.archive_dir,
+        tables=args.tables,
+        dry_run=args.dry_run,
+        vacuum=not args.no_vacuum,
+    )
+    print(json.dumps(summary, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
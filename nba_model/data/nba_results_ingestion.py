@@ -11,6 +11,10 @@ Two passes per season:
 Each season is fetched independently with retries; the orchestrator stops
 at the first season where the API returns nothing (current season starts).
 
+``refresh_player_game_logs_incremental`` is the cheap recurring variant the
+daily and hourly ETLs use: the same league-wide request, bounded to games on
+or after the latest ``game_date`` already stored for the season.
+
 CLI:
     python -m nba_model.data.nba_results_ingestion --seasons 2024-25 2023-24
 """
@@ -182,11 +186,29 @@ def ingest_games(
 # ----- Player game logs ----------------------------------------------------
 
 
-def fetch_player_game_logs_for_season(season: str) -> pd.DataFrame:
-    """Fetch one season of league-wide player game logs."""
+def current_season(reference_time: Optional[datetime] = None) -> str:
+    """NBA season string (e.g. ``2025-26``) in progress at ``reference_time``."""
+    ts = reference_time or datetime.now(timezone.utc)
+    start_year = ts.year if ts.month >= 10 else ts.year - 1
+    return f"{start_year}-{str(start_year + 1)[-2:]}"
+
+
+def fetch_player_game_logs_for_season(
+    season: str, date_from: Optional[str] = None,
+) -> pd.DataFrame:
+    """Fetch one season of league-wide player game logs.
+
+    ``date_from`` (``YYYY-MM-DD``, inclusive) narrows the request to games on
+    or after that date.
+    """
     logger.info("Fetching player game logs for season %s …", season)
+    kwargs = {"season_nullable": season}
+    if date_from:
+        kwargs["date_from_nullable"] = (
+            datetime.strptime(str(date_from)[:10], "%Y-%m-%d").strftime("%m/%d/%Y")
+        )
     time.sleep(RATE_LIMIT_SECONDS)
-    res = _retry(lambda: playergamelogs.PlayerGameLogs(season_nullable=season))
+    res = _retry(lambda: playergamelogs.PlayerGameLogs(**kwargs))
     return res.get_data_frames()[0]
 
 
@@ -259,6 +281,59 @@ def ingest_player_game_logs(
     return summary
 
 
+def _latest_game_date(db: DatabaseManager, season: str) -> Optional[str]:
+    row = db.conn.execute(
+        "SELECT MAX(game_date) FROM game_logs WHERE season = ?", (season,),
+    ).fetchone()
+    return str(row[0])[:10] if row and row[0] else None
+
+
+def refresh_player_game_logs_incremental(
+    seasons: Optional[Iterable[str]] = None,
+    db_path: str = "data/database/nba_data.db",
+    player_ids: Optional[Iterable[int]] = None,
+    full_season: bool = False,
+) -> dict:
+    """Pull only game logs at or after each season's latest stored game date.
+
+    One league-wide ``playergamelogs`` request per season (default: the
+    current one), however many players are tracked. The date bound is
+    inclusive so a slate that was only partly final at the last pull gets
+    completed; re-pulled rows are upserted, all seasons in one
+    ``insert_game_logs`` transaction. ``player_ids`` keeps only those
+    players' rows; ``full_season`` ignores the stored watermark. Request
+    failures raise after ``_retry``.
+    """
+    seasons = list(seasons or [current_season()])
+    wanted = None if player_ids is None else {int(pid) for pid in player_ids}
+    summary = {"seasons": [], "requests": 0, "attempted": 0, "inserted": 0}
+    frames = []
+    with DatabaseManager(db_path=db_path) as db:
+        for season in seasons:
+            date_from = None if full_season else _latest_game_date(db, season)
+            mapped = transform_player_logs_frame(
+                fetch_player_game_logs_for_season(season, date_from=date_from)
+            )
+            summary["requests"] += 1
+            if wanted is not None and not mapped.empty:
+                mapped = mapped[mapped["player_id"].astype(int).isin(wanted)]
+            summary["seasons"].append({
+                "season": season, "date_from": date_from, "rows_pulled": int(len(mapped)),
+            })
+            frames.append(mapped)
+
+        frames = [frame for frame in frames if not frame.empty]
+        combined = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        summary["attempted"] = int(len(combined))
+        if not combined.empty:
+            summary["inserted"] = int(db.insert_game_logs(combined, upsert=True))
+    summary["rows_by_player"] = (
+        {int(pid): int(n) for pid, n in combined["player_id"].value_counts().items()}
+        if not combined.empty else {}
+    )
+    return summary
+
+
 def ingest_all(
     seasons: Iterable[str] = DEFAULT_SEASONS,
     db_path: str = "data/database/nba_data.db",
@@ -139,11 +139,16 @@ def run_publish(
     repo_root: Optional[str] = None,
     dry_run: bool = False,
     message: Optional[str] = None,
+    compact_web_text: bool = False,
     git_runner: Callable[[Sequence[str], str], subprocess.CompletedProcess] = _run_git,
     log: Callable[[str], None] = print,
 ) -> dict:
     """Publish the DB to git. Returns a report dict; never raises on a clean
-    no-op or a held lock (caller maps ``exit_code`` to the process exit)."""
+    no-op or a held lock (caller maps ``exit_code`` to the process exit).
+
+    ``compact_web_text`` first moves any legacy inline snapshot text into the
+    compressed ``web_text_blobs`` store and VACUUMs, so the committed file
+    actually shrinks (one-off after upgrading an old DB; cheap no-op after)."""
     report: dict = {
         "db_path": db_path,
         "dry_run": bool(dry_run),
@@ -154,6 +159,7 @@ def run_publish(
         "pushed": False,
         "exit_code": EXIT_OK,
         "message": None,
+        "compaction": None,
     }
 
     db = Path(db_path)
@@ -172,6 +178,13 @@ def run_publish(
         log(f"SKIP: {report['message']}")
         return report
 
+    if compact_web_text and not dry_run:
+        from nba_model.data.database.db_manager import DatabaseManager
+
+        with DatabaseManager(db_path=db_path) as dbm:
+            report["compaction"] = dbm.compact_web_text_snapshots(vacuum=True)
+        log(f"  compacted web_text_snapshots: {report['compaction']['rows_compacted']} rows")
+
     report["row_counts"] = count_rows(db_path)
     for table, n in report["row_counts"].items():
         log(f"  {table}: {n} rows")
@@ -242,6 +255,9 @@ def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     p.add_argument("--repo-root", default=None,
                    help="git repo root (defaults to the DB's project root)")
     p.add_argument("--message", default=None, help="override the commit message")
+    p.add_argument("--compact-web-text", action="store_true",
+                   help="move legacy inline snapshot text into compressed blobs "
+                        "and VACUUM before publishing")
     p.add_argument("--dry-run", action="store_true",
                    help="print what would happen; skip all mutating git commands")
     return p.parse_args(argv)
@@ -262,6 +278,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         repo_root=args.repo_root,
         dry_run=args.dry_run,
         message=args.message,
+        compact_web_text=args.compact_web_text,
         log=logger.info,
     )
     logger.info(
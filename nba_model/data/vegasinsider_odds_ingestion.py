@@ -51,7 +51,7 @@ def _latest_snapshot(
     """Newest ``web_text_snapshots`` row whose URL matches ``source_url_like``."""
     row = db.conn.execute(
         """
-        SELECT source_url, fetched_at_utc, text_content
+        SELECT snapshot_id, source_url, fetched_at_utc
         FROM web_text_snapshots
         WHERE source_url LIKE ?
         ORDER BY fetched_at_utc DESC
@@ -61,11 +61,15 @@ def _latest_snapshot(
     ).fetchone()
     if not row:
         return None
-    return {
-        "source_url": row[0],
-        "fetched_at_utc": row[1],
-        "text_content": row[2] or "",
-    }
+    # Text may live in the compressed blob store; let the DB layer resolve it.
+    ref = {"snapshot_id": row[0], "source_url": row[1], "fetched_at_utc": row[2]}
+    for snap in db.iter_web_text_snapshots([ref]):
+        return {
+            "source_url": snap["source_url"],
+            "fetched_at_utc": snap["fetched_at_utc"],
+            "text_content": snap["text_content"] or "",
+        }
+    return None
 
 
 def _game_date_from_fetched(fetched_at_utc: Optional[str]) -> Optional[str]:
@@ -144,7 +148,8 @@ def ingest_vegasinsider_odds(
                         "dry-run" if dry_run else "no records", summary)
             return summary
 
-        insert = db.insert_betting_lines_records(records)
+        from nba_model.model.arb_events import insert_betting_lines
+        insert = insert_betting_lines(db, records)
 
     summary.update({
         "inserted": int(insert.get("inserted", 0)),
@@ -40,7 +40,8 @@ def load_snapshots(
 ) -> pd.DataFrame:
     """Load betting_line_snapshots from DB, optionally filtered by date and stat_type."""
     with DatabaseManager(db_path=db_path) as db:
-        df = pd.read_sql_query("SELECT * FROM betting_line_snapshots", db.conn)
+        source = db.line_history_source("betting_line_snapshots", since=start_date)
+        df = pd.read_sql_query(f"SELECT * FROM {source}", db.conn)
 
     if df.empty:
         return df
@@ -0,0 +1,148 @@
+"""Benchmark prop-card extraction modes (regex scan vs name-anchored) on stored captures."""
+
+import argparse
+import time
+from datetime import datetime
+from pathlib import Path
+
+from nba_model.data.database.db_manager import DatabaseManager
+from nba_model.model import browser_prop_parser as bpp
+
+ARTIFACT_DIR = Path("nba_model/evaluation/artifacts")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Time regex vs name-anchored prop-card extraction on stored web_text snapshots."
+    )
+    parser.add_argument("--db-path", default="data/database/nba_data.db")
+    parser.add_argument("--source-urls", nargs="*", default=None)
+    parser.add_argument("--max-snapshots-per-url", type=int, default=3)
+    parser.add_argument("--max-total-snapshots", type=int, default=250)
+    parser.add_argument("--write-artifact", action="store_true")
+    parser.add_argument("--output-prefix", default="parser_benchmark")
+    return parser
+
+
+def _active_card_keys(cards: list[dict]) -> set[tuple]:
+    return {
+        (bpp._normalize_name_key(c["player_name"]), c["stat_type"], c["line_value"], c["side"])
+        for c in cards
+        if c["player_classification"] == "active_nba"
+    }
+
+
+def run_parser_benchmark(snapshots: list[dict], active_names: list[str]) -> dict:
+    """Time both extraction modes over ``snapshots`` (dicts with ``text_content``).
+
+    ``match_*`` times only the candidate scan over preprocessed text;
+    ``extract_*`` times the full ``extract_prop_cards_from_text`` call.
+    Agreement is the Jaccard overlap of active-player cards across modes.
+    """
+    active_name_keys = {bpp._normalize_name_key(n) for n in active_names} - {""}
+    build_start = time.perf_counter()
+    matcher = bpp.build_name_matcher(active_names)
+    build_seconds = time.perf_counter() - build_start
+
+    totals = {
+        "match_regex": 0.0, "match_names": 0.0,
+        "extract_regex": 0.0, "extract_names": 0.0,
+    }
+    cards = {"regex": 0, "names": 0}
+    active_regex: set = set()
+    active_names_found: set = set()
+    total_bytes = 0
+    for snap in snapshots:
+        raw = str(snap.get("text_content") or "")
+        total_bytes += len(raw.encode("utf-8"))
+        url = str(snap.get("source_url", ""))
+        text = bpp._collapse_whitespace(raw)
+        pre = bpp._run_book_preprocessors(text, url)
+        if pre:
+            text = pre + " " + text
+
+        start = time.perf_counter()
+        sum(1 for _ in bpp._regex_card_matches(text))
+        totals["match_regex"] += time.perf_counter() - start
+        if matcher is not None:
+            start = time.perf_counter()
+            sum(1 for _ in bpp._anchored_card_matches(text, matcher))
+            totals["match_names"] += time.perf_counter() - start
+
+        for mode, name_matcher in (("regex", None), ("names", matcher)):
+            if mode == "names" and matcher is None:
+                continue
+            start = time.perf_counter()
+            found = bpp.extract_prop_cards_from_text(
+                text_content=raw, source_url=url,
+                snapshot_id=int(snap.get("snapshot_id", 0) or 0),
+                observed_at_utc=str(snap.get("fetched_at_utc", "")),
+                active_name_keys=active_name_keys, name_matcher=name_matcher,
+            )
+            totals[f"extract_{mode}"] += time.perf_counter() - start
+            cards[mode] += len(found)
+            keys = {(url,) + key for key in _active_card_keys(found)}
+            (active_regex if mode == "regex" else active_names_found).update(keys)
+
+    megabytes = total_bytes / 1e6
+    union = active_regex | active_names_found
+    summary = {
+        "snapshots": len(snapshots),
+        "megabytes": round(megabytes, 4),
+        "active_names": len(active_names),
+        "matcher_build_seconds": round(build_seconds, 4),
+        "cards_regex": cards["regex"],
+        "cards_names": cards["names"],
+        "active_cards_regex": len(active_regex),
+        "active_cards_names": len(active_names_found),
+        "active_card_agreement": (
+            round(len(active_regex & active_names_found) / len(union), 4) if union else None
+        ),
+    }
+    for key, seconds in totals.items():
+        summary[f"{key}_seconds"] = round(seconds, 4)
+        summary[f"{key}_mb_per_s"] = round(megabytes / seconds, 3) if seconds > 0 else None
+    for stage in ("match", "extract"):
+        regex_s, names_s = totals[f"{stage}_regex"], totals[f"{stage}_names"]
+        summary[f"{stage}_speedup"] = round(regex_s / names_s, 2) if names_s > 0 else None
+    return summary
+
+
+def _write_artifact(summary: dict, output_prefix: str) -> str:
+    ARTIFACT_DIR.mkdir(parents=True, exist_ok=True)
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    markdown_path = ARTIFACT_DIR / f"{output_prefix}_summary_{ts}.md"
+    md_lines = ["# Prop-Card Parser Benchmark", ""]
+    md_lines += [f"- {key}: {value}" for key, value in summary.items()]
+    markdown_path.write_text("\n".join(md_lines), encoding="utf-8")
+    return str(markdown_path)
+
+
+def main():
+    args = _build_parser().parse_args()
+    with DatabaseManager(db_path=args.db_path) as db:
+        refs = db.get_recent_web_text_snapshot_refs(
+            source_urls=args.source_urls,
+            max_snapshots_per_url=args.max_snapshots_per_url,
+            limit_total=args.max_total_snapshots,
+        )
+        snapshots = list(db.iter_web_text_snapshots(refs))
+        active_names = db.get_active_players_reference_names()
+
+    if not snapshots:
+        print("No web_text snapshots available to benchmark.")
+        return
+    if not active_names:
+        print("No active-player reference names; run the active-player sync first.")
+        return
+
+    summary = run_parser_benchmark(snapshots, active_names)
+    print("Parser benchmark summary:")
+    for key, value in summary.items():
+        print(f"  {key}: {value}")
+    if args.write_artifact:
+        print(f"summary_md: {_write_artifact(summary, args.output_prefix)}")
+
+
+if __name__ == "__main__":
+    main()
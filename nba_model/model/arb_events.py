@@ -0,0 +1,395 @@
+"""Event-driven cross-book arb / middle detection (runs on line insert).
+
+``cross_book_arb`` answers "what's open right now?" for a page view by scanning
+every recent line. This module answers it at write time instead: the ingestion
+callers insert through ``insert_betting_lines`` / ``insert_web_prop_cards``
+here, which pass the ``changed_props`` reported by the ``DatabaseManager``
+writers on to the detector, and only those props' current book sets are
+re-evaluated:
+
+    betting_lines   — real two-way prices: TRUE arbs via
+                      ``cross_book_arb.detect_two_way_arb`` plus middles (over at
+                      the lowest priced line, under at the highest).
+    web_prop_cards  — DFS boards carry no real prices, so middles only (the
+                      module-level rule in ``cross_book_arb``: never synthesise
+                      an arb from assumed -110 defaults).
+
+Each prop's latest quote per book is loaded into an in-memory book (one
+windowed query per batch of touched props) and the hits are appended to
+``arb_events`` with the detection timestamp. ``event_key`` fingerprints the
+exact legs + prices, so re-evaluating an unchanged opportunity never appends it
+twice; a new price on either leg is a new event.
+
+Public API:
+    insert_betting_lines(db, records) / insert_web_prop_cards(db, records)
+        -> the writer's summary, with ``arb_events`` in place of ``changed_props``
+    detect_line_events(db, source, prop_keys) -> {"evaluated", "events", "recorded"}
+    fetch_arb_events(db_path, since_hours=..., event_types=..., limit=...)
+        -> newest-first ``ARB_EVENT_COLUMNS`` frame for the UI / API
+"""
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from typing import Iterable, Optional, Sequence
+
+import pandas as pd
+
+from nba_model.data.database.db_manager import DatabaseManager
+from nba_model.model import cross_book_arb as cba
+from nba_model.visualization import player_charts as pc
+
+logger = logging.getLogger(__name__)
+
+EVENT_ARB = "arb"
+EVENT_MIDDLE = cba.OPP_MIDDLE
+SOURCE_BETTING_LINES = "betting_lines"
+SOURCE_WEB_PROP_CARDS = "web_prop_cards"
+# DFS cards have no game_date; a prop's book set is its cards in this window
+# (the cross-book view's default lookback).
+DEFAULT_CARD_WINDOW_HOURS = cba.DEFAULT_SINCE_HOURS
+# Bulk lookups bind a few parameters per prop; stay under SQLite's 999 limit.
+_PROP_CHUNK = 250
+
+ARB_EVENT_COLUMNS = [
+    "event_id", "detected_at_utc", "event_type", "source_table",
+    "player_id", "player_name", "stat_type", "game_date",
+    "over_book", "over_line", "over_odds",
+    "under_book", "under_line", "under_odds",
+    "line_gap", "combined_implied", "guaranteed_margin", "legs",
+]
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _odds_or_none(value) -> Optional[int]:
+    try:
+        odds = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if pd.isna(odds) else int(round(odds))
+
+
+# ---------------------------------------------------------------------------
+# In-memory book: latest quote per book for the touched props
+# ---------------------------------------------------------------------------
+
+def _latest_betting_lines(db: DatabaseManager, keys: Sequence[tuple]) -> pd.DataFrame:
+    """``fetch_two_way_lines``-shaped rows for ``(player_id, stat, game_date)`` keys."""
+    frames = []
+    for start in range(0, len(keys), _PROP_CHUNK):
+        chunk = keys[start:start + _PROP_CHUNK]
+        values = ", ".join("(?, ?, ?)" for _ in chunk)
+        frames.append(pd.read_sql_query(
+            f"""
+            WITH wanted(player_id, stat_type, game_date) AS (VALUES {values}),
+            latest AS (
+                SELECT bl.player_id,
+                       COALESCE(p.name, '') AS player_name,
+                       bl.game_date,
+                       lower(bl.stat_type) AS stat_type,
+                       bl.book,
+                       bl.line_value,
+                       bl.over_odds,
+                       bl.under_odds,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY bl.player_id, lower(bl.stat_type),
+                                        lower(bl.book), bl.game_date
+                           ORDER BY bl.scraped_at DESC, bl.line_id DESC
+                       ) AS rn
+                FROM betting_lines bl
+                JOIN wanted w
+                  ON w.player_id = bl.player_id
+                 AND w.game_date = bl.game_date
+                 AND w.stat_type = lower(bl.stat_type)
+                LEFT JOIN players p ON p.player_id = bl.player_id
+                WHERE bl.line_value IS NOT NULL
+            )
+            SELECT player_id, player_name, game_date, stat_type, book,
+                   line_value, over_odds, under_odds
+            FROM latest WHERE rn = 1
+            ORDER BY player_name ASC, stat_type ASC, game_date ASC, book ASC
+            """,
+            db.conn,
+            params=[v for key in chunk for v in key],
+        ))
+    if not frames:
+        return pd.DataFrame(columns=cba.TWO_WAY_LINE_COLUMNS)
+    df = pd.concat(frames, ignore_index=True)
+    df["stat_type"] = df["stat_type"].map(pc._canonical_stat_type)
+    return df
+
+
+def _latest_prop_cards(
+    db: DatabaseManager, keys: Sequence[tuple], window_hours: float,
+) -> pd.DataFrame:
+    """One line per book for ``(player_key, canonical_stat)`` keys.
+
+    Latest card per (book, side) inside the window, sides collapsed to their
+    median — the same per-book line the edge scanner scores."""
+    names = sorted({player_key for player_key, _ in keys})
+    frames = []
+    for start in range(0, len(names), _PROP_CHUNK):
+        chunk = names[start:start + _PROP_CHUNK]
+        placeholders = ", ".join("?" * len(chunk))
+        frames.append(pd.read_sql_query(
+            f"""
+            SELECT player_name, stat_type, book, side, line_value, observed_at_utc
+            FROM (
+                SELECT player_name, stat_type, book, side, line_value,
+                       observed_at_utc,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY lower(player_name), lower(stat_type),
+                                        lower(book), lower(side)
+                           ORDER BY observed_at_utc DESC, card_id DESC
+                       ) AS rn
+                FROM web_prop_cards
+                WHERE player_classification = 'active_nba'
+                  AND observed_at_utc >= datetime('now', ?)
+                  AND lower(player_name) IN ({placeholders})
+            )
+            WHERE rn = 1
+            """,
+            db.conn,
+            params=(f"-{float(window_hours)} hours", *chunk),
+        ))
+    cards = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    if cards.empty:
+        return pd.DataFrame(columns=["player_key", "player_name", "stat_type",
+                                     "book", "line_value"])
+    cards["player_key"] = cards["player_name"].str.lower()
+    cards["stat_type"] = cards["stat_type"].map(pc._canonical_stat_type)
+    cards["book_key"] = cards["book"].str.lower()
+    wanted = set(keys)
+    cards = cards[[
+        key in wanted for key in zip(cards["player_key"], cards["stat_type"])
+    ]]
+    return (
+        cards.groupby(["player_key", "stat_type", "book_key"], as_index=False)
+        .agg(player_name=("player_name", "first"), book=("book", "first"),
+             line_value=("line_value", "median"))
+    )
+
+
+# ---------------------------------------------------------------------------
+# Evaluation
+# ---------------------------------------------------------------------------
+
+def _middle_event(group: pd.DataFrame, *, over_ok, under_ok) -> Optional[dict]:
+    """Over at the lowest line + under at the highest, when the gap is a middle.
+
+    ``over_ok`` / ``under_ok`` mask the rows that can take each leg (a priced
+    side for betting_lines, any row for DFS). Ties resolve by book name, like
+    ``find_cross_book_opportunities``."""
+    overs = group[over_ok].sort_values(["line_value", "book"])
+    unders = group[under_ok].sort_values(["line_value", "book"])
+    if overs.empty or unders.empty:
+        return None
+    over, under = overs.iloc[0], unders.iloc[-1]
+    if str(over["book"]).lower() == str(under["book"]).lower():
+        return None
+    gap = float(under["line_value"]) - float(over["line_value"])
+    if gap < cba.DEFAULT_MIDDLE_GAP:
+        return None
+    over_odds = _odds_or_none(over.get("over_odds"))
+    under_odds = _odds_or_none(under.get("under_odds"))
+    legs = (
+        f"OVER {float(over['line_value']):g} @ {over['book']}"
+        + (f" ({cba._fmt_odds(over_odds)})" if over_odds is not None else "")
+        + f" + UNDER {float(under['line_value']):g} @ {under['book']}"
+        + (f" ({cba._fmt_odds(under_odds)})" if under_odds is not None else "")
+    )
+    return {
+        "event_type": EVENT_MIDDLE,
+        "over_book": over["book"],
+        "over_line": float(over["line_value"]),
+        "over_odds": over_odds,
+        "under_book": under["book"],
+        "under_line": float(under["line_value"]),
+        "under_odds": under_odds,
+        "line_gap": round(gap, 3),
+        "combined_implied": None,
+        "guaranteed_margin": None,
+        "legs": legs,
+    }
+
+
+def _betting_line_events(lines: pd.DataFrame) -> list[dict]:
+    events: list[dict] = []
+    if lines.empty:
+        return events
+    for arb in cba.detect_two_way_arb(lines).to_dict("records"):
+        events.append({
+            **arb,
+            "event_type": EVENT_ARB,
+            "line_gap": round(arb["under_line"] - arb["over_line"], 3),
+        })
+    if events:
+        # detect_two_way_arb reports names; carry the prop's id alongside.
+        ids = {
+            (name, stat, date): pid
+            for pid, name, stat, date in lines[
+                ["player_id", "player_name", "stat_type", "game_date"]
+            ].itertuples(index=False, name=None)
+        }
+        for event in events:
+            event["player_id"] = ids.get(
+                (event["player_name"], event["stat_type"], event["game_date"]))
+    for (pid, stat, game_date), group in lines.groupby(
+            ["player_id", "stat_type", "game_date"], sort=False):
+        middle = _middle_event(
+            group,
+            over_ok=group["over_odds"].notna(),
+            under_ok=group["under_odds"].notna(),
+        )
+        if middle is not None:
+            events.append({
+                **middle, "player_id": pid, "player_name": group["player_name"].iloc[0],
+                "stat_type": stat, "game_date": game_date,
+            })
+    return events
+
+
+def _prop_card_events(cards: pd.DataFrame) -> list[dict]:
+    events: list[dict] = []
+    for _, group in cards.groupby(["player_key", "stat_type"], sort=False):
+        everyone = pd.Series(True, index=group.index)
+        middle = _middle_event(group, over_ok=everyone, under_ok=everyone)
+        if middle is not None:
+            events.append({
+                **middle, "player_id": None,
+                "player_name": group["player_name"].iloc[0],
+                "stat_type": group["stat_type"].iloc[0], "game_date": None,
+            })
+    return events
+
+
+def _event_key(source: str, event: dict) -> str:
+    player = event.get("player_id") or str(event.get("player_name") or "").lower()
+    return "|".join(str(part) for part in (
+        event["event_type"], source, player, event["stat_type"],
+        event.get("game_date"),
+        str(event["over_book"]).lower(), f"{event['over_line']:g}", event.get("over_odds"),
+        str(event["under_book"]).lower(), f"{event['under_line']:g}",
+        event.get("under_odds"),
+    ))
+
+
+def _record_events(db: DatabaseManager, source: str, events: list[dict]) -> int:
+    """Append events to ``arb_events`` (an identical opportunity is kept once)."""
+    if not events:
+        return 0
+    detected_at = _utc_now()
+    before = db.conn.total_changes
+    db.conn.executemany(
+        """
+        INSERT OR IGNORE INTO arb_events (
+            event_key, detected_at_utc, event_type, source_table,
+            player_id, player_name, stat_type, game_date,
+            over_book, over_line, over_odds, under_book, under_line, under_odds,
+            line_gap, combined_implied, guaranteed_margin, legs
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (
+                _event_key(source, e), detected_at, e["event_type"], source,
+                None if e.get("player_id") is None else int(e["player_id"]),
+                e.get("player_name"), e["stat_type"], e.get("game_date"),
+                e["over_book"], float(e["over_line"]), e.get("over_odds"),
+                e["under_book"], float(e["under_line"]), e.get("under_odds"),
+                e.get("line_gap"), e.get("combined_implied"),
+                e.get("guaranteed_margin"), e.get("legs"),
+            )
+            for e in events
+        ],
+    )
+    db.conn.commit()
+    return db.conn.total_changes - before
+
+
+def detect_line_events(
+    db: DatabaseManager,
+    source: str,
+    prop_keys: Iterable[tuple],
+    *,
+    card_window_hours: float = DEFAULT_CARD_WINDOW_HOURS,
+) -> dict:
+    """Re-evaluate the props whose line just changed; append new hits.
+
+    ``prop_keys`` are ``(player_id, lower(stat_type), game_date)`` for
+    ``source="betting_lines"`` and ``(lower(player_name), stat_type)`` for
+    ``source="web_prop_cards"``. Returns ``{"evaluated", "events",
+    "recorded"}`` — ``recorded`` counts only events not already in the table."""
+    keys = sorted(set(prop_keys), key=str)
+    if source == SOURCE_BETTING_LINES:
+        events = _betting_line_events(_latest_betting_lines(db, keys))
+    elif source == SOURCE_WEB_PROP_CARDS:
+        keys = sorted({(name, pc._canonical_stat_type(stat)) for name, stat in keys})
+        events = _prop_card_events(_latest_prop_cards(db, keys, card_window_hours))
+    else:
+        raise ValueError(f"unknown line source {source!r}")
+    recorded = _record_events(db, source, events)
+    if recorded:
+        logger.info("Recorded %s new arb/middle events from %s", recorded, source)
+    return {"evaluated": len(keys), "events": len(events), "recorded": int(recorded)}
+
+
+def _detect_best_effort(db: DatabaseManager, source: str, summary: dict) -> dict:
+    """Swap the insert summary's ``changed_props`` for a detection summary.
+
+    A detector failure is logged and never fails the insert that triggered
+    it; ``arb_events`` is ``None`` when nothing changed or detection failed."""
+    prop_keys = summary.pop("changed_props", None)
+    summary["arb_events"] = None
+    if prop_keys:
+        try:
+            summary["arb_events"] = detect_line_events(db, source, prop_keys)
+        except Exception as exc:  # noqa: BLE001 — never block the line insert
+            logger.warning("arb/middle detection on %s insert failed: %s", source, exc)
+    return summary
+
+
+def insert_betting_lines(db: DatabaseManager, records) -> dict:
+    """``insert_betting_lines_records``, then detection on the props it changed."""
+    return _detect_best_effort(
+        db, SOURCE_BETTING_LINES, db.insert_betting_lines_records(records),
+    )
+
+
+def insert_web_prop_cards(db: DatabaseManager, records) -> dict:
+    """``insert_web_prop_cards``, then middle detection on the props it changed."""
+    return _detect_best_effort(
+        db, SOURCE_WEB_PROP_CARDS, db.insert_web_prop_cards(records),
+    )
+
+
+def fetch_arb_events(
+    db_path: str,
+    *,
+    since_hours: Optional[float] = 24.0,
+    event_types: Optional[Sequence[str]] = None,
+    limit: int = 200,
+) -> pd.DataFrame:
+    """Newest-first ``arb_events`` rows detected within ``since_hours``."""
+    clauses = ["1 = 1"]
+    params: list = []
+    if since_hours and since_hours > 0:
+        clauses.append("detected_at_utc >= datetime('now', ?)")
+        params.append(f"-{float(since_hours)} hours")
+    if event_types:
+        clauses.append(f"event_type IN ({','.join('?' * len(event_types))})")
+        params.extend(event_types)
+    params.append(int(limit))
+    with DatabaseManager(db_path=db_path) as db:
+        return pd.read_sql_query(
+            f"""
+            SELECT {", ".join(ARB_EVENT_COLUMNS)}
+            FROM arb_events
+            WHERE {" AND ".join(clauses)}
+            ORDER BY detected_at_utc DESC, event_id DESC
+            LIMIT ?
+            """,
+            db.conn, params=tuple(params),
+        )
@@ -2,8 +2,9 @@
 
 Per-book regex / preprocessing lives under ``nba_model.scrapers``.  This
 module orchestrates: it pulls the visible-text snapshots from the DB, runs
-each registered book's preprocessor over them, applies a small set of
-generic ``Player Line Stat Side`` patterns, and writes the results to the
+the preprocessor(s) of the book each snapshot came from (every registered
+one only for unknown domains), applies a small set of generic
+``Player Line Stat Side`` patterns, and writes the results to the
 ``web_prop_cards`` table.
 """
 
@@ -11,13 +12,18 @@ import argparse
 import hashlib
 import logging
 import re
+import time
+from functools import partial
 from typing import Optional
 from urllib.parse import urlparse
 
 from nba_model.data.database.db_manager import DatabaseManager
+from nba_model.model.incremental_scan import TextDiff, rescan_items
+from nba_model.model.snapshot_pool import map_ordered
 from nba_model.model.web_text_ingestion import detect_login_wall, load_urls_from_file
 from nba_model.scrapers import SCRAPERS, get_scraper_for_url
 from nba_model.scrapers.base import NAME_STOP_WORDS
+from nba_model.scrapers.player_names import name_variants
 # Re-exported for backward compatibility — tests import these from this module.
 from nba_model.scrapers.prizepicks import preprocess as _preprocess_prizepicks_text  # noqa: F401
 from nba_model.scrapers.underdog import preprocess as _preprocess_underdog_text  # noqa: F401
@@ -28,6 +34,10 @@ PARSER_VERSION = "visible_text_v2"
 DEFAULT_MIN_PARSE_CONFIDENCE = 0.45
 DEFAULT_MAX_SNAPSHOTS_PER_URL = 1
 DEFAULT_MAX_TOTAL_SNAPSHOTS = 250
+# parse_ledger consumer name; snapshots whose text was already parsed by this
+# PARSER_VERSION are skipped, and a version bump reparses history in batches.
+LEDGER_PARSER = "prop_cards"
+DEFAULT_BACKLOG_LIMIT = 0
 
 _SIDE_MAP = {
     "higher": "over",
@@ -156,6 +166,40 @@ _CARD_PATTERNS = [
 
 _NOISE_HINTS = {"loading", "login", "sign in", "create account", "mobile web is coming"}
 
+# Extraction modes. "regex" scans the page with the generic _CARD_PATTERNS;
+# "names" anchors on known active-player names (see build_name_matcher) and
+# parses side / line / stat locally after each hit, so the broad name regex
+# never backtracks over long pages. Only known names are extracted in "names"
+# mode, so it yields no non_nba cards.
+EXTRACTION_MODES = ("regex", "names")
+
+# After an anchored name: up to two team-abbreviation tokens ("LAL"), then the
+# same three side / line / stat orders as _CARD_PATTERNS, matched in place.
+_LOCAL_TEAM_TOKENS = r"(?:\s+(?-i:[A-Z]{2,4})\b){0,2}"
+_LOCAL_CARD_PATTERNS = [
+    re.compile(
+        _LOCAL_TEAM_TOKENS
+        + rf"\s+(?P<side>{_SIDE_PATTERN})\s+"
+        rf"(?P<line>{_LINE_PATTERN})\s+"
+        rf"(?P<stat>{_STAT_PATTERN})\b",
+        flags=re.IGNORECASE,
+    ),
+    re.compile(
+        _LOCAL_TEAM_TOKENS
+        + rf"\s+(?P<line>{_LINE_PATTERN})\s+"
+        rf"(?P<stat>{_STAT_PATTERN})\s+"
+        rf"(?P<side>{_SIDE_PATTERN})\b",
+        flags=re.IGNORECASE,
+    ),
+    re.compile(
+        _LOCAL_TEAM_TOKENS
+        + rf"\s+(?P<stat>{_STAT_PATTERN})\s+"
+        rf"(?P<line>{_LINE_PATTERN})\s+"
+        rf"(?P<side>{_SIDE_PATTERN})\b",
+        flags=re.IGNORECASE,
+    ),
+]
+
 
 def _collapse_whitespace(text: str) -> str:
     """Collapse repeated whitespace into one space."""
@@ -259,6 +303,197 @@ def _infer_book_from_url(source_url: str) -> str:
     return "unknown"
 
 
+def _trie_pattern(phrases: list[str]) -> str:
+    """Regex for ``phrases`` factored into a character trie.
+
+    Shared prefixes are matched once, so the compiled pattern behaves like a
+    multi-pattern automaton: one left-to-right pass with no alternation
+    fan-out. An optional tail is tried longest-first.
+    """
+    trie: dict = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [
+            re.escape(char) + build(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        terminal = "" in node
+        if len(branches) == 1 and not terminal:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if terminal else group
+
+    return build(trie)
+
+
+def build_name_matcher(player_names) -> Optional[re.Pattern]:
+    """Compile known player names into one anchored matcher (``"names"`` mode).
+
+    Each name contributes its ``player_names.name_variants`` surface forms;
+    matching is case-insensitive and bounded so a name never starts or ends
+    mid-word. Returns ``None`` when there are no usable names.
+    """
+    variants = set()
+    for name in player_names or []:
+        variants |= {_collapse_whitespace(form).lower() for form in name_variants(name)}
+    variants.discard("")
+    if not variants:
+        return None
+    return re.compile(
+        r"(?<![A-Za-z0-9'.\-])(?P<player>"
+        + _trie_pattern(sorted(variants))
+        + r")(?![A-Za-z0-9'\-])",
+        flags=re.IGNORECASE,
+    )
+
+
+def _regex_card_matches(text: str):
+    """``(player, side, line, stat, raw)`` candidates from _CARD_PATTERNS."""
+    for pattern in _CARD_PATTERNS:
+        for match in pattern.finditer(text):
+            yield (
+                match.group("player"), match.group("side"), match.group("line"),
+                match.group("stat"), match.group(0),
+            )
+
+
+def _anchored_card_matches(text: str, name_matcher: re.Pattern):
+    """Candidates parsed in place after each known-name hit.
+
+    Emitted pattern by pattern, in text order within each, like
+    ``_regex_card_matches``, so first-wins dedupe behaves the same.
+    """
+    hits = [(hit.start(), hit.end(), hit.group("player")) for hit in name_matcher.finditer(text)]
+    for pattern in _LOCAL_CARD_PATTERNS:
+        for start, end, player in hits:
+            match = pattern.match(text, end)
+            if match is None:
+                continue
+            yield (
+                player, match.group("side"), match.group("line"),
+                match.group("stat"), text[start:match.end()],
+            )
+
+
+# Incremental extraction (``incremental_scan``): no match attempt of either
+# mode looks further ahead than this many tokens — four name words or one
+# known name, two team tokens, side, line and a multi-word stat alias.
+_RESCAN_PAD_TOKENS = 32
+
+
+def scanner_key(name_matcher: Optional[re.Pattern] = None) -> str:
+    """Fingerprint of the candidate scan: parser version, mode and patterns.
+
+    A stored scan state is only diffed against when its key matches, so a
+    pattern edit or a changed active-player list starts from a full scan.
+    """
+    if name_matcher is not None:
+        patterns = [name_matcher.pattern] + [p.pattern for p in _LOCAL_CARD_PATTERNS]
+    else:
+        patterns = [p.pattern for p in _CARD_PATTERNS]
+    mode = "names" if name_matcher is not None else "regex"
+    payload = "\n".join([PARSER_VERSION, mode] + patterns)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _card_item_searches(text: str, name_matcher: Optional[re.Pattern] = None) -> list:
+    """One ``search(pos, endpos)`` per candidate stream, for ``rescan_items``.
+
+    Items are ``(start, end, extent, cards)``; each card is ``(slot, player,
+    side, line, stat, length)`` with ``length`` relative to ``start``, so a
+    carried-over item needs no rewriting. ``slot`` is the pattern index that
+    orders candidates like ``_regex_card_matches`` / ``_anchored_card_matches``.
+    """
+    def regex_search(slot: int, pattern: re.Pattern):
+        def search(pos: int, endpos: int):
+            match = pattern.search(text, pos, endpos)
+            if match is None:
+                return None
+            start, end = match.span()
+            card = (
+                slot, match.group("player"), match.group("side"),
+                match.group("line"), match.group("stat"), end - start,
+            )
+            return (start, end, end, (card,))
+        return search
+
+    def names_search(pos: int, endpos: int):
+        while True:
+            hit = name_matcher.search(text, pos, endpos)
+            if hit is None:
+                return None
+            start, end = hit.span()
+            cards = []
+            for slot, pattern in enumerate(_LOCAL_CARD_PATTERNS):
+                match = pattern.match(text, end)
+                if match is not None:
+                    cards.append((
+                        slot, hit.group("player"), match.group("side"),
+                        match.group("line"), match.group("stat"), match.end() - start,
+                    ))
+            if cards:
+                extent = start + max(card[5] for card in cards)
+                return (start, end, extent, tuple(cards))
+            pos = end
+
+    if name_matcher is not None:
+        return [names_search]
+    return [regex_search(slot, pattern) for slot, pattern in enumerate(_CARD_PATTERNS)]
+
+
+def scan_card_items(
+    text: str,
+    name_matcher: Optional[re.Pattern] = None,
+    previous_scan: Optional[dict] = None,
+) -> dict:
+    """Candidate items of a preprocessed snapshot text, reusing a previous scan.
+
+    ``previous_scan`` is an earlier return value (``{"text", "items"}``) for
+    the same URL and ``scanner_key``; only regions that changed since are
+    searched again. The result also reports ``changed_chars`` (``None`` for a
+    full scan).
+    """
+    searches = _card_item_searches(text, name_matcher)
+    diff = None
+    old_streams = [[] for _ in searches]
+    if previous_scan and len(previous_scan.get("items") or []) == len(searches):
+        diff = TextDiff(str(previous_scan.get("text", "")), text, _RESCAN_PAD_TOKENS)
+        old_streams = previous_scan["items"]
+    items = [
+        rescan_items(search, len(text), old_items, diff)
+        for search, old_items in zip(searches, old_streams)
+    ]
+    return {
+        "text": text,
+        "items": items,
+        "changed_chars": diff.changed_chars() if diff is not None else None,
+    }
+
+
+def _scan_candidates(scan: dict):
+    """``(player, side, line, stat, raw)`` candidates in first-wins order."""
+    text = scan["text"]
+    cards = sorted(
+        (
+            (card[0], item[0], card)
+            for stream in scan["items"]
+            for item in stream
+            for card in item[3]
+        ),
+        key=lambda entry: (entry[0], entry[1]),
+    )
+    for _, start, card in cards:
+        yield card[1], card[2], card[3], card[4], text[start:start + card[5]]
+
+
 def _compute_parse_confidence(
     player_name: str,
     stat_type: str,
@@ -304,20 +539,44 @@ def _build_record_sha256(
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
-def _run_book_preprocessors(text: str) -> str:
-    """Run every registered scraper's preprocessor over ``text``.
+# Book name -> preprocessors of every config for that book (one per sport),
+# so a snapshot only pays for its own site's parsing.
+_PREPROCESSORS_BY_BOOK: dict[str, tuple] = {}
+for _scraper in SCRAPERS:
+    if _scraper.prop_preprocess is not None:
+        _PREPROCESSORS_BY_BOOK.setdefault(_scraper.name, ())
+        _PREPROCESSORS_BY_BOOK[_scraper.name] += (_scraper.prop_preprocess,)
+del _scraper
+_ALL_PREPROCESSORS = tuple(
+    scraper.prop_preprocess for scraper in SCRAPERS if scraper.prop_preprocess is not None
+)
+
+
+def _preprocessors_for_url(source_url: Optional[str]) -> tuple:
+    """Preprocessors to run for a snapshot from ``source_url``.
+
+    A URL the scraper registry resolves gets only its book's preprocessors
+    (none for config-only stubs); an unknown or missing domain falls back to
+    every registered preprocessor.
+    """
+    scraper = get_scraper_for_url(source_url) if source_url else None
+    if scraper is None:
+        return _ALL_PREPROCESSORS
+    return _PREPROCESSORS_BY_BOOK.get(scraper.name, ())
+
+
+def _run_book_preprocessors(text: str, source_url: Optional[str] = None) -> str:
+    """Run the snapshot's book preprocessor(s) over ``text``.
 
     Each preprocessor that recognizes its book's UI shape returns a
     normalized "Player Line Stat Side" segment.  The aggregated segments
     are prepended to the original text so the generic ``_CARD_PATTERNS``
-    can match them.
+    can match them.  See ``_preprocessors_for_url`` for the dispatch.
     """
     parts: list[str] = []
-    for scraper in SCRAPERS:
-        if scraper.prop_preprocess is None:
-            continue
+    for preprocess in _preprocessors_for_url(source_url):
         try:
-            chunk = scraper.prop_preprocess(text)
+            chunk = preprocess(text)
         except Exception:
             chunk = ""
         if chunk:
@@ -331,206 +590,417 @@ def extract_prop_cards_from_text(
     snapshot_id: int,
     observed_at_utc: str,
     active_name_keys: set[str],
+    name_matcher: Optional[re.Pattern] = None,
 ) -> list[dict]:
     """
     Extract prop card candidates from visible page text.
 
     Returns parsed rows in DB-ready shape, including classification + confidence.
+    With a ``name_matcher`` (``build_name_matcher``) cards are anchored at
+    known-name positions instead of the generic ``_CARD_PATTERNS`` scan.
     """
-    text = _collapse_whitespace(text_content)
+    text = _scan_text(text_content, source_url)
     if not text:
         return []
+    if name_matcher is not None:
+        candidates = _anchored_card_matches(text, name_matcher)
+    else:
+        candidates = _regex_card_matches(text)
+    return _records_from_candidates(
+        candidates, source_url, snapshot_id, observed_at_utc, active_name_keys,
+    )
+
 
-    preprocessed = _run_book_preprocessors(text)
+def extract_prop_cards_incremental(
+    text_content: str,
+    source_url: str,
+    snapshot_id: int,
+    observed_at_utc: str,
+    active_name_keys: set[str],
+    name_matcher: Optional[re.Pattern] = None,
+    previous_scan: Optional[dict] = None,
+) -> tuple[list[dict], Optional[dict]]:
+    """``extract_prop_cards_from_text`` that re-scans only what changed.
+
+    Returns the same records plus this text's scan (``scan_card_items``) to
+    pass as ``previous_scan`` for the URL's next snapshot. Book preprocessors
+    still run over the whole page; only the card-pattern scan is incremental.
+    """
+    text = _scan_text(text_content, source_url)
+    if not text:
+        return [], None
+    scan = scan_card_items(text, name_matcher, previous_scan)
+    records = _records_from_candidates(
+        _scan_candidates(scan), source_url, snapshot_id, observed_at_utc, active_name_keys,
+    )
+    return records, scan
+
+
+def _scan_text(text_content: str, source_url: str) -> str:
+    """Collapsed page text with the book preprocessors' segments prepended."""
+    text = _collapse_whitespace(text_content)
+    if not text:
+        return ""
+    preprocessed = _run_book_preprocessors(text, source_url)
     if preprocessed:
         text = preprocessed + " " + text
+    return text
+
 
+def _records_from_candidates(
+    candidates,
+    source_url: str,
+    snapshot_id: int,
+    observed_at_utc: str,
+    active_name_keys: set[str],
+) -> list[dict]:
+    """Validate, dedupe (first wins), classify and score raw candidates."""
     records: list[dict] = []
     seen_card_keys: set[tuple] = set()
     book = _infer_book_from_url(source_url)
+    for raw_player, raw_side, raw_line, raw_stat, raw_match in candidates:
+        player_name = _clean_player_name(raw_player)
+        side = _canonicalize_side(raw_side)
+        line_value = _parse_line_value(raw_line)
+        stat_type = _canonicalize_stat(raw_stat)
+        if not player_name or side is None or line_value is None or stat_type is None:
+            continue
 
-    for pattern in _CARD_PATTERNS:
-        for match in pattern.finditer(text):
-            player_name = _clean_player_name(match.group("player"))
-            side = _canonicalize_side(match.group("side"))
-            line_value = _parse_line_value(match.group("line"))
-            stat_type = _canonicalize_stat(match.group("stat"))
-            if not player_name or side is None or line_value is None or stat_type is None:
-                continue
-
-            dedupe_key = (
-                _normalize_name_key(player_name),
-                stat_type,
-                round(line_value, 3),
-                side,
-            )
-            if dedupe_key in seen_card_keys:
-                continue
-            seen_card_keys.add(dedupe_key)
+        dedupe_key = (
+            _normalize_name_key(player_name),
+            stat_type,
+            round(line_value, 3),
+            side,
+        )
+        if dedupe_key in seen_card_keys:
+            continue
+        seen_card_keys.add(dedupe_key)
 
-            player_key = _normalize_name_key(player_name)
-            classification = (
-                "active_nba" if player_key in active_name_keys else "non_nba"
-            )
-            raw_card_text = _collapse_whitespace(match.group(0))[:300]
-            parse_confidence = _compute_parse_confidence(
-                player_name=player_name,
-                stat_type=stat_type,
-                line_value=line_value,
-                side=side,
-                classification=classification,
-                raw_card_text=raw_card_text,
-            )
-            records.append(
-                {
-                    "snapshot_id": int(snapshot_id),
-                    "source_url": str(source_url).strip(),
-                    "book": book,
-                    "observed_at_utc": str(observed_at_utc).strip(),
-                    "player_name": player_name,
-                    "player_classification": classification,
-                    "stat_type": stat_type,
-                    "line_value": float(line_value),
-                    "side": side,
-                    "parse_confidence": float(parse_confidence),
-                    "raw_card_text": raw_card_text,
-                    "parser_version": PARSER_VERSION,
-                    "record_sha256": _build_record_sha256(
-                        snapshot_id=int(snapshot_id),
-                        source_url=str(source_url).strip(),
-                        player_name=player_name,
-                        stat_type=stat_type,
-                        line_value=float(line_value),
-                        side=side,
-                        raw_card_text=raw_card_text,
-                    ),
-                }
-            )
+        player_key = _normalize_name_key(player_name)
+        classification = (
+            "active_nba" if player_key in active_name_keys else "non_nba"
+        )
+        raw_card_text = _collapse_whitespace(raw_match)[:300]
+        parse_confidence = _compute_parse_confidence(
+            player_name=player_name,
+            stat_type=stat_type,
+            line_value=line_value,
+            side=side,
+            classification=classification,
+            raw_card_text=raw_card_text,
+        )
+        records.append(
+            {
+                "snapshot_id": int(snapshot_id),
+                "source_url": str(source_url).strip(),
+                "book": book,
+                "observed_at_utc": str(observed_at_utc).strip(),
+                "player_name": player_name,
+                "player_classification": classification,
+                "stat_type": stat_type,
+                "line_value": float(line_value),
+                "side": side,
+                "parse_confidence": float(parse_confidence),
+                "raw_card_text": raw_card_text,
+                "parser_version": PARSER_VERSION,
+                "record_sha256": _build_record_sha256(
+                    snapshot_id=int(snapshot_id),
+                    source_url=str(source_url).strip(),
+                    player_name=player_name,
+                    stat_type=stat_type,
+                    line_value=float(line_value),
+                    side=side,
+                    raw_card_text=raw_card_text,
+                ),
+            }
+        )
     return records
 
 
+def _parse_snapshot(
+    snapshot: dict,
+    active_name_keys: set[str],
+    name_matcher: Optional[re.Pattern] = None,
+    incremental: bool = False,
+) -> dict:
+    """Parse one snapshot's text; pure, so ``--workers`` can run it in a pool.
+
+    Returns the snapshot's metadata (without its text), the extracted cards,
+    the extraction time, and the login-wall reason when it was skipped.
+    ``incremental`` diffs against the snapshot's ``previous_scan`` and also
+    returns this text's ``scan`` with the ``changed_chars`` it re-scanned.
+    """
+    text_content = snapshot.get("text_content", "")
+    source_url = str(snapshot.get("source_url", ""))
+    meta = {
+        key: value for key, value in snapshot.items()
+        if key not in ("text_content", "previous_scan")
+    }
+    # Guard: a login/paywall snapshot must not be parsed, or the generic
+    # card regexes scrape UI junk into web_prop_cards. Skip + record it.
+    is_wall, wall_reason = detect_login_wall(text_content, source_url)
+    if is_wall:
+        return {
+            "snapshot": meta,
+            "records": [],
+            "parse_seconds": 0.0,
+            "skipped_login_wall": wall_reason,
+        }
+    started = time.perf_counter()
+    kwargs = {
+        "text_content": text_content,
+        "source_url": source_url,
+        "snapshot_id": int(snapshot.get("snapshot_id")),
+        "observed_at_utc": str(snapshot.get("fetched_at_utc", "")),
+        "active_name_keys": active_name_keys,
+        "name_matcher": name_matcher,
+    }
+    scan = None
+    if incremental:
+        records, scan = extract_prop_cards_incremental(
+            previous_scan=snapshot.get("previous_scan"), **kwargs,
+        )
+    else:
+        records = extract_prop_cards_from_text(**kwargs)
+    return {
+        "snapshot": meta,
+        "records": records,
+        "parse_seconds": time.perf_counter() - started,
+        "skipped_login_wall": None,
+        "scan": scan,
+    }
+
+
+def _ledger_entry(snapshot: dict, status: str, extracted: int = 0, retained: int = 0) -> dict:
+    """``parse_ledger`` entry for a handled snapshot (without its page text)."""
+    return {
+        "content_sha256": snapshot.get("content_sha256"),
+        "source_url": snapshot.get("source_url"),
+        "snapshot_id": snapshot.get("snapshot_id"),
+        "fetched_at_utc": snapshot.get("fetched_at_utc"),
+        "status": status,
+        "records_extracted": int(extracted),
+        "records_retained": int(retained),
+    }
+
+
 def parse_and_store_web_prop_cards(
     db_path: str = "data/database/nba_data.db",
     source_urls: Optional[list[str]] = None,
     max_snapshots_per_url: int = DEFAULT_MAX_SNAPSHOTS_PER_URL,
     max_total_snapshots: int = DEFAULT_MAX_TOTAL_SNAPSHOTS,
     min_parse_confidence: float = DEFAULT_MIN_PARSE_CONFIDENCE,
+    backlog_limit: int = DEFAULT_BACKLOG_LIMIT,
+    workers: int = 1,
+    extraction_mode: str = "regex",
+    incremental: bool = False,
 ) -> dict:
-    """Parse recent web snapshots into structured prop-card rows."""
+    """Parse recent web snapshots into structured prop-card rows.
+
+    A recent snapshot whose text is already its URL's head in ``parse_ledger``
+    for this ``PARSER_VERSION`` is skipped. ``backlog_limit`` additionally
+    parses up to that many older snapshot texts this version has never seen
+    (oldest first), so a version bump reparses history once, in batches.
+    ``workers`` > 1 extracts on a process pool; results come back in snapshot
+    order and are inserted here in one batch, exactly as a serial run.
+    ``extraction_mode="names"`` anchors cards on the active-player names
+    (``build_name_matcher``) instead of the generic regex scan.
+    ``incremental=True`` diffs each snapshot against its URL's stored scan
+    (``parse_scan_state``) and re-scans only the changed regions; the cards
+    are identical to a full parse.
+    """
+    if extraction_mode not in EXTRACTION_MODES:
+        raise ValueError(
+            f"extraction_mode must be one of {EXTRACTION_MODES}, got {extraction_mode!r}"
+        )
     normalized_urls = _normalize_urls(source_urls or [])
     with DatabaseManager(db_path=db_path) as db:
-        snapshots = db.get_recent_web_text_snapshots(
+        # Metadata only — page text is streamed one snapshot at a time below
+        # so peak memory doesn't grow with the snapshot archive.
+        snapshot_refs = db.get_recent_web_text_snapshot_refs(
             source_urls=normalized_urls if normalized_urls else None,
             max_snapshots_per_url=max_snapshots_per_url,
             limit_total=max_total_snapshots,
         )
         active_names = db.get_active_players_reference_names()
 
-    if not snapshots:
-        return {
-            "status": "skipped",
-            "reason": "No web_text snapshots available for parsing.",
-            "urls_considered": int(len(normalized_urls)),
-            "snapshots_considered": 0,
-            "cards_extracted": 0,
-            "cards_retained": 0,
-            "db_inserted": 0,
-            "db_attempted": 0,
-            "active_reference_count": int(len(active_names)),
-            "results": [],
+        if not snapshot_refs:
+            return {
+                "status": "skipped",
+                "reason": "No web_text snapshots available for parsing.",
+                "urls_considered": int(len(normalized_urls)),
+                "snapshots_considered": 0,
+                "snapshots_skipped_unchanged": 0,
+                "snapshots_backlog": 0,
+                "cards_extracted": 0,
+                "cards_retained": 0,
+                "db_inserted": 0,
+                "db_attempted": 0,
+                "active_reference_count": int(len(active_names)),
+                "parse_seconds_by_book": {},
+                "results": [],
+            }
+
+        heads = db.get_parse_ledger_heads(
+            LEDGER_PARSER, PARSER_VERSION, [ref["source_url"] for ref in snapshot_refs],
+        )
+        pending_refs = [
+            ref for ref in snapshot_refs
+            if not ref.get("content_sha256")
+            or heads.get(ref["source_url"]) != ref["content_sha256"]
+        ]
+        backlog_refs = db.get_parse_backlog_refs(
+            LEDGER_PARSER, PARSER_VERSION, backlog_limit,
+            source_urls=normalized_urls or None,
+            exclude_sha256={ref.get("content_sha256") for ref in snapshot_refs},
+        )
+
+        threshold = float(min_parse_confidence)
+        active_name_keys = {
+            _normalize_name_key(name)
+            for name in active_names
+            if _normalize_name_key(name)
         }
+        all_records: list[dict] = []
+        results: list[dict] = []
+        total_extracted = 0
+        total_retained = 0
+        retained_active = 0
+        retained_non_nba = 0
+        snapshots_login_walled = 0
+        parse_seconds_by_book: dict[str, float] = {}
+        ledger_entries: list[dict] = []
 
-    threshold = float(min_parse_confidence)
-    active_name_keys = {
-        _normalize_name_key(name)
-        for name in active_names
-        if _normalize_name_key(name)
-    }
-    all_records: list[dict] = []
-    results: list[dict] = []
-    total_extracted = 0
-    total_retained = 0
-    retained_active = 0
-    retained_non_nba = 0
-    snapshots_login_walled = 0
-
-    for snapshot in snapshots:
-        text_content = snapshot.get("text_content", "")
-        source_url = str(snapshot.get("source_url", ""))
-        # Guard: a login/paywall snapshot must not be parsed, or the generic
-        # card regexes scrape UI junk into web_prop_cards. Skip + record it.
-        is_wall, wall_reason = detect_login_wall(text_content, source_url)
-        if is_wall:
-            snapshots_login_walled += 1
+        name_matcher = (
+            build_name_matcher(active_names) if extraction_mode == "names" else None
+        )
+        parse = partial(
+            _parse_snapshot, active_name_keys=active_name_keys, name_matcher=name_matcher,
+            incremental=incremental,
+        )
+        snapshots = db.iter_web_text_snapshots(pending_refs + backlog_refs)
+        key = scanner_key(name_matcher)
+        newest_scans: dict[str, dict] = {}
+        last_scans: dict[str, dict] = {}
+        snapshots_incremental = 0
+        if incremental:
+            previous_scans = db.get_parse_scan_states(
+                key, {ref["source_url"] for ref in pending_refs + backlog_refs},
+            )
+            # Lazy, so each snapshot diffs against the scan parsed just before it
+            # for its URL in this run (with workers, up to the chunks in flight).
+            snapshots = (
+                dict(snap, previous_scan=last_scans.get(
+                    snap["source_url"], previous_scans.get(snap["source_url"]),
+                ))
+                for snap in snapshots
+            )
+        for outcome in map_ordered(parse, snapshots, workers=workers):
+            snapshot = outcome["snapshot"]
+            source_url = str(snapshot.get("source_url", ""))
+            book = _infer_book_from_url(source_url)
+            wall_reason = outcome["skipped_login_wall"]
+            if wall_reason:
+                snapshots_login_walled += 1
+                results.append(
+                    {
+                        "snapshot_id": snapshot.get("snapshot_id"),
+                        "source_url": snapshot.get("source_url"),
+                        "book": book,
+                        "extracted_count": 0,
+                        "retained_count": 0,
+                        "skipped_login_wall": wall_reason,
+                    }
+                )
+                logger.warning(
+                    "Skipping login-walled snapshot %s (%s): %s",
+                    snapshot.get("snapshot_id"),
+                    source_url,
+                    wall_reason,
+                )
+                ledger_entries.append(_ledger_entry(snapshot, "login_wall"))
+                continue
+            parsed = outcome["records"]
+            parse_seconds = outcome["parse_seconds"]
+            scan = outcome.get("scan")
+            if scan is not None:
+                snapshots_incremental += int(scan["changed_chars"] is not None)
+                last_scans[source_url] = {"text": scan["text"], "items": scan["items"]}
+                order = (str(snapshot.get("fetched_at_utc", "")), snapshot.get("snapshot_id"))
+                current = newest_scans.get(source_url)
+                if current is None or order >= current["order"]:
+                    newest_scans[source_url] = {
+                        "order": order,
+                        "source_url": source_url,
+                        "snapshot_id": snapshot.get("snapshot_id"),
+                        "fetched_at_utc": snapshot.get("fetched_at_utc"),
+                        "state": {"text": scan["text"], "items": scan["items"]},
+                    }
+            parse_seconds_by_book[book] = parse_seconds_by_book.get(book, 0.0) + parse_seconds
+            total_extracted += len(parsed)
+            retained = [
+                row for row in parsed if float(row.get("parse_confidence", 0.0)) >= threshold
+            ]
+            total_retained += len(retained)
+            retained_active += sum(
+                1 for row in retained if row.get("player_classification") == "active_nba"
+            )
+            retained_non_nba += sum(
+                1 for row in retained if row.get("player_classification") == "non_nba"
+            )
+            all_records.extend(retained)
             results.append(
                 {
                     "snapshot_id": snapshot.get("snapshot_id"),
                     "source_url": snapshot.get("source_url"),
-                    "book": _infer_book_from_url(source_url),
-                    "extracted_count": 0,
-                    "retained_count": 0,
-                    "skipped_login_wall": wall_reason,
+                    "book": book,
+                    "extracted_count": int(len(parsed)),
+                    "retained_count": int(len(retained)),
+                    "parse_seconds": round(parse_seconds, 4),
                 }
             )
-            logger.warning(
-                "Skipping login-walled snapshot %s (%s): %s",
-                snapshot.get("snapshot_id"),
-                source_url,
-                wall_reason,
+            ledger_entries.append(
+                _ledger_entry(snapshot, "parsed", len(parsed), len(retained))
             )
-            continue
-        parsed = extract_prop_cards_from_text(
-            text_content=text_content,
-            source_url=source_url,
-            snapshot_id=int(snapshot.get("snapshot_id")),
-            observed_at_utc=str(snapshot.get("fetched_at_utc", "")),
-            active_name_keys=active_name_keys,
-        )
-        total_extracted += len(parsed)
-        retained = [
-            row for row in parsed if float(row.get("parse_confidence", 0.0)) >= threshold
-        ]
-        total_retained += len(retained)
-        retained_active += sum(
-            1 for row in retained if row.get("player_classification") == "active_nba"
-        )
-        retained_non_nba += sum(
-            1 for row in retained if row.get("player_classification") == "non_nba"
-        )
-        all_records.extend(retained)
-        results.append(
-            {
-                "snapshot_id": snapshot.get("snapshot_id"),
-                "source_url": snapshot.get("source_url"),
-                "book": _infer_book_from_url(str(snapshot.get("source_url", ""))),
-                "extracted_count": int(len(parsed)),
-                "retained_count": int(len(retained)),
-            }
-        )
 
-    db_summary = {"inserted": 0, "attempted": 0, "skipped_unchanged": 0}
-    if all_records:
-        with DatabaseManager(db_path=db_path) as db:
-            db_summary = db.insert_web_prop_cards(all_records)
+        db_summary = {"inserted": 0, "attempted": 0, "skipped_unchanged": 0}
+        if all_records:
+            # Imported here: arb_events pulls in the charting stack.
+            from nba_model.model.arb_events import insert_web_prop_cards
+            db_summary = insert_web_prop_cards(db, all_records)
+        db.record_parse_ledger(LEDGER_PARSER, PARSER_VERSION, ledger_entries)
+        if newest_scans:
+            db.upsert_parse_scan_states(key, newest_scans.values())
 
     status = "success"
-    if total_extracted == 0:
+    if not ledger_entries:
+        status = "skipped"
+    elif total_extracted == 0:
         status = "partial_success"
 
     return {
         "status": status,
         "urls_considered": int(len(normalized_urls)),
-        "snapshots_considered": int(len(snapshots)),
+        "snapshots_considered": int(len(snapshot_refs)),
+        "snapshots_skipped_unchanged": int(len(snapshot_refs) - len(pending_refs)),
+        "snapshots_backlog": int(len(backlog_refs)),
         "snapshots_login_walled": int(snapshots_login_walled),
         "cards_extracted": int(total_extracted),
         "cards_retained": int(total_retained),
         "cards_retained_active_nba": int(retained_active),
         "cards_retained_non_nba": int(retained_non_nba),
         "min_parse_confidence": float(threshold),
+        "extraction_mode": extraction_mode,
+        "incremental": bool(incremental),
+        "snapshots_incremental": int(snapshots_incremental),
         "db_inserted": int(db_summary.get("inserted", 0)),
         "db_attempted": int(db_summary.get("attempted", 0)),
         "db_skipped_unchanged": int(db_summary.get("skipped_unchanged", 0)),
         "active_reference_count": int(len(active_names)),
+        "parse_seconds_by_book": {
+            book: round(seconds, 4)
+            for book, seconds in sorted(parse_seconds_by_book.items())
+        },
         "results": results,
     }
 
@@ -557,6 +1027,29 @@ def _build_parser() -> argparse.ArgumentParser:
         type=float,
         default=DEFAULT_MIN_PARSE_CONFIDENCE,
     )
+    parser.add_argument(
+        "--backlog-limit",
+        type=int,
+        default=DEFAULT_BACKLOG_LIMIT,
+        help="Also reparse up to N older snapshots this PARSER_VERSION has not seen.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for snapshot extraction (default: serial).",
+    )
+    parser.add_argument(
+        "--extraction-mode",
+        choices=EXTRACTION_MODES,
+        default="regex",
+        help="'names' anchors cards on known active-player names.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Re-scan only what changed since each URL's last parsed snapshot.",
+    )
     return parser
 
 
@@ -573,15 +1066,23 @@ def main() -> None:
         max_snapshots_per_url=max(1, int(args.max_snapshots_per_url)),
         max_total_snapshots=max(1, int(args.max_total_snapshots)),
         min_parse_confidence=float(args.min_parse_confidence),
+        backlog_limit=max(0, int(args.backlog_limit)),
+        workers=max(1, int(args.workers)),
+        extraction_mode=args.extraction_mode,
+        incremental=args.incremental,
     )
 
     print("Browser parser summary:")
     print(f"- status: {summary.get('status')}")
     print(f"- snapshots_considered: {summary.get('snapshots_considered')}")
+    print(f"- snapshots_skipped_unchanged: {summary.get('snapshots_skipped_unchanged')}")
+    print(f"- snapshots_backlog: {summary.get('snapshots_backlog')}")
     print(f"- cards_extracted: {summary.get('cards_extracted')}")
     print(f"- cards_retained: {summary.get('cards_retained')}")
     print(f"- db_attempted: {summary.get('db_attempted')}")
     print(f"- db_inserted: {summary.get('db_inserted')}")
+    for book, seconds in (summary.get("parse_seconds_by_book") or {}).items():
+        print(f"- parse_seconds[{book}]: {seconds:.3f}")
 
 
 if __name__ == "__main__":
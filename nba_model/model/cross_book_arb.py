@@ -27,7 +27,8 @@ carry real ``over_odds`` / ``under_odds`` (from ``betting_lines``).
 
 Public API:
     find_cross_book_opportunities(scored_df, *, min_books=2, ...)
-        -> per (player, stat) line_gap / middle-candidate table. Input is the
+        -> per (player, stat) line_gap / middle-candidate table, with the
+           model's P(landing in the middle) and the two-leg EV. Input is the
            ``edge_scanner.score_prop_edges`` output (one row per player/stat/book).
     fetch_two_way_lines(db_path, books=..., stat_types=..., since_hours=...)
         -> latest deduped betting_lines rows (WITH real odds) joined to players.
@@ -45,12 +46,16 @@ import argparse
 import math
 from typing import Optional, Sequence
 
+import numpy as np
 import pandas as pd
-from scipy.stats import norm
 
 from nba_model.data.database.db_manager import DatabaseManager
 from nba_model.model import edge_scanner as es
 from nba_model.model.odds import american_to_implied_prob
+from nba_model.model.probability import (
+    DISCRETE_DISTRIBUTIONS,
+    prob_over_distribution_array,
+)
 from nba_model.visualization import player_charts as pc
 
 DEFAULT_DB_PATH = "data/database/nba_data.db"
@@ -69,6 +74,7 @@ CROSS_BOOK_COLUMNS = [
     "p_over_at_line_min", "p_over_at_line_max",
     "middle_size", "opportunity_type",
     "model_mu", "model_sigma",
+    "p_middle", "middle_ev",
 ]
 
 TWO_WAY_LINE_COLUMNS = [
@@ -97,19 +103,6 @@ def _is_nan(x) -> bool:
     return isinstance(x, float) and math.isnan(x)
 
 
-def _p_over_normal(mu, sigma, line) -> Optional[float]:
-    """P(value > line) under N(mu, sigma). Mirrors ``player_charts.fitted_prob_over``
-    and ``edge_scanner._normal_p_over`` (kept local — no private import)."""
-    if mu is None or sigma is None or line is None:
-        return None
-    if _is_nan(mu) or _is_nan(sigma) or _is_nan(line):
-        return None
-    mu, sigma, line = float(mu), float(sigma), float(line)
-    if sigma <= 0:
-        return 1.0 if mu > line else (0.5 if mu == line else 0.0)
-    return float(norm.sf(line, loc=mu, scale=sigma))
-
-
 def _safe_implied_prob(odds) -> Optional[float]:
     """American odds -> implied probability, tolerant of NaN / bad values."""
     if odds is None or _is_nan(odds):
@@ -129,6 +122,7 @@ def find_cross_book_opportunities(
     *,
     min_books: int = 2,
     middle_gap_threshold: float = DEFAULT_MIDDLE_GAP,
+    default_american_odds: int = es.DEFAULT_AMERICAN_ODDS,
 ) -> pd.DataFrame:
     """Per ``(player, stat)`` with ``>= min_books`` books, surface the line-shop
     spread and whether the gap is wide enough to be a middle candidate.
@@ -136,76 +130,129 @@ def find_cross_book_opportunities(
     Input is the ``edge_scanner.score_prop_edges`` output (one row per
     player/stat/book, already carrying ``model_mu`` / ``model_sigma`` fitted per
     player+stat). We do NOT refetch game logs — ``p_over_at_line_min`` /
-    ``p_over_at_line_max`` are recomputed from the row's own μ/σ via ``scipy.norm``.
+    ``p_over_at_line_max`` are recomputed from the row's own μ/σ under its
+    ``distribution`` (normal when the column is absent).
+
+    ``p_middle`` is P(line_min < X < line_max) — both legs win — and
+    ``middle_ev`` the expected profit of one unit on the over at ``line_min``
+    plus one unit on the under at ``line_max``, each at ``default_american_odds``.
+    Discrete families use CDF differences, so a whole-number line pushes instead
+    of losing.
 
     ``best_over_book`` is the book at ``line_min`` (lowest line = easiest to clear
     an over); ``best_under_book`` is the book at ``line_max``. Sorted by
     ``line_gap`` descending. Single-book props are excluded. Every row is at least
     a ``line_gap`` opportunity; a gap ``>= middle_gap_threshold`` is a
     ``middle_candidate`` (never a guaranteed arb — see module docstring).
+
+    The whole slate is scored in one pass: a single sort by (group, line, book)
+    gives every group's min/max row from its boundaries.
     """
     if scored_df is None or scored_df.empty:
         return pd.DataFrame(columns=CROSS_BOOK_COLUMNS)
 
-    df = scored_df.copy()
-    if "book_line" not in df.columns or "book" not in df.columns:
+    if "book_line" not in scored_df.columns or "book" not in scored_df.columns:
         return pd.DataFrame(columns=CROSS_BOOK_COLUMNS)
 
+    df = scored_df.copy()
     df["book_line"] = pd.to_numeric(df["book_line"], errors="coerce")
     df = df.dropna(subset=["book_line"])
     if df.empty:
         return pd.DataFrame(columns=CROSS_BOOK_COLUMNS)
 
-    rows: list[dict] = []
-    for (player_name, stat_type), group in df.groupby(
-        ["player_name", "stat_type"], sort=False
-    ):
-        if group["book"].nunique() < max(2, int(min_books)):
-            continue
-
-        # Deterministic ordering so ties on the min/max line resolve to a stable
-        # book (sort by line then book name).
-        g = group.sort_values(["book_line", "book"]).reset_index(drop=True)
-        line_min = float(g["book_line"].iloc[0])
-        line_max = float(g["book_line"].iloc[-1])
-        line_gap = line_max - line_min
-        best_over_book = str(g["book"].iloc[0])      # lowest line -> best for OVER
-        best_under_book = str(g["book"].iloc[-1])    # highest line -> best for UNDER
-
-        consensus_mean = float(g["book_line"].mean())
-
-        mu = g["model_mu"].iloc[0] if "model_mu" in g.columns else None
-        sigma = g["model_sigma"].iloc[0] if "model_sigma" in g.columns else None
-        p_min = _p_over_normal(mu, sigma, line_min)
-        p_max = _p_over_normal(mu, sigma, line_max)
-
-        opportunity_type = (
-            OPP_MIDDLE if line_gap >= float(middle_gap_threshold) else OPP_LINE_GAP
-        )
-
-        rows.append({
-            "player_name": player_name,
-            "stat_type": stat_type,
-            "n_books": int(group["book"].nunique()),
-            "line_min": round(line_min, 3),
-            "line_max": round(line_max, 3),
-            "line_gap": round(line_gap, 3),
-            "best_over_book": best_over_book,
-            "best_under_book": best_under_book,
-            "consensus_mean": round(consensus_mean, 3),
-            "p_over_at_line_min": round(p_min, 4) if p_min is not None else None,
-            "p_over_at_line_max": round(p_max, 4) if p_max is not None else None,
-            "middle_size": round(line_gap, 3),
-            "opportunity_type": opportunity_type,
-            "model_mu": round(float(mu), 3) if mu is not None and not _is_nan(mu) else None,
-            "model_sigma": (
-                round(float(sigma), 3) if sigma is not None and not _is_nan(sigma) else None
-            ),
-        })
-
-    if not rows:
+    keys = ["player_name", "stat_type"]
+    df["_group"] = df.groupby(keys, sort=False).ngroup()
+    df = df[df["_group"] >= 0]  # NaN keys drop out, as groupby does
+    n_books = df.groupby("_group")["book"].nunique()
+    keep = n_books.index[n_books >= max(2, int(min_books))]
+    df = df[df["_group"].isin(keep)]
+    if df.empty:
         return pd.DataFrame(columns=CROSS_BOOK_COLUMNS)
-    out = pd.DataFrame(rows, columns=CROSS_BOOK_COLUMNS)
+
+    # Deterministic ordering so ties on the min/max line resolve to a stable
+    # book (sort by line then book name) — one sort for the whole slate.
+    df = df.sort_values(["_group", "book_line", "book"], kind="mergesort")
+    group = df["_group"].to_numpy()
+    line = df["book_line"].to_numpy(dtype=float)
+    first = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+    last = np.r_[first[1:] - 1, len(group) - 1]
+    sizes = last - first + 1
+
+    line_min = line[first]
+    line_max = line[last]
+    line_gap = line_max - line_min
+    consensus = np.add.reduceat(line, first) / sizes
+
+    def first_row(col: str, default=np.nan) -> np.ndarray:
+        if col not in df.columns:
+            return np.full(len(first), default, dtype=object)
+        return df[col].to_numpy()[first]
+
+    mu = pd.to_numeric(pd.Series(first_row("model_mu")), errors="coerce").to_numpy(float)
+    sigma = pd.to_numeric(
+        pd.Series(first_row("model_sigma")), errors="coerce").to_numpy(float)
+    distribution = np.array([
+        str(d).strip().lower() if isinstance(d, str) and d.strip() else "normal"
+        for d in first_row("distribution", "normal")
+    ])
+    sample_size = pd.to_numeric(
+        pd.Series(first_row("n_games_used")), errors="coerce").to_numpy(float)
+
+    fitted = ~(np.isnan(mu) | np.isnan(sigma))
+    p_min = np.full(len(first), np.nan)
+    p_max = np.full(len(first), np.nan)
+    p_middle = np.full(len(first), np.nan)
+    middle_ev = np.full(len(first), np.nan)
+    if fitted.any():
+        f_mu, f_sigma = mu[fitted], sigma[fitted]
+        f_dist, f_n = distribution[fitted], sample_size[fitted]
+        lo, hi = line_min[fitted], line_max[fitted]
+
+        def survival(x: np.ndarray) -> np.ndarray:
+            return prob_over_distribution_array(
+                x, f_mu, f_sigma, f_dist,
+                sample_size=np.where(np.isnan(f_n), 0, f_n),
+            )
+
+        # For integer-valued outcomes P(X < x) = 1 - P(X > ceil(x) - 1), which
+        # leaves P(X == x) as a push on whole-number lines.
+        discrete = np.isin(f_dist, list(DISCRETE_DISTRIBUTIONS))
+        below_lo = np.where(discrete, np.ceil(lo) - 1.0, lo)
+        below_hi = np.where(discrete, np.ceil(hi) - 1.0, hi)
+        s_lo, s_hi = survival(lo), survival(hi)
+        s_below_lo, s_below_hi = survival(below_lo), survival(below_hi)
+
+        over_win, over_lose = s_lo, 1.0 - s_below_lo
+        under_win, under_lose = 1.0 - s_below_hi, s_hi
+        payout = 1.0 / float(american_to_implied_prob(int(default_american_odds))) - 1.0
+        p_min[fitted], p_max[fitted] = s_lo, s_hi
+        p_middle[fitted] = np.clip(s_lo - s_below_hi, 0.0, 1.0)
+        middle_ev[fitted] = (over_win + under_win) * payout - (over_lose + under_lose)
+
+    def rounded(values: np.ndarray, digits: int) -> list:
+        return [None if np.isnan(v) else round(float(v), digits) for v in values]
+
+    books = df["book"].astype(str).to_numpy()
+    out = pd.DataFrame({
+        "player_name": first_row("player_name"),
+        "stat_type": first_row("stat_type"),
+        "n_books": n_books.loc[group[first]].to_numpy(dtype=int),
+        "line_min": np.round(line_min, 3),
+        "line_max": np.round(line_max, 3),
+        "line_gap": np.round(line_gap, 3),
+        "best_over_book": books[first],       # lowest line -> best for OVER
+        "best_under_book": books[last],       # highest line -> best for UNDER
+        "consensus_mean": np.round(consensus, 3),
+        "p_over_at_line_min": rounded(p_min, 4),
+        "p_over_at_line_max": rounded(p_max, 4),
+        "middle_size": np.round(line_gap, 3),
+        "opportunity_type": np.where(
+            line_gap >= float(middle_gap_threshold), OPP_MIDDLE, OPP_LINE_GAP),
+        "model_mu": rounded(mu, 3),
+        "model_sigma": rounded(sigma, 3),
+        "p_middle": rounded(p_middle, 4),
+        "middle_ev": rounded(middle_ev, 4),
+    }, columns=CROSS_BOOK_COLUMNS)
     return out.sort_values(
         ["line_gap", "player_name", "stat_type"], ascending=[False, True, True]
     ).reset_index(drop=True)
@@ -316,6 +363,11 @@ def detect_two_way_arb(lines_with_odds_df: pd.DataFrame) -> pd.DataFrame:
     be real, so a -110 / -110 pair (0.5238 + 0.5238 = 1.0476) is never flagged,
     and assumed-default DFS lines never reach this function as real odds.
     Returns only the flagged arb rows, sorted by ``guaranteed_margin`` desc.
+
+    The search is column-wise: implied probabilities are computed once per
+    price column, each group is sorted by line, and a running best over-price
+    prunes every under that can't complete an arb before the surviving pairs
+    are enumerated as index arrays — no per-pair Python work.
     """
     if lines_with_odds_df is None or lines_with_odds_df.empty:
         return pd.DataFrame(columns=ARB_COLUMNS)
@@ -343,66 +395,100 @@ def detect_two_way_arb(lines_with_odds_df: pd.DataFrame) -> pd.DataFrame:
     else:
         df["_pkey"] = df["player_name"]
 
-    group_keys = ["_pkey", "stat_canon", "game_date"]
-    rows: list[dict] = []
-    for _, group in df.groupby(group_keys, dropna=False, sort=False):
-        books = group.reset_index(drop=True)
-        if books["book"].nunique() < 2:
-            continue
-        recs = books.to_dict("records")
-        for a in recs:
-            implied_over = _safe_implied_prob(a.get("over_odds"))
-            over_line = a.get("line_value")
-            if implied_over is None or over_line is None or _is_nan(over_line):
-                continue
-            for b in recs:
-                if str(a.get("book")) == str(b.get("book")):
-                    continue
-                implied_under = _safe_implied_prob(b.get("under_odds"))
-                under_line = b.get("line_value")
-                if implied_under is None or under_line is None or _is_nan(under_line):
-                    continue
-                # Executable direction only: no dead zone where both legs lose.
-                if float(over_line) > float(under_line):
-                    continue
-                combined = implied_over + implied_under
-                if combined >= 1.0:
-                    continue
-                margin = 1.0 - combined
-                legs = (
-                    f"OVER {float(over_line):g} @ {a.get('book')} "
-                    f"({_fmt_odds(a.get('over_odds'))}) + "
-                    f"UNDER {float(under_line):g} @ {b.get('book')} "
-                    f"({_fmt_odds(b.get('under_odds'))})"
-                )
-                rows.append({
-                    "player_name": a.get("player_name"),
-                    "stat_type": a.get("stat_canon"),
-                    "game_date": a.get("game_date"),
-                    "over_book": a.get("book"),
-                    "over_line": float(over_line),
-                    "over_odds": int(round(float(a.get("over_odds")))),
-                    "under_book": b.get("book"),
-                    "under_line": float(under_line),
-                    "under_odds": int(round(float(b.get("under_odds")))),
-                    "implied_over": round(implied_over, 4),
-                    "implied_under": round(implied_under, 4),
-                    "combined_implied": round(combined, 4),
-                    "devig_over": round(implied_over / combined, 4),
-                    "devig_under": round(implied_under / combined, 4),
-                    "guaranteed_margin": round(margin, 4),
-                    "legs": legs,
-                })
-
-    if not rows:
+    # One implied probability per leg, computed column-wise (same rounding to
+    # whole American odds as ``_safe_implied_prob``); unusable prices / lines
+    # become NaN and can never satisfy the ``< 1.0`` test below.
+    over_odds = _rounded_odds(df["over_odds"])
+    under_odds = _rounded_odds(df["under_odds"])
+    implied_over = _implied_prob_array(over_odds)
+    implied_under = _implied_prob_array(under_odds)
+    line = df["line_value"].to_numpy(dtype=float)
+    group = df.groupby(
+        ["_pkey", "stat_canon", "game_date"], dropna=False, sort=False,
+    ).ngroup().to_numpy()
+    book = pd.factorize(df["book"].astype(str))[0]
+
+    # Sort each group by line. For an UNDER at row b, every executable OVER
+    # sits in the group's prefix up to the last row quoting line <= b's line,
+    # so the running best (lowest) over-implied along that prefix bounds every
+    # pair b can form: unders whose bound is already >= 1.0 are dropped
+    # without enumerating a single pair.
+    valid = np.flatnonzero(~np.isnan(line))
+    order = valid[np.lexsort((line[valid], group[valid]))]
+    g_sorted, line_sorted = group[order], line[order]
+    n_sorted = len(order)
+    new_group = np.r_[True, g_sorted[1:] != g_sorted[:-1]] if n_sorted else np.array([], bool)
+    group_start = np.maximum.accumulate(np.where(new_group, np.arange(n_sorted), 0))
+    new_run = new_group | np.r_[True, line_sorted[1:] != line_sorted[:-1]][:n_sorted]
+    run_end = np.r_[np.flatnonzero(new_run)[1:], n_sorted] - 1
+    prefix_end = run_end[np.cumsum(new_run) - 1]
+    best_over = (
+        pd.Series(np.where(np.isnan(implied_over[order]), np.inf, implied_over[order]))
+        .groupby(g_sorted).cummin().to_numpy()
+    )
+    candidate = np.flatnonzero(best_over[prefix_end] + implied_under[order] < 1.0)
+    if candidate.size == 0:
+        return pd.DataFrame(columns=ARB_COLUMNS)
+
+    # Every (over, under) pair inside the surviving unders' prefixes.
+    spans = prefix_end[candidate] - group_start[candidate] + 1
+    under_pos = np.repeat(candidate, spans)
+    over_pos = (
+        np.repeat(group_start[candidate] - np.cumsum(spans) + spans, spans)
+        + np.arange(spans.sum())
+    )
+    a, b = order[over_pos], order[under_pos]
+    combined = implied_over[a] + implied_under[b]
+    keep = (combined < 1.0) & (book[a] != book[b])
+    a, b, combined = a[keep], b[keep], combined[keep]
+    if a.size == 0:
         return pd.DataFrame(columns=ARB_COLUMNS)
-    out = pd.DataFrame(rows, columns=ARB_COLUMNS)
+    # Same row order as a per-group OVER-major scan before the final sort.
+    pair_order = np.lexsort((b, a, group[a]))
+    a, b, combined = a[pair_order], b[pair_order], combined[pair_order]
+
+    books = df["book"].to_numpy(dtype=object)
+    legs = [
+        f"OVER {ol:g} @ {ob} ({_fmt_odds(oo)}) + UNDER {ul:g} @ {ub} ({_fmt_odds(uo)})"
+        for ol, ob, oo, ul, ub, uo in zip(
+            line[a], books[a], over_odds[a], line[b], books[b], under_odds[b])
+    ]
+    out = pd.DataFrame({
+        "player_name": df["player_name"].to_numpy(dtype=object)[a],
+        "stat_type": df["stat_canon"].to_numpy(dtype=object)[a],
+        "game_date": df["game_date"].to_numpy(dtype=object)[a],
+        "over_book": books[a],
+        "over_line": line[a],
+        "over_odds": over_odds[a].astype(int),
+        "under_book": books[b],
+        "under_line": line[b],
+        "under_odds": under_odds[b].astype(int),
+        "implied_over": np.round(implied_over[a], 4),
+        "implied_under": np.round(implied_under[b], 4),
+        "combined_implied": np.round(combined, 4),
+        "devig_over": np.round(implied_over[a] / combined, 4),
+        "devig_under": np.round(implied_under[b] / combined, 4),
+        "guaranteed_margin": np.round(1.0 - combined, 4),
+        "legs": legs,
+    }, columns=ARB_COLUMNS)
     return out.sort_values(
         ["guaranteed_margin", "player_name", "stat_type"],
         ascending=[False, True, True],
     ).reset_index(drop=True)
 
 
+def _rounded_odds(odds: pd.Series) -> np.ndarray:
+    """American odds rounded to whole numbers; NaN where missing / unparseable."""
+    values = pd.to_numeric(odds, errors="coerce").to_numpy(dtype=float)
+    return np.round(np.where(np.isfinite(values), values, np.nan))
+
+
+def _implied_prob_array(odds: np.ndarray) -> np.ndarray:
+    """Vectorized ``american_to_implied_prob`` (NaN in, NaN out)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(odds > 0, 100.0 / (odds + 100.0), -odds / (-odds + 100.0))
+
+
 def _fmt_odds(odds) -> str:
     try:
         o = int(round(float(odds)))
@@ -17,6 +17,11 @@ Public API:
         -> per-row μ/σ, P(over), edge vs implied, EV (μ/σ memoized per player+stat)
     top_edges(scored_df, min_p_over=..., min_edge=..., only_positive_ev=...)
         -> filtered + sorted view
+    refresh_scored_edges(db_path, profiles=..., since_hours=...)
+        -> incremental rescore of the materialized ``scored_edges`` table
+    fetch_scored_edges(db_path, books=..., model_mode=..., min_edge=...)
+        -> the same ranked view straight from ``scored_edges`` via SQL
+           (``None`` when no fresh profile exists → score live)
 
 DFS books (Underdog / PrizePicks / Pick6 / ParlayPlay) rarely carry American
 odds, so edge is shown against the -110 breakeven (52.38%) baseline unless a
@@ -25,23 +30,42 @@ real price is present.
 from __future__ import annotations
 
 import argparse
+import json
+import logging
 import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, Sequence
 
+import numpy as np
 import pandas as pd
 from scipy.stats import norm
 
 from nba_model.data.database.db_manager import DatabaseManager
 from nba_model.model.odds import american_to_implied_prob
-from nba_model.model.probability import prob_over_distribution
+from nba_model.model.probability import prob_over_distribution_array
 from nba_model.visualization import player_charts as pc
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_DB_PATH = "data/database/nba_data.db"
 DEFAULT_SINCE_HOURS = 48.0
 DEFAULT_N_GAMES = 25
 DEFAULT_AMERICAN_ODDS = -110
 # Need at least this many games to fit a normal (σ needs ≥2 points).
 MIN_GAMES_FOR_FIT = 2
+# ``full`` mode fans players out over worker processes only when the slate is
+# big enough to repay process start-up; the API uses the default worker count.
+DEFAULT_FULL_MODE_WORKERS = max(1, min(4, os.cpu_count() or 1))
+PARALLEL_MIN_PLAYERS = 8
+# Bulk lookups bind one parameter per name / player id; stay well under the
+# 999-variable limit of older SQLite builds.
+SQL_PARAM_CHUNK = 500
+# game_logs columns behind every chart_mean stat (PRA / RA are derived).
+_BULK_GAME_COLUMNS = tuple(
+    f"g.{col}" for col in dict.fromkeys(
+        [*pc.STAT_COLUMN_BY_TYPE.values(), "points", "rebounds", "assists"])
+)
 
 LINE_COLUMNS = [
     "book", "player_name", "stat_type", "side", "line_value", "observed_at_utc",
@@ -67,6 +91,49 @@ SCORED_COLUMNS_FULL = SCORED_COLUMNS + APPENDED_COLUMNS
 # plain-normal fit.
 MODEL_MODES = ("chart_mean", "rolling", "full")
 
+# ``scored_edges`` profiles the hourly update keeps materialized. ``rolling``
+# is DataLoader-backed (network) and always scores live. Readers fall back to
+# live scoring when a profile is older than ``MATERIALIZED_MAX_AGE_HOURS``.
+MATERIALIZED_MODES = ("chart_mean", "full")
+MATERIALIZED_PROFILES = (
+    ("chart_mean", DEFAULT_N_GAMES, 10),
+    ("full", DEFAULT_N_GAMES, 10),
+)
+MATERIALIZED_MAX_AGE_HOURS = 3.0
+_SCORED_EDGE_MODEL_COLUMNS = (
+    "model_mu", "model_sigma", "line_vs_mu", "p_over", "p_under", "best_side",
+    "model_edge", "ev_best", "n_games_used", "distribution",
+)
+_SCORED_EDGE_UPSERT_SQL = """
+    INSERT INTO scored_edges (
+        model_mode, n_games, rolling_window, player_key, stat_type, book_key,
+        book, player_name, player_id, book_line, observed_at_utc, n_lines,
+        model_mu, model_sigma, line_vs_mu, p_over, p_under, best_side,
+        model_edge, ev_best, n_games_used, distribution,
+        fit_watermark, scored_at_utc
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(model_mode, n_games, rolling_window, player_key, stat_type, book_key)
+    DO UPDATE SET
+        book = excluded.book,
+        player_name = excluded.player_name,
+        player_id = excluded.player_id,
+        book_line = excluded.book_line,
+        observed_at_utc = excluded.observed_at_utc,
+        n_lines = excluded.n_lines,
+        model_mu = excluded.model_mu,
+        model_sigma = excluded.model_sigma,
+        line_vs_mu = excluded.line_vs_mu,
+        p_over = excluded.p_over,
+        p_under = excluded.p_under,
+        best_side = excluded.best_side,
+        model_edge = excluded.model_edge,
+        ev_best = excluded.ev_best,
+        n_games_used = excluded.n_games_used,
+        distribution = excluded.distribution,
+        fit_watermark = excluded.fit_watermark,
+        scored_at_utc = excluded.scored_at_utc
+"""
+
 
 # ---------------------------------------------------------------------------
 # 1. Pull the latest deduped prop lines from the scraped DFS board
@@ -99,22 +166,23 @@ def fetch_latest_prop_lines(
         params.extend([str(b).lower() for b in books])
     where_sql = " AND ".join(clauses)
 
-    query = f"""
-        WITH latest AS (
-            SELECT book, player_name, stat_type, side, line_value, observed_at_utc,
-                   ROW_NUMBER() OVER (
-                       PARTITION BY lower(player_name), lower(stat_type),
-                                    lower(book), lower(side)
-                       ORDER BY observed_at_utc DESC, card_id DESC
-                   ) AS rn
-            FROM web_prop_cards
-            WHERE {where_sql}
-        )
-        SELECT book, player_name, stat_type, side, line_value, observed_at_utc
-        FROM latest WHERE rn = 1
-        ORDER BY player_name ASC, stat_type ASC, book ASC, side ASC
-    """
     with DatabaseManager(db_path=db_path) as db:
+        source = db.line_history_source("web_prop_cards", since_hours=since_hours)
+        query = f"""
+            WITH latest AS (
+                SELECT book, player_name, stat_type, side, line_value, observed_at_utc,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY lower(player_name), lower(stat_type),
+                                        lower(book), lower(side)
+                           ORDER BY observed_at_utc DESC, card_id DESC
+                       ) AS rn
+                FROM {source}
+                WHERE {where_sql}
+            )
+            SELECT book, player_name, stat_type, side, line_value, observed_at_utc
+            FROM latest WHERE rn = 1
+            ORDER BY player_name ASC, stat_type ASC, book ASC, side ASC
+        """
         df = pd.read_sql_query(query, db.conn, params=tuple(params))
 
     if df.empty:
@@ -153,6 +221,107 @@ def _resolve_player_id(db: DatabaseManager, name: str) -> Optional[int]:
     return None
 
 
+def _resolve_player_ids(db: DatabaseManager, names: Sequence[str]) -> dict:
+    """Bulk ``_resolve_player_id``: ``{name.lower(): player_id or None}``.
+
+    One query per ``SQL_PARAM_CHUNK`` names instead of one per name; keys match
+    the scanner's ``player_key`` memo keys."""
+    unique = list(dict.fromkeys(str(n) for n in names if n))
+    hits: dict = {}
+    for start in range(0, len(unique), SQL_PARAM_CHUNK):
+        chunk = unique[start:start + SQL_PARAM_CHUNK]
+        values = ", ".join("(?)" for _ in chunk)
+        rows = db.conn.execute(
+            f"""
+            WITH wanted(name) AS (VALUES {values})
+            SELECT w.name, r.player_id
+            FROM wanted w
+            JOIN nba_active_players_ref r ON lower(r.player_name) = lower(w.name)
+            """,
+            chunk,
+        ).fetchall()
+        for name, pid in rows:
+            if name in hits or pid is None:
+                continue
+            try:
+                hits[name] = int(pid)
+            except (TypeError, ValueError):
+                continue
+    out: dict = {}
+    for name in unique:
+        key = name.lower()
+        if out.get(key) is None:
+            out[key] = hits.get(name)
+    return out
+
+
+def _fetch_recent_games_bulk(
+    db: DatabaseManager, player_ids: Sequence[int], n_games: int,
+) -> pd.DataFrame:
+    """Last ``n_games`` game_logs rows for every player in one windowed query.
+
+    Same rows ``db.get_player_games`` returns per player (newest first by
+    ``game_date``), restricted to the stat columns ``pc._series_for_stat``
+    reads and tagged with ``recent_rank`` (1 = newest)."""
+    ids = sorted({int(pid) for pid in player_ids if pid is not None})
+    frames = []
+    for start in range(0, len(ids), SQL_PARAM_CHUNK):
+        chunk = ids[start:start + SQL_PARAM_CHUNK]
+        placeholders = ", ".join("?" * len(chunk))
+        frames.append(pd.read_sql_query(
+            f"""
+            SELECT *
+            FROM (
+                SELECT g.player_id, g.game_date, {", ".join(_BULK_GAME_COLUMNS)},
+                       ROW_NUMBER() OVER (
+                           PARTITION BY g.player_id ORDER BY g.game_date DESC
+                       ) AS recent_rank
+                FROM game_logs g
+                WHERE g.player_id IN ({placeholders})
+            )
+            WHERE recent_rank <= ?
+            """,
+            db.conn,
+            params=(*chunk, max(1, int(n_games))),
+        ))
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def _chart_mean_fits_bulk(
+    games: pd.DataFrame, stats: Sequence[str],
+) -> dict:
+    """``{(player_id, stat): {"mu","sigma","n"}}`` for the chart_mean model.
+
+    A grouped NumPy reduction (``np.bincount`` over the player codes) of the
+    same per-game series ``pc._series_for_stat`` yields, so μ is the last-N
+    mean and σ the ddof=1 sample std — ``PlayerChartData.mu`` / ``.sigma`` —
+    for every player at once. Players with fewer than ``MIN_GAMES_FOR_FIT``
+    games (or stats with no game_logs column) are absent."""
+    fits: dict = {}
+    if games is None or games.empty:
+        return fits
+    codes, player_ids = pd.factorize(games["player_id"])
+    counts = np.bincount(codes, minlength=len(player_ids))
+    fittable = counts >= MIN_GAMES_FOR_FIT
+    for stat in dict.fromkeys(stats):
+        values = pc._series_for_stat(games, stat)
+        if values.size != codes.size:
+            continue
+        mu = np.bincount(codes, weights=values, minlength=len(player_ids)) / np.maximum(counts, 1)
+        dev = values - mu[codes]
+        ss = np.bincount(codes, weights=dev * dev, minlength=len(player_ids))
+        sigma = np.sqrt(ss / np.maximum(counts - 1, 1))
+        for idx in np.flatnonzero(fittable):
+            fits[(int(player_ids[idx]), stat)] = {
+                "mu": float(mu[idx]),
+                "sigma": float(sigma[idx]),
+                "n": int(counts[idx]),
+            }
+    return fits
+
+
 def _resolve_player_team(db: DatabaseManager, player_id: int) -> Optional[str]:
     """Player's team abbrev from the ``players`` table (or ``None`` if unknown).
 
@@ -175,13 +344,18 @@ def _fit_player_stat_full(
     n_games: int,
     rolling_window: int,
     team_prior_map: dict,
+    history_cache: Optional[dict] = None,
 ) -> Optional[dict]:
     """Full-model fit: rolling μ/σ + team-prior blend + per-stat distribution.
 
     Uses the shared ``prop_board`` projection helpers off the DB directly (no
     DataLoader / network), so it produces the same μ/σ/distribution the hourly
     ``_persist_predictions`` path stores for the same inputs. Returns ``None``
-    (row dropped) for unprojectable stats or insufficient history."""
+    (row dropped) for unprojectable stats or insufficient history.
+
+    ``history_cache`` (player_id → (latest row, team)) lets one scan build a
+    player's rolling history once for all of their stats; the projection
+    helpers don't mutate it."""
     from nba_model.model import prop_board
 
     if canonical_stat not in prop_board.PROJECTABLE_STATS:
@@ -192,14 +366,19 @@ def _fit_player_stat_full(
     pid = name_to_id[key]
     if pid is None:
         return None
-    games = db.get_player_games(pid, n_games=max(1, int(n_games)))
-    latest = prop_board.build_history_from_games(
-        games, rolling_window=int(rolling_window))
+    if history_cache is not None and pid in history_cache:
+        latest, team = history_cache[pid]
+    else:
+        games = db.get_player_games(pid, n_games=max(1, int(n_games)))
+        latest = prop_board.build_history_from_games(
+            games, rolling_window=int(rolling_window))
+        team = _resolve_player_team(db, pid) if latest is not None else None
+        if history_cache is not None:
+            history_cache[pid] = (latest, team)
     if latest is None:
         return None
 
     prior_inputs = None
-    team = _resolve_player_team(db, pid)
     if team:
         prior_inputs = team_prior_map.get(team.upper())
 
@@ -234,6 +413,7 @@ def _fit_player_stat(
     rolling_window: int,
     db_path: str,
     team_prior_map: Optional[dict] = None,
+    history_cache: Optional[dict] = None,
 ) -> Optional[dict]:
     """Return ``{"mu","sigma","n"[,"distribution"]}`` for a player+stat, or None
     when un-fittable."""
@@ -245,6 +425,7 @@ def _fit_player_stat(
             return _fit_player_stat_full(
                 db, name_to_id, player_name, canonical_stat,
                 n_games, rolling_window, team_prior_map or {},
+                history_cache=history_cache,
             )
         except Exception:
             return None
@@ -282,12 +463,67 @@ def _fit_player_stat(
     return {"mu": float(data.mu), "sigma": float(data.sigma), "n": int(values.size)}
 
 
-def _hours_ago(observed_at_utc) -> Optional[float]:
-    ts = pd.to_datetime(observed_at_utc, errors="coerce", utc=True)
-    if pd.isna(ts):
+def _full_fit_worker(task: tuple) -> dict:
+    """Process-pool entry point: full-mode fits for one partition of players.
+
+    Runs the exact serial code path (``_fit_player_stat``) against a
+    read-only ``DatabaseManager``; returns ``{(player_key, stat): fit}``."""
+    db_path, assignments, n_games, rolling_window, team_prior_map = task
+    fits: dict = {}
+    history_cache: dict = {}
+    with DatabaseManager(db_path=db_path, read_only=True) as db:
+        for player_key, player_name, pid, stats in assignments:
+            name_to_id = {player_key: pid}
+            for stat in stats:
+                fits[(player_key, stat)] = _fit_player_stat(
+                    db, name_to_id, player_name, stat, n_games, "full",
+                    rolling_window, db_path, team_prior_map=team_prior_map,
+                    history_cache=history_cache,
+                )
+    return fits
+
+
+def _fit_full_parallel(
+    per_book: pd.DataFrame,
+    name_to_id: dict,
+    *,
+    db_path: str,
+    n_games: int,
+    rolling_window: int,
+    team_prior_map: dict,
+    workers: int,
+) -> Optional[dict]:
+    """Full-mode fits for the slate with unique players spread over processes.
+
+    Players are dealt round-robin into ``workers`` partitions (each player's
+    stats stay together so their rolling history is built once). Returns the
+    merged ``{(player_key, stat): fit}`` memo, or ``None`` when the pool can't
+    run here — the caller then fits serially, so output never depends on it."""
+    firsts = per_book.drop_duplicates(["player_key", "canonical_stat"])
+    assignments = [
+        (player_key, group["player_name"].iloc[0], name_to_id.get(player_key),
+         list(group["canonical_stat"]))
+        for player_key, group in firsts.groupby("player_key", sort=True)
+    ]
+    memo = {
+        (player_key, stat): None
+        for player_key, _, pid, stats in assignments if pid is None
+        for stat in stats
+    }
+    assignments = [a for a in assignments if a[2] is not None]
+    partitions = [assignments[i::workers] for i in range(workers)]
+    tasks = [
+        (db_path, part, n_games, rolling_window, team_prior_map)
+        for part in partitions if part
+    ]
+    try:
+        with ProcessPoolExecutor(max_workers=len(tasks)) as pool:
+            for fits in pool.map(_full_fit_worker, tasks):
+                memo.update(fits)
+    except (OSError, RuntimeError) as exc:
+        logger.warning("full-mode process pool unavailable (%s); fitting serially", exc)
         return None
-    delta = pd.Timestamp.now(tz="UTC") - ts
-    return float(delta.total_seconds() / 3600.0)
+    return memo
 
 
 def score_prop_edges(
@@ -298,10 +534,13 @@ def score_prop_edges(
     model_mode: str = "chart_mean",
     rolling_window: int = 10,
     default_american_odds: int = DEFAULT_AMERICAN_ODDS,
+    workers: Optional[int] = None,
 ) -> pd.DataFrame:
     """Score each book line against the fitted model. One row per (book,
-    player, stat). μ/σ are memoized per (player, stat) so a 200-prop slate
-    triggers one game-log fetch per unique player+stat, not per row.
+    player, stat). μ/σ are memoized per (player, stat). In ``chart_mean`` mode
+    the whole slate costs one name-resolution query and one windowed
+    game-log query, fitted with a grouped NumPy reduction; scoring (P(over),
+    edge, EV, staleness) is column-wise for every mode.
 
     ``model_mode``:
       * ``chart_mean`` (default) — plain normal on the last-N mean/std.
@@ -309,117 +548,211 @@ def score_prop_edges(
       * ``full`` — the full prop_board projection: rolling μ/σ + team-prior
         blend (when the player's team has a prior) + the per-stat default
         distribution via ``get_default_distribution``. Matches the numbers the
-        hourly ``predictions`` recompute stores.
+        hourly ``predictions`` recompute stores. With ``workers`` > 1 and at
+        least ``PARALLEL_MIN_PLAYERS`` slate players, the fits run in a
+        process pool (read-only DB connections, one partition of players per
+        worker); the output is identical to the serial scan.
 
     Output keeps ``SCORED_COLUMNS`` as its ordered prefix and appends
     ``distribution`` + ``model_mode`` (see ``SCORED_COLUMNS_FULL``)."""
     if lines_df is None or lines_df.empty:
         return pd.DataFrame(columns=SCORED_COLUMNS_FULL)
 
+    per_book = _collapse_per_book(lines_df)
+    # Cross-book consensus mean per (player, stat).
+    per_book["consensus_mean"] = (
+        per_book.groupby(["player_key", "canonical_stat"])["book_line"]
+        .transform("mean")
+    )
+
+    with DatabaseManager(db_path=db_path) as db:
+        row_fits = _fit_per_book(
+            db, per_book, db_path=db_path, n_games=n_games,
+            model_mode=model_mode, rolling_window=rolling_window, workers=workers,
+        )
+
+    keep = np.array([fit is not None for fit in row_fits], dtype=bool)
+    if not keep.any():
+        return pd.DataFrame(columns=SCORED_COLUMNS_FULL)
+    scored = per_book.loc[keep].reset_index(drop=True)
+    row_fits = [fit for fit in row_fits if fit is not None]
+    return _score_rows(
+        scored, row_fits,
+        model_mode=model_mode,
+        rolling_window=rolling_window,
+        default_american_odds=default_american_odds,
+    )
+
+
+def _collapse_per_book(lines_df: pd.DataFrame) -> pd.DataFrame:
+    """One line per ``(player_key, canonical_stat, book_key)``.
+
+    Over/under sides collapse to their median line; ``observed_at_utc`` is the
+    newest side's observation and ``n_lines`` the number of input lines
+    collapsed. (Column names avoid leading underscores so itertuples keeps
+    them.)"""
     work = lines_df.copy()
     work["canonical_stat"] = work["stat_type"].map(pc._canonical_stat_type)
     work["player_key"] = work["player_name"].str.lower()
     work["book_key"] = work["book"].str.lower()
+    # Latest observation per group via sorted integer codes: a string ``max``
+    # aggregation is by far the slowest step of the collapse below.
+    observed_codes, observed_values = pd.factorize(work["observed_at_utc"], sort=True)
+    work["observed_code"] = observed_codes
 
-    # Collapse over/under sides into one line per (player, stat, book).
-    # (Column names avoid leading underscores so itertuples keeps them.)
     per_book = (
         work.groupby(["player_key", "canonical_stat", "book_key"], as_index=False)
         .agg(
             player_name=("player_name", "first"),
             book=("book", "first"),
             book_line=("line_value", "median"),
-            observed_at_utc=("observed_at_utc", "max"),
+            observed_code=("observed_code", "max"),
+            n_lines=("line_value", "size"),
         )
     )
+    observed_values = np.asarray(observed_values, dtype=object)
+    per_book["observed_at_utc"] = [
+        observed_values[code] if code >= 0 else None
+        for code in per_book.pop("observed_code")
+    ]
+    return per_book
 
-    # Cross-book consensus mean per (player, stat).
-    consensus = (
-        per_book.groupby(["player_key", "canonical_stat"])["book_line"]
-        .mean()
-        .to_dict()
-    )
-
-    implied_default = american_to_implied_prob(int(default_american_odds))
 
+def _fit_per_book(
+    db: DatabaseManager,
+    per_book: pd.DataFrame,
+    *,
+    db_path: str,
+    n_games: int,
+    model_mode: str,
+    rolling_window: int,
+    workers: Optional[int] = None,
+    name_to_id: Optional[dict] = None,
+    team_prior_map: Optional[dict] = None,
+) -> list:
+    """Fit for every ``per_book`` row (``None`` where un-fittable), memoized per
+    (player, stat). ``name_to_id`` / ``team_prior_map`` may be passed in when
+    the caller already resolved them."""
     memo: dict = {}
-    name_to_id: dict = {}
-    rows: list[dict] = []
-    with DatabaseManager(db_path=db_path) as db:
-        # Full mode pulls the whole slate's team priors once (pace + implied
-        # team total per team) — the same map the hourly recompute blends.
-        team_prior_map = (
-            db.get_team_prior_inputs_map() if model_mode == "full" else {}
+    if model_mode == "rolling":
+        name_to_id = {}
+    elif name_to_id is None:
+        # Every slate name resolved in one query up front.
+        name_to_id = _resolve_player_ids(db, per_book["player_name"].tolist())
+    if model_mode not in ("rolling", "full"):
+        # chart_mean: one windowed game-log query for the whole slate, then
+        # a grouped reduction for every (player, stat) at once.
+        slate_ids = {name_to_id.get(key) for key in per_book["player_key"].unique()}
+        games = _fetch_recent_games_bulk(
+            db, [pid for pid in slate_ids if pid is not None], n_games,
         )
+        fits = _chart_mean_fits_bulk(games, per_book["canonical_stat"].unique())
+        for fit_key in per_book[["player_key", "canonical_stat"]].itertuples(
+                index=False, name=None):
+            pid = name_to_id.get(fit_key[0])
+            memo[fit_key] = fits.get((pid, fit_key[1])) if pid is not None else None
+    else:
+        # Full mode pulls the whole slate's team priors once (pace +
+        # implied team total per team) — the same map the hourly
+        # recompute blends.
+        if team_prior_map is None:
+            team_prior_map = (
+                db.get_team_prior_inputs_map() if model_mode == "full" else {}
+            )
+        n_workers = int(workers or 1)
+        if (model_mode == "full" and n_workers > 1
+                and per_book["player_key"].nunique() >= PARALLEL_MIN_PLAYERS):
+            memo = _fit_full_parallel(
+                per_book, name_to_id, db_path=db_path, n_games=n_games,
+                rolling_window=rolling_window, team_prior_map=team_prior_map,
+                workers=n_workers,
+            ) or {}
+        history_cache: dict = {}
         for r in per_book.itertuples(index=False):
-            canonical_stat = r.canonical_stat
-            fit_key = (r.player_key, canonical_stat)
+            fit_key = (r.player_key, r.canonical_stat)
             if fit_key not in memo:
                 memo[fit_key] = _fit_player_stat(
-                    db, name_to_id, r.player_name, canonical_stat,
+                    db, name_to_id, r.player_name, r.canonical_stat,
                     n_games, model_mode, rolling_window, db_path,
                     team_prior_map=team_prior_map,
+                    history_cache=history_cache,
                 )
-            fit = memo[fit_key]
-            if fit is None:
-                continue
+    return [
+        memo.get(key)
+        for key in zip(per_book["player_key"], per_book["canonical_stat"])
+    ]
 
-            mu, sigma = fit["mu"], fit["sigma"]
-            distribution = fit.get("distribution", "normal")
-            line = float(r.book_line)
-            if model_mode == "full":
-                # Per-stat distribution (rebounds → poisson, etc.), not a
-                # hardcoded normal.
-                p_over = float(prob_over_distribution(
-                    line=line, mu=mu, sigma=sigma,
-                    distribution=distribution, sample_size=int(rolling_window),
-                ))
-            else:
-                p_over = _normal_p_over(mu, sigma, line)
-            p_under = 1.0 - p_over
-            best_side = "over" if p_over >= p_under else "under"
-            p_best = max(p_over, p_under)
-            # DFS cards carry no American price → both sides priced at -110.
-            model_edge = p_best - implied_default
-            ev_best = pc.expected_value(p_best, default_american_odds)
-
-            cmean = consensus.get((r.player_key, canonical_stat))
-            pct_from_consensus = (
-                ((line - cmean) / cmean * 100.0)
-                if cmean not in (None, 0) else None
-            )
 
-            rows.append({
-                "book": r.book,
-                "player_name": r.player_name,
-                "stat_type": canonical_stat,
-                "book_line": line,
-                "model_mu": round(mu, 3),
-                "model_sigma": round(sigma, 3),
-                "line_vs_mu": round(line - mu, 3),
-                "p_over": round(p_over, 4),
-                "p_under": round(p_under, 4),
-                "best_side": best_side,
-                "model_edge": round(model_edge, 4),
-                "ev_best": round(ev_best, 4) if ev_best is not None else None,
-                "consensus_mean": round(cmean, 3) if cmean is not None else None,
-                "pct_from_consensus": (
-                    round(pct_from_consensus, 2)
-                    if pct_from_consensus is not None else None
-                ),
-                "observed_hours_ago": (
-                    round(_hours_ago(r.observed_at_utc), 2)
-                    if _hours_ago(r.observed_at_utc) is not None else None
-                ),
-                "observed_at_utc": r.observed_at_utc,
-                "n_games_used": fit["n"],
-                "distribution": distribution,
-                "model_mode": model_mode,
-            })
-
-    if not rows:
-        return pd.DataFrame(columns=SCORED_COLUMNS_FULL)
-    return pd.DataFrame(rows, columns=SCORED_COLUMNS_FULL)
+def _score_rows(
+    scored: pd.DataFrame,
+    row_fits: list,
+    *,
+    model_mode: str,
+    rolling_window: int,
+    default_american_odds: int,
+) -> pd.DataFrame:
+    """Whole-column p_over / edge / EV / staleness for the fitted per-book rows."""
+    mu = np.array([fit["mu"] for fit in row_fits], dtype=float)
+    sigma = np.array([fit["sigma"] for fit in row_fits], dtype=float)
+    distribution = [fit.get("distribution", "normal") for fit in row_fits]
+    line = scored["book_line"].astype(float).to_numpy()
+
+    if model_mode == "full":
+        # Per-stat distribution (rebounds → poisson, etc.), not a hardcoded
+        # normal; evaluated family by family over the whole slate.
+        p_over = prob_over_distribution_array(
+            line, mu, sigma, distribution, sample_size=int(rolling_window),
+        )
+    else:
+        # Vectorized ``_normal_p_over`` (degenerate σ ≤ 0 → step function).
+        safe_sigma = np.where(sigma > 0, sigma, 1.0)
+        p_over = np.where(
+            sigma > 0,
+            1.0 - norm.cdf(line, loc=mu, scale=safe_sigma),
+            np.where(mu > line, 1.0, np.where(mu == line, 0.5, 0.0)),
+        )
+    p_under = 1.0 - p_over
+    p_best = np.maximum(p_over, p_under)
+    # DFS cards carry no American price → both sides priced at -110.
+    implied_default = american_to_implied_prob(int(default_american_odds))
+    decimal_odds = pc._american_odds_to_decimal(default_american_odds)
+    ev_best = (
+        p_best * (decimal_odds - 1.0) - (1.0 - p_best)
+        if decimal_odds is not None else np.full(len(p_best), np.nan)
+    )
+
+    cmean = scored["consensus_mean"].astype(float).to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct_from_consensus = np.where(
+            cmean != 0, (line - cmean) / cmean * 100.0, np.nan,
+        )
+    observed = pd.to_datetime(
+        scored["observed_at_utc"], errors="coerce", utc=True, format="mixed",
+    )
+    hours_ago = (pd.Timestamp.now(tz="UTC") - observed).dt.total_seconds() / 3600.0
+
+    out = pd.DataFrame({
+        "book": scored["book"],
+        "player_name": scored["player_name"],
+        "stat_type": scored["canonical_stat"],
+        "book_line": line,
+        "model_mu": np.round(mu, 3),
+        "model_sigma": np.round(sigma, 3),
+        "line_vs_mu": np.round(line - mu, 3),
+        "p_over": np.round(p_over, 4),
+        "p_under": np.round(p_under, 4),
+        "best_side": np.where(p_over >= p_under, "over", "under"),
+        "model_edge": np.round(p_best - implied_default, 4),
+        "ev_best": np.round(ev_best, 4),
+        "consensus_mean": np.round(cmean, 3),
+        "pct_from_consensus": np.round(pct_from_consensus, 2),
+        "observed_hours_ago": hours_ago.round(2).to_numpy(),
+        "observed_at_utc": scored["observed_at_utc"],
+        "n_games_used": [int(fit["n"]) for fit in row_fits],
+        "distribution": distribution,
+        "model_mode": model_mode,
+    })
+    return out[SCORED_COLUMNS_FULL]
 
 
 # ---------------------------------------------------------------------------
@@ -455,6 +788,346 @@ def top_edges(
     return df
 
 
+# ---------------------------------------------------------------------------
+# 4. Materialized scored_edges (refreshed incrementally by the hourly update)
+# ---------------------------------------------------------------------------
+
+def _fit_watermarks(
+    db: DatabaseManager,
+    name_to_id: dict,
+    player_keys: Sequence[str],
+    *,
+    model_mode: str,
+    team_prior_map: dict,
+) -> dict:
+    """``{player_key: fingerprint}`` of everything a player's fit reads.
+
+    The game-log part is ``DatabaseManager.game_log_marks``, which moves on
+    new, re-inserted and in-place corrected game logs; full mode also folds
+    in the player's team and that team's prior inputs. A row whose
+    fingerprint is unchanged since the last refresh keeps its fit."""
+    ids = sorted({
+        int(name_to_id[key]) for key in player_keys
+        if name_to_id.get(key) is not None
+    })
+    seen = db.game_log_marks(ids)
+    if model_mode == "full":
+        teams: dict = {}
+        for start in range(0, len(ids), SQL_PARAM_CHUNK):
+            chunk = ids[start:start + SQL_PARAM_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            teams.update(db.conn.execute(
+                f"SELECT player_id, team FROM players WHERE player_id IN ({placeholders})",
+                chunk,
+            ).fetchall())
+        for pid, mark in seen.items():
+            team = teams.get(pid)
+            team = str(team).strip().upper() if team and str(team).strip() else ""
+            prior = team_prior_map.get(team) if team else None
+            seen[pid] = f"{mark}|{team}|{json.dumps(prior, sort_keys=True, default=str)}"
+    out: dict = {}
+    for key in player_keys:
+        pid = name_to_id.get(key)
+        out[key] = "unresolved" if pid is None else seen.get(int(pid), "no_games")
+    return out
+
+
+def _refresh_profile(
+    db: DatabaseManager,
+    per_book: pd.DataFrame,
+    name_to_id: dict,
+    *,
+    db_path: str,
+    model_mode: str,
+    n_games: int,
+    rolling_window: int,
+    since_hours: float,
+    workers: Optional[int],
+    scored_at: str,
+) -> dict:
+    """Bring one ``scored_edges`` profile up to date with ``per_book``."""
+    profile = (model_mode, int(n_games), int(rolling_window))
+    team_prior_map = db.get_team_prior_inputs_map() if model_mode == "full" else {}
+    current = per_book.copy()
+    marks = _fit_watermarks(
+        db, name_to_id, current["player_key"].unique().tolist(),
+        model_mode=model_mode, team_prior_map=team_prior_map,
+    )
+    current["fit_watermark"] = current["player_key"].map(marks)
+
+    keys = ["player_key", "canonical_stat", "book_key"]
+    stored = pd.read_sql_query(
+        """
+        SELECT player_key, stat_type AS canonical_stat, book_key,
+               book_line AS stored_line, observed_at_utc AS stored_observed,
+               n_lines AS stored_n_lines, fit_watermark AS stored_watermark
+        FROM scored_edges
+        WHERE model_mode = ? AND n_games = ? AND rolling_window = ?
+        """,
+        db.conn, params=profile,
+    )
+    merged = current.merge(stored, on=keys, how="left")
+    dirty = (
+        merged["stored_line"].isna()
+        | (merged["stored_line"] != merged["book_line"])
+        | (merged["stored_watermark"] != merged["fit_watermark"])
+    ).to_numpy()
+    moved = (~dirty) & (
+        (merged["stored_observed"] != merged["observed_at_utc"])
+        | (merged["stored_n_lines"] != merged["n_lines"])
+    ).to_numpy()
+    vanished = stored.merge(current[keys], on=keys, how="left", indicator=True)
+    vanished = vanished[vanished["_merge"] == "left_only"]
+
+    rescore = merged.loc[dirty].reset_index(drop=True)
+    row_fits = []
+    if not rescore.empty:
+        row_fits = _fit_per_book(
+            db, rescore, db_path=db_path, n_games=n_games, model_mode=model_mode,
+            rolling_window=rolling_window, workers=workers,
+            name_to_id=name_to_id, team_prior_map=team_prior_map,
+        )
+    fitted = np.array([fit is not None for fit in row_fits], dtype=bool)
+    model_values: dict = {}
+    if fitted.any():
+        subset = rescore.loc[fitted].reset_index(drop=True)
+        subset["consensus_mean"] = np.nan  # consensus is computed at read time
+        scored = _score_rows(
+            subset, [fit for fit in row_fits if fit is not None],
+            model_mode=model_mode, rolling_window=rolling_window,
+            default_american_odds=DEFAULT_AMERICAN_ODDS,
+        )
+        model_values = dict(zip(
+            np.flatnonzero(fitted),
+            scored[list(_SCORED_EDGE_MODEL_COLUMNS)].itertuples(index=False, name=None),
+        ))
+
+    empty_model = (None,) * len(_SCORED_EDGE_MODEL_COLUMNS)
+    upserts = []
+    for idx, r in enumerate(rescore.itertuples(index=False)):
+        values = tuple(
+            None if isinstance(v, float) and not math.isfinite(v) else v
+            for v in model_values.get(idx, empty_model)
+        )
+        pid = name_to_id.get(r.player_key)
+        upserts.append((
+            *profile, r.player_key, r.canonical_stat, r.book_key, r.book,
+            r.player_name, None if pid is None else int(pid),
+            float(r.book_line), r.observed_at_utc, int(r.n_lines), *values,
+            r.fit_watermark, scored_at,
+        ))
+
+    if len(vanished):
+        db.conn.executemany(
+            "DELETE FROM scored_edges WHERE model_mode = ? AND n_games = ? "
+            "AND rolling_window = ? AND player_key = ? AND stat_type = ? "
+            "AND book_key = ?",
+            [(*profile, *k) for k in vanished[keys].itertuples(index=False, name=None)],
+        )
+    if upserts:
+        db.conn.executemany(_SCORED_EDGE_UPSERT_SQL, upserts)
+    touched = merged.loc[moved]
+    if len(touched):
+        db.conn.executemany(
+            "UPDATE scored_edges SET observed_at_utc = ?, n_lines = ?, book = ?, "
+            "player_name = ? "
+            "WHERE model_mode = ? AND n_games = ? AND rolling_window = ? "
+            "AND player_key = ? AND stat_type = ? AND book_key = ?",
+            [
+                (r.observed_at_utc, int(r.n_lines), r.book, r.player_name, *profile,
+                 r.player_key, r.canonical_stat, r.book_key)
+                for r in touched.itertuples(index=False)
+            ],
+        )
+    db.conn.execute(
+        """
+        INSERT INTO scored_edges_profiles
+            (model_mode, n_games, rolling_window, since_hours,
+             refreshed_at_utc, row_count)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(model_mode, n_games, rolling_window) DO UPDATE SET
+            since_hours = excluded.since_hours,
+            refreshed_at_utc = excluded.refreshed_at_utc,
+            row_count = excluded.row_count
+        """,
+        (*profile, float(since_hours or 0), scored_at, int(len(current))),
+    )
+    db.conn.commit()
+    return {
+        "rows": int(len(current)),
+        "rescored": int(dirty.sum()),
+        "fitted": int(fitted.sum()),
+        "reused": int(len(current) - dirty.sum()),
+        "deleted": int(len(vanished)),
+    }
+
+
+def refresh_scored_edges(
+    db_path: str = DEFAULT_DB_PATH,
+    *,
+    profiles: Sequence[tuple] = MATERIALIZED_PROFILES,
+    since_hours: float = DEFAULT_SINCE_HOURS,
+    workers: Optional[int] = None,
+) -> dict:
+    """Incrementally refresh ``scored_edges`` for each ``(model_mode, n_games,
+    rolling_window)`` profile.
+
+    Only (player, stat, book) rows that are new, whose collapsed line moved,
+    or whose player's fit watermark changed (new game logs; team / prior for
+    ``full``) are refitted and rescored; rows that left the ``since_hours``
+    slate are deleted. Consensus and staleness are left to the readers, so an
+    unchanged row costs nothing. Returns per-profile counts."""
+    for model_mode, _, _ in profiles:
+        if model_mode not in MATERIALIZED_MODES:
+            raise ValueError(
+                f"scored_edges can't materialize model_mode={model_mode!r}; "
+                f"expected one of {MATERIALIZED_MODES}"
+            )
+    lines = fetch_latest_prop_lines(db_path, since_hours=since_hours)
+    if lines.empty:
+        per_book = pd.DataFrame(columns=[
+            "player_key", "canonical_stat", "book_key", "player_name", "book",
+            "book_line", "observed_at_utc", "n_lines",
+        ])
+    else:
+        per_book = _collapse_per_book(lines)
+    scored_at = pd.Timestamp.now(tz="UTC").strftime("%Y-%m-%d %H:%M:%S")
+    summary: dict = {"lines": int(len(per_book)), "profiles": {}}
+    with DatabaseManager(db_path=db_path) as db:
+        name_to_id = _resolve_player_ids(db, per_book["player_name"].tolist())
+        for model_mode, n_games, rolling_window in profiles:
+            label = f"{model_mode}:{int(n_games)}:{int(rolling_window)}"
+            summary["profiles"][label] = _refresh_profile(
+                db, per_book, name_to_id, db_path=db_path, model_mode=model_mode,
+                n_games=n_games, rolling_window=rolling_window,
+                since_hours=since_hours, workers=workers, scored_at=scored_at,
+            )
+            logger.info("scored_edges %s: %s", label, summary["profiles"][label])
+    return summary
+
+
+def fetch_scored_edges(
+    db_path: str,
+    *,
+    books: Optional[Sequence[str]] = None,
+    stat_types: Optional[Sequence[str]] = None,
+    players: Optional[Sequence[str]] = None,
+    since_hours: float = DEFAULT_SINCE_HOURS,
+    n_games: int = DEFAULT_N_GAMES,
+    model_mode: str = "chart_mean",
+    rolling_window: int = 10,
+    min_p_over: Optional[float] = None,
+    min_edge: Optional[float] = None,
+    only_positive_ev: bool = False,
+    limit: Optional[int] = None,
+    max_age_hours: float = MATERIALIZED_MAX_AGE_HOURS,
+) -> Optional[dict]:
+    """Read the materialized scan: ``{"scored", "n_lines", "n_scored",
+    "refreshed_at_utc"}``, or ``None`` when the profile can't answer.
+
+    ``scored`` has the ``score_prop_edges`` → ``top_edges`` shape, with the
+    book / stat / lookback selection, cross-book consensus, staleness, the
+    filters and the ranking all done in SQL. Consensus is taken over every
+    selected line (fitted or not), like the live scan; ``players`` narrows the
+    returned rows without changing it. ``n_lines`` counts the raw per-side
+    lines, as ``len(fetch_latest_prop_lines(...))`` does on the live path.
+    ``None`` means no fresh profile exists for ``(model_mode, n_games,
+    rolling_window)`` refreshed within ``max_age_hours`` over exactly
+    ``since_hours``, and the caller should score live: rows are collapsed
+    over the refresh window, so a narrower window can't be cut from them."""
+    profile = (model_mode, int(n_games), int(rolling_window))
+    with DatabaseManager(db_path=db_path) as db:
+        meta = db.conn.execute(
+            """
+            SELECT since_hours, refreshed_at_utc,
+                   (julianday('now') - julianday(refreshed_at_utc)) * 24.0
+            FROM scored_edges_profiles
+            WHERE model_mode = ? AND n_games = ? AND rolling_window = ?
+            """,
+            profile,
+        ).fetchone()
+        if meta is None:
+            return None
+        profile_since, refreshed_at, age_hours = meta
+        bounded = bool(since_hours and since_hours > 0)
+        same_window = (
+            float(since_hours) == float(profile_since) if bounded
+            else (profile_since or 0) <= 0
+        )
+        if not same_window or age_hours is None or age_hours > float(max_age_hours):
+            return None
+        if books is not None and len(books) == 0:
+            return {"scored": pd.DataFrame(columns=SCORED_COLUMNS_FULL),
+                    "n_lines": 0, "n_scored": 0, "refreshed_at_utc": refreshed_at}
+
+        clauses = ["model_mode = ?", "n_games = ?", "rolling_window = ?"]
+        params: list = list(profile)
+        if bounded:
+            clauses.append("observed_at_utc >= datetime('now', ?)")
+            params.append(f"-{float(since_hours)} hours")
+        if books:
+            clauses.append(f"book_key IN ({','.join('?' * len(books))})")
+            params.extend(str(b).lower() for b in books)
+        if stat_types:
+            wanted = sorted({pc._canonical_stat_type(s) for s in stat_types})
+            clauses.append(f"stat_type IN ({','.join('?' * len(wanted))})")
+            params.extend(wanted)
+
+        filters = ["model_mu IS NOT NULL"]
+        filter_params: list = []
+        if players is not None:
+            names = sorted({str(p).lower() for p in players})
+            filters.append(f"player_key IN ({','.join('?' * len(names)) or 'NULL'})")
+            filter_params.extend(names)
+        if min_p_over is not None:
+            filters.append("p_over >= ?")
+            filter_params.append(float(min_p_over))
+        if min_edge is not None:
+            filters.append("model_edge >= ?")
+            filter_params.append(float(min_edge))
+        if only_positive_ev:
+            filters.append("COALESCE(ev_best, -1) > 0")
+        limit_sql = ""
+        if limit is not None and limit >= 0:
+            limit_sql = "LIMIT ?"
+            filter_params.append(int(limit))
+
+        selected_sql = f"""
+            SELECT *, AVG(book_line) OVER (
+                       PARTITION BY player_key, stat_type) AS consensus_mean
+            FROM scored_edges
+            WHERE {" AND ".join(clauses)}
+        """
+        n_lines, n_scored = db.conn.execute(
+            f"SELECT SUM(n_lines), COUNT(model_mu) FROM ({selected_sql})", params,
+        ).fetchone()
+        scored = pd.read_sql_query(
+            f"""
+            SELECT book, player_name, stat_type, book_line,
+                   model_mu, model_sigma, line_vs_mu,
+                   p_over, p_under, best_side, model_edge, ev_best,
+                   ROUND(consensus_mean, 3) AS consensus_mean,
+                   CASE WHEN consensus_mean != 0 THEN ROUND(
+                       (book_line - consensus_mean) / consensus_mean * 100.0, 2)
+                   END AS pct_from_consensus,
+                   ROUND((julianday('now') - julianday(observed_at_utc)) * 24.0, 2)
+                       AS observed_hours_ago,
+                   observed_at_utc, n_games_used, distribution, model_mode
+            FROM ({selected_sql})
+            WHERE {" AND ".join(filters)}
+            ORDER BY model_edge DESC, p_over DESC
+            {limit_sql}
+            """,
+            db.conn, params=(*params, *filter_params),
+        )
+    return {
+        "scored": scored[SCORED_COLUMNS_FULL],
+        "n_lines": int(n_lines or 0),
+        "n_scored": int(n_scored or 0),
+        "refreshed_at_utc": refreshed_at,
+    }
+
+
 # ---------------------------------------------------------------------------
 # CLI helper (test without Streamlit)
 # ---------------------------------------------------------------------------
@@ -473,6 +1146,8 @@ def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     p.add_argument("--model-mode", choices=list(MODEL_MODES),
                    default="chart_mean")
     p.add_argument("--rolling-window", type=int, default=10)
+    p.add_argument("--workers", type=int, default=1,
+                   help="worker processes for --model-mode full (default: serial)")
     p.add_argument("--min-edge", type=float, default=None)
     p.add_argument("--min-p-over", type=float, default=None)
     p.add_argument("--only-positive-ev", action="store_true")
@@ -492,6 +1167,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     scored = score_prop_edges(
         lines, db_path=args.db, n_games=args.n_games,
         model_mode=args.model_mode, rolling_window=args.rolling_window,
+        workers=args.workers,
     )
     top = top_edges(
         scored, min_p_over=args.min_p_over, min_edge=args.min_edge,
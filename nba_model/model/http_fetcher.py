@@ -0,0 +1,191 @@
+"""Concurrent conditional-GET fetcher for requests-mode web text ingestion.
+
+All URLs of a run share one ``httpx.AsyncClient`` connection pool. Each host
+gets a concurrency slot limit and a token bucket, so aggregator sites see a
+steady, bounded request rate. Stored validators (``ETag`` /
+``Last-Modified``) are sent back as ``If-None-Match`` /
+``If-Modified-Since``: a 304 comes back with no body, and the caller reuses
+the text it already has.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from urllib.parse import urlparse
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 16
+DEFAULT_PER_HOST_LIMIT = 2
+DEFAULT_HOST_RATE_PER_SECOND = 2.0
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` tokens per second, bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = max(1e-6, float(rate))
+        self.capacity = max(1.0, float(capacity if capacity is not None else rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate,
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+
+def _conditional_headers(validator: Optional[dict]) -> dict:
+    headers = {}
+    if validator:
+        if validator.get("etag"):
+            headers["If-None-Match"] = str(validator["etag"])
+        if validator.get("last_modified"):
+            headers["If-Modified-Since"] = str(validator["last_modified"])
+    return headers
+
+
+async def _fetch_one(
+    client: httpx.AsyncClient,
+    url: str,
+    validator: Optional[dict],
+    slot: asyncio.Semaphore,
+    bucket: TokenBucket,
+    retries: int,
+    retry_delay_seconds: float,
+    retry_backoff: float,
+) -> dict:
+    attempts = max(1, int(retries) + 1)
+    delay_base = max(0.0, float(retry_delay_seconds))
+    backoff = max(1.0, float(retry_backoff))
+    headers = _conditional_headers(validator)
+    for attempt in range(1, attempts + 1):
+        try:
+            async with slot:
+                await bucket.acquire()
+                response = await client.get(url, headers=headers)
+            if response.status_code != 304:
+                response.raise_for_status()
+            return {
+                "url": url,
+                "status_code": int(response.status_code),
+                "not_modified": response.status_code == 304,
+                "content_type": str(response.headers.get("Content-Type", "")).strip(),
+                "text": "" if response.status_code == 304 else response.text,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+        except (httpx.HTTPError, OSError) as exc:
+            if attempt >= attempts:
+                raise
+            delay = delay_base * (backoff ** (attempt - 1))
+            logger.warning(
+                "Web text fetch failed (%s/%s) for %s: %s. Retrying in %.2fs.",
+                attempt, attempts, url, exc, delay,
+            )
+            if delay > 0:
+                await asyncio.sleep(delay)
+    raise RuntimeError("Request failed without response")
+
+
+async def _fetch_all(
+    urls: list[str],
+    validators: dict,
+    user_agent: str,
+    timeout: float,
+    retries: int,
+    retry_delay_seconds: float,
+    retry_backoff: float,
+    per_host_limit: int,
+    host_rate_per_second: float,
+    max_connections: int,
+    transport: Optional[httpx.AsyncBaseTransport],
+) -> list[tuple]:
+    hosts = [urlparse(url).netloc.lower() for url in urls]
+    slots: dict[str, asyncio.Semaphore] = {}
+    buckets: dict[str, TokenBucket] = {}
+    for host in hosts:
+        if host not in slots:
+            slots[host] = asyncio.Semaphore(max(1, int(per_host_limit)))
+            buckets[host] = TokenBucket(
+                host_rate_per_second, capacity=max(1, int(per_host_limit)),
+            )
+
+    limits = httpx.Limits(
+        max_connections=max(1, int(max_connections)),
+        max_keepalive_connections=max(1, int(max_connections)),
+    )
+    async with httpx.AsyncClient(
+        headers={"User-Agent": user_agent, "Accept": "text/html,text/plain,*/*"},
+        timeout=float(timeout),
+        limits=limits,
+        follow_redirects=True,
+        transport=transport,
+    ) as client:
+        tasks = [
+            _fetch_one(
+                client, url, validators.get(url), slots[host], buckets[host],
+                retries, retry_delay_seconds, retry_backoff,
+            )
+            for url, host in zip(urls, hosts)
+        ]
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+    return [
+        (None, outcome) if isinstance(outcome, BaseException) else (outcome, None)
+        for outcome in outcomes
+    ]
+
+
+def fetch_urls_conditional(
+    urls: list[str],
+    validators: Optional[dict] = None,
+    *,
+    user_agent: str,
+    timeout: float = 20,
+    retries: int = 1,
+    retry_delay_seconds: float = 0.75,
+    retry_backoff: float = 2.0,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    host_rate_per_second: float = DEFAULT_HOST_RATE_PER_SECOND,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> list[tuple]:
+    """Fetch ``urls`` concurrently and return ``(response, error)`` per URL.
+
+    ``response`` is a dict with ``url``, ``status_code``, ``not_modified``,
+    ``content_type``, ``text`` ('' on 304), ``etag`` and ``last_modified``.
+    ``validators`` maps URL -> ``{"etag", "last_modified"}`` from the previous
+    fetch. Failed URLs are retried with the same delay/backoff policy as the
+    one-at-a-time fetcher; the final error is returned, not raised. Results
+    keep input order.
+    """
+    if not urls:
+        return []
+    coroutine = _fetch_all(
+        list(urls), validators or {}, user_agent, timeout, retries,
+        retry_delay_seconds, retry_backoff, per_host_limit, host_rate_per_second,
+        max_connections, transport,
+    )
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    # Called from inside an event loop (e.g. a notebook): run on a fresh one.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
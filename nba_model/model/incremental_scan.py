@@ -0,0 +1,161 @@
+"""Incremental re-scan of regex match streams between two versions of a text.
+
+A *stream* is what ``pattern.finditer`` produces: non-overlapping items, each
+``(start, end, extent, payload)``, where the next search resumes at ``end``
+and ``extent`` is the furthest offset the payload was parsed from. Given the
+items of the previous text, ``rescan_items`` searches the new text only
+around the changed regions and carries every other item over by reference
+(offsets shifted, payload untouched).
+
+Exactness rests on one bound, ``pad`` tokens: no match attempt starting at a
+position examines more than the previous character and the next ``pad``
+tokens. Under that bound an old item is reused only when everything it could
+have looked at lies in an unchanged block, and the new search re-joins the
+old stream at the first position, past a change, where both would search
+identical text from an identical state.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+from difflib import SequenceMatcher
+from itertools import accumulate
+from typing import Callable, Optional
+
+# Content-defined chunks: each ends after a token holding a digit (a card's
+# line, a payout multiplier) or after 256 digit-free characters, so an edit
+# only perturbs its own chunk and the diff runs over a few hundred mostly
+# unique chunks rather than every word.
+_CHUNK_RE = re.compile(r"\D{0,256}\d\S*\s*|\D{1,256}")
+
+
+def _chunk(text: str) -> tuple[list[str], list[int]]:
+    """Chunk strings and their start offsets (plus ``len(text)``)."""
+    chunks = _CHUNK_RE.findall(text)
+    return chunks, [0] + list(accumulate(map(len, chunks)))
+
+
+class TextDiff:
+    """Unchanged character blocks between ``old_text`` and ``new_text``."""
+
+    def __init__(self, old_text: str, new_text: str, pad: int):
+        old_chunks, old_starts = _chunk(old_text)
+        new_chunks, new_starts = _chunk(new_text)
+        matcher = SequenceMatcher(None, old_chunks, new_chunks, autojunk=False)
+        # (old_lo, old_hi, new_lo, new_hi) character offsets per block.
+        self.blocks = [
+            (old_starts[a], old_starts[a + size], new_starts[b], new_starts[b + size])
+            for a, b, size in matcher.get_matching_blocks()
+            if size
+        ]
+        self.text = new_text
+        self.old_len = len(old_text)
+        self._block_new_lo = [block[2] for block in self.blocks]
+        self._pad_re = re.compile(r"(?:\S*\s+){%d}" % (int(pad) + 1))
+        # One run more walking backwards, so the forward window from the
+        # limit ends strictly before the block does.
+        self._back_re = re.compile(r"(?:\S*\s+){%d}" % (int(pad) + 2))
+        self._reversed: Optional[str] = None
+
+    def changed_chars(self) -> int:
+        """Characters of the new text outside every unchanged block."""
+        return len(self.text) - sum(hi - lo for _, _, lo, hi in self.blocks)
+
+    def reaches_end(self, block: tuple) -> bool:
+        return block[1] == self.old_len and block[3] == len(self.text)
+
+    @staticmethod
+    def shift(block: tuple) -> int:
+        """Offset to add to an old-text position inside ``block``."""
+        return block[2] - block[0]
+
+    def _inside(self, block: tuple, pos: int) -> bool:
+        """Whether an attempt at new offset ``pos`` only examines ``block``."""
+        if pos - 1 < block[2] and not (block[0] == 0 and block[2] == 0):
+            return False
+        if self.reaches_end(block):
+            return pos <= block[3]
+        window = self._pad_re.match(self.text, pos)
+        return window is not None and window.end() < block[3]
+
+    def next_sync(self, pos: int) -> Optional[tuple]:
+        """First ``(offset, block)`` at or after ``pos`` where both texts scan alike."""
+        k = max(0, bisect_right(self._block_new_lo, pos) - 1)
+        for block in self.blocks[k:]:
+            lo = block[2] if block[0] == 0 and block[2] == 0 else block[2] + 1
+            candidate = max(pos, lo)
+            if candidate <= block[3] and self._inside(block, candidate):
+                return candidate, block
+        return None
+
+    def copy_limit(self, block: tuple) -> int:
+        """New offset before which every attempt in ``block`` stays inside it."""
+        if self.reaches_end(block):
+            return block[3]
+        if self._reversed is None:
+            self._reversed = self.text[::-1]
+        size = len(self.text)
+        window = self._back_re.match(self._reversed, size - block[3])
+        limit = size - window.end() if window is not None else block[2]
+        return limit if limit > block[2] and self._inside(block, limit) else block[2]
+
+    def window_end(self, pos: int) -> int:
+        """``endpos`` that keeps every attempt before ``pos`` exact."""
+        window = self._pad_re.match(self.text, pos)
+        return len(self.text) if window is None else min(len(self.text), window.end() + 1)
+
+
+def rescan_items(
+    search: Callable[[int, int], Optional[tuple]],
+    size: int,
+    old_items: list = (),
+    diff: Optional[TextDiff] = None,
+) -> list[tuple]:
+    """Items of the new text, searching only where ``diff`` says it changed.
+
+    ``search(pos, endpos)`` returns the first item starting at or after
+    ``pos`` in ``text[:endpos]`` (or None); ``size`` is ``len(text)``. With
+    ``diff=None`` this is a plain full scan and ``old_items`` is ignored.
+    """
+    items: list[tuple] = []
+    if diff is None:
+        pos = 0
+        while (item := search(pos, size)) is not None:
+            items.append(item)
+            pos = item[1]
+        return items
+
+    old_starts = [item[0] for item in old_items]
+    pos = 0
+    floor = 0
+    while True:
+        sync = diff.next_sync(max(pos, floor))
+        endpos = size if sync is None else diff.window_end(sync[0])
+        item = search(pos, endpos)
+        if item is not None and (sync is None or item[0] < sync[0]):
+            items.append(item)
+            pos = item[1]
+            continue
+        if sync is None:
+            return items
+
+        # Nothing new starts before ``q``: re-join the old stream there, unless
+        # an old item straddles ``q`` (the old search was not at ``q``).
+        q, block = sync
+        shift = diff.shift(block)
+        k = bisect_left(old_starts, q - shift)
+        if k > 0 and old_items[k - 1][1] > q - shift:
+            pos, floor = q, old_items[k - 1][1] + shift
+            continue
+        limit = diff.copy_limit(block) - shift
+        to_end = diff.reaches_end(block)
+        while k < len(old_items) and (to_end or old_items[k][0] < limit):
+            start, end, extent, payload = old_items[k]
+            items.append((start + shift, end + shift, extent + shift, payload))
+            k += 1
+        if to_end:
+            return items
+        # The next re-join can only happen past this block.
+        pos = max(q, items[-1][1] if items else 0, limit + shift)
+        floor = block[3]
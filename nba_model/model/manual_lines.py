@@ -449,12 +449,13 @@ def parse_manual_lines_text(
 def persist_manual_lines_records(records: list[dict], db=None) -> dict:
     """Insert parsed manual-line records into the ``betting_lines`` table.
 
-    Thin wrapper over ``DatabaseManager.insert_betting_lines_records`` that
-    keeps the Streamlit/Tk callers from having to import the DB manager
-    themselves. Opens its own ``DatabaseManager`` when ``db`` is ``None``.
+    Thin wrapper over ``arb_events.insert_betting_lines`` (the writer plus
+    write-time arb/middle detection) that keeps the Streamlit/Tk callers from
+    having to import the DB manager themselves. Opens its own
+    ``DatabaseManager`` when ``db`` is ``None``.
 
     Returns the insert summary dict (``inserted`` / ``duplicates_ignored`` /
-    ``attempted``) from the underlying writer.
+    ``attempted`` / ``arb_events``) from the underlying writer.
     """
     if not records:
         return {"inserted": 0, "duplicates_ignored": 0, "attempted": 0}
@@ -467,4 +468,6 @@ def persist_manual_lines_records(records: list[dict], db=None) -> dict:
 
         db = DatabaseManager()
 
-    return db.insert_betting_lines_records(records)
+    from nba_model.model.arb_events import insert_betting_lines
+
+    return insert_betting_lines(db, records)
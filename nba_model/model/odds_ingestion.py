@@ -2,10 +2,16 @@
 
 import argparse
 from collections import Counter
+import hashlib
+import json
 import logging
 import os
+import shutil
 import time
-from datetime import datetime, timezone
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
@@ -13,6 +19,7 @@ import requests
 from nba_api.stats.static import players as static_players
 
 from nba_model.data.database.db_manager import DatabaseManager
+from nba_model.scrapers.player_names import PlayerNameIndex
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +28,13 @@ DEFAULT_REQUEST_TIMEOUT = 25
 DEFAULT_REQUEST_RETRIES = 2
 DEFAULT_REQUEST_RETRY_DELAY_SECONDS = 0.75
 DEFAULT_REQUEST_RETRY_BACKOFF = 2.0
+# Per-event odds requests in flight at once; each one still costs quota.
+DEFAULT_EVENT_CONCURRENCY = 4
+# Event payloads cached per UTC hour, so a rerun in the same hour re-reads
+# them from disk instead of spending quota. Older hours are pruned.
+DEFAULT_ODDS_CACHE_DIR = "data/raw/odds_api"
+DEFAULT_ODDS_CACHE_KEEP_HOURS = 48
+_CACHE_HOUR_FORMAT = "%Y%m%dT%H"
 PLAYER_PROP_MARKETS = {
     "player_points": "points",
     "player_assists": "assists",
@@ -364,6 +378,114 @@ def fetch_event_player_props(
     return {}
 
 
+def _event_cache_path(
+    cache_dir: str,
+    snapshot_hour: str,
+    sport: str,
+    event_id: str,
+    regions: str,
+    markets: List[str],
+    bookmakers: Optional[List[str]],
+) -> Path:
+    """Cache file for one event's odds request in one snapshot hour."""
+    request_key = "|".join([
+        sport, str(event_id), regions, ",".join(sorted(markets)),
+        ",".join(sorted(bookmakers or [])),
+    ])
+    digest = hashlib.sha256(request_key.encode("utf-8")).hexdigest()[:32]
+    return Path(cache_dir) / snapshot_hour / f"{digest}.json"
+
+
+def _prune_event_cache(cache_dir: str, snapshot_hour: str, keep_hours: int) -> int:
+    """Delete hour directories older than ``keep_hours``; returns how many."""
+    root = Path(cache_dir)
+    if not root.is_dir():
+        return 0
+    current = datetime.strptime(snapshot_hour, _CACHE_HOUR_FORMAT)
+    cutoff = (current - timedelta(hours=max(1, int(keep_hours)))).strftime(_CACHE_HOUR_FORMAT)
+    removed = 0
+    for child in root.iterdir():
+        if child.is_dir() and child.name < cutoff:
+            shutil.rmtree(child, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+def fetch_event_player_props_many(
+    api_key: str,
+    event_ids: List[str],
+    sport: str = "basketball_nba",
+    regions: str = "us",
+    markets: Optional[List[str]] = None,
+    bookmakers: Optional[List[str]] = None,
+    request_timeout: int = DEFAULT_REQUEST_TIMEOUT,
+    request_retries: int = DEFAULT_REQUEST_RETRIES,
+    request_retry_delay_seconds: float = DEFAULT_REQUEST_RETRY_DELAY_SECONDS,
+    request_retry_backoff: float = DEFAULT_REQUEST_RETRY_BACKOFF,
+    max_concurrency: int = DEFAULT_EVENT_CONCURRENCY,
+    cache_dir: Optional[str] = None,
+    snapshot_hour: Optional[str] = None,
+    sleep_seconds: float = 0.0,
+) -> List[Tuple[Optional[dict], Optional[Exception], bool]]:
+    """
+    Fetch player-prop odds for many events, ``max_concurrency`` at a time.
+
+    With ``cache_dir``, each event payload is stored on disk keyed by
+    (event, markets, regions, bookmakers, snapshot hour); a cached event is
+    read back without an API call. ``snapshot_hour`` defaults to the current
+    UTC hour. ``sleep_seconds`` is slept by a worker after each API call.
+
+    Returns:
+        ``(payload, error, from_cache)`` per event id, in input order.
+    """
+    selected_markets = markets or list(PLAYER_PROP_MARKETS.keys())
+    hour = snapshot_hour or datetime.now(timezone.utc).strftime(_CACHE_HOUR_FORMAT)
+
+    def fetch_one(event_id: str):
+        path = None
+        if cache_dir:
+            path = _event_cache_path(
+                cache_dir, hour, sport, event_id, regions, selected_markets, bookmakers,
+            )
+            try:
+                with open(path, "r", encoding="utf-8") as handle:
+                    return json.load(handle), None, True
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as exc:
+                logger.warning(f"Ignoring unreadable odds cache file {path}: {exc}")
+        try:
+            payload = fetch_event_player_props(
+                api_key=api_key,
+                event_id=event_id,
+                sport=sport,
+                regions=regions,
+                markets=selected_markets,
+                bookmakers=bookmakers,
+                request_timeout=request_timeout,
+                request_retries=request_retries,
+                request_retry_delay_seconds=request_retry_delay_seconds,
+                request_retry_backoff=request_retry_backoff,
+            )
+        except Exception as exc:
+            return None, exc, False
+        if path is not None and payload:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle)
+            os.replace(tmp_path, path)
+        if sleep_seconds > 0:
+            time.sleep(sleep_seconds)
+        return payload, None, False
+
+    if not event_ids:
+        return []
+    workers = max(1, min(int(max_concurrency), len(event_ids)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(fetch_one, event_ids))
+
+
 def _parse_game_date(commence_time: str) -> str:
     """Convert API commence timestamp to YYYY-MM-DD date string."""
     ts = pd.to_datetime(commence_time, errors="coerce", utc=True)
@@ -385,19 +507,44 @@ def _extract_player_name(outcome: dict) -> Optional[str]:
     return None
 
 
+_PLAYER_ID_INDEX: Optional[Tuple[PlayerNameIndex, Dict[str, int]]] = None
+
+
+def _strip_accents(text: str) -> str:
+    """``Jokić`` -> ``Jokic``; feeds and ``nba_api`` disagree on diacritics."""
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def _player_id_index() -> Tuple[PlayerNameIndex, Dict[str, int]]:
+    """Name index over every ``nba_api`` static player, plus full name -> id.
+
+    Built once per process, on accent-free names. Active players come first,
+    so a full name shared with a retired player resolves to the active one.
+    """
+    global _PLAYER_ID_INDEX
+    if _PLAYER_ID_INDEX is None:
+        ids: Dict[str, int] = {}
+        for player in sorted(static_players.get_players(), key=lambda p: not p.get("is_active")):
+            ids.setdefault(_strip_accents(player["full_name"]), int(player["id"]))
+        _PLAYER_ID_INDEX = (PlayerNameIndex(ids), ids)
+    return _PLAYER_ID_INDEX
+
+
 def _resolve_player_id(player_name: str, cache: Dict[str, Optional[int]]) -> Optional[int]:
-    """Resolve player full name to NBA player id with memoization."""
+    """Resolve player full name to NBA player id with memoization.
+
+    Uses the prebuilt ``_player_id_index``: exact, suffix-free and
+    punctuation-free variants (``Kelly Oubre`` / ``CJ McCollum``) resolve
+    through ``PlayerNameIndex`` dict lookups.
+    """
     key = player_name.strip()
     if key in cache:
         return cache[key]
 
-    candidates = static_players.find_players_by_full_name(key)
-    if not candidates:
-        # Try a light normalization fallback.
-        normalized = key.replace(".", "")
-        candidates = static_players.find_players_by_full_name(normalized)
-
-    player_id = candidates[0]["id"] if candidates else None
+    index, ids = _player_id_index()
+    full_name = index.resolve(_strip_accents(key))
+    player_id = ids.get(full_name) if full_name else None
     cache[key] = player_id
     return player_id
 
@@ -492,8 +639,17 @@ def fetch_and_store_betting_lines(
     request_retry_delay_seconds: float = DEFAULT_REQUEST_RETRY_DELAY_SECONDS,
     request_retry_backoff: float = DEFAULT_REQUEST_RETRY_BACKOFF,
     write_snapshots: bool = True,
+    max_concurrency: int = DEFAULT_EVENT_CONCURRENCY,
+    cache_dir: Optional[str] = None,
+    cache_keep_hours: int = DEFAULT_ODDS_CACHE_KEEP_HOURS,
 ) -> dict:
-    """Fetch upcoming player props and store normalized rows in betting_lines table."""
+    """Fetch upcoming player props and store normalized rows in betting_lines table.
+
+    Per-event odds are fetched ``max_concurrency`` at a time; with
+    ``cache_dir`` they are cached per snapshot hour (see
+    ``fetch_event_player_props_many``) and hours older than
+    ``cache_keep_hours`` are pruned.
+    """
     selected_markets = markets or list(PLAYER_PROP_MARKETS.keys())
 
     all_records = []
@@ -501,6 +657,7 @@ def fetch_and_store_betting_lines(
     player_id_cache: Dict[str, Optional[int]] = {}
     ingestion_mode = None
     event_odds_failures = 0
+    event_cache_hits = 0
     first_event_error = None
     diagnostic = None
 
@@ -575,35 +732,37 @@ def fetch_and_store_betting_lines(
         if max_events is not None:
             events = events[:max_events]
         ingestion_mode = "event_odds"
-        for event in events:
-            event_id = event.get("id")
-            if not event_id:
-                continue
-            try:
-                payload = fetch_event_player_props(
-                    api_key=api_key,
-                    event_id=event_id,
-                    sport=sport,
-                    regions=regions,
-                    markets=selected_markets,
-                    bookmakers=bookmakers,
-                    request_timeout=request_timeout,
-                    request_retries=request_retries,
-                    request_retry_delay_seconds=request_retry_delay_seconds,
-                    request_retry_backoff=request_retry_backoff,
-                )
-            except Exception as exc:
+        event_ids = [event.get("id") for event in events if event.get("id")]
+        snapshot_hour = datetime.now(timezone.utc).strftime(_CACHE_HOUR_FORMAT)
+        if cache_dir:
+            _prune_event_cache(cache_dir, snapshot_hour, cache_keep_hours)
+        outcomes = fetch_event_player_props_many(
+            api_key=api_key,
+            event_ids=event_ids,
+            sport=sport,
+            regions=regions,
+            markets=selected_markets,
+            bookmakers=bookmakers,
+            request_timeout=request_timeout,
+            request_retries=request_retries,
+            request_retry_delay_seconds=request_retry_delay_seconds,
+            request_retry_backoff=request_retry_backoff,
+            max_concurrency=max_concurrency,
+            cache_dir=cache_dir,
+            snapshot_hour=snapshot_hour,
+            sleep_seconds=sleep_seconds,
+        )
+        for event_id, (payload, exc, from_cache) in zip(event_ids, outcomes):
+            if exc is not None:
                 logger.warning(f"Skipping event {event_id}: {exc}")
                 event_odds_failures += 1
                 if first_event_error is None:
                     first_event_error = str(exc)
                 continue
-
+            event_cache_hits += int(from_cache)
             records, missing = normalize_event_player_props(payload, player_id_cache=player_id_cache)
             all_records.extend(records)
             unresolved_names.update(missing)
-            if sleep_seconds > 0:
-                time.sleep(sleep_seconds)
 
     valid_records, validation_summary = validate_betting_line_records(all_records)
     deduped_records, duplicates_in_payload = _dedupe_records(valid_records)
@@ -627,7 +786,9 @@ def fetch_and_store_betting_lines(
             if pid not in seen_players and player_name:
                 seen_players[pid] = row["player_name"]
                 db.insert_player(pid, row["player_name"])
-        db_insert_summary = db.insert_betting_lines_records(deduped_records)
+        # Imported here: arb_events pulls in the charting stack.
+        from nba_model.model.arb_events import insert_betting_lines
+        db_insert_summary = insert_betting_lines(db, deduped_records)
 
         if write_snapshots and valid_records:
             snapshot_records = []
@@ -656,6 +817,7 @@ def fetch_and_store_betting_lines(
         "events_processed": len(events),
         "events_with_bookmakers": events_with_books,
         "event_odds_failures": event_odds_failures,
+        "event_cache_hits": event_cache_hits,
         "first_event_error": first_event_error,
         "diagnostic": diagnostic,
         "markets_requested": selected_markets,
@@ -697,6 +859,13 @@ def _build_parser() -> argparse.ArgumentParser:
         default=DEFAULT_REQUEST_RETRY_DELAY_SECONDS,
     )
     parser.add_argument("--request-retry-backoff", type=float, default=DEFAULT_REQUEST_RETRY_BACKOFF)
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_EVENT_CONCURRENCY)
+    parser.add_argument("--cache-dir", default=DEFAULT_ODDS_CACHE_DIR)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the API instead of reusing this hour's cached event payloads.",
+    )
     return parser
 
 
@@ -721,6 +890,8 @@ def main():
         request_retries=args.request_retries,
         request_retry_delay_seconds=args.request_retry_delay_seconds,
         request_retry_backoff=args.request_retry_backoff,
+        max_concurrency=max(1, int(args.max_concurrency)),
+        cache_dir=None if args.no_cache else args.cache_dir,
     )
     print("Odds ingestion summary:")
     for key, value in summary.items():
@@ -46,88 +46,143 @@ def prob_over_distribution(
       - uniform
       - lognormal
       - power_law (Pareto approximation)
+
+    Evaluated by ``prob_over_distribution_array`` so the scalar and vectorized
+    paths share one parameterisation per family.
     """
-    dist = str(distribution or "normal").strip().lower()
-    x = float(line)
-    mean = float(mu)
-    std = max(float(sigma), 1e-6)
+    return float(
+        prob_over_distribution_array(line, mu, sigma, distribution, sample_size)[0]
+    )
+
+
+# Integer-valued families: P(X > line) steps at whole numbers, so interval
+# probabilities come from CDF differences at floor / ceil of the lines.
+DISCRETE_DISTRIBUTIONS = frozenset({
+    "poisson", "binomial", "bernoulli_trials",
+    "negative_binomial", "negativebinomial", "neg_binomial", "nbinom", "negbin",
+})
+
+_KNOWN_DISTRIBUTIONS = DISCRETE_DISTRIBUTIONS | {
+    "normal", "gaussian", "student_t", "studentt", "t", "t_distribution",
+    "exponential", "uniform", "lognormal", "log_normal", "power_law", "powerlaw", "pareto",
+}
 
-    if dist in {"normal", "gaussian"}:
-        return float(1.0 - norm.cdf(x, loc=mean, scale=std))
 
-    if dist in {"student_t", "studentt", "t", "t_distribution"}:
-        if sample_size is not None and int(sample_size) > 1:
-            dof = float(int(sample_size) - 1)
+def prob_over_distribution_array(
+    line,
+    mu,
+    sigma,
+    distribution="normal",
+    sample_size=None,
+) -> np.ndarray:
+    """Vectorized ``prob_over_distribution`` over aligned arrays.
+
+    ``distribution`` (and ``sample_size``) may be scalars or per-row arrays;
+    rows are evaluated family by family, and only the families present are
+    computed. This is the single implementation behind the scalar function.
+    """
+    x = np.atleast_1d(np.asarray(line, dtype=float))
+    mean = np.broadcast_to(np.asarray(mu, dtype=float), x.shape)
+    std = np.maximum(np.broadcast_to(np.asarray(sigma, dtype=float), x.shape), 1e-6)
+    dist = np.array([
+        str(d or "normal").strip().lower()
+        for d in np.broadcast_to(np.asarray(distribution, dtype=object), x.shape)
+    ])
+    out = np.full(x.shape, np.nan)
+    present = set(dist.tolist())
+    # Unfitted rows (NaN line or mean) stay NaN whatever their label.
+    fitted = ~(np.isnan(x) | np.isnan(mean))
+    bad = sorted(set(dist[fitted].tolist()) - _KNOWN_DISTRIBUTIONS)
+    if bad:
+        raise ValueError(
+            f"Unsupported distribution '{bad[0]}'. "
+            "Supported: normal, student_t, binomial, negative_binomial, poisson, "
+            "exponential, uniform, lognormal, power_law."
+        )
+
+    def family(*names):
+        """Row mask for the family, or None when no row uses it."""
+        if present.isdisjoint(names):
+            return None
+        return np.isin(dist, names) if len(present) > 1 else np.ones(x.shape, dtype=bool)
+
+    m = family("normal", "gaussian")
+    if m is not None:
+        out[m] = 1.0 - norm.cdf(x[m], loc=mean[m], scale=std[m])
+
+    m = family("student_t", "studentt", "t", "t_distribution")
+    if m is not None:
+        if sample_size is None:
+            dof = np.full(x.shape, 6.0)
         else:
-            dof = 6.0
-        dof = max(2.0, dof)
-        return float(1.0 - t.cdf(x, df=dof, loc=mean, scale=std))
-
-    if dist == "poisson":
-        lam = max(0.0, mean)
-        k = int(np.floor(x))
-        return float(1.0 - poisson.cdf(k, mu=lam))
-
-    if dist in {"binomial", "bernoulli_trials"}:
-        if mean <= 1e-9:
-            return float(1.0 if x < 0 else 0.0)
-        variance = max(std * std, 1e-6)
-        p = float(np.clip(1.0 - (variance / mean), 1e-4, 0.999))
-        n_trials = int(np.clip(np.ceil(mean / p), 1, 5000))
-        k = int(np.floor(x))
-        return float(1.0 - binom.cdf(k, n=n_trials, p=p))
-
-    if dist in {"negative_binomial", "negativebinomial", "neg_binomial", "nbinom", "negbin"}:
-        if mean <= 1e-9:
-            return float(1.0 if x < 0 else 0.0)
-        variance = max(std * std, 1e-6)
-        if variance <= mean * 1.0001:
-            # No overdispersion — fall back to Poisson for stability.
-            k = int(np.floor(x))
-            return float(1.0 - poisson.cdf(k, mu=mean))
-        p = float(np.clip(mean / variance, 1e-4, 0.999))
-        r = float(np.clip(mean * p / max(1.0 - p, 1e-6), 1e-3, 1e6))
-        k = int(np.floor(x))
-        return float(1.0 - nbinom.cdf(k, n=r, p=p))
-
-    if dist == "exponential":
-        scale = std
-        shift = mean - scale
-        if x < shift:
-            return 1.0
-        return float(1.0 - expon.cdf(x, loc=shift, scale=scale))
-
-    if dist == "uniform":
+            n = np.floor(np.nan_to_num(
+                np.broadcast_to(np.asarray(sample_size, dtype=float), x.shape)))
+            dof = np.where(n > 1, n - 1.0, 6.0)
+        dof = np.maximum(2.0, dof)
+        out[m] = 1.0 - t.cdf(x[m], df=dof[m], loc=mean[m], scale=std[m])
+
+    m = family("poisson")
+    if m is not None:
+        out[m] = 1.0 - poisson.cdf(np.floor(x[m]), mu=np.maximum(0.0, mean[m]))
+
+    variance = np.maximum(std * std, 1e-6)
+    safe_mean = np.where(mean > 1e-9, mean, 1.0)
+    degenerate = 1.0 - np.where(x < 0, 0.0, 1.0)
+
+    m = family("binomial", "bernoulli_trials")
+    if m is not None:
+        p = np.clip(1.0 - variance / safe_mean, 1e-4, 0.999)
+        n_trials = np.clip(np.ceil(safe_mean / p), 1, 5000).astype(int)
+        fitted = 1.0 - binom.cdf(np.floor(x), n=n_trials, p=p)
+        out[m] = np.where(mean <= 1e-9, degenerate, fitted)[m]
+
+    m = family("negative_binomial", "negativebinomial", "neg_binomial", "nbinom", "negbin")
+    if m is not None:
+        p = np.clip(safe_mean / variance, 1e-4, 0.999)
+        r = np.clip(safe_mean * p / np.maximum(1.0 - p, 1e-6), 1e-3, 1e6)
+        k = np.floor(x)
+        fitted = np.where(
+            variance <= safe_mean * 1.0001,
+            1.0 - poisson.cdf(k, mu=safe_mean),
+            1.0 - nbinom.cdf(k, n=r, p=p),
+        )
+        out[m] = np.where(mean <= 1e-9, degenerate, fitted)[m]
+
+    m = family("exponential")
+    if m is not None:
+        shift = mean - std
+        out[m] = np.where(
+            x < shift, 1.0, 1.0 - expon.cdf(x, loc=shift, scale=std))[m]
+
+    m = family("uniform")
+    if m is not None:
         half_range = np.sqrt(3.0) * std
-        low = mean - half_range
-        high = mean + half_range
-        if high <= low:
-            return float(1.0 if mean > x else 0.0)
-        return float(1.0 - uniform.cdf(x, loc=low, scale=(high - low)))
-
-    if dist in {"lognormal", "log_normal"}:
-        positive_mean = max(mean, 1e-3)
-        variance = max(std * std, 1e-6)
+        low, high = mean - half_range, mean + half_range
+        width = np.where(high > low, high - low, 1.0)
+        out[m] = np.where(
+            high <= low,
+            np.where(mean > x, 1.0, 0.0),
+            1.0 - uniform.cdf(x, loc=low, scale=width),
+        )[m]
+
+    positive_mean = np.maximum(mean, 1e-3)
+
+    m = family("lognormal", "log_normal")
+    if m is not None:
         phi = np.sqrt(variance + positive_mean * positive_mean)
-        log_sigma = np.sqrt(max(np.log((phi * phi) / (positive_mean * positive_mean)), 1e-9))
+        log_sigma = np.sqrt(np.maximum(
+            np.log((phi * phi) / (positive_mean * positive_mean)), 1e-9))
         log_mu = np.log((positive_mean * positive_mean) / phi)
-        if x <= 0:
-            return 1.0
-        return float(1.0 - lognorm.cdf(x, s=log_sigma, scale=np.exp(log_mu)))
+        out[m] = np.where(
+            x <= 0, 1.0, 1.0 - lognorm.cdf(x, s=log_sigma, scale=np.exp(log_mu)))[m]
 
-    if dist in {"power_law", "powerlaw", "pareto"}:
-        positive_mean = max(mean, 1e-3)
-        variance = max(std * std, 1e-6)
+    m = family("power_law", "powerlaw", "pareto")
+    if m is not None:
         ratio = variance / (positive_mean * positive_mean)
-        alpha = 1.0 + np.sqrt(1.0 + (1.0 / max(ratio, 1e-6)))
-        alpha = max(float(alpha), 2.05)
+        alpha = np.maximum(
+            1.0 + np.sqrt(1.0 + 1.0 / np.maximum(ratio, 1e-6)), 2.05)
         x_m = positive_mean * (alpha - 1.0) / alpha
-        if x <= x_m:
-            return 1.0
-        return float(1.0 - pareto.cdf(x, b=alpha, scale=x_m))
-
-    raise ValueError(
-        f"Unsupported distribution '{distribution}'. "
-        "Supported: normal, student_t, binomial, negative_binomial, poisson, "
-        "exponential, uniform, lognormal, power_law."
-    )
+        out[m] = np.where(
+            x <= x_m, 1.0, 1.0 - pareto.cdf(x, b=alpha, scale=x_m))[m]
+
+    return out
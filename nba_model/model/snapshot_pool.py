@@ -0,0 +1,72 @@
+"""Ordered process-pool fan-out for the snapshot parsers (``--workers``).
+
+Snapshot parsing is pure regex work over page text, so the prop-card and
+team-line parsers hand each snapshot to a module-level function that returns
+its parsed records. ``map_ordered`` runs that function serially or on a
+process pool in chunks and yields results in input order. The caller stays
+the single DB reader and writer, so dedupe and insert order match a serial run.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 8
+# Chunks in flight per worker: enough to keep every process busy while the
+# main process reads the next texts, without loading the whole backlog.
+_CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+
+def _run_chunk(fn: Callable, chunk: list) -> list:
+    """Process-pool entry point: ``fn`` over one chunk, in order."""
+    return [fn(item) for item in chunk]
+
+
+def map_ordered(
+    fn: Callable,
+    items: Iterable,
+    *,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator:
+    """Yield ``fn(item)`` for every item, in input order.
+
+    ``workers`` <= 1 runs inline. Otherwise ``items`` is consumed lazily in
+    ``chunk_size`` chunks with a bounded number in flight, so only a few
+    chunks of page text are held at once. ``fn`` (and anything it closes
+    over, e.g. a ``functools.partial``) must be picklable. If the pool can't
+    start here the items are processed inline, so output never depends on it.
+    """
+    workers = int(workers or 1)
+    if workers <= 1:
+        for item in items:
+            yield fn(item)
+        return
+
+    iterator = iter(items)
+    chunk_size = max(1, int(chunk_size))
+    try:
+        pool = ProcessPoolExecutor(max_workers=workers)
+    except (OSError, RuntimeError) as exc:
+        logger.warning("snapshot process pool unavailable (%s); parsing serially", exc)
+        for item in iterator:
+            yield fn(item)
+        return
+
+    with pool:
+        in_flight: deque = deque()
+        max_in_flight = workers * _CHUNKS_IN_FLIGHT_PER_WORKER
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if chunk:
+                in_flight.append(pool.submit(_run_chunk, fn, chunk))
+            if in_flight and (not chunk or len(in_flight) >= max_in_flight):
+                yield from in_flight.popleft().result()
+            if not chunk and not in_flight:
+                break
@@ -11,9 +11,11 @@ from __future__ import annotations
 import argparse
 import hashlib
 import logging
+from functools import partial
 from typing import Optional
 
 from nba_model.data.database.db_manager import DatabaseManager
+from nba_model.model.snapshot_pool import map_ordered
 from nba_model.model.web_text_ingestion import detect_login_wall
 from nba_model.scrapers import get_scraper_for_url
 
@@ -23,6 +25,10 @@ PARSER_VERSION = "team_lines_v1"
 DEFAULT_MAX_SNAPSHOTS_PER_URL = 1
 DEFAULT_MAX_TOTAL_SNAPSHOTS = 250
 DEFAULT_MIN_PARSE_CONFIDENCE = 0.45
+# parse_ledger consumer name (suffixed with the sport for non-NBA parses);
+# see browser_prop_parser for the skip / backlog semantics.
+LEDGER_PARSER = "team_lines"
+DEFAULT_BACKLOG_LIMIT = 0
 
 
 def _build_record_sha256(
@@ -135,6 +141,47 @@ def extract_team_lines_from_snapshot(
     return out
 
 
+def _parse_snapshot(snap: dict, sport: Optional[str] = None) -> dict:
+    """Extract one snapshot's team lines; pure, so ``--workers`` can pool it.
+
+    Returns the snapshot's metadata (without its text), the extracted rows,
+    and the login-wall reason when it was skipped.
+    """
+    text_content = snap.get("text_content", "")
+    source_url = str(snap.get("source_url", ""))
+    meta = {key: value for key, value in snap.items() if key != "text_content"}
+    # Guard: skip login/paywall snapshots so we don't store junk team lines.
+    is_wall, wall_reason = detect_login_wall(text_content, source_url, sport=sport)
+    if is_wall:
+        return {"snapshot": meta, "records": [], "skipped_login_wall": wall_reason}
+    rows = extract_team_lines_from_snapshot(
+        text_content=text_content,
+        source_url=source_url,
+        snapshot_id=int(snap.get("snapshot_id")),
+        observed_at_utc=str(snap.get("fetched_at_utc", "")),
+        sport=sport,
+    )
+    return {"snapshot": meta, "records": rows, "skipped_login_wall": None}
+
+
+def _ledger_parser(sport: Optional[str]) -> str:
+    sport_key = str(sport or "nba").strip().lower()
+    return LEDGER_PARSER if sport_key == "nba" else f"{LEDGER_PARSER}:{sport_key}"
+
+
+def _ledger_entry(snap: dict, status: str, extracted: int = 0, retained: int = 0) -> dict:
+    """``parse_ledger`` entry for a handled snapshot (without its page text)."""
+    return {
+        "content_sha256": snap.get("content_sha256"),
+        "source_url": snap.get("source_url"),
+        "snapshot_id": snap.get("snapshot_id"),
+        "fetched_at_utc": snap.get("fetched_at_utc"),
+        "status": status,
+        "records_extracted": int(extracted),
+        "records_retained": int(retained),
+    }
+
+
 def parse_and_store_web_team_lines(
     db_path: str = "data/database/nba_data.db",
     source_urls: Optional[list[str]] = None,
@@ -142,90 +189,113 @@ def parse_and_store_web_team_lines(
     max_total_snapshots: int = DEFAULT_MAX_TOTAL_SNAPSHOTS,
     min_parse_confidence: float = DEFAULT_MIN_PARSE_CONFIDENCE,
     sport: Optional[str] = None,
+    backlog_limit: int = DEFAULT_BACKLOG_LIMIT,
+    workers: int = 1,
 ) -> dict:
     """Parse stored snapshots into ``web_team_lines`` rows and persist them.
 
     ``sport`` selects the per-(book, sport) scraper config for extraction
-    (default NBA); pass 'mlb' when parsing MLB lobby snapshots.
+    (default NBA); pass 'mlb' when parsing MLB lobby snapshots. Snapshots whose
+    text was already parsed are skipped via ``parse_ledger``; ``backlog_limit``
+    reparses up to that many older texts this ``PARSER_VERSION`` never saw.
+    ``workers`` > 1 extracts on a process pool with serial ordering/dedupe.
     """
     with DatabaseManager(db_path=db_path) as db:
-        snapshots = db.get_recent_web_text_snapshots(
+        # Metadata only; texts are streamed one snapshot at a time below.
+        snapshot_refs = db.get_recent_web_text_snapshot_refs(
             source_urls=list(source_urls) if source_urls else None,
             max_snapshots_per_url=max_snapshots_per_url,
             limit_total=max_total_snapshots,
         )
 
-    if not snapshots:
-        return {
-            "status": "skipped",
-            "snapshots_considered": 0,
-            "lines_extracted": 0,
-            "lines_retained": 0,
-            "db_inserted": 0,
-            "db_attempted": 0,
-            "results": [],
-        }
-
-    threshold = float(min_parse_confidence)
-    all_records: list[dict] = []
-    results: list[dict] = []
-    total_extracted = 0
-    total_retained = 0
-    snapshots_login_walled = 0
-
-    for snap in snapshots:
-        text_content = snap.get("text_content", "")
-        source_url = str(snap.get("source_url", ""))
-        # Guard: skip login/paywall snapshots so we don't store junk team lines.
-        is_wall, wall_reason = detect_login_wall(text_content, source_url, sport=sport)
-        if is_wall:
-            snapshots_login_walled += 1
+        if not snapshot_refs:
+            return {
+                "status": "skipped",
+                "snapshots_considered": 0,
+                "lines_extracted": 0,
+                "lines_retained": 0,
+                "db_inserted": 0,
+                "db_attempted": 0,
+                "results": [],
+            }
+
+        ledger_parser = _ledger_parser(sport)
+        heads = db.get_parse_ledger_heads(
+            ledger_parser, PARSER_VERSION, [ref["source_url"] for ref in snapshot_refs],
+        )
+        pending_refs = [
+            ref for ref in snapshot_refs
+            if not ref.get("content_sha256")
+            or heads.get(ref["source_url"]) != ref["content_sha256"]
+        ]
+        backlog_refs = db.get_parse_backlog_refs(
+            ledger_parser, PARSER_VERSION, backlog_limit,
+            source_urls=list(source_urls) if source_urls else None,
+            exclude_sha256={ref.get("content_sha256") for ref in snapshot_refs},
+        )
+
+        threshold = float(min_parse_confidence)
+        all_records: list[dict] = []
+        results: list[dict] = []
+        total_extracted = 0
+        total_retained = 0
+        snapshots_login_walled = 0
+        ledger_entries: list[dict] = []
+
+        parse = partial(_parse_snapshot, sport=sport)
+        snapshots = db.iter_web_text_snapshots(pending_refs + backlog_refs)
+        for outcome in map_ordered(parse, snapshots, workers=workers):
+            snap = outcome["snapshot"]
+            wall_reason = outcome["skipped_login_wall"]
+            if wall_reason:
+                snapshots_login_walled += 1
+                results.append(
+                    {
+                        "snapshot_id": snap.get("snapshot_id"),
+                        "source_url": snap.get("source_url"),
+                        "extracted_count": 0,
+                        "retained_count": 0,
+                        "skipped_login_wall": wall_reason,
+                    }
+                )
+                logger.warning(
+                    "Skipping login-walled snapshot %s (%s): %s",
+                    snap.get("snapshot_id"), snap.get("source_url"), wall_reason,
+                )
+                ledger_entries.append(_ledger_entry(snap, "login_wall"))
+                continue
+            rows = outcome["records"]
+            total_extracted += len(rows)
+            retained = [
+                r for r in rows
+                if float(r.get("parse_confidence", 0.0)) >= threshold
+            ]
+            total_retained += len(retained)
+            all_records.extend(retained)
             results.append(
                 {
                     "snapshot_id": snap.get("snapshot_id"),
                     "source_url": snap.get("source_url"),
-                    "extracted_count": 0,
-                    "retained_count": 0,
-                    "skipped_login_wall": wall_reason,
+                    "extracted_count": len(rows),
+                    "retained_count": len(retained),
                 }
             )
-            logger.warning(
-                "Skipping login-walled snapshot %s (%s): %s",
-                snap.get("snapshot_id"), source_url, wall_reason,
-            )
-            continue
-        rows = extract_team_lines_from_snapshot(
-            text_content=text_content,
-            source_url=source_url,
-            snapshot_id=int(snap.get("snapshot_id")),
-            observed_at_utc=str(snap.get("fetched_at_utc", "")),
-            sport=sport,
-        )
-        total_extracted += len(rows)
-        retained = [
-            r for r in rows
-            if float(r.get("parse_confidence", 0.0)) >= threshold
-        ]
-        total_retained += len(retained)
-        all_records.extend(retained)
-        results.append(
-            {
-                "snapshot_id": snap.get("snapshot_id"),
-                "source_url": snap.get("source_url"),
-                "extracted_count": len(rows),
-                "retained_count": len(retained),
-            }
-        )
+            ledger_entries.append(_ledger_entry(snap, "parsed", len(rows), len(retained)))
 
-    db_summary = {"inserted": 0, "attempted": 0, "skipped_unchanged": 0}
-    if all_records:
-        with DatabaseManager(db_path=db_path) as db:
+        db_summary = {"inserted": 0, "attempted": 0, "skipped_unchanged": 0}
+        if all_records:
             db_summary = db.insert_web_team_lines(all_records)
+        db.record_parse_ledger(ledger_parser, PARSER_VERSION, ledger_entries)
 
-    status = "success" if total_extracted else "partial_success"
+    if not ledger_entries:
+        status = "skipped"
+    else:
+        status = "success" if total_extracted else "partial_success"
     return {
         "status": status,
-        "snapshots_considered": len(snapshots),
+        "snapshots_considered": len(snapshot_refs),
+        "snapshots_skipped_unchanged": len(snapshot_refs) - len(pending_refs),
+        "snapshots_backlog": len(backlog_refs),
         "snapshots_login_walled": int(snapshots_login_walled),
         "lines_extracted": total_extracted,
         "lines_retained": total_retained,
@@ -255,6 +325,16 @@ def main() -> None:
         "--min-parse-confidence",
         type=float, default=DEFAULT_MIN_PARSE_CONFIDENCE,
     )
+    parser.add_argument(
+        "--backlog-limit",
+        type=int, default=DEFAULT_BACKLOG_LIMIT,
+        help="Also reparse up to N older snapshots this PARSER_VERSION has not seen.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int, default=1,
+        help="Worker processes for snapshot extraction (default: serial).",
+    )
     args = parser.parse_args()
     summary = parse_and_store_web_team_lines(
         db_path=args.db_path,
@@ -262,6 +342,8 @@ def main() -> None:
         max_snapshots_per_url=max(1, int(args.max_snapshots_per_url)),
         max_total_snapshots=max(1, int(args.max_total_snapshots)),
         min_parse_confidence=float(args.min_parse_confidence),
+        backlog_limit=max(0, int(args.backlog_limit)),
+        workers=max(1, int(args.workers)),
     )
     print("Team-line parser summary:")
     for k, v in summary.items():
@@ -7,6 +7,7 @@ import os
 import threading
 import time
 from datetime import datetime, timezone
+from functools import partial
 from html.parser import HTMLParser
 from pathlib import Path
 from typing import Optional
@@ -15,6 +16,11 @@ import requests
 from nba_api.stats.static import players as nba_players
 
 from nba_model.data.database.db_manager import DatabaseManager
+from nba_model.model.http_fetcher import (
+    DEFAULT_HOST_RATE_PER_SECOND,
+    DEFAULT_PER_HOST_LIMIT,
+    fetch_urls_conditional,
+)
 from nba_model.scrapers import get_scraper_for_url
 
 logger = logging.getLogger(__name__)
@@ -26,6 +32,10 @@ DEFAULT_WEB_TEXT_REQUEST_RETRY_BACKOFF = 2.0
 DEFAULT_WEB_TEXT_MAX_CHARS = 60000
 DEFAULT_WEB_TEXT_BROWSER_WAIT_AFTER_LOAD_SECONDS = 4.0
 DEFAULT_WEB_TEXT_BROWSER_PAGE_TIMEOUT_SECONDS = 45
+# CDP fetch session: reusable tabs per run, and how many URLs of one domain
+# may load at once (books rate-limit and share session state per domain).
+DEFAULT_CDP_MAX_TABS = 4
+DEFAULT_CDP_PER_DOMAIN_LIMIT = 1
 DEFAULT_ACTIVE_PLAYERS_OUTPUT_FILE = "data/config/active_nba_players.txt"
 DEFAULT_AUTH_STATE_DIR = "data/config/auth"
 DEFAULT_WEB_TEXT_USER_AGENT = (
@@ -741,9 +751,23 @@ def _fetch_url_text_with_requests(
     }
     response = requests.get(url, headers=headers, timeout=int(timeout))
     response.raise_for_status()
+    return _http_text_record(
+        url=url,
+        status_code=response.status_code,
+        content_type=str(response.headers.get("Content-Type", "")).strip(),
+        body=response.text or "",
+        max_chars=max_chars,
+    )
+
 
-    content_type = str(response.headers.get("Content-Type", "")).strip()
-    body = response.text or ""
+def _http_text_record(
+    url: str,
+    status_code: int,
+    content_type: str,
+    body: str,
+    max_chars: int,
+) -> dict:
+    """Normalized snapshot payload for an HTTP response body."""
     looks_like_html = "html" in content_type.lower() or "<html" in body.lower()
     text_content = (
         _extract_visible_text(body)
@@ -759,7 +783,7 @@ def _fetch_url_text_with_requests(
     return {
         "source_url": url,
         "fetched_at_utc": datetime.now(timezone.utc).isoformat(),
-        "http_status": int(response.status_code),
+        "http_status": int(status_code),
         "content_type": content_type or None,
         "text_content": text_content,
         "text_length": int(len(text_content)),
@@ -767,6 +791,33 @@ def _fetch_url_text_with_requests(
     }
 
 
+def _http_response_record(response: dict, max_chars: int) -> dict:
+    """Snapshot payload for one ``fetch_urls_conditional`` response.
+
+    A 304 yields a stub flagged ``not_modified``; the caller fills in the
+    stored text it validated.
+    """
+    if response["not_modified"]:
+        record = {
+            "source_url": response["url"],
+            "fetched_at_utc": datetime.now(timezone.utc).isoformat(),
+            "http_status": int(response["status_code"]),
+            "content_type": None,
+            "not_modified": True,
+        }
+    else:
+        record = _http_text_record(
+            url=response["url"],
+            status_code=response["status_code"],
+            content_type=response["content_type"],
+            body=response["text"] or "",
+            max_chars=max_chars,
+        )
+    record["etag"] = response.get("etag")
+    record["last_modified"] = response.get("last_modified")
+    return record
+
+
 def _ensure_local_playwright_browsers() -> None:
     """Point PLAYWRIGHT_BROWSERS_PATH at project-local dir when available."""
     local_browser_dir = Path(__file__).resolve().parents[2] / ".playwright-browsers"
@@ -860,31 +911,119 @@ def _resolve_auth_state_path(
 
 
 _SELECTOR_TIMEOUT_MS = 2000  # per-selector timeout (keeps total wait bounded)
+# The page counts as rendered once no nodes have been added for this long.
+_DOM_QUIET_MS = 750
+# Cap on scrolling plus the settle wait after it (the former fixed sleep).
+_SCROLL_SETTLE_MS = 1500
+# Per scroll step: how long a step may keep adding nodes before the next one.
+_SCROLL_STEP_QUIET_MS = 200
+
+# Resolves once no node has been added for ``quietMs`` (or ``maxMs`` passed)
+# and returns the milliseconds waited. The observer is installed on first use
+# per document and survives across calls.
+_DOM_QUIESCENCE_SCRIPT = """
+async ({quietMs, maxMs}) => {
+    const started = performance.now();
+    if (!window.__domQuiet) {
+        window.__domQuiet = {last: started, added: 0};
+        new MutationObserver((records) => {
+            for (const r of records) {
+                if (r.addedNodes.length) {
+                    window.__domQuiet.last = performance.now();
+                    window.__domQuiet.added += r.addedNodes.length;
+                }
+            }
+        }).observe(document.documentElement || document, {childList: true, subtree: true});
+    }
+    const tick = Math.max(10, Math.min(50, quietMs));
+    while (true) {
+        const now = performance.now();
+        if (now - started >= maxMs) break;
+        if (now - Math.max(window.__domQuiet.last, started) >= quietMs) break;
+        await new Promise((resolve) => setTimeout(resolve, tick));
+    }
+    return performance.now() - started;
+}
+"""
 
+# Scrolls one viewport step at a time, letting each step settle (up to three
+# quiet intervals), and stops at the first step that adds no nodes and no
+# height, or at the bottom / ``maxMs``. Restores the top of the page and
+# returns the steps and milliseconds spent.
+_ADAPTIVE_SCROLL_SCRIPT = """
+async ({stepQuietMs, maxMs}) => {
+    const started = performance.now();
+    const step = Math.max(200, Math.round(window.innerHeight * 0.8));
+    const height = () => Math.max(
+        document.body ? document.body.scrollHeight : 0,
+        document.documentElement.scrollHeight,
+    );
+    const nodes = () => document.getElementsByTagName('*').length;
+    let y = 0;
+    let steps = 0;
+    while (performance.now() - started < maxMs) {
+        const before = [nodes(), height()];
+        y += step;
+        window.scrollTo(0, y);
+        steps += 1;
+        const stepStarted = performance.now();
+        let last = stepStarted;
+        let count = before[0];
+        while (performance.now() - last < stepQuietMs
+               && performance.now() - stepStarted < 3 * stepQuietMs
+               && performance.now() - started < maxMs) {
+            await new Promise((resolve) => setTimeout(resolve, 25));
+            if (nodes() !== count) {
+                count = nodes();
+                last = performance.now();
+            }
+        }
+        if (nodes() === before[0] && height() === before[1]) break;
+        if (y >= height()) break;
+    }
+    window.scrollTo(0, 0);
+    return {steps: steps, ms: performance.now() - started};
+}
+"""
 
-def _scroll_page_for_lazy_content(page) -> None:
-    """Scroll the page incrementally to trigger lazy-loaded content."""
+
+def _wait_for_dom_quiescence(page, max_seconds: float, quiet_ms: int = _DOM_QUIET_MS) -> None:
+    """Wait until the DOM stops growing, for at most ``max_seconds``.
+
+    Falls back to the plain ``max_seconds`` sleep if the page can't run the
+    observer script (e.g. mid-navigation), matching the old fixed wait.
+    """
+    max_ms = int(max(0.0, float(max_seconds)) * 1000)
+    if max_ms <= 0:
+        return
     try:
         page.evaluate(
-            """
-            () => {
-                const step = Math.round(window.innerHeight * 0.8);
-                const max = Math.max(
-                    document.body.scrollHeight,
-                    document.documentElement.scrollHeight,
-                    3000,
-                );
-                let y = 0;
-                while (y < max) {
-                    window.scrollTo(0, y);
-                    y += step;
-                }
-                window.scrollTo(0, 0);
-            }
-            """
+            _DOM_QUIESCENCE_SCRIPT, {"quietMs": int(min(quiet_ms, max_ms)), "maxMs": max_ms},
+        )
+    except Exception:
+        try:
+            page.wait_for_timeout(max_ms)
+        except Exception:
+            pass
+
+
+def _scroll_page_for_lazy_content(page) -> None:
+    """Scroll until a step adds no new content, then let the page settle.
+
+    Scrolling and the settle wait share the ``_SCROLL_SETTLE_MS`` budget that
+    used to be a fixed sleep after a full-length scroll.
+    """
+    spent_ms = 0.0
+    try:
+        outcome = page.evaluate(
+            _ADAPTIVE_SCROLL_SCRIPT,
+            {"stepQuietMs": _SCROLL_STEP_QUIET_MS, "maxMs": _SCROLL_SETTLE_MS},
         )
+        spent_ms = float((outcome or {}).get("ms") or 0.0)
     except Exception:
         pass
+    remaining = max(0.0, _SCROLL_SETTLE_MS - spent_ms) / 1000.0
+    _wait_for_dom_quiescence(page, remaining, quiet_ms=min(_DOM_QUIET_MS, _SCROLL_SETTLE_MS // 3))
 
 
 # Domains whose SPA has always been scrolled for lazy content, kept so the
@@ -923,17 +1062,22 @@ def _detect_login_wall_early(page, url: str) -> bool:
         return False
 
 
-def _wait_for_dynamic_content(page, url: str, base_wait_seconds: float) -> None:
+def _wait_for_dynamic_content(page, url: str, base_wait_seconds: float) -> float:
     """Apply smart wait strategies: book-specific selector waits then networkidle fallback.
 
     After domcontentloaded we do a fast login-wall check first.  If the page is
     already showing a login wall we return immediately — this avoids the multi-minute
     hang that would otherwise occur as every selector times out one by one (up to
     ``_SELECTOR_TIMEOUT_MS`` × len(selectors) seconds per URL).
+
+    The settle wait after the selectors ends as soon as the DOM stops growing
+    (``_wait_for_dom_quiescence``); ``base_wait_seconds`` plus the book's
+    ``extra_wait_seconds`` is only its cap. Returns the seconds spent waiting.
     """
+    started = time.perf_counter()
     if _detect_login_wall_early(page, url):
         logger.info("Login wall detected early for %s — skipping extended content waits.", url)
-        return
+        return time.perf_counter() - started
 
     scraper = get_scraper_for_url(url)
     selectors = scraper.wait_selectors if scraper is not None else ()
@@ -960,18 +1104,13 @@ def _wait_for_dynamic_content(page, url: str, base_wait_seconds: float) -> None:
     # found.  On login-wall pages that slipped past the early check, skip the
     # extra wait to avoid stalling unnecessarily.
     effective_extra = extra_wait if selector_found else 0.0
-    total_wait = base_wait_seconds + effective_extra
-    if total_wait > 0:
-        page.wait_for_timeout(int(total_wait * 1000))
+    _wait_for_dom_quiescence(page, base_wait_seconds + effective_extra)
 
     # Scroll to trigger lazy-loaded content (SPAs like PrizePicks render cards
     # on scroll; sportsbook grids like DraftKings opt in via ``scroll_page``).
     if _should_scroll_for_lazy_content(scraper, book_domain):
         _scroll_page_for_lazy_content(page)
-        try:
-            page.wait_for_timeout(1500)
-        except Exception:
-            pass
+    return time.perf_counter() - started
 
 
 def _extract_page_text(page, url: str = "") -> str:
@@ -1017,11 +1156,222 @@ def _extract_page_text(page, url: str = "") -> str:
     return visible_text
 
 
+def _connect_over_cdp(p, chrome_debug_port: int):
+    """Connect Playwright ``p`` to the real Chrome, with the launch hint on failure."""
+    try:
+        return p.chromium.connect_over_cdp(f"http://localhost:{chrome_debug_port}")
+    except Exception as exc:
+        raise RuntimeError(
+            f"Cannot connect to Chrome on port {chrome_debug_port}: {exc}. "
+            "Launch Chrome with: open -na \"Google Chrome\" --args "
+            f"--remote-debugging-port={chrome_debug_port} "
+            "--user-data-dir=/tmp/pp-chrome-profile"
+        ) from exc
+
+
+def _find_domain_tab(browser, target_domain: str, skip_urls=frozenset()):
+    """First ``(context, page)`` already on ``target_domain``, or ``(None, None)``."""
+    for ctx in browser.contexts:
+        for pg in ctx.pages:
+            page_url = pg.url or ""
+            if target_domain in page_url and page_url not in skip_urls:
+                return ctx, pg
+    return None, None
+
+
+class CdpFetchSession:
+    """CDP connections and reusable tabs shared by one ingestion run.
+
+    ``map`` fetches URLs concurrently on up to ``max_tabs`` worker threads,
+    with at most ``per_domain_limit`` URLs of one domain loading at once.
+    Each worker connects to Chrome once and navigates one pooled tab for the
+    whole run (Playwright's sync API is bound to the thread that started it),
+    instead of connecting and opening a tab per URL. ``close`` (or leaving the
+    ``with`` block) closes the pooled tabs and disconnects; the user's Chrome
+    keeps running.
+    """
+
+    def __init__(
+        self,
+        chrome_debug_port: int,
+        max_tabs: int = DEFAULT_CDP_MAX_TABS,
+        per_domain_limit: int = DEFAULT_CDP_PER_DOMAIN_LIMIT,
+    ):
+        self.chrome_debug_port = int(chrome_debug_port)
+        self.max_tabs = max(1, int(max_tabs))
+        self.per_domain_limit = max(1, int(per_domain_limit))
+        self.connections_opened = 0
+        self._cond = threading.Condition()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._pending: list[dict] = []
+        self._in_flight_by_domain: dict[str, int] = {}
+        self._workers: list[threading.Thread] = []
+        self._closed = False
+        # Domains the user already had a tab on when the session first
+        # connected (read in place, never navigated), and the URL each pooled
+        # tab currently shows, so a pooled tab is never mistaken for one.
+        self._user_tab_domains: Optional[set[str]] = None
+        self._pool_tab_urls: dict[int, str] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def map(self, fn, urls: list[str]) -> list[tuple]:
+        """Run ``fn(url)`` for every URL on the tab workers.
+
+        Returns ``(result, error)`` per URL in input order; an exception from
+        ``fn`` is returned as ``error`` rather than raised.
+        """
+        from urllib.parse import urlparse
+
+        jobs = [
+            {"url": url, "domain": urlparse(url).netloc.lower(), "fn": fn,
+             "done": False, "result": None, "error": None}
+            for url in urls
+        ]
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("CdpFetchSession is closed.")
+            self._pending.extend(jobs)
+            while len(self._workers) < min(self.max_tabs, len(self._pending)):
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"cdp-tab-{len(self._workers)}",
+                    daemon=True,
+                )
+                self._workers.append(worker)
+                worker.start()
+            self._cond.notify_all()
+            while not all(job["done"] for job in jobs):
+                self._cond.wait()
+        return [(job["result"], job["error"]) for job in jobs]
+
+    def close(self) -> None:
+        """Stop the workers; each closes its tab and disconnects."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+
+    def _claim_job(self) -> Optional[dict]:
+        """Next pending job whose domain has a free slot (caller holds ``_cond``)."""
+        while True:
+            for i, job in enumerate(self._pending):
+                in_flight = self._in_flight_by_domain.get(job["domain"], 0)
+                if in_flight < self.per_domain_limit:
+                    del self._pending[i]
+                    self._in_flight_by_domain[job["domain"]] = in_flight + 1
+                    return job
+            if self._closed and not self._pending:
+                return None
+            self._cond.wait()
+
+    def _worker_loop(self) -> None:
+        try:
+            while True:
+                with self._cond:
+                    job = self._claim_job()
+                if job is None:
+                    return
+                try:
+                    job["result"] = job["fn"](job["url"])
+                except Exception as exc:  # noqa: BLE001 — handed back via map()
+                    job["error"] = exc
+                with self._cond:
+                    self._in_flight_by_domain[job["domain"]] -= 1
+                    job["done"] = True
+                    self._cond.notify_all()
+        finally:
+            self.discard_connection()
+
+    def _connection(self) -> dict:
+        """This worker's connection and pooled tab, opened on first use."""
+        state = getattr(self._local, "state", None)
+        if state is not None:
+            return state
+        _ensure_local_playwright_browsers()
+        playwright = _import_playwright()().start()
+        try:
+            browser = _connect_over_cdp(playwright, self.chrome_debug_port)
+            if not browser.contexts:
+                browser.close()
+                raise RuntimeError("No browser context in running Chrome.")
+            with self._lock:
+                if self._user_tab_domains is None:
+                    from urllib.parse import urlparse
+
+                    self._user_tab_domains = {
+                        urlparse(pg.url or "").netloc
+                        for ctx in browser.contexts
+                        for pg in ctx.pages
+                    } - {""}
+                page = browser.contexts[0].new_page()
+                self.connections_opened += 1
+        except Exception:
+            playwright.stop()
+            raise
+        state = {"playwright": playwright, "browser": browser, "page": page}
+        self._local.state = state
+        return state
+
+    def discard_connection(self) -> None:
+        """Close this worker's tab and disconnect; the next fetch reconnects."""
+        state = getattr(self._local, "state", None)
+        if state is None:
+            return
+        self._local.state = None
+        with self._lock:
+            self._pool_tab_urls.pop(threading.get_ident(), None)
+        for close in (state["page"].close, state["browser"].close, state["playwright"].stop):
+            try:
+                close()
+            except Exception:
+                pass
+
+    def read_url(self, url: str, timeout: int):
+        """Load ``url`` in this worker's tab.
+
+        Returns ``(response, visible_text, wait_seconds)``. Like the one-shot
+        CDP fetch, a tab the user already had open on the domain is read in
+        place without navigating or waiting (``response`` is None).
+        """
+        from urllib.parse import urlparse
+
+        state = self._connection()
+        target_domain = urlparse(url).netloc
+        existing_page = None
+        with self._lock:
+            pool_urls = set(self._pool_tab_urls.values())
+            user_domain = target_domain in (self._user_tab_domains or ())
+        if user_domain:
+            _, existing_page = _find_domain_tab(state["browser"], target_domain, pool_urls)
+
+        page = existing_page or state["page"]
+        page.set_default_timeout(max(1000, int(timeout) * 1000))
+        response = None
+        wait_seconds = 0.0
+        if existing_page is None:
+            response = page.goto(url, wait_until="domcontentloaded")
+            wait_seconds = _wait_for_dynamic_content(
+                page, url, DEFAULT_WEB_TEXT_BROWSER_WAIT_AFTER_LOAD_SECONDS,
+            )
+            with self._lock:
+                self._pool_tab_urls[threading.get_ident()] = page.url or url
+        return response, _extract_page_text(page, url=page.url or url), wait_seconds
+
+
 def _fetch_url_text_via_cdp(
     url: str,
     chrome_debug_port: int,
     timeout: int,
     max_chars: int,
+    cdp_session: Optional[CdpFetchSession] = None,
 ) -> dict:
     """Fetch page text by connecting to a REAL Chrome via CDP.
 
@@ -1032,21 +1382,27 @@ def _fetch_url_text_via_cdp(
         open -na "Google Chrome" --args \\
             --remote-debugging-port=<chrome_debug_port> \\
             --user-data-dir=/tmp/pp-chrome-profile
+
+    With a ``cdp_session`` the page is loaded in that session's pooled tab
+    over its open connection; without one this connects, uses a fresh tab,
+    and disconnects.
     """
+    if cdp_session is not None:
+        try:
+            response, visible_text, wait_seconds = cdp_session.read_url(url, timeout)
+        except Exception:
+            # Drop the (possibly dead) connection so a retry reconnects.
+            cdp_session.discard_connection()
+            raise
+        return _cdp_snapshot_record(
+            url, chrome_debug_port, max_chars, response, visible_text, wait_seconds,
+        )
+
     _ensure_local_playwright_browsers()
     sync_playwright = _import_playwright()
 
-    cdp_endpoint = f"http://localhost:{chrome_debug_port}"
     with sync_playwright() as p:
-        try:
-            browser = p.chromium.connect_over_cdp(cdp_endpoint)
-        except Exception as exc:
-            raise RuntimeError(
-                f"Cannot connect to Chrome on port {chrome_debug_port}: {exc}. "
-                "Launch Chrome with: open -na \"Google Chrome\" --args "
-                f"--remote-debugging-port={chrome_debug_port} "
-                "--user-data-dir=/tmp/pp-chrome-profile"
-            ) from exc
+        browser = _connect_over_cdp(p, chrome_debug_port)
 
         context = browser.contexts[0] if browser.contexts else None
         if not context:
@@ -1055,26 +1411,20 @@ def _fetch_url_text_via_cdp(
         # Prefer an existing tab already on the target domain so we reuse its
         # fully-loaded SPA state rather than starting a cold navigation.
         from urllib.parse import urlparse as _up
-        target_domain = _up(url).netloc
-        existing_page = None
-        for ctx in browser.contexts:
-            for pg in ctx.pages:
-                if target_domain in (pg.url or ""):
-                    existing_page = pg
-                    context = ctx
-                    break
-            if existing_page:
-                break
+        existing_context, existing_page = _find_domain_tab(browser, _up(url).netloc)
+        if existing_page:
+            context = existing_context
 
         opened_new_tab = existing_page is None
         page = existing_page or context.new_page()
         visible_text = ""
+        wait_seconds = 0.0
         try:
             page.set_default_timeout(max(1000, int(timeout) * 1000))
             response = None
             if opened_new_tab:
                 response = page.goto(url, wait_until="domcontentloaded")
-                _wait_for_dynamic_content(
+                wait_seconds = _wait_for_dynamic_content(
                     page, url, DEFAULT_WEB_TEXT_BROWSER_WAIT_AFTER_LOAD_SECONDS,
                 )
             # For an already-loaded existing tab, skip the scroll/wait so we
@@ -1092,6 +1442,20 @@ def _fetch_url_text_via_cdp(
             except Exception:
                 pass
 
+    return _cdp_snapshot_record(
+        url, chrome_debug_port, max_chars, response, visible_text, wait_seconds,
+    )
+
+
+def _cdp_snapshot_record(
+    url: str,
+    chrome_debug_port: int,
+    max_chars: int,
+    response,
+    visible_text: str,
+    wait_seconds: float = 0.0,
+) -> dict:
+    """Normalized snapshot payload for text fetched through CDP."""
     max_chars = max(0, int(max_chars))
     if max_chars > 0 and len(visible_text) > max_chars:
         visible_text = visible_text[:max_chars]
@@ -1112,6 +1476,7 @@ def _fetch_url_text_via_cdp(
         "text_length": int(len(visible_text)),
         "content_sha256": content_sha256,
         "fetch_method": f"cdp:{chrome_debug_port}",
+        "wait_seconds": round(float(wait_seconds), 3),
     }
 
 
@@ -1123,6 +1488,7 @@ def _fetch_url_text_with_browser(
     browser_auth_state_file: Optional[str],
     browser_user_data_dir: Optional[str],
     chrome_debug_port: Optional[int] = None,
+    cdp_session: Optional[CdpFetchSession] = None,
 ) -> dict:
     """Fetch one URL in browser context, optionally with persisted session state."""
     if chrome_debug_port is not None:
@@ -1136,6 +1502,7 @@ def _fetch_url_text_with_browser(
                 chrome_debug_port=chrome_debug_port,
                 timeout=timeout,
                 max_chars=max_chars,
+                cdp_session=cdp_session,
             )
         except Exception as exc:  # noqa: BLE001 — surfaced via retry log below
             disconnect_markers = (
@@ -1160,6 +1527,7 @@ def _fetch_url_text_with_browser(
                     chrome_debug_port=chrome_debug_port,
                     timeout=timeout,
                     max_chars=max_chars,
+                    cdp_session=cdp_session,
                 )
             raise
 
@@ -1171,6 +1539,7 @@ def _fetch_url_text_with_browser(
 
     response = None
     visible_text = ""
+    wait_seconds = 0.0
     with sync_playwright() as p:
         browser = p.chromium.launch(
             headless=True,
@@ -1188,7 +1557,7 @@ def _fetch_url_text_with_browser(
                 page.set_default_timeout(max(1000, int(timeout) * 1000))
 
                 response = page.goto(url, wait_until="domcontentloaded")
-                _wait_for_dynamic_content(
+                wait_seconds = _wait_for_dynamic_content(
                     page, url, DEFAULT_WEB_TEXT_BROWSER_WAIT_AFTER_LOAD_SECONDS,
                 )
                 visible_text = _extract_page_text(page, url=url)
@@ -1225,6 +1594,7 @@ def _fetch_url_text_with_browser(
         "text_content": visible_text,
         "text_length": int(len(visible_text)),
         "content_sha256": content_sha256,
+        "wait_seconds": round(float(wait_seconds), 3),
     }
 
 
@@ -1239,6 +1609,7 @@ def _fetch_url_text(
     browser_auth_state_file: Optional[str] = None,
     browser_user_data_dir: Optional[str] = None,
     chrome_debug_port: Optional[int] = None,
+    cdp_session: Optional[CdpFetchSession] = None,
 ) -> dict:
     """Fetch one URL with retry policy and return normalized text payload."""
     attempts = max(1, int(retries) + 1)
@@ -1262,6 +1633,7 @@ def _fetch_url_text(
                     browser_auth_state_file=browser_auth_state_file,
                     browser_user_data_dir=browser_user_data_dir,
                     chrome_debug_port=chrome_debug_port,
+                    cdp_session=cdp_session,
                 )
             return _fetch_url_text_with_requests(
                 url=url,
@@ -1304,8 +1676,25 @@ def fetch_and_store_web_text(
     browser_auth_state_file: Optional[str] = None,
     browser_user_data_dir: Optional[str] = None,
     chrome_debug_port: Optional[int] = None,
+    cdp_max_tabs: int = DEFAULT_CDP_MAX_TABS,
+    cdp_per_domain_limit: int = DEFAULT_CDP_PER_DOMAIN_LIMIT,
+    http_per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    http_host_rate_per_second: float = DEFAULT_HOST_RATE_PER_SECOND,
 ) -> dict:
-    """Fetch text snapshots for URLs and store into web_text_snapshots table."""
+    """Fetch text snapshots for URLs and store into web_text_snapshots table.
+
+    With ``chrome_debug_port`` the URLs are loaded concurrently through one
+    ``CdpFetchSession`` (up to ``cdp_max_tabs`` reusable tabs, at most
+    ``cdp_per_domain_limit`` per domain), so the run takes about as long as
+    its slowest pages rather than their sum. Snapshots from every path are
+    stored in one ``insert_web_text_snapshots`` batch, in URL order.
+
+    Without a browser, URLs are fetched concurrently by
+    ``http_fetcher.fetch_urls_conditional`` (``http_per_host_limit`` requests
+    in flight and ``http_host_rate_per_second`` per host). Each URL's last
+    ``ETag`` / ``Last-Modified`` is sent back, and a 304 is stored as an
+    ``unchanged`` snapshot reusing the previous text, without downloading it.
+    """
     use_browser = bool(
         str(browser_auth_state_file or "").strip()
         or str(browser_user_data_dir or "").strip()
@@ -1332,13 +1721,17 @@ def fetch_and_store_web_text(
         min_hours = max(0.0, float(min_hours_between_polls))
     with DatabaseManager(db_path=db_path) as db:
         latest_fetch_map = db.get_latest_web_text_fetch_times(normalized_urls)
+        validators = {} if use_browser else db.get_web_fetch_validators(normalized_urls)
 
     now_utc = datetime.now(timezone.utc)
     snapshot_records = []
     results = []
     fetched_count = 0
+    unchanged_count = 0
     skipped_recent_count = 0
     failed_count = 0
+    # (results index, url) for every URL that is due, fetched after the scan.
+    due: list[tuple[int, str]] = []
 
     for url in normalized_urls:
         latest_raw = latest_fetch_map.get(url)
@@ -1367,49 +1760,131 @@ def fetch_and_store_web_text(
                 }
             )
             continue
-
-        try:
-            record = _fetch_url_text(
-                url=url,
+        due.append((len(results), url))
+        results.append(None)
+
+    fetch_one = partial(
+        _fetch_url_text,
+        timeout=request_timeout,
+        retries=request_retries,
+        retry_delay_seconds=request_retry_delay_seconds,
+        retry_backoff=request_retry_backoff,
+        user_agent=user_agent,
+        max_chars=max_chars,
+        browser_auth_state_file=browser_auth_state_file,
+        browser_user_data_dir=browser_user_data_dir,
+        chrome_debug_port=chrome_debug_port,
+    )
+    due_urls = [url for _, url in due]
+    fetch_started = time.perf_counter()
+    if chrome_debug_port is not None and due_urls:
+        with CdpFetchSession(
+            chrome_debug_port,
+            max_tabs=cdp_max_tabs,
+            per_domain_limit=cdp_per_domain_limit,
+        ) as cdp_session:
+            outcomes = cdp_session.map(
+                lambda url: fetch_one(url=url, cdp_session=cdp_session), due_urls,
+            )
+    elif not use_browser:
+        outcomes = [
+            (_http_response_record(response, max_chars), None) if exc is None else (None, exc)
+            for response, exc in fetch_urls_conditional(
+                due_urls,
+                validators,
+                user_agent=str(user_agent).strip() or DEFAULT_WEB_TEXT_USER_AGENT,
                 timeout=request_timeout,
                 retries=request_retries,
                 retry_delay_seconds=request_retry_delay_seconds,
                 retry_backoff=request_retry_backoff,
-                user_agent=user_agent,
-                max_chars=max_chars,
-                browser_auth_state_file=browser_auth_state_file,
-                browser_user_data_dir=browser_user_data_dir,
-                chrome_debug_port=chrome_debug_port,
-            )
-            snapshot_records.append(record)
-            fetched_count += 1
-            results.append(
-                {
-                    "url": url,
-                    "status": "fetched",
-                    "http_status": record.get("http_status"),
-                    "text_length": record.get("text_length"),
-                    "content_sha256": record.get("content_sha256"),
-                }
+                per_host_limit=http_per_host_limit,
+                host_rate_per_second=http_host_rate_per_second,
             )
-        except Exception as exc:
+        ]
+    else:
+        outcomes = []
+        for url in due_urls:
+            try:
+                outcomes.append((fetch_one(url=url), None))
+            except Exception as exc:
+                outcomes.append((None, exc))
+    fetch_wall_seconds = time.perf_counter() - fetch_started
+    # Browser page-load waits per book, to see what the adaptive waits save.
+    wait_seconds_by_book: dict[str, float] = {}
+
+    for (slot, url), (record, exc) in zip(due, outcomes):
+        if exc is None and record.get("not_modified") and url not in validators:
+            exc = RuntimeError("HTTP 304 without a stored snapshot to reuse.")
+        if exc is not None:
             failed_count += 1
-            results.append(
-                {
-                    "url": url,
-                    "status": "failed",
-                    "error_type": exc.__class__.__name__,
-                    "error_message": str(exc),
-                }
+            results[slot] = {
+                "url": url,
+                "status": "failed",
+                "error_type": exc.__class__.__name__,
+                "error_message": str(exc),
+            }
+            continue
+        snapshot_records.append(record)
+        if record.get("not_modified"):
+            unchanged_count += 1
+            record["content_sha256"] = validators[url]["content_sha256"]
+            results[slot] = {
+                "url": url,
+                "status": "unchanged",
+                "http_status": record.get("http_status"),
+                "content_sha256": record["content_sha256"],
+            }
+            continue
+        fetched_count += 1
+        results[slot] = {
+            "url": url,
+            "status": "fetched",
+            "http_status": record.get("http_status"),
+            "text_length": record.get("text_length"),
+            "content_sha256": record.get("content_sha256"),
+        }
+        if record.get("wait_seconds") is not None:
+            results[slot]["wait_seconds"] = record["wait_seconds"]
+            book = _match_book_domain(url) or "unknown"
+            wait_seconds_by_book[book] = round(
+                wait_seconds_by_book.get(book, 0.0) + float(record["wait_seconds"]), 3,
             )
 
     db_insert_summary = {"inserted": 0, "attempted": 0}
     if snapshot_records:
         with DatabaseManager(db_path=db_path) as db:
+            reused = [rec for rec in snapshot_records if rec.get("not_modified")]
+            if reused:
+                # A 304 re-stores the text it validated; its blob already exists.
+                stored_texts = {
+                    snap["source_url"]: snap["text_content"]
+                    for snap in db.iter_web_text_snapshots([
+                        {"source_url": rec["source_url"],
+                         "snapshot_id": validators[rec["source_url"]]["snapshot_id"]}
+                        for rec in reused
+                    ])
+                }
+                for rec in reused:
+                    rec["text_content"] = stored_texts.get(rec["source_url"], "")
+                    rec["text_length"] = len(rec["text_content"])
             db_insert_summary = db.insert_web_text_snapshots(snapshot_records)
+            if not use_browser:
+                validator_rows = []
+                for rec in snapshot_records:
+                    # A 304 may omit the validators; keep the ones it confirmed.
+                    previous = (
+                        validators.get(rec["source_url"], {}) if rec.get("not_modified") else {}
+                    )
+                    validator_rows.append({
+                        "source_url": rec["source_url"],
+                        "etag": rec.get("etag") or previous.get("etag"),
+                        "last_modified": rec.get("last_modified") or previous.get("last_modified"),
+                        "content_sha256": rec.get("content_sha256"),
+                    })
+                db.upsert_web_fetch_validators(validator_rows)
 
     status = "success"
-    if failed_count > 0 and fetched_count == 0:
+    if failed_count > 0 and fetched_count + unchanged_count == 0:
         status = "failed"
     elif failed_count > 0:
         status = "partial_success"
@@ -1420,10 +1895,13 @@ def fetch_and_store_web_text(
         "urls_considered": int(len(normalized_urls)),
         "fetch_mode": ("browser" if use_browser else "requests"),
         "fetched_count": int(fetched_count),
+        "unchanged_count": int(unchanged_count),
         "skipped_recent_count": int(skipped_recent_count),
         "failed_count": int(failed_count),
         "min_hours_between_polls": min_hours,
         "force_poll": bool(force_poll),
+        "fetch_wall_seconds": round(fetch_wall_seconds, 3),
+        "wait_seconds_by_book": wait_seconds_by_book,
         "db_inserted": int(db_insert_summary.get("inserted", 0)),
         "db_attempted": int(db_insert_summary.get("attempted", 0)),
         "results": results,
@@ -1531,6 +2009,30 @@ def _build_parser() -> argparse.ArgumentParser:
             "real Chrome instead of Playwright's headless Chromium."
         ),
     )
+    parser.add_argument(
+        "--cdp-max-tabs",
+        type=int,
+        default=DEFAULT_CDP_MAX_TABS,
+        help="Reusable Chrome tabs fetching concurrently with --chrome-debug-port.",
+    )
+    parser.add_argument(
+        "--cdp-per-domain-limit",
+        type=int,
+        default=DEFAULT_CDP_PER_DOMAIN_LIMIT,
+        help="Max pages of one domain loading at once with --chrome-debug-port.",
+    )
+    parser.add_argument(
+        "--http-per-host-limit",
+        type=int,
+        default=DEFAULT_PER_HOST_LIMIT,
+        help="Concurrent requests per host without a browser.",
+    )
+    parser.add_argument(
+        "--http-host-rate",
+        type=float,
+        default=DEFAULT_HOST_RATE_PER_SECOND,
+        help="Max requests per second per host without a browser.",
+    )
     parser.add_argument(
         "--login-timeout",
         type=int,
@@ -1653,6 +2155,10 @@ def main():
             browser_auth_state_file=args.browser_auth_state_file,
             browser_user_data_dir=args.browser_user_data_dir,
             chrome_debug_port=args.chrome_debug_port,
+            cdp_max_tabs=args.cdp_max_tabs,
+            cdp_per_domain_limit=args.cdp_per_domain_limit,
+            http_per_host_limit=args.http_per_host_limit,
+            http_host_rate_per_second=args.http_host_rate,
         )
 
         print("Web text ingestion summary:")
@@ -1662,8 +2168,11 @@ def main():
             "urls_considered",
             "fetch_mode",
             "fetched_count",
+            "unchanged_count",
             "skipped_recent_count",
             "failed_count",
+            "fetch_wall_seconds",
+            "wait_seconds_by_book",
             "db_attempted",
             "db_inserted",
         ):
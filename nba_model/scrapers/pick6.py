@@ -17,10 +17,7 @@ import re
 from typing import Optional
 
 from nba_model.scrapers.base import BookScraper, SessionMarkers
-from nba_model.scrapers.player_names import (
-    load_active_player_names,
-    resolve_player_name,
-)
+from nba_model.scrapers.player_names import PlayerNameIndex, get_player_name_index
 
 
 # Position abbrevs Pick6 uses.
@@ -42,15 +39,9 @@ _ROW_RE = re.compile(
 )
 
 
-_ACTIVE_PLAYERS_CACHE: Optional[list[str]] = None
-
-
-def _load_active_players(db_path: str = "data/database/nba_data.db") -> list[str]:
-    """Cached wrapper around the shared loader."""
-    global _ACTIVE_PLAYERS_CACHE
-    if _ACTIVE_PLAYERS_CACHE is None:
-        _ACTIVE_PLAYERS_CACHE = load_active_player_names(db_path)
-    return _ACTIVE_PLAYERS_CACHE
+def _active_player_index(db_path: str = "data/database/nba_data.db") -> PlayerNameIndex:
+    """Shared active-player index (loaded once per DB, see ``player_names``)."""
+    return get_player_name_index(db_path)
 
 
 def _expand_abbreviated_name(abbrev: str) -> Optional[str]:
@@ -61,7 +52,7 @@ def _expand_abbreviated_name(abbrev: str) -> Optional[str]:
     scrapers can reuse the same expansion without duplicating the matrix
     of initial / surname / suffix rules.
     """
-    return resolve_player_name(abbrev, _load_active_players())
+    return _active_player_index().resolve(abbrev)
 
 
 def preprocess(text: str) -> str:
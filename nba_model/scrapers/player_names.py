@@ -17,6 +17,8 @@ chart pipelines.  This module centralizes the resolution:
   - ``resolve_player_name(raw, active_names=...)`` — returns the canonical
     full name for *any* of the variants above when there's a unique match
     in the active-players reference; ``None`` when ambiguous or unknown.
+  - ``get_player_name_index(db_path)`` — the same rules on a ``PlayerNameIndex``
+    built once per DB / sport, for callers resolving a name per parsed card.
 
 The Pick6 abbreviated-name expansion that lives in
 ``nba_model/scrapers/pick6.py`` is a thin wrapper over this so other
@@ -32,6 +34,13 @@ from typing import Iterable, Optional
 
 _SUFFIX_RE = re.compile(r"\b(?:jr|sr|ii|iii|iv|v)\.?$", flags=re.IGNORECASE)
 
+DEFAULT_DB_PATH = "data/database/nba_data.db"
+# Active-player reference table per sport; other sports have none yet.
+_ACTIVE_PLAYER_TABLES = {"nba": "nba_active_players_ref"}
+# (db_path, sport) -> (roster fingerprint, PlayerNameIndex), see
+# ``get_player_name_index``.
+_NAME_INDEX_CACHE: dict[tuple[str, str], tuple[object, "PlayerNameIndex"]] = {}
+
 
 def normalize_name_key(name: str) -> str:
     """Lowercase + strip non-alphanumerics for tolerant comparisons.
@@ -71,6 +80,113 @@ def _looks_like_initial(token: str) -> bool:
     return len(t) == 1 and t.isalpha()
 
 
+class PlayerNameIndex:
+    """Active-player lookups built once, for resolving many raw names.
+
+    ``resolve(raw)`` applies the ``resolve_player_name`` rules with dict
+    lookups only, so each call costs the same however large the roster is.
+    Results (including misses) are memoized per raw string.
+    """
+
+    def __init__(self, active_names: Iterable[str]):
+        self.names = [n for n in active_names if n]
+        self._by_key: dict[str, str] = {}
+        self._by_key_no_suffix: dict[str, str] = {}
+        self._by_lastname: dict[str, list[str]] = {}
+        self._by_initial_last: dict[tuple[str, str], list[str]] = {}
+        self._memo: dict[str, Optional[str]] = {}
+        for name in self.names:
+            k = normalize_name_key(name)
+            if k:
+                self._by_key.setdefault(k, name)
+            kns = normalize_name_key(_strip_suffix(name))
+            if kns:
+                self._by_key_no_suffix.setdefault(kns, name)
+            first, last = _split_first_last(_strip_suffix(name))
+            if last:
+                self._by_lastname.setdefault(normalize_name_key(last), []).append(name)
+                if first:
+                    self._by_initial_last.setdefault(
+                        (first[0].lower(), normalize_name_key(last)),
+                        [],
+                    ).append(name)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def resolve(self, raw: str) -> Optional[str]:
+        """Canonical active-player name for ``raw``, or ``None``.
+
+        See ``resolve_player_name`` for the resolution order.
+        """
+        if not raw:
+            return None
+        raw_stripped = str(raw).strip()
+        if not raw_stripped or not self.names:
+            return None
+        try:
+            return self._memo[raw_stripped]
+        except KeyError:
+            pass
+        resolved = self._resolve(raw_stripped)
+        self._memo[raw_stripped] = resolved
+        return resolved
+
+    def _resolve(self, raw_stripped: str) -> Optional[str]:
+        by_key = self._by_key
+        by_key_no_suffix = self._by_key_no_suffix
+
+        # 1. Exact key match.
+        direct = by_key.get(normalize_name_key(raw_stripped))
+        if direct:
+            return direct
+
+        # 2. Suffix-stripped match.
+        direct_ns = by_key_no_suffix.get(normalize_name_key(_strip_suffix(raw_stripped)))
+        if direct_ns:
+            return direct_ns
+
+        first, last = _split_first_last(_strip_suffix(raw_stripped))
+        first_key = normalize_name_key(first)
+        last_key = normalize_name_key(last)
+
+        # 3a. "Last, First" form was normalized by ``_split_first_last`` already,
+        #     but the resulting concatenation differs from the canonical
+        #     ``"First Last"``.  Try the reversed concatenation too.
+        if first_key and last_key:
+            reversed_key = first_key + last_key
+            m = by_key.get(reversed_key) or by_key_no_suffix.get(reversed_key)
+            if m:
+                return m
+
+        # 3b. Initial + surname (e.g. "J. Brunson", "J Brunson").
+        if first and last_key and _looks_like_initial(first):
+            matches = self._by_initial_last.get((first[0].lower(), last_key), [])
+            if len(matches) == 1:
+                return matches[0]
+            if len(matches) > 1:
+                return None  # ambiguous initial — refuse to guess
+
+        # 4. Single-token input: treat it as the surname and resolve when unique.
+        #    Covers ``"Wembanyama"`` → ``"Victor Wembanyama"``, ``"Brunson"`` →
+        #    ``"Jalen Brunson"``.  ``_split_first_last`` puts a single token in
+        #    ``first`` and leaves ``last`` empty, so we have to check both
+        #    orientations.
+        sole_token_key = last_key if last_key and not first_key else first_key
+        if sole_token_key and not (first_key and last_key):
+            matches = self._by_lastname.get(sole_token_key, [])
+            if len(matches) == 1:
+                return matches[0]
+
+        # 5. Surname-only when explicit ``(first='', last='Foo')`` form was used.
+        if last_key and not first_key:
+            matches = self._by_lastname.get(last_key, [])
+            if len(matches) == 1:
+                return matches[0]
+
+        return None
+
+
 def resolve_player_name(
     raw: str,
     active_names: Iterable[str],
@@ -86,113 +202,105 @@ def resolve_player_name(
        whose first name starts with ``J`` and last name is ``Brunson``).
     4. Surname-only when unique (e.g. ``"Wembanyama"`` → ``"Victor Wembanyama"``
        — only one Wembanyama in the league).
+
+    This builds a throwaway ``PlayerNameIndex``; callers resolving many
+    names should reuse one from ``get_player_name_index`` instead.
     """
-    if not raw:
-        return None
-    raw_stripped = str(raw).strip()
-    if not raw_stripped:
+    if not raw or not str(raw).strip():
         return None
+    return PlayerNameIndex(active_names).resolve(raw)
 
-    active = [n for n in active_names if n]
-    if not active:
-        return None
 
-    raw_key = normalize_name_key(raw_stripped)
-    raw_no_suffix_key = normalize_name_key(_strip_suffix(raw_stripped))
-
-    by_key = {}
-    by_key_no_suffix = {}
-    by_lastname: dict[str, list[str]] = {}
-    by_initial_last: dict[tuple[str, str], list[str]] = {}
-    for name in active:
-        k = normalize_name_key(name)
-        if k:
-            by_key.setdefault(k, name)
-        kns = normalize_name_key(_strip_suffix(name))
-        if kns:
-            by_key_no_suffix.setdefault(kns, name)
-        first, last = _split_first_last(_strip_suffix(name))
-        if last:
-            by_lastname.setdefault(normalize_name_key(last), []).append(name)
-            if first:
-                by_initial_last.setdefault(
-                    (first[0].lower(), normalize_name_key(last)),
-                    [],
-                ).append(name)
-
-    # 1. Exact key match.
-    direct = by_key.get(raw_key)
-    if direct:
-        return direct
-
-    # 2. Suffix-stripped match.
-    direct_ns = by_key_no_suffix.get(raw_no_suffix_key)
-    if direct_ns:
-        return direct_ns
-
-    first, last = _split_first_last(_strip_suffix(raw_stripped))
-    first_key = normalize_name_key(first)
-    last_key = normalize_name_key(last)
-
-    # 3a. "Last, First" form was normalized by ``_split_first_last`` already,
-    #     but the resulting concatenation differs from the canonical
-    #     ``"First Last"``.  Try the reversed concatenation too.
-    if first_key and last_key:
-        reversed_key = first_key + last_key
-        m = by_key.get(reversed_key) or by_key_no_suffix.get(reversed_key)
-        if m:
-            return m
-
-    # 3b. Initial + surname (e.g. "J. Brunson", "J Brunson").
-    if first and last_key and _looks_like_initial(first):
-        matches = by_initial_last.get((first[0].lower(), last_key), [])
-        if len(matches) == 1:
-            return matches[0]
-        if len(matches) > 1:
-            return None  # ambiguous initial — refuse to guess
-
-    # 4. Single-token input: treat it as the surname and resolve when unique.
-    #    Covers ``"Wembanyama"`` → ``"Victor Wembanyama"``, ``"Brunson"`` →
-    #    ``"Jalen Brunson"``.  ``_split_first_last`` puts a single token in
-    #    ``first`` and leaves ``last`` empty, so we have to check both
-    #    orientations.
-    sole_token_key = last_key if last_key and not first_key else first_key
-    if sole_token_key and not (first_key and last_key):
-        matches = by_lastname.get(sole_token_key, [])
-        if len(matches) == 1:
-            return matches[0]
-
-    # 5. Surname-only when explicit ``(first='', last='Foo')`` form was used.
-    if last_key and not first_key:
-        matches = by_lastname.get(last_key, [])
-        if len(matches) == 1:
-            return matches[0]
-
-    return None
+def name_variants(name: str) -> set[str]:
+    """Surface forms a page may print for the canonical ``name``.
+
+    The name itself, its suffix-stripped form (``"Tim Hardaway Jr."`` →
+    ``"Tim Hardaway"``) and dot-free spellings (``"C.J. McCollum"`` →
+    ``"CJ McCollum"``, ``"Jr."`` → ``"Jr"``). Single-word forms are dropped:
+    a bare surname is too ambiguous to anchor on in free page text.
+    """
+    base = " ".join(str(name or "").split())
+    if not base:
+        return set()
+    forms = {base, _strip_suffix(base)}
+    forms |= {form.replace(".", "") for form in forms}
+    forms |= {" ".join(form.split()) for form in forms}
+    return {form for form in forms if len(form.split()) >= 2}
 
 
 def load_active_player_names(
-    db_path: str = "data/database/nba_data.db",
+    db_path: str = DEFAULT_DB_PATH,
+    sport: str = "nba",
 ) -> list[str]:
-    """Load active-player names from ``nba_active_players_ref``.
+    """Load active-player names from the sport's reference table.
 
     Tiny helper so resolver callers don't have to repeat the SQL.  Returns
     an empty list rather than raising when the DB / table is missing — the
-    parsers degrade gracefully (they'll skip name expansion).
+    parsers degrade gracefully (they'll skip name expansion).  Only NBA has
+    a reference table (``nba_active_players_ref``) so far.
     """
+    table = _ACTIVE_PLAYER_TABLES.get(str(sport or "").lower())
+    if table is None:
+        return []
     try:
         conn = sqlite3.connect(db_path)
-        rows = conn.execute(
-            "SELECT player_name FROM nba_active_players_ref"
-        ).fetchall()
+        rows = conn.execute(f"SELECT player_name FROM {table}").fetchall()
         conn.close()
     except Exception:
         return []
     return [r[0] for r in rows if r and r[0]]
 
 
+def _roster_fingerprint(db_path: str, sport: str) -> Optional[tuple]:
+    """``(row count, newest synced_at_utc)`` of the sport's reference table.
+
+    ``None`` when the sport has no table or the DB / table is unreadable."""
+    table = _ACTIVE_PLAYER_TABLES.get(sport)
+    if table is None:
+        return None
+    try:
+        conn = sqlite3.connect(db_path)
+        try:
+            row = conn.execute(
+                f"SELECT COUNT(*), MAX(synced_at_utc) FROM {table}").fetchone()
+        finally:
+            conn.close()
+    except Exception:
+        return None
+    return tuple(row)
+
+
+def get_player_name_index(
+    db_path: str = DEFAULT_DB_PATH,
+    sport: str = "nba",
+) -> PlayerNameIndex:
+    """Shared ``PlayerNameIndex`` for ``(db_path, sport)``.
+
+    The index is rebuilt only when the reference table's row count or newest
+    ``synced_at_utc`` moves, so a re-sync (in this process or another one
+    writing the same DB) reaches long-lived callers on their next lookup.
+    """
+    key = (str(db_path), str(sport or "").lower())
+    fingerprint = _roster_fingerprint(key[0], key[1])
+    cached = _NAME_INDEX_CACHE.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    index = PlayerNameIndex(load_active_player_names(db_path, sport=key[1]))
+    _NAME_INDEX_CACHE[key] = (fingerprint, index)
+    return index
+
+
+def clear_player_name_index_cache() -> None:
+    """Drop every cached ``PlayerNameIndex``."""
+    _NAME_INDEX_CACHE.clear()
+
+
 __all__ = [
     "normalize_name_key",
+    "name_variants",
+    "PlayerNameIndex",
     "resolve_player_name",
     "load_active_player_names",
+    "get_player_name_index",
+    "clear_player_name_index_cache",
 ]
@@ -27,6 +27,7 @@ if __package__ in {None, ""}:
 from nba_model.data.database.db_manager import DatabaseManager  # noqa: E402
 from nba_model.model.manual_lines import (  # noqa: E402
     parse_manual_lines_text as _shared_parse_manual_lines_text,
+    persist_manual_lines_records,
 )
 from nba_model.run_model import (  # noqa: E402
     DEFAULT_AMERICAN_ODDS,
@@ -1392,7 +1393,7 @@ class SimpleModelUI:
                     if player_id not in seen:
                         seen[player_id] = row["player_name"]
                         db.insert_player(player_id, row["player_name"])
-                db.insert_betting_lines_records(self.manual_records)
+                persist_manual_lines_records(self.manual_records, db=db)
                 after_count = db.conn.execute(
                     "SELECT COUNT(*) FROM betting_lines").fetchone()[0]
 
@@ -0,0 +1,138 @@
+"""Tests for write-time arb / middle detection (``nba_model.model.arb_events``).
+
+The ingestion insert helpers re-evaluate only the props whose line changed and
+append hits to ``arb_events``; an unchanged opportunity is recorded once.
+"""
+
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+from nba_model.data.database.db_manager import DatabaseManager
+from nba_model.model import arb_events
+
+LEBRON_ID = 2544
+GAME_DATE = "2026-01-15"
+
+
+def _line(book, line, over_odds, under_odds, player_id=LEBRON_ID):
+    return {
+        "player_id": player_id, "game_date": GAME_DATE, "book": book,
+        "stat_type": "points", "line_value": line,
+        "over_odds": over_odds, "under_odds": under_odds,
+    }
+
+
+def _card(book, line, idx, observed):
+    return {
+        "snapshot_id": 1, "source_url": f"https://{book}.test/nba", "book": book,
+        "observed_at_utc": observed, "player_name": "LeBron James",
+        "player_classification": "active_nba", "stat_type": "points",
+        "line_value": line, "side": "over", "parse_confidence": 0.99,
+        "parser_version": "test-1", "record_sha256": f"sha-{book}-{idx}",
+    }
+
+
+class ArbEventsTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self._tmp.name) / "nba.db")
+        with DatabaseManager(db_path=self.db_path) as db:
+            db.conn.execute(
+                "INSERT INTO players (player_id, name) VALUES (?, ?)",
+                (LEBRON_ID, "LeBron James"),
+            )
+            db.conn.commit()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _events(self):
+        return arb_events.fetch_arb_events(self.db_path, since_hours=None)
+
+    def test_true_arb_recorded_once_per_price(self):
+        with DatabaseManager(db_path=self.db_path) as db:
+            first = arb_events.insert_betting_lines(db, [
+                _line("BookA", 25.5, 105, -130),
+                _line("BookB", 25.5, -140, 102),
+            ])
+            # A re-scrape of identical prices inserts nothing and detects nothing.
+            again = arb_events.insert_betting_lines(db, [_line("BookB", 25.5, -140, 102)])
+        self.assertEqual(first["arb_events"]["recorded"], 1)
+        self.assertIsNone(again.get("arb_events"))
+
+        events = self._events()
+        self.assertEqual(list(events["event_type"]), ["arb"])
+        row = events.iloc[0]
+        self.assertEqual((row["over_book"], row["under_book"]), ("BookA", "BookB"))
+        self.assertEqual(row["player_id"], LEBRON_ID)
+        self.assertGreater(row["guaranteed_margin"], 0)
+
+        # BookB moves its under price: a new executable arb is a new event.
+        with DatabaseManager(db_path=self.db_path) as db:
+            moved = arb_events.insert_betting_lines(db, [_line("BookB", 25.5, -140, 110)])
+        self.assertEqual(moved["arb_events"]["recorded"], 1)
+        self.assertEqual(len(self._events()), 2)
+
+    def test_priced_middle_without_arb(self):
+        with DatabaseManager(db_path=self.db_path) as db:
+            arb_events.insert_betting_lines(db, [
+                _line("BookA", 24.5, -110, -110),
+                _line("BookB", 26.5, -110, -110),
+            ])
+        events = self._events()
+        self.assertEqual(list(events["event_type"]), ["middle_candidate"])
+        row = events.iloc[0]
+        self.assertEqual((row["over_book"], row["over_line"]), ("BookA", 24.5))
+        self.assertEqual((row["under_book"], row["under_line"]), ("BookB", 26.5))
+        self.assertEqual(row["line_gap"], 2.0)
+
+    def test_dfs_cards_flag_middles_only(self):
+        now = datetime.now(timezone.utc)
+        ts = (now - timedelta(hours=1)).strftime("%Y-%m-%d %H:%M:%S")
+        with DatabaseManager(db_path=self.db_path) as db:
+            res = arb_events.insert_web_prop_cards(db, [
+                _card("Underdog", 17.5, 1, ts), _card("PrizePicks", 20.5, 2, ts),
+            ])
+            # Unchanged re-scrape: skipped as unchanged, nothing re-evaluated.
+            again = arb_events.insert_web_prop_cards(db, [_card("Underdog", 17.5, 3, ts)])
+        self.assertEqual(res["arb_events"]["recorded"], 1)
+        self.assertIsNone(again.get("arb_events"))
+        events = self._events()
+        self.assertEqual(list(events["event_type"]), ["middle_candidate"])
+        self.assertEqual(events.iloc[0]["source_table"], "web_prop_cards")
+        self.assertTrue(events["over_odds"].isna().all())
+
+    def test_detector_failure_never_blocks_insert(self):
+        with DatabaseManager(db_path=self.db_path) as db, patch.object(
+            arb_events, "detect_line_events", side_effect=RuntimeError("boom"),
+        ):
+            res = arb_events.insert_betting_lines(db, [
+                _line("BookA", 25.5, 105, -130), _line("BookB", 25.5, -140, 102),
+            ])
+        self.assertEqual(res["inserted"], 2)
+        self.assertIsNone(res["arb_events"])
+        self.assertNotIn("changed_props", res)
+
+    def test_writer_reports_changed_props_without_detecting(self):
+        with DatabaseManager(db_path=self.db_path) as db:
+            db.insert_betting_lines_records([_line("BookA", 25.5, 105, -130)])
+            res = db.insert_betting_lines_records([
+                _line("BookA", 25.5, 105, -130),            # duplicate
+                _line("BookB", 25.5, -140, 102),
+                {**_line("BookB", 7.5, -110, -110), "stat_type": "Rebounds"},
+                _line("BookA", 30.5, -110, -110, player_id=201939),
+            ])
+        self.assertEqual((res["inserted"], res["duplicates_ignored"]), (3, 1))
+        self.assertEqual(res["changed_props"], [
+            (LEBRON_ID, "points", GAME_DATE),
+            (LEBRON_ID, "rebounds", GAME_DATE),
+            (201939, "points", GAME_DATE),
+        ])
+        self.assertTrue(self._events().empty)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,7 +12,7 @@ from pathlib import Path
 
 import pandas as pd
 
-from nba_model.data.database.db_manager import DatabaseManager
+from nba_model.data.database.db_manager import DatabaseManager, _grade_bet_side
 
 LEBRON_ID = 2544
 GAME_DATE = "2025-04-10"
@@ -104,6 +104,46 @@ class BetLogRoundTripTests(unittest.TestCase):
             status = db.conn.execute("SELECT status FROM bet_log").fetchone()[0]
         self.assertEqual(status, "pending")
 
+    def test_set_based_grading_matches_grade_bet_side(self):
+        # Derived stats + whole/half lines on both sides: every row's status
+        # must equal the scalar _grade_bet_side rule (actuals pra 45, ra 15).
+        cases = [
+            (stat, line, side)
+            for stat, actual in (("points", 30), ("pra", 45), ("ra", 15))
+            for line in (actual - 0.5, float(actual), actual + 0.5)
+            for side in ("over", "under")
+        ]
+        with DatabaseManager(db_path=self.db_path) as db:
+            db.insert_bet_log_rows([_pick(st, ln, sd) for st, ln, sd in cases])
+            res = db.settle_bet_log(fill_clv=False)
+            rows = db.conn.execute(
+                "SELECT stat_type, line, side, actual_value, status FROM bet_log"
+            ).fetchall()
+        self.assertEqual(res["settled"], len(cases))
+        for stat, line, side, actual, status in rows:
+            self.assertEqual(status, _grade_bet_side(side, actual, line), (stat, line, side))
+
+    def test_predictions_backfill_grades_in_one_pass(self):
+        with DatabaseManager(db_path=self.db_path) as db:
+            for stat, line in (("points", 25.5), ("rebounds", 8.0),
+                               ("pra", 50.5), ("dunks", 1.5)):
+                db.insert_prediction({
+                    "player_id": LEBRON_ID, "game_date": GAME_DATE,
+                    "stat_type": stat, "predicted_mean": 1.0,
+                    "predicted_std": 1.0, "prob_over": 0.5, "line_value": line,
+                })
+            res = db.backfill_predictions_outcomes()
+            rows = dict(db.conn.execute(
+                "SELECT stat_type, actual_result || ':' || outcome FROM predictions"
+            ).fetchall())
+        self.assertEqual(res["scanned"], 4)
+        self.assertEqual(res["settled"], 3)
+        self.assertEqual(res["unsupported_stats"], ["dunks"])
+        self.assertEqual(rows["points"], "30.0:over")
+        self.assertEqual(rows["rebounds"], "8.0:push")
+        self.assertEqual(rows["pra"], "45.0:under")
+        self.assertIsNone(rows["dunks"])
+
     def test_invalid_side_is_skipped_on_insert(self):
         with DatabaseManager(db_path=self.db_path) as db:
             ins = db.insert_bet_log_rows([
@@ -4,12 +4,17 @@ import tempfile
 import unittest
 from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 from nba_model.data.database.db_manager import DatabaseManager
+from nba_model.model import browser_prop_parser as bpp
+from nba_model.model.snapshot_pool import map_ordered
+from nba_model.scrapers.player_names import name_variants
 from nba_model.model.browser_prop_parser import (
     _canonicalize_stat,
     _infer_book_from_url,
     _preprocess_prizepicks_text,
+    build_name_matcher,
     extract_prop_cards_from_text,
     parse_and_store_web_prop_cards,
 )
@@ -257,6 +262,467 @@ class BrowserPropParserTests(unittest.TestCase):
         for row in rows:
             self.assertEqual(row[3], "active_nba")
             self.assertEqual(row[4], "prizepicks")
+        # Parse time is attributed to the snapshot's book.
+        self.assertEqual(list(summary["parse_seconds_by_book"]), ["prizepicks"])
+        self.assertGreaterEqual(summary["results"][0]["parse_seconds"], 0.0)
+
+    def test_preprocessors_dispatched_by_source_url(self):
+        """Only the resolved book's preprocessor runs; unknown hosts run them all."""
+        calls = []
+
+        def _spy(name):
+            return lambda text: calls.append(name) or ""
+
+        fake = {"prizepicks": (_spy("prizepicks"),), "underdog": (_spy("underdog"),)}
+        with patch.object(bpp, "_PREPROCESSORS_BY_BOOK", fake), patch.object(
+            bpp, "_ALL_PREPROCESSORS", fake["prizepicks"] + fake["underdog"],
+        ):
+            bpp._run_book_preprocessors("text", "https://app.prizepicks.com/board/nba")
+            self.assertEqual(calls, ["prizepicks"])
+            calls.clear()
+            # A known book without a preprocessor (config-only stub) runs none.
+            bpp._run_book_preprocessors("text", "https://sportsbook.draftkings.com/nba")
+            self.assertEqual(calls, [])
+            bpp._run_book_preprocessors("text", "https://unknown-book.example/nba")
+            self.assertEqual(calls, ["prizepicks", "underdog"])
+
+
+class RecentSnapshotWindowTests(unittest.TestCase):
+    """``get_recent_web_text_snapshot_refs`` windows per URL in SQL and the
+    texts are only loaded when ``iter_web_text_snapshots`` is consumed."""
+
+    def _seed(self, db):
+        rows = []
+        for url in ("https://a.example/nba", "https://b.example/nba"):
+            for hour in range(4):
+                text = f"{url} hour {hour}"
+                rows.append({
+                    "source_url": url,
+                    "fetched_at_utc": f"2026-05-08T0{hour}:00:00+00:00",
+                    "http_status": 200,
+                    "content_type": "text/html",
+                    "text_content": text,
+                    "text_length": len(text),
+                    "content_sha256": f"{url}-{hour}",
+                })
+        db.insert_web_text_snapshots(rows)
+
+    def test_refs_keep_newest_per_url_without_text(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with DatabaseManager(db_path=str(Path(tmpdir) / "nba_data.db")) as db:
+                self._seed(db)
+                refs = db.get_recent_web_text_snapshot_refs(max_snapshots_per_url=2)
+                capped = db.get_recent_web_text_snapshot_refs(
+                    max_snapshots_per_url=2, limit_total=3,
+                )
+                filtered = db.get_recent_web_text_snapshot_refs(
+                    source_urls=["https://b.example/nba"],
+                )
+
+        self.assertEqual(
+            [(r["source_url"], r["fetched_at_utc"][11:13]) for r in refs],
+            [
+                ("https://a.example/nba", "03"),
+                ("https://a.example/nba", "02"),
+                ("https://b.example/nba", "03"),
+                ("https://b.example/nba", "02"),
+            ],
+        )
+        self.assertTrue(all("text_content" not in r for r in refs))
+        self.assertEqual(len(capped), 3)
+        self.assertEqual(len(filtered), 1)
+        self.assertEqual(filtered[0]["source_url"], "https://b.example/nba")
+
+    def test_iter_streams_texts_in_ref_order(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with DatabaseManager(db_path=str(Path(tmpdir) / "nba_data.db")) as db:
+                self._seed(db)
+                refs = db.get_recent_web_text_snapshot_refs(max_snapshots_per_url=1)
+                stream = db.iter_web_text_snapshots(refs)
+                self.assertNotIsInstance(stream, list)
+                texts = [snap["text_content"] for snap in stream]
+                materialized = db.get_recent_web_text_snapshots(max_snapshots_per_url=1)
+
+        self.assertEqual(
+            texts,
+            ["https://a.example/nba hour 3", "https://b.example/nba hour 3"],
+        )
+        self.assertEqual([s["text_content"] for s in materialized], texts)
+
+
+
+class ParseLedgerTests(unittest.TestCase):
+    """Snapshot texts already parsed by this ``PARSER_VERSION`` are skipped;
+    a version bump reparses history once, ``backlog_limit`` at a time."""
+
+    URL = "https://app.underdogfantasy.com/pick-em/higher-lower/all/NBA"
+    TEXTS = {
+        "a": "LeBron James Higher 27.5 Points",
+        "b": "LeBron James Higher 28.5 Points",
+    }
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self._tmp.name) / "nba_data.db")
+        self._hour = 0
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _fetch(self, key):
+        self._hour += 1
+        with DatabaseManager(db_path=self.db_path) as db:
+            db.insert_web_text_snapshots([{
+                "source_url": self.URL,
+                "fetched_at_utc": f"2026-05-08T{self._hour:02d}:00:00+00:00",
+                "http_status": 200,
+                "content_type": "text/plain",
+                "text_content": self.TEXTS[key],
+                "text_length": len(self.TEXTS[key]),
+                "content_sha256": f"sha-{key}",
+            }])
+
+    def _parse(self, **kwargs):
+        return parse_and_store_web_prop_cards(
+            db_path=self.db_path, source_urls=[self.URL], **kwargs,
+        )
+
+    def _latest_line(self):
+        with DatabaseManager(db_path=self.db_path) as db:
+            return db._latest_web_prop_card_line("underdog", "LeBron James", "points", "over")
+
+    def test_unchanged_text_skipped_and_revert_reparsed(self):
+        self._fetch("a")
+        first = self._parse()
+        self._fetch("a")
+        unchanged = self._parse()
+        self._fetch("b")
+        moved = self._parse()
+        self._fetch("a")  # the page reverts to text parsed two runs ago
+        reverted = self._parse()
+
+        self.assertEqual(first["cards_extracted"], 1)
+        self.assertEqual(unchanged["status"], "skipped")
+        self.assertEqual(unchanged["snapshots_skipped_unchanged"], 1)
+        self.assertEqual(unchanged["cards_extracted"], 0)
+        self.assertEqual(moved["db_inserted"], 1)
+        self.assertEqual(reverted["snapshots_skipped_unchanged"], 0)
+        self.assertEqual(reverted["db_inserted"], 1)
+        self.assertEqual(self._latest_line(), 27.5)
+
+    def test_version_bump_drains_backlog_in_batches(self):
+        for key in ("a", "b", "a"):
+            self._fetch(key)
+        self._parse()
+        self.assertEqual(self._parse(backlog_limit=10)["snapshots_backlog"], 1)
+
+        with patch.object(bpp, "PARSER_VERSION", "visible_text_bumped"):
+            bumped = self._parse(backlog_limit=0)
+            batch = self._parse(backlog_limit=1)
+            drained = self._parse(backlog_limit=1)
+
+        # The newest text is reparsed at once; the one older distinct text
+        # (sha-b) is the backlog, parsed exactly once.
+        self.assertEqual(bumped["snapshots_skipped_unchanged"], 0)
+        self.assertEqual(bumped["snapshots_backlog"], 0)
+        self.assertEqual(batch["snapshots_skipped_unchanged"], 1)
+        self.assertEqual(batch["snapshots_backlog"], 1)
+        self.assertEqual(drained["snapshots_backlog"], 0)
+        self.assertEqual(drained["status"], "skipped")
+        with DatabaseManager(db_path=self.db_path) as db:
+            versions = db.conn.execute(
+                "SELECT parser_version, COUNT(*) FROM parse_ledger "
+                "WHERE parser = 'prop_cards' GROUP BY parser_version ORDER BY 1"
+            ).fetchall()
+        self.assertEqual(versions, [("visible_text_bumped", 2), (bpp.PARSER_VERSION, 2)])
+
+
+
+class WorkerPoolParseTests(unittest.TestCase):
+    """``workers`` > 1 fans extraction out to processes; the stored rows and
+    summary match a serial run."""
+
+    def _seed(self, db_path):
+        rows = []
+        for i in range(12):
+            url = f"https://app.underdogfantasy.com/pick-em/{i % 4}/NBA"
+            text = (
+                f"LeBron James Higher {20 + i}.5 Points "
+                f"Stephen Curry Lower {3 + i % 3}.5 Assists "
+                "Tom Brady Lower 0.5 Points"
+            )
+            rows.append({
+                "source_url": url,
+                "fetched_at_utc": f"2026-05-08T{i:02d}:00:00+00:00",
+                "http_status": 200,
+                "content_type": "text/plain",
+                "text_content": text,
+                "text_length": len(text),
+                "content_sha256": f"sha-{i}",
+            })
+        with DatabaseManager(db_path=db_path) as db:
+            db.insert_web_text_snapshots(rows)
+
+    def _run(self, workers):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = str(Path(tmpdir) / "nba_data.db")
+            self._seed(db_path)
+            summary = parse_and_store_web_prop_cards(
+                db_path=db_path, max_snapshots_per_url=3, workers=workers,
+            )
+            with DatabaseManager(db_path=db_path) as db:
+                rows = db.conn.execute(
+                    "SELECT snapshot_id, book, player_name, stat_type, line_value, side, "
+                    "record_sha256 FROM web_prop_cards ORDER BY card_id"
+                ).fetchall()
+        for result in summary["results"]:
+            result.pop("parse_seconds", None)
+        summary.pop("parse_seconds_by_book")
+        return summary, rows
+
+    def test_parallel_matches_serial(self):
+        serial_summary, serial_rows = self._run(workers=1)
+        parallel_summary, parallel_rows = self._run(workers=2)
+        self.assertEqual(serial_summary["snapshots_considered"], 12)
+        self.assertGreater(len(serial_rows), 0)
+        self.assertEqual(parallel_rows, serial_rows)
+        self.assertEqual(parallel_summary, serial_summary)
+
+    def test_map_ordered_keeps_input_order(self):
+        items = list(range(23))
+        self.assertEqual(
+            list(map_ordered(abs, iter(items), workers=2, chunk_size=3)), items,
+        )
+        self.assertEqual(list(map_ordered(abs, [], workers=2)), [])
+
+
+class NameAnchoredExtractionTests(unittest.TestCase):
+    """``extraction_mode="names"`` anchors cards on known active-player names
+    and must find the same active cards as the regex scan."""
+
+    ACTIVE = ["LeBron James", "Tim Hardaway Jr.", "C.J. McCollum", "Nikola Jokic"]
+    URL = "https://app.underdogfantasy.com/pick-em/higher-lower/all/NBA"
+
+    def _extract(self, text, source_url=URL, matcher=None):
+        keys = {bpp._normalize_name_key(name) for name in self.ACTIVE}
+        return extract_prop_cards_from_text(
+            text_content=text, source_url=source_url, snapshot_id=1,
+            observed_at_utc="2026-05-09T00:00:00+00:00",
+            active_name_keys=keys, name_matcher=matcher,
+        )
+
+    @staticmethod
+    def _card_keys(cards, classification="active_nba"):
+        return [
+            (c["player_name"], c["stat_type"], c["line_value"], c["side"])
+            for c in cards if c["player_classification"] == classification
+        ]
+
+    def test_name_variants_strip_suffix_and_dots(self):
+        self.assertEqual(
+            name_variants("Tim Hardaway Jr."),
+            {"Tim Hardaway Jr.", "Tim Hardaway Jr", "Tim Hardaway"},
+        )
+        self.assertIn("CJ McCollum", name_variants("C.J. McCollum"))
+        self.assertEqual(name_variants("Nene"), set())
+
+    def test_names_mode_matches_regex_active_cards(self):
+        text = (
+            "Trending picks LeBron James Higher 27.5 Points "
+            "Tim Hardaway Jr. Lower 2.5 3-Pointers Made "
+            "CJ McCollum Higher 19.5 Points "
+            "Tom Brady Lower 0.5 Points"
+        )
+        matcher = build_name_matcher(self.ACTIVE)
+        regex_cards = self._extract(text)
+        name_cards = self._extract(text, matcher=matcher)
+        self.assertEqual(len(self._card_keys(name_cards)), 3)
+        self.assertEqual(self._card_keys(name_cards), self._card_keys(regex_cards))
+        # Unknown names are never anchored, so they are not extracted at all.
+        self.assertEqual(self._card_keys(name_cards, "non_nba"), [])
+        self.assertTrue(self._card_keys(regex_cards, "non_nba"))
+
+    def test_names_mode_prizepicks_team_tokens(self):
+        text = "LeBron James LAL Points 27.5 More Less Nikola Jokic DEN Rebounds 12.5 More Less"
+        cards = self._extract(
+            text, source_url="https://app.prizepicks.com/board/nba",
+            matcher=build_name_matcher(self.ACTIVE),
+        )
+        self.assertEqual(
+            {(c["player_name"], c["stat_type"], c["line_value"]) for c in cards},
+            {("LeBron James", "points", 27.5), ("Nikola Jokic", "rebounds", 12.5)},
+        )
+
+    def test_build_name_matcher_without_names(self):
+        self.assertIsNone(build_name_matcher([]))
+        with self.assertRaises(ValueError):
+            parse_and_store_web_prop_cards(db_path=":memory:", extraction_mode="fuzzy")
+
+
+class IncrementalExtractionTests(unittest.TestCase):
+    """Incremental extraction re-scans only what changed between consecutive
+    snapshots of a URL and must give exactly the cards of a full parse."""
+
+    ACTIVE = ["LeBron James", "Stephen Curry", "Nikola Jokic", "Jayson Tatum", "Luka Doncic"]
+    UNDERDOG = "https://app.underdogfantasy.com/pick-em/higher-lower/all/NBA"
+    PRIZEPICKS = "https://app.prizepicks.com/board/nba"
+    STATS = ["Points", "Rebounds", "Assists", "Pts + Rebs + Asts", "3-Pointers Made"]
+
+    def _card(self, book, card_id, line):
+        name = self.ACTIVE[card_id % len(self.ACTIVE)] if card_id % 7 else "Tom Brady"
+        stat = self.STATS[card_id % len(self.STATS)]
+        if book == "underdog":
+            side = "Higher" if card_id % 2 else "Lower"
+            return f"{name} LAL @ DEN - 7:30PM EDT {line} {stat} {side} 1.0{card_id % 9}x"
+        return f"{name} LAL {stat} {line} More Less"
+
+    def _corpus(self, book):
+        """Five consecutive captures of one board: moved lines, a pulled card,
+        a new card at the top and a changed banner."""
+        board = [(card_id, f"{10 + card_id % 25}.5") for card_id in range(60)]
+        banner = "Pick'em Projections Trending"
+        boards = [(banner, list(board))]
+        board[5], board[40] = (5, "11.5"), (40, "30.5")
+        boards.append((banner, list(board)))
+        del board[20]
+        boards.append((banner, list(board)))
+        board.insert(0, (60, "44.5"))
+        boards.append((banner, list(board)))
+        boards.append(("Pick'em Projections Live Now", list(board)))
+        return [
+            "\n".join([head] + [self._card(book, card_id, line) for card_id, line in cards])
+            for head, cards in boards
+        ]
+
+    def _run(self, url, texts, matcher=None):
+        keys = {bpp._normalize_name_key(name) for name in self.ACTIVE}
+        previous = None
+        for snapshot_id, text in enumerate(texts, start=1):
+            kwargs = {
+                "text_content": text, "source_url": url, "snapshot_id": snapshot_id,
+                "observed_at_utc": "2026-05-10T00:00:00+00:00",
+                "active_name_keys": keys, "name_matcher": matcher,
+            }
+            full = extract_prop_cards_from_text(**kwargs)
+            incremental, scan = bpp.extract_prop_cards_incremental(
+                previous_scan=previous, **kwargs,
+            )
+            self.assertGreater(len(full), 20)
+            self.assertEqual(incremental, full)
+            if previous is not None:
+                self.assertLess(scan["changed_chars"], len(scan["text"]) // 4)
+            previous = scan
+
+    def test_incremental_matches_full_regex_mode(self):
+        for url, book in ((self.UNDERDOG, "underdog"), (self.PRIZEPICKS, "prizepicks")):
+            with self.subTest(book=book):
+                self._run(url, self._corpus(book))
+
+    def test_incremental_matches_full_names_mode(self):
+        matcher = build_name_matcher(self.ACTIVE)
+        for url, book in ((self.UNDERDOG, "underdog"), (self.PRIZEPICKS, "prizepicks")):
+            with self.subTest(book=book):
+                self._run(url, self._corpus(book), matcher=matcher)
+
+    def test_unrelated_previous_scan_still_exact(self):
+        underdog, prizepicks = self._corpus("underdog"), self._corpus("prizepicks")
+        self._run(self.PRIZEPICKS, [prizepicks[0]])
+        keys = {bpp._normalize_name_key(name) for name in self.ACTIVE}
+        _, stale = bpp.extract_prop_cards_incremental(
+            underdog[0], self.UNDERDOG, 1, "2026-05-10T00:00:00+00:00", keys,
+        )
+        cards, _ = bpp.extract_prop_cards_incremental(
+            prizepicks[0], self.PRIZEPICKS, 2, "2026-05-10T00:00:00+00:00", keys,
+            previous_scan=stale,
+        )
+        self.assertEqual(
+            cards,
+            extract_prop_cards_from_text(
+                prizepicks[0], self.PRIZEPICKS, 2, "2026-05-10T00:00:00+00:00", keys,
+            ),
+        )
+
+    def test_parse_and_store_incremental_matches_full(self):
+        texts = self._corpus("underdog")
+
+        def run(incremental):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                db_path = str(Path(tmpdir) / "nba_data.db")
+                summaries = []
+                for i, text in enumerate(texts):
+                    with DatabaseManager(db_path=db_path) as db:
+                        db.insert_web_text_snapshots([{
+                            "source_url": self.UNDERDOG,
+                            "fetched_at_utc": f"2026-05-10T{i:02d}:00:00+00:00",
+                            "http_status": 200,
+                            "content_type": "text/plain",
+                            "text_content": text,
+                            "text_length": len(text),
+                            "content_sha256": f"sha-{i}",
+                        }])
+                    summaries.append(
+                        parse_and_store_web_prop_cards(db_path=db_path, incremental=incremental)
+                    )
+                with DatabaseManager(db_path=db_path) as db:
+                    rows = db.conn.execute(
+                        "SELECT snapshot_id, player_name, stat_type, line_value, side, "
+                        "record_sha256 FROM web_prop_cards ORDER BY card_id"
+                    ).fetchall()
+                    states = db.conn.execute(
+                        "SELECT snapshot_id FROM parse_scan_state"
+                    ).fetchall()
+            return summaries, rows, states
+
+        full_summaries, full_rows, full_states = run(incremental=False)
+        inc_summaries, inc_rows, inc_states = run(incremental=True)
+        self.assertEqual(inc_rows, full_rows)
+        self.assertEqual(full_states, [])
+        self.assertEqual(inc_states, [(len(texts),)])
+        self.assertEqual(
+            [summary["snapshots_incremental"] for summary in inc_summaries], [0, 1, 1, 1, 1],
+        )
+        self.assertEqual(
+            [summary["cards_extracted"] for summary in inc_summaries],
+            [summary["cards_extracted"] for summary in full_summaries],
+        )
+
+    def test_backlog_snapshots_chain_within_one_run(self):
+        texts = self._corpus("prizepicks")
+
+        def run(incremental):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                db_path = str(Path(tmpdir) / "nba_data.db")
+                with DatabaseManager(db_path=db_path) as db:
+                    db.insert_web_text_snapshots([
+                        {
+                            "source_url": self.PRIZEPICKS,
+                            "fetched_at_utc": f"2026-05-10T{i:02d}:00:00+00:00",
+                            "http_status": 200,
+                            "content_type": "text/plain",
+                            "text_content": text,
+                            "text_length": len(text),
+                            "content_sha256": f"sha-{i}",
+                        }
+                        for i, text in enumerate(texts)
+                    ])
+                summary = parse_and_store_web_prop_cards(
+                    db_path=db_path, max_snapshots_per_url=1, backlog_limit=10,
+                    incremental=incremental,
+                )
+                with DatabaseManager(db_path=db_path) as db:
+                    rows = db.conn.execute(
+                        "SELECT snapshot_id, player_name, stat_type, line_value, side "
+                        "FROM web_prop_cards ORDER BY snapshot_id, player_name, stat_type"
+                    ).fetchall()
+            return summary, rows
+
+        full_summary, full_rows = run(incremental=False)
+        inc_summary, inc_rows = run(incremental=True)
+        self.assertEqual(inc_summary["snapshots_backlog"], len(texts) - 1)
+        self.assertEqual(inc_rows, full_rows)
+        # Only the first snapshot parsed in the run has nothing to diff against.
+        self.assertEqual(inc_summary["snapshots_incremental"], len(texts) - 1)
+        self.assertEqual(full_summary["snapshots_incremental"], 0)
 
 
 if __name__ == "__main__":
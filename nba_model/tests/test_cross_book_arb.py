@@ -17,11 +17,12 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pandas as pd
-from scipy.stats import norm
+from scipy.stats import norm, poisson
 
 from nba_model.data.database.db_manager import DatabaseManager
 from nba_model.model import cross_book_arb as cba
 from nba_model.model import edge_scanner as es
+from nba_model.model import probability
 
 LEBRON_ID = 2544
 SOLO_ID = 9001
@@ -155,6 +156,60 @@ class FindCrossBookOpportunitiesTests(unittest.TestCase):
         gaps = list(out["line_gap"])
         self.assertEqual(gaps, sorted(gaps, reverse=True))
 
+    def test_middle_probability_and_ev_normal(self):
+        row = cba.find_cross_book_opportunities(self._three_book_df()).iloc[0]
+        p_mid = norm.cdf(19.5, self.MU, self.SIGMA) - norm.cdf(17.5, self.MU, self.SIGMA)
+        self.assertAlmostEqual(row["p_middle"], round(p_mid, 4), places=4)
+        # Continuous: exactly one leg wins outside the middle, both inside it.
+        payout = 100 / 110
+        exp_ev = (1 + p_mid) * payout - (1 - p_mid)
+        self.assertAlmostEqual(row["middle_ev"], round(exp_ev, 4), places=4)
+
+    def test_discrete_middle_uses_cdf_differences(self):
+        # Poisson rebounds: over 7.5 + under 10 wins on 8 or 9; 10 pushes the under.
+        mu = 8.0
+        df = pd.DataFrame([
+            {**_scored_row("A", "Big Man", "rebounds", 7.5, mu, 2.8),
+             "distribution": "poisson"},
+            {**_scored_row("B", "Big Man", "rebounds", 10.0, mu, 2.8),
+             "distribution": "poisson"},
+        ])
+        row = cba.find_cross_book_opportunities(df).iloc[0]
+        p8, p9 = (poisson.pmf(k, mu) for k in (8, 9))
+        self.assertAlmostEqual(row["p_middle"], round(p8 + p9, 4), places=4)
+        over_win = poisson.sf(7, mu)
+        under_win = poisson.cdf(9, mu)
+        exp_ev = (over_win + under_win) * (100 / 110) - (
+            poisson.cdf(7, mu) + poisson.sf(10, mu))
+        self.assertAlmostEqual(row["middle_ev"], round(exp_ev, 4), places=4)
+        self.assertAlmostEqual(
+            row["p_over_at_line_max"], round(poisson.sf(10, mu), 4), places=4)
+
+    def test_unfitted_rows_have_no_middle_probability(self):
+        df = pd.DataFrame([
+            _scored_row("A", "No Fit", "points", 10.5, float("nan"), float("nan")),
+            _scored_row("B", "No Fit", "points", 12.5, float("nan"), float("nan")),
+        ])
+        row = cba.find_cross_book_opportunities(df).iloc[0]
+        self.assertIsNone(row["p_middle"])
+        self.assertIsNone(row["middle_ev"])
+        self.assertEqual(row["opportunity_type"], cba.OPP_MIDDLE)
+
+    def test_mixed_family_array_matches_scalar_per_row(self):
+        dists = ["normal", "student_t", "poisson", "negative_binomial", "binomial",
+                 "exponential", "uniform", "lognormal", "power_law"]
+        lines = [22.5, 7.0, 3.5, 9.5, 4.0, 1.5, 18.0, 30.5, 12.5]
+        mus = [8.0] * len(dists)
+        sigmas = [6.0, 2.5, 1.0, 4.0, 1.5, 3.0, 5.0, 9.0, 7.0]
+        out = probability.prob_over_distribution_array(lines, mus, sigmas, dists, 12)
+        for i, dist in enumerate(dists):
+            self.assertEqual(
+                out[i],
+                probability.prob_over_distribution(lines[i], mus[i], sigmas[i], dist, 12),
+            )
+        with self.assertRaises(ValueError):
+            probability.prob_over_distribution_array([1.5, 2.5], 3.0, 1.0, ["normal", "cauchy"])
+
 
 # ---------------------------------------------------------------------------
 # detect_two_way_arb — pure, on synthetic betting_lines-shaped frames
@@ -234,6 +289,35 @@ class DetectTwoWayArbTests(unittest.TestCase):
         out = cba.detect_two_way_arb(df)
         self.assertTrue(out.empty)  # different players -> no valid pair
 
+    def test_every_executable_pair_across_many_books(self):
+        # Staggered lines over six books: each OVER may pair with any other
+        # book's UNDER at an equal or higher line; every such pair whose raw
+        # implied sum is < 1 must be emitted, not just the best one.
+        quotes = [
+            ("BookA", 24.5, 120, -150), ("BookB", 25.5, 105, -125),
+            ("BookC", 25.5, -115, 110), ("BookD", 26.5, -150, 125),
+            ("BookE", 24.5, None, 115), ("BookF", 25.5, 102, None),
+        ]
+        df = pd.DataFrame([
+            self._row(book, over_odds=o, under_odds=u, line=line)
+            for book, line, o, u in quotes
+        ])
+        expected = set()
+        for ob, ol, oo, _ in quotes:
+            for ub, ul, _, uo in quotes:
+                if ob == ub or oo is None or uo is None or ol > ul:
+                    continue
+                combined = (cba._safe_implied_prob(oo)
+                            + cba._safe_implied_prob(uo))
+                if combined < 1.0:
+                    expected.add((ob, ub, round(1.0 - combined, 4)))
+        out = cba.detect_two_way_arb(df)
+        got = set(zip(out["over_book"], out["under_book"], out["guaranteed_margin"]))
+        self.assertEqual(got, expected)
+        self.assertGreater(len(expected), 3)
+        margins = list(out["guaranteed_margin"])
+        self.assertEqual(margins, sorted(margins, reverse=True))
+
 
 # ---------------------------------------------------------------------------
 # Fixture-DB round trips
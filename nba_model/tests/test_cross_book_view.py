@@ -20,6 +20,7 @@ def _cross_row(player, gap, opp_type):
         "line_min": 17.5, "line_max": 17.5 + gap, "line_gap": gap,
         "best_over_book": "A", "best_under_book": "B", "consensus_mean": 18.0,
         "p_over_at_line_min": 0.6, "p_over_at_line_max": 0.4,
+        "p_middle": 0.2, "middle_ev": -0.5,
         "middle_size": gap, "opportunity_type": opp_type,
         "model_mu": 18.0, "model_sigma": 3.0,
     }
@@ -4,9 +4,7 @@ import unittest
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import tempfile
-from unittest.mock import MagicMock, patch
-
-import pandas as pd
+from unittest.mock import patch
 
 from nba_model.data.daily_etl import (
     _player_names_with_existing_game_logs,
@@ -188,19 +186,18 @@ class DailyETLTests(unittest.TestCase):
     @patch("nba_model.data.daily_etl.fetch_and_store_betting_lines")
     @patch("nba_model.data.daily_etl.build_team_defense_validation_report")
     @patch("nba_model.data.daily_etl.populate_team_defense")
-    @patch("nba_model.data.daily_etl.DataLoader")
+    @patch("nba_model.data.daily_etl.refresh_player_game_logs_incremental")
     def test_run_daily_etl_successful_flow(
         self,
-        mock_loader_cls,
+        mock_refresh_logs,
         mock_populate_team_defense,
         mock_validation_report,
         mock_fetch_odds,
         mock_reverse_engineering,
     ):
-        loader = MagicMock()
-        loader.load_player_data.return_value = pd.DataFrame({"points": [20, 25], "minutes": [34, 36]})
-        loader.db = MagicMock()
-        mock_loader_cls.return_value = loader
+        mock_refresh_logs.return_value = {
+            "requests": 1, "inserted": 2, "rows_by_player": {2544: 2},
+        }
 
         mock_populate_team_defense.return_value = 30
         mock_validation_report.return_value = {
@@ -241,10 +238,10 @@ class DailyETLTests(unittest.TestCase):
         self.assertFalse(report["alert"]["alert"])  # clean run → no alert
         self.assertEqual(report["alert"]["severity"], "ok")
 
-        loader.load_player_data.assert_called_once_with(
-            player_name="LeBron James",
-            n_games=120,
-            force_refresh=True,
+        mock_refresh_logs.assert_called_once()
+        self.assertEqual(mock_refresh_logs.call_args.kwargs["player_ids"], {2544})
+        self.assertEqual(
+            report["steps"]["game_logs"]["result"]["players"][0]["rows_loaded"], 2,
         )
 
     @patch("nba_model.data.daily_etl.run_market_reverse_engineering_continuous")
@@ -377,22 +374,18 @@ class DailyETLTests(unittest.TestCase):
     @patch("nba_model.data.daily_etl.fetch_and_store_betting_lines")
     @patch("nba_model.data.daily_etl.build_team_defense_validation_report")
     @patch("nba_model.data.daily_etl.populate_team_defense")
-    @patch("nba_model.data.daily_etl.DataLoader")
-    def test_run_daily_etl_partial_success_when_player_refresh_fails(
+    @patch("nba_model.data.daily_etl.refresh_player_game_logs_incremental")
+    def test_run_daily_etl_partial_success_when_player_unresolved(
         self,
-        mock_loader_cls,
+        mock_refresh_logs,
         mock_populate_team_defense,
         mock_validation_report,
         mock_fetch_odds,
         mock_reverse_engineering,
     ):
-        loader = MagicMock()
-        loader.db = MagicMock()
-        loader.load_player_data.side_effect = [
-            RuntimeError("api timeout"),
-            pd.DataFrame({"points": [18], "minutes": [30]}),
-        ]
-        mock_loader_cls.return_value = loader
+        mock_refresh_logs.return_value = {
+            "requests": 1, "inserted": 1, "rows_by_player": {2544: 1},
+        }
 
         mock_populate_team_defense.return_value = 30
         mock_validation_report.return_value = {
@@ -411,7 +404,7 @@ class DailyETLTests(unittest.TestCase):
         }
 
         report = run_daily_etl(
-            players=["Player A", "Player B"],
+            players=["Zzyzx Notaplayer", "LeBron James"],
             include_db_players=False,
             odds_api_key="dummy-key",
             retries=0,
@@ -428,19 +421,18 @@ class DailyETLTests(unittest.TestCase):
     @patch("nba_model.data.daily_etl.fetch_and_store_betting_lines")
     @patch("nba_model.data.daily_etl.build_team_defense_validation_report")
     @patch("nba_model.data.daily_etl.populate_team_defense")
-    @patch("nba_model.data.daily_etl.DataLoader")
+    @patch("nba_model.data.daily_etl.refresh_player_game_logs_incremental")
     def test_run_daily_etl_reverse_engineering_partial_when_not_ready(
         self,
-        mock_loader_cls,
+        mock_refresh_logs,
         mock_populate_team_defense,
         mock_validation_report,
         mock_fetch_odds,
         mock_reverse_engineering,
     ):
-        loader = MagicMock()
-        loader.load_player_data.return_value = pd.DataFrame({"points": [22], "minutes": [32]})
-        loader.db = MagicMock()
-        mock_loader_cls.return_value = loader
+        mock_refresh_logs.return_value = {
+            "requests": 1, "inserted": 1, "rows_by_player": {2544: 1},
+        }
 
         mock_populate_team_defense.return_value = 30
         mock_validation_report.return_value = {
@@ -0,0 +1,88 @@
+"""Tests for the DataLoader columnar game-log file cache."""
+
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pyarrow as pa
+
+from nba_model.data.data_loader import DataLoader
+
+
+def _games(n, player_id=2544):
+    return pd.DataFrame({
+        "player_id": player_id,
+        "game_id": [f"00224{i:05d}" for i in range(n)],
+        "game_date": [f"2025-0{1 + i // 28}-{1 + i % 28:02d}T00:00:00" for i in range(n)][::-1],
+        "season": ["2023-24"] * 2 + ["2024-25"] * (n - 2),
+        "minutes": [30.5] * n,
+        "points": list(range(n)),
+        "home_away": "home",
+    })
+
+
+class DataLoaderCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.tmp_dir.name)
+        self.loader = DataLoader(cache_dir=str(root / "raw"), db_path=str(root / "nba.db"))
+
+    def tearDown(self):
+        self.loader.db.close()
+        self.tmp_dir.cleanup()
+
+    def test_round_trip_keeps_types_and_reads_only_leading_rows(self):
+        self.loader.write_cached_games(2544, _games(40))
+
+        df = self.loader.read_cached_games(2544, 5)
+
+        self.assertEqual(list(df["points"]), [0, 1, 2, 3, 4])
+        self.assertEqual(str(df["points"].dtype), "int64")
+        self.assertEqual(str(df["minutes"].dtype), "float64")
+        info = self.loader.cache_info(2544)
+        self.assertEqual(info["rows"], 40)
+        self.assertEqual((info["season_min"], info["season_max"]), ("2023-24", "2024-25"))
+        self.assertIsNone(self.loader.read_cached_games(2544, 41))
+
+    def test_stale_cache_is_not_served(self):
+        fetched_at = datetime.now(timezone.utc) - timedelta(hours=30)
+        self.loader.write_cached_games(2544, _games(10), fetched_at=fetched_at)
+
+        self.assertIsNone(self.loader.read_cached_games(2544, 5))
+        self.loader.cache_max_age_hours = 48
+        self.assertEqual(len(self.loader.read_cached_games(2544, 5)), 5)
+        self.loader.cache_max_age_hours = None
+        self.assertEqual(len(self.loader.read_cached_games(2544, 5)), 5)
+
+    def test_reads_close_their_memory_map(self):
+        self.loader.write_cached_games(2544, _games(10))
+        opened = []
+        real_memory_map = pa.memory_map
+
+        def memory_map(*args, **kwargs):
+            opened.append(real_memory_map(*args, **kwargs))
+            return opened[-1]
+
+        with patch("nba_model.data.data_loader.pa.memory_map", side_effect=memory_map):
+            self.assertEqual(len(self.loader.read_cached_games(2544, 5)), 5)
+            self.assertIsNone(self.loader.read_cached_games(2544, 11))
+            self.assertEqual(self.loader.cache_info(2544)["rows"], 10)
+
+        self.assertEqual(len(opened), 3)
+        self.assertTrue(all(source.closed for source in opened))
+
+    def test_load_player_data_serves_fresh_cache_without_api_call(self):
+        self.loader.write_cached_games(2544, _games(20))
+
+        with patch("nba_model.data.data_loader.playergamelogs.PlayerGameLogs") as endpoint:
+            df = self.loader.load_player_data("LeBron James", n_games=10)
+
+        endpoint.assert_not_called()
+        self.assertEqual(len(df), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -180,6 +180,27 @@ class ScorePropEdgesTests(EdgeScannerTestBase):
         for cmean in lebron["consensus_mean"]:
             self.assertAlmostEqual(cmean, 19.0, places=3)
 
+    def test_bulk_fit_matches_per_player_fit(self):
+        # The windowed query + grouped reduction must reproduce the per-player
+        # get_player_games → PlayerChartData fit, including a window cut.
+        lines = pd.DataFrame([
+            {"book": "Underdog", "player_name": "lebron james", "stat_type": stat,
+             "side": "over", "line_value": 10.5, "observed_at_utc": self.recent}
+            for stat in ("points", "pra", "3pm", "steals")
+        ])
+        scored = es.score_prop_edges(lines, db_path=self.db_path, n_games=6)
+        self.assertEqual(
+            sorted(scored["stat_type"]), ["points", "pra", "three_pointers_made"])
+        with DatabaseManager(db_path=self.db_path) as db:
+            for row in scored.itertuples(index=False):
+                fit = es._fit_player_stat(
+                    db, {}, "LeBron James", row.stat_type, 6, "chart_mean", 10,
+                    self.db_path,
+                )
+                self.assertAlmostEqual(row.model_mu, round(fit["mu"], 3), places=9)
+                self.assertAlmostEqual(row.model_sigma, round(fit["sigma"], 3), places=9)
+                self.assertEqual(row.n_games_used, fit["n"])
+
     def test_empty_lines_returns_shaped_empty(self):
         out = es.score_prop_edges(
             pd.DataFrame(columns=es.LINE_COLUMNS), db_path=self.db_path,
@@ -220,5 +241,99 @@ class TopEdgesTests(EdgeScannerTestBase):
         self.assertEqual(list(out.columns), es.SCORED_COLUMNS_FULL)
 
 
+class ScoredEdgesTableTests(EdgeScannerTestBase):
+    PROFILES = (("chart_mean", 25, 10),)
+
+    def _refresh(self):
+        summary = es.refresh_scored_edges(self.db_path, profiles=self.PROFILES)
+        return summary["profiles"]["chart_mean:25:10"]
+
+    def test_materialized_view_matches_live_scan(self):
+        self._refresh()
+        live = es.top_edges(
+            es.score_prop_edges(es.fetch_latest_prop_lines(self.db_path),
+                                db_path=self.db_path, n_games=25),
+            limit=None,
+        )
+        stored = es.fetch_scored_edges(self.db_path, n_games=25)
+        self.assertEqual(stored["n_scored"], len(live))
+        # One Gamer's unfit line still counts toward the slate.
+        self.assertEqual(stored["n_lines"], len(live) + 1)
+        got = stored["scored"]
+        self.assertEqual(list(got.columns), es.SCORED_COLUMNS_FULL)
+        self.assertEqual(list(got["book"]), list(live["book"]))
+        for col in ("book_line", "model_mu", "model_sigma", "p_over", "model_edge",
+                    "ev_best", "consensus_mean", "pct_from_consensus"):
+            self.assertEqual(list(got[col]), list(live[col]), col)
+        self.assertTrue((abs(got["observed_hours_ago"] - 1.0) < 0.05).all())
+
+    def test_sql_filters_and_book_scoped_consensus(self):
+        self._refresh()
+        stored = es.fetch_scored_edges(
+            self.db_path, books=["underdog", "prizepicks"], min_p_over=0.5,
+            only_positive_ev=True)
+        got = stored["scored"]
+        self.assertEqual(list(got["book"]), ["Underdog"])
+        # Consensus over the two selected books only: (17.5 + 20.5) / 2.
+        self.assertAlmostEqual(got.iloc[0]["consensus_mean"], 19.0, places=3)
+        self.assertTrue(es.fetch_scored_edges(
+            self.db_path, players=["Nobody"])["scored"].empty)
+
+    def test_refresh_rescores_only_changed_rows(self):
+        first = self._refresh()
+        self.assertEqual((first["rows"], first["rescored"], first["fitted"]), (4, 4, 3))
+        self.assertEqual(self._refresh()["rescored"], 0)
+
+        with DatabaseManager(db_path=self.db_path) as db:
+            db.insert_web_prop_cards([
+                _card("PrizePicks", "LeBron James", "points", 21.5, "over",
+                      _utc(datetime.now(timezone.utc)), 10),
+            ])
+        moved = self._refresh()
+        self.assertEqual((moved["rescored"], moved["reused"]), (1, 3))
+        pp = es.fetch_scored_edges(self.db_path, books=["prizepicks"])["scored"]
+        self.assertEqual(pp.iloc[0]["book_line"], 21.5)
+
+        # A new game log re-fits every line of that player, not the others.
+        with DatabaseManager(db_path=self.db_path) as db:
+            db.insert_game_logs(pd.DataFrame([_game_row(LEBRON_ID, 11, 30)]))
+        refit = self._refresh()
+        self.assertEqual((refit["rescored"], refit["reused"]), (3, 1))
+
+        # So does an in-place box-score correction (same games, same dates).
+        with DatabaseManager(db_path=self.db_path) as db:
+            db.insert_game_logs(pd.DataFrame([_game_row(LEBRON_ID, 11, 44)]), upsert=True)
+        corrected = self._refresh()
+        self.assertEqual((corrected["rescored"], corrected["reused"]), (3, 1))
+
+    def test_n_lines_counts_raw_sides_like_live(self):
+        with DatabaseManager(db_path=self.db_path) as db:
+            db.insert_web_prop_cards([
+                _card("PrizePicks", "LeBron James", "points", 20.5, "under",
+                      self.recent, 11),
+            ])
+        self._refresh()
+        stored = es.fetch_scored_edges(self.db_path, n_games=25)
+        self.assertEqual(stored["n_lines"], len(es.fetch_latest_prop_lines(self.db_path)))
+        self.assertEqual(stored["n_lines"], 5)  # four collapsed rows
+        pp = es.fetch_scored_edges(self.db_path, books=["prizepicks"])
+        self.assertEqual((pp["n_lines"], pp["n_scored"]), (2, 1))
+
+    def test_missing_or_stale_profile_returns_none(self):
+        self.assertIsNone(es.fetch_scored_edges(self.db_path))
+        self._refresh()
+        self.assertIsNone(es.fetch_scored_edges(self.db_path, model_mode="full"))
+        self.assertIsNone(es.fetch_scored_edges(self.db_path, since_hours=96))
+        # Rows are collapsed over the refresh window; a narrower one scores live.
+        self.assertIsNone(es.fetch_scored_edges(self.db_path, since_hours=24))
+        self.assertIsNone(es.fetch_scored_edges(self.db_path, since_hours=None))
+        with DatabaseManager(db_path=self.db_path) as db:
+            db.conn.execute(
+                "UPDATE scored_edges_profiles "
+                "SET refreshed_at_utc = datetime('now', '-1 day')")
+            db.conn.commit()
+        self.assertIsNone(es.fetch_scored_edges(self.db_path))
+
+
 if __name__ == "__main__":
     unittest.main()
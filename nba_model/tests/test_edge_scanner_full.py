@@ -247,6 +247,44 @@ class FullModeProjectionTests(EdgeScannerFullTestBase):
         self.assertFalse(full["model_mu"].isna().any())
 
 
+class FullModeParallelTests(EdgeScannerFullTestBase):
+    def _seed_extra_players(self, n):
+        rows, refs, cards = [], [], []
+        for k in range(n):
+            pid = 7000 + k
+            refs.append({"player_id": pid, "player_name": f"Depth Player {k}",
+                         "synced_at_utc": self.recent})
+            rows += [_game_row(pid, i, 10 + (i * k) % 9, rebounds=3 + k % 4)
+                     for i in range(1, 13)]
+            for stat, line in (("points", 12.5), ("rebounds", 4.5), ("steals", 0.5)):
+                cards.append(_card("Underdog", f"Depth Player {k}", stat, line,
+                                   "over", self.recent, 100 + 3 * k + len(cards)))
+        with DatabaseManager(db_path=self.db_path) as db:
+            db.upsert_active_players_reference(refs)
+            db.insert_game_logs(pd.DataFrame(rows))
+            db.insert_web_prop_cards(cards)
+
+    def test_process_pool_matches_serial(self):
+        self._seed_extra_players(es.PARALLEL_MIN_PLAYERS)
+        lines = es.fetch_latest_prop_lines(self.db_path)
+        serial = es.score_prop_edges(
+            lines, db_path=self.db_path, n_games=25, model_mode="full")
+        parallel = es.score_prop_edges(
+            lines, db_path=self.db_path, n_games=25, model_mode="full", workers=2)
+        self.assertGreater(len(serial), es.PARALLEL_MIN_PLAYERS)
+        pd.testing.assert_frame_equal(
+            serial.drop(columns=["observed_hours_ago"]),
+            parallel.drop(columns=["observed_hours_ago"]),
+        )
+
+    def test_read_only_manager_never_writes(self):
+        with DatabaseManager(db_path=self.db_path, read_only=True) as db:
+            n = db.conn.execute("SELECT COUNT(*) FROM game_logs").fetchone()[0]
+            with self.assertRaises(Exception):
+                db.conn.execute("DELETE FROM game_logs")
+        self.assertGreater(n, 0)
+
+
 class FullModeContractTests(EdgeScannerFullTestBase):
     def test_scored_columns_prefix_and_appended(self):
         self.assertEqual(
@@ -13,11 +13,13 @@ Coverage:
 import json
 import os
 import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch
 
 from nba_model.data import hourly_update
+from nba_model.data.hourly_update import _utc_now_iso as _utc_now
 
 
 class CheckChromeCdpReachableTests(unittest.TestCase):
@@ -113,6 +115,8 @@ class RunHourlyUpdateReportTests(unittest.TestCase):
                          return_value={"settled": 0, "pending": 4}),
             patch.object(hourly_update, "_run_prediction_recompute",
                          return_value={"scored": 7}),
+            patch.object(hourly_update, "_run_scored_edges_refresh",
+                         return_value={"lines": 0, "profiles": {}}),
         ]
         for p in patches:
             p.start()
@@ -136,7 +140,7 @@ class RunHourlyUpdateReportTests(unittest.TestCase):
                 "team_line_parser", "game_log_refresh",
                 "players_table_sync",
                 "reverse_engineering", "outcome_settlement",
-                "prediction_recompute",
+                "prediction_recompute", "scored_edges_refresh",
             ):
                 self.assertIn(step, report["steps"])
                 self.assertTrue(report["steps"][step]["ok"], f"step {step}")
@@ -182,6 +186,8 @@ class RunHourlyUpdateReportTests(unittest.TestCase):
                              return_value={"settled": 0}),
                 patch.object(hourly_update, "_run_prediction_recompute",
                              return_value={"scored": 0}),
+                patch.object(hourly_update, "_run_scored_edges_refresh",
+                             return_value={"lines": 0, "profiles": {}}),
             ]
             for p in patches:
                 p.start()
@@ -216,6 +222,8 @@ class BetLogSettlementStepTests(unittest.TestCase):
             patch.object(hourly_update, "_run_outcome_settlement", return_value={}),
             patch.object(hourly_update, "_run_prediction_recompute",
                          return_value={"scored": 0}),
+            patch.object(hourly_update, "_run_scored_edges_refresh",
+                         return_value={"lines": 0, "profiles": {}}),
         ]
 
     def _run(self, tmp, **kwargs):
@@ -244,6 +252,205 @@ class BetLogSettlementStepTests(unittest.TestCase):
         self.assertTrue(report["steps"]["bet_log_settlement"]["ok"])
 
 
+class StepDagTests(unittest.TestCase):
+    """Independent branches overlap; dependents wait for every dependency."""
+
+    STEP_FUNCS = {
+        "web_text": "_run_web_text",
+        "browser_prop_parser": "_run_browser_prop_parser",
+        "team_line_parser": "_run_team_line_parser",
+        "game_log_refresh": "_run_game_log_refresh",
+        "players_table_sync": "_run_players_table_sync",
+        "reverse_engineering": "_run_reverse_engineering",
+        "outcome_settlement": "_run_outcome_settlement",
+        "prediction_recompute": "_run_prediction_recompute",
+        "scored_edges_refresh": "_run_scored_edges_refresh",
+    }
+
+    def _run(self, tmp, seconds, **kwargs):
+        def sleeper(step):
+            def run(*args):
+                time.sleep(seconds.get(step, 0.02))
+                return {"step": step}
+            return run
+
+        patches = [patch.object(hourly_update, "_run_preflight", return_value={})]
+        patches += [
+            patch.object(hourly_update, func, side_effect=sleeper(step))
+            for step, func in self.STEP_FUNCS.items()
+        ]
+        for p in patches:
+            p.start()
+        try:
+            return hourly_update.run_hourly_update(
+                report_dir=tmp, require_playwright=False, **kwargs)
+        finally:
+            for p in patches:
+                p.stop()
+
+    def test_branches_overlap_and_report_critical_path(self):
+        seconds = {"web_text": 0.3, "game_log_refresh": 0.3, "browser_prop_parser": 0.2,
+                   "team_line_parser": 0.2}
+        with tempfile.TemporaryDirectory() as tmp:
+            report = self._run(tmp, seconds)
+            saved = json.loads(Path(report["report_path"]).read_text())
+
+        self.assertTrue(report["ok"])
+        steps = report["steps"]
+        for name in self.STEP_FUNCS:
+            for dep in steps[name]["depends_on"]:
+                self.assertGreaterEqual(
+                    steps[name]["start_offset_s"], steps[dep]["end_offset_s"], (name, dep))
+        # web_text and game_log_refresh start together; the parsers overlap too.
+        self.assertLess(steps["game_log_refresh"]["start_offset_s"], 0.1)
+        self.assertLess(
+            abs(steps["browser_prop_parser"]["start_offset_s"]
+                - steps["team_line_parser"]["start_offset_s"]), 0.1)
+        schedule = report["schedule"]
+        self.assertEqual(schedule["critical_path"][0], "web_text")
+        self.assertEqual(schedule["critical_path"][-1], "scored_edges_refresh")
+        self.assertLess(schedule["wall_s"], schedule["steps_total_s"] - 0.4)
+        self.assertEqual(saved["schedule"]["critical_path"], schedule["critical_path"])
+
+    def test_single_worker_runs_steps_one_at_a_time(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            report = self._run(tmp, {}, max_workers=1, skip_recompute=True)
+
+        spans = sorted(
+            (step["start_offset_s"], step["end_offset_s"])
+            for name, step in report["steps"].items() if name != "preflight"
+        )
+        self.assertNotIn("prediction_recompute", report["steps"])
+        for (_, end), (start, _) in zip(spans, spans[1:]):
+            self.assertGreaterEqual(start, end)
+
+    def test_dependency_cycle_raises(self):
+        report = {"steps": {}, "failed_steps": []}
+        steps = {"a": (("b",), dict, ()), "b": (("a",), dict, ())}
+        with self.assertRaises(ValueError):
+            hourly_update._run_step_dag(report, steps, max_workers=2)
+
+
+class PredictionRecomputeWatermarkTests(unittest.TestCase):
+    """Only (player, stat) keys whose logs, lines or team prior moved are re-scored."""
+
+    PLAYERS = {"Alpha Guard": (101, "LAL"), "Beta Forward": (202, "BOS")}
+
+    def setUp(self):
+        import pandas as pd
+        from datetime import datetime, timezone
+
+        from nba_model.data.database.db_manager import DatabaseManager
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "nba.db")
+        self.today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        with DatabaseManager(db_path=self.db_path) as db:
+            db.conn.executemany(
+                "INSERT INTO players (player_id, name, team) VALUES (?, ?, ?)",
+                [(pid, name, team) for name, (pid, team) in self.PLAYERS.items()],
+            )
+            db.conn.commit()
+            db.insert_game_logs(pd.DataFrame([
+                self._game(pid, day) for pid, _ in self.PLAYERS.values()
+                for day in range(1, 13)
+            ]))
+            self._prior(db, home_total=115.0)
+            for name, (pid, _) in self.PLAYERS.items():
+                for stat, line in (("points", 20.5), ("rebounds", 7.5)):
+                    self._line(db, pid, stat, line)
+        self.history_calls = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    @staticmethod
+    def _game(pid, day, points=20):
+        return {
+            "player_id": pid, "game_id": f"g{pid}_{day}", "game_date": f"2025-03-{day:02d}",
+            "season": "2024-25", "matchup": "LAL vs. BOS", "home_away": "home",
+            "minutes": 32.0, "points": points + day % 5, "rebounds": 8, "assists": 5,
+        }
+
+    @staticmethod
+    def _prior(db, home_total):
+        db.upsert_team_priors([{
+            "away_team": "BOS", "home_team": "LAL", "computed_at_utc": _utc_now(),
+            "consensus_total": 228.0, "home_team_total": home_total,
+            "away_team_total": 113.0, "pace_factor": 1.1, "n_books": 3,
+        }])
+
+    def _line(self, db, pid, stat, line):
+        db.conn.execute(
+            "INSERT INTO betting_lines (player_id, game_date, book, stat_type, line_value, "
+            "over_odds, under_odds) VALUES (?, ?, 'DraftKings', ?, ?, -110, -110)",
+            (pid, self.today, stat, line),
+        )
+        db.conn.commit()
+
+    def _recompute(self):
+        from nba_model.data.database.db_manager import DatabaseManager
+        from nba_model.model import prop_board
+
+        def history(player_name, n_games, rolling_window, db_path):
+            self.history_calls.append(player_name)
+            with DatabaseManager(db_path=db_path) as db:
+                games = db.get_player_games(self.PLAYERS[player_name][0], n_games)
+            return prop_board.build_history_from_games(games, rolling_window=rolling_window)
+
+        with patch.object(prop_board, "_build_player_history", side_effect=history):
+            return hourly_update._run_prediction_recompute(self.db_path)
+
+    def test_quiet_hour_reuses_every_key(self):
+        first = self._recompute()
+        second = self._recompute()
+
+        self.assertEqual((first["recomputed"], first["reused"]), (4, 0))
+        self.assertEqual(first["recompute_reasons"]["new"], 4)
+        self.assertEqual(first["predictions_persisted"], 4)
+        self.assertEqual((second["recomputed"], second["reused"]), (0, 4))
+        self.assertEqual((second["scored"], second["players"]), (0, 0))
+        self.assertEqual(sorted(self.history_calls), ["Alpha Guard", "Beta Forward"])
+
+    def test_changed_inputs_recompute_only_affected_keys(self):
+        import pandas as pd
+
+        from nba_model.data.database.db_manager import DatabaseManager
+
+        self._recompute()
+        with DatabaseManager(db_path=self.db_path) as db:
+            self._line(db, 101, "points", 22.5)        # Alpha points line moved
+            db.insert_game_logs(pd.DataFrame([self._game(202, 13, points=35)]))
+        changed = self._recompute()
+
+        self.assertEqual((changed["recomputed"], changed["reused"]), (3, 1))
+        self.assertEqual(changed["recompute_reasons"],
+                         {"new": 0, "game_logs": 2, "lines": 1, "team_prior": 0})
+        with DatabaseManager(db_path=self.db_path) as db:
+            self._prior(db, home_total=119.5)          # LAL total moved: Alpha only
+        repriced = self._recompute()
+
+        self.assertEqual((repriced["recomputed"], repriced["reused"]), (2, 2))
+        self.assertEqual(repriced["recompute_reasons"]["team_prior"], 2)
+        self.assertEqual(self.history_calls.count("Beta Forward"), 2)
+
+    def test_in_place_stat_correction_recomputes_that_player(self):
+        import pandas as pd
+
+        from nba_model.data.database.db_manager import DatabaseManager
+
+        self._recompute()
+        with DatabaseManager(db_path=self.db_path) as db:
+            # Same game, same date, same count: only the box score changes.
+            db.insert_game_logs(pd.DataFrame([self._game(101, 12, points=44)]), upsert=True)
+        corrected = self._recompute()
+
+        self.assertEqual((corrected["recomputed"], corrected["reused"]), (2, 2))
+        self.assertEqual(corrected["recompute_reasons"]["game_logs"], 2)
+        self.assertEqual(self.history_calls.count("Alpha Guard"), 2)
+        self.assertEqual(self.history_calls.count("Beta Forward"), 1)
+
+
 class PersistPredictionsTests(unittest.TestCase):
     """_persist_predictions widens the predictions table and is idempotent."""
 
@@ -282,6 +489,90 @@ class PersistPredictionsTests(unittest.TestCase):
             self.assertEqual(total, 3)
             self.assertEqual(stats, {"points", "assists", "rebounds"})
 
+    def test_rerun_updates_ungraded_rows_in_place(self):
+        from nba_model.data.database.db_manager import DatabaseManager
+        from nba_model.data.hourly_update import _persist_predictions
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "nba.db")
+            name_to_id = {"LeBron James": 2544}
+            _persist_predictions(
+                db_path,
+                [self._board_line("points", 25.5, 26.0), self._board_line("assists", 7.5, 8.0)],
+                name_to_id, "2025-04-01",
+            )
+            with DatabaseManager(db_path=db_path) as db:
+                db.conn.execute(
+                    "UPDATE predictions SET outcome = 'over' WHERE stat_type = 'assists'")
+                db.conn.commit()
+            n = _persist_predictions(
+                db_path,
+                [self._board_line("points", 26.5, 27.5), self._board_line("assists", 8.5, 9.0)],
+                name_to_id, "2025-04-01",
+            )
+            with DatabaseManager(db_path=db_path) as db:
+                rows = db.conn.execute(
+                    "SELECT prediction_id, stat_type, line_value, predicted_mean, outcome "
+                    "FROM predictions ORDER BY prediction_id").fetchall()
+        self.assertEqual(n, 1)
+        # Graded history is kept as settled; the open row is repriced in place.
+        self.assertEqual(rows, [
+            (1, "points", 26.5, 27.5, None),
+            (2, "assists", 7.5, 8.0, "over"),
+        ])
+
+    def test_slate_upsert_leaves_backtest_rows_alone(self):
+        from nba_model.data.database.db_manager import DatabaseManager
+        row = {
+            "player_id": 1, "game_date": "2025-04-01", "stat_type": "points",
+            "predicted_mean": 20.0, "predicted_std": 5.0, "prob_over": 0.5,
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "nba.db")
+            with DatabaseManager(db_path=db_path) as db:
+                # Two backtest runs with different configs on the same key.
+                db.insert_prediction({**row, "model_config_json": '{"window": 10}'})
+                db.insert_prediction({**row, "predicted_mean": 21.0,
+                                      "model_config_json": '{"window": 20}'})
+                first = db.upsert_predictions([{**row, "predicted_mean": 22.0}])
+                second = db.upsert_predictions([{**row, "predicted_mean": 23.0}])
+                rows = db.conn.execute(
+                    "SELECT p.predicted_mean, COUNT(c.config_id) FROM predictions p "
+                    "LEFT JOIN prediction_configs c USING (prediction_id) "
+                    "GROUP BY p.prediction_id ORDER BY p.prediction_id").fetchall()
+        self.assertEqual(first, {"upserted": 1, "attempted": 1})
+        self.assertEqual(second, {"upserted": 1, "attempted": 1})
+        self.assertEqual(rows, [(20.0, 1), (21.0, 1), (23.0, 0)])
+
+    def test_collapse_duplicate_predictions_keeps_graded_then_newest(self):
+        from nba_model.data.database.db_manager import DatabaseManager
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "nba.db")
+            with DatabaseManager(db_path=db_path) as db:
+                # Leftovers of the old delete-then-insert path, plus a backtest row.
+                for stat, mean, outcome in (
+                    ("points", 20.0, "over"), ("points", 21.0, None),
+                    ("assists", 7.0, None), ("assists", 8.0, None),
+                ):
+                    db.insert_prediction({
+                        "player_id": 1, "game_date": "2025-04-01", "stat_type": stat,
+                        "predicted_mean": mean, "predicted_std": 5.0, "prob_over": 0.5,
+                    })
+                    if outcome:
+                        db.conn.execute(
+                            "UPDATE predictions SET outcome = ? "
+                            "WHERE prediction_id = last_insert_rowid()", (outcome,))
+                db.insert_prediction({
+                    "player_id": 1, "game_date": "2025-04-01", "stat_type": "points",
+                    "predicted_mean": 19.0, "predicted_std": 5.0, "prob_over": 0.5,
+                    "model_config_json": "{}",
+                })
+                removed = db.collapse_duplicate_predictions()
+                removed_again = db.collapse_duplicate_predictions()
+                means = [r[0] for r in db.conn.execute(
+                    "SELECT predicted_mean FROM predictions ORDER BY prediction_id")]
+        self.assertEqual((removed, removed_again), (2, 0))
+        self.assertEqual(means, [20.0, 8.0, 19.0])
+
     def test_skips_unknown_player(self):
         from nba_model.data.database.db_manager import DatabaseManager
         from nba_model.data.hourly_update import _persist_predictions
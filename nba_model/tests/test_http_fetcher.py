@@ -0,0 +1,126 @@
+"""Tests for the concurrent conditional-GET fetcher (``nba_model.model.http_fetcher``)."""
+
+import asyncio
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from nba_model.model.http_fetcher import TokenBucket, fetch_urls_conditional
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    """Answers after ``DELAY``; tracks peak overlap per Host and 404s ``/missing``."""
+
+    DELAY = 0.2
+    lock = threading.Lock()
+    in_flight: dict = {}
+    peak: dict = {}
+    seen_headers: list = []
+
+    def do_GET(self):
+        host = self.headers.get("Host", "")
+        with self.lock:
+            self.in_flight[host] = self.in_flight.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.in_flight[host])
+            self.seen_headers.append((self.path, self.headers.get("If-None-Match")))
+        try:
+            time.sleep(self.DELAY)
+            if self.path.startswith("/missing"):
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if self.headers.get("If-None-Match") == '"same"':
+                self.send_response(304)
+                self.send_header("ETag", '"same"')
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = f"body of {self.path}".encode()
+            self.send_response(200)
+            self.send_header("ETag", '"same"')
+            self.send_header("Content-Type", "text/plain")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with self.lock:
+                self.in_flight[host] -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+class FetchUrlsConditionalTests(unittest.TestCase):
+    def setUp(self):
+        _SlowHandler.in_flight.clear()
+        _SlowHandler.peak.clear()
+        _SlowHandler.seen_headers = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.port = self.server.server_address[1]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _fetch(self, urls, **kwargs):
+        kwargs.setdefault("retries", 0)
+        return fetch_urls_conditional(urls, user_agent="test-agent", timeout=5, **kwargs)
+
+    def test_per_host_limit_and_input_order(self):
+        urls = [f"http://127.0.0.1:{self.port}/p{i}" for i in range(6)]
+        urls += [f"http://localhost:{self.port}/q{i}" for i in range(2)]
+        started = time.perf_counter()
+        outcomes = self._fetch(urls, per_host_limit=2, host_rate_per_second=100)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual([err for _, err in outcomes], [None] * 8)
+        self.assertEqual(
+            [resp["text"] for resp, _ in outcomes],
+            [f"body of /{url.rsplit('/', 1)[1]}" for url in urls],
+        )
+        self.assertEqual(max(_SlowHandler.peak.values()), 2)
+        # Six 127.0.0.1 pages two at a time: three waves, well under eight serial loads.
+        self.assertLess(elapsed, 8 * _SlowHandler.DELAY)
+
+    def test_validators_send_conditional_request(self):
+        url = f"http://127.0.0.1:{self.port}/board"
+        (fresh, _), = self._fetch([url])
+        (cached, _), = self._fetch([url], validators={url: {"etag": fresh["etag"]}})
+
+        self.assertEqual((fresh["status_code"], fresh["not_modified"]), (200, False))
+        self.assertEqual((cached["status_code"], cached["not_modified"]), (304, True))
+        self.assertEqual(cached["text"], "")
+        self.assertEqual(_SlowHandler.seen_headers, [("/board", None), ("/board", '"same"')])
+
+    def test_errors_returned_after_retries(self):
+        ok_url = f"http://127.0.0.1:{self.port}/ok"
+        bad_url = f"http://127.0.0.1:{self.port}/missing"
+        outcomes = self._fetch(
+            [bad_url, ok_url], retries=1, retry_delay_seconds=0.0, host_rate_per_second=100,
+        )
+        (bad, bad_err), (ok, ok_err) = outcomes
+        self.assertIsNone(bad)
+        self.assertIn("404", str(bad_err))
+        self.assertIsNone(ok_err)
+        self.assertEqual(ok["status_code"], 200)
+        self.assertEqual(
+            sum(1 for path, _ in _SlowHandler.seen_headers if path == "/missing"), 2,
+        )
+
+    def test_token_bucket_spaces_requests(self):
+        async def take(n):
+            bucket = TokenBucket(rate=20.0, capacity=1)
+            started = time.perf_counter()
+            for _ in range(n):
+                await bucket.acquire()
+            return time.perf_counter() - started
+
+        # One burst token, then one every 50ms.
+        self.assertGreaterEqual(asyncio.run(take(5)), 4 * 0.05 * 0.9)
+
+
+if __name__ == "__main__":
+    unittest.main()
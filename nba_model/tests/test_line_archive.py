@@ -0,0 +1,160 @@
+"""Tests for hot/cold tiering of the line-history tables.
+
+Archiving must be invisible to readers: the consensus / CLV queries return the
+same answer before and after old rows move into a per-season archive file,
+while recent-window reads keep hitting only the hot tables.
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+from nba_model.data.database.db_manager import DatabaseManager
+from nba_model.data.line_archive import archive_line_history, season_for_month
+
+NOW = datetime(2026, 3, 15, 12, 0, tzinfo=timezone.utc)
+GAME_DATE = (NOW - timedelta(days=60)).strftime("%Y-%m-%d")
+
+
+def _ts(days_ago: float) -> str:
+    return (NOW - timedelta(days=days_ago)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _card(snapshot_id, line, book, ts):
+    return {
+        "snapshot_id": snapshot_id,
+        "source_url": f"https://{book}.com",
+        "book": book,
+        "observed_at_utc": ts,
+        "player_name": "LeBron James",
+        "player_classification": "active_nba",
+        "stat_type": "points",
+        "line_value": line,
+        "side": "over",
+        "parse_confidence": 0.9,
+        "raw_card_text": f"raw-{book}-{line}",
+        "parser_version": "v1",
+        "record_sha256": f"{book}-{line}-{ts}",
+    }
+
+
+class SeasonLabelTests(unittest.TestCase):
+    def test_october_starts_the_season(self):
+        self.assertEqual(season_for_month("2025-10"), "2025-26")
+        self.assertEqual(season_for_month("2026-04"), "2025-26")
+        self.assertEqual(season_for_month("2025-09"), "2024-25")
+        self.assertIsNone(season_for_month(None))
+
+
+class LineArchiveTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self._tmp.name, "nba_data.db")
+        with DatabaseManager(self.db_path) as db:
+            db.insert_web_text_snapshots([
+                {
+                    "source_url": "https://prizepicks.com",
+                    "fetched_at_utc": _ts(days),
+                    "http_status": 200,
+                    "text_content": f"LeBron James points snapshot {days}",
+                }
+                for days in (90, 2)
+            ])
+            db.insert_web_prop_cards([
+                _card(1, 24.5, "prizepicks", _ts(90)),
+                _card(1, 25.5, "underdog", _ts(89)),
+                _card(2, 26.5, "prizepicks", _ts(2)),
+            ])
+            db.insert_game_logs(pd.DataFrame([{
+                "player_id": 2544, "game_id": "g2544", "game_date": GAME_DATE,
+                "season": "2025-26", "points": 27,
+            }]))
+            db.insert_betting_line_snapshots([
+                {
+                    "snapshot_ts_utc": _ts(60),
+                    "game_date": GAME_DATE,
+                    "player_id": 2544,
+                    "book": "draftkings",
+                    "market_key": "player_points",
+                    "stat_type": "points",
+                    "line_value": 25.5,
+                    "over_odds": -110,
+                    "under_odds": -130,
+                },
+            ])
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _readers(self):
+        with DatabaseManager(self.db_path) as db:
+            consensus = [
+                (r["mean_line"], r["n_books"])
+                for r in db.get_consensus_prop_lines(player_name="LeBron James")
+            ]
+            # A fresh pending pick each time, closed out by the settlement SQL.
+            db.conn.execute("DELETE FROM bet_log")
+            db.insert_bet_log_rows([{
+                "game_date": GAME_DATE, "player_id": 2544, "player_name": "LeBron James",
+                "stat_type": "points", "line": 25.5, "side": "under", "implied_prob": 0.5,
+            }])
+            db.settle_bet_log()
+            clv = db.conn.execute("SELECT clv_delta FROM bet_log").fetchone()[0]
+        return consensus, clv
+
+    def test_archive_moves_old_rows_and_keeps_readers_whole(self):
+        before = self._readers()
+        self.assertIsNotNone(before[1])
+        summary = archive_line_history(self.db_path, horizon_days=30, now=NOW)
+
+        self.assertEqual(summary["tables"]["web_prop_cards"], {"2025-26": 2})
+        self.assertEqual(summary["tables"]["betting_line_snapshots"], {"2025-26": 1})
+        self.assertEqual(summary["tables"]["web_text_snapshots"], {"2025-26": 1})
+        archive = os.path.join(self._tmp.name, "archive", "line_history_2025-26.db")
+        self.assertTrue(os.path.exists(archive))
+
+        with DatabaseManager(self.db_path) as db:
+            hot_cards = db.conn.execute("SELECT COUNT(*) FROM web_prop_cards").fetchone()[0]
+            self.assertEqual(hot_cards, 1)
+            # Recent window stays hot-only; full history unions the archive.
+            self.assertEqual(db.line_history_source("web_prop_cards", since_hours=24),
+                             "web_prop_cards")
+            source = db.line_history_source("web_prop_cards")
+            self.assertIn("line_archive_2025_26", source)
+            total = db.conn.execute(f"SELECT COUNT(*) FROM {source}").fetchone()[0]
+            self.assertEqual(total, 3)
+            # The parsers' recent-snapshot reads only ever see the hot tier.
+            recent = db.get_recent_web_text_snapshots(max_snapshots_per_url=10)
+            self.assertEqual(len(recent), 1)
+        with sqlite3.connect(archive) as conn:
+            blobs = conn.execute(
+                "SELECT COUNT(*) FROM web_text_snapshots s "
+                "JOIN web_text_blobs b ON b.blob_sha256 = s.blob_sha256"
+            ).fetchone()[0]
+            self.assertEqual(blobs, 1)
+
+        self.assertEqual(self._readers(), before)
+
+    def test_dry_run_and_rerun_are_safe(self):
+        dry = archive_line_history(self.db_path, horizon_days=30, now=NOW, dry_run=True)
+        self.assertEqual(dry["tables"]["web_prop_cards"], {"2025-26": 2})
+        self.assertEqual(dry["rows_moved"], 0)
+        self.assertFalse(os.path.exists(os.path.join(self._tmp.name, "archive")))
+
+        archive_line_history(self.db_path, horizon_days=30, now=NOW)
+        again = archive_line_history(self.db_path, horizon_days=30, now=NOW)
+        self.assertEqual(again["rows_moved"], 0)
+        with DatabaseManager(self.db_path) as db:
+            row = db.conn.execute(
+                "SELECT row_count FROM line_archive_manifest "
+                "WHERE table_name = 'web_prop_cards' AND season = '2025-26'"
+            ).fetchone()
+            self.assertEqual(row[0], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""Tests for the incremental league-wide game-log refresh against a fake nba_api endpoint."""
+
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+
+from nba_model.data import hourly_update, nba_results_ingestion
+from nba_model.data.database.db_manager import DatabaseManager
+from nba_model.data.nba_results_ingestion import refresh_player_game_logs_incremental
+
+
+def _log_row(player_id, day, season="2025-26", pts=10):
+    return {
+        "PLAYER_ID": player_id,
+        "GAME_ID": f"{season[:4]}{day:04d}{player_id % 15:02d}",
+        "GAME_DATE": f"{season[:4]}-11-{day:02d}T00:00:00",
+        "SEASON_YEAR": season,
+        "MATCHUP": "LAL vs. BOS" if player_id % 2 else "BOS @ LAL",
+        "WL": "W",
+        "MIN": 30.5,
+        "PTS": pts,
+        "REB": 5,
+        "AST": 4,
+    }
+
+
+class _FakePlayerGameLogs:
+    """Stands in for ``playergamelogs.PlayerGameLogs`` over a fixed league frame."""
+
+    league: list = []
+    calls: list = []
+
+    def __init__(self, **kwargs):
+        self.calls.append(kwargs)
+        rows = [row for row in self.league if row["SEASON_YEAR"] == kwargs["season_nullable"]]
+        if kwargs.get("date_from_nullable"):
+            floor = datetime.strptime(kwargs["date_from_nullable"], "%m/%d/%Y")
+            rows = [row for row in rows if datetime.fromisoformat(row["GAME_DATE"]) >= floor]
+        self._frame = pd.DataFrame(rows)
+
+    def get_data_frames(self):
+        return [self._frame]
+
+
+class IncrementalGameLogRefreshTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.tmp_dir.name) / "nba_data.db")
+        DatabaseManager(db_path=self.db_path).close()
+        _FakePlayerGameLogs.league = []
+        _FakePlayerGameLogs.calls = []
+        self.patches = [
+            patch.object(nba_results_ingestion.playergamelogs, "PlayerGameLogs",
+                         _FakePlayerGameLogs),
+            patch.object(nba_results_ingestion, "RATE_LIMIT_SECONDS", 0),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        self.tmp_dir.cleanup()
+
+    def _rows(self, sql, params=()):
+        with DatabaseManager(db_path=self.db_path) as db:
+            return db.conn.execute(sql, params).fetchall()
+
+    def test_500_players_refresh_with_one_date_bounded_request(self):
+        tracked = list(range(1000, 1500))
+        _FakePlayerGameLogs.league = [
+            _log_row(pid, day) for day in (1, 2, 3) for pid in tracked + [9999]
+        ]
+        first = refresh_player_game_logs_incremental(
+            seasons=["2025-26"], db_path=self.db_path, player_ids=tracked,
+        )
+        self.assertEqual(first["requests"], 1)
+        self.assertEqual(first["inserted"], 1500)
+        self.assertNotIn("date_from_nullable", _FakePlayerGameLogs.calls[0])
+
+        # Day 4 goes final and a day-3 box score gets a stat correction.
+        _FakePlayerGameLogs.league += [_log_row(pid, 4) for pid in tracked + [9999]]
+        _FakePlayerGameLogs.league[2 * 501] = _log_row(1000, 3, pts=44)
+        second = refresh_player_game_logs_incremental(
+            seasons=["2025-26"], db_path=self.db_path, player_ids=tracked,
+        )
+
+        self.assertEqual(second["requests"], 1)
+        self.assertEqual(_FakePlayerGameLogs.calls[1]["date_from_nullable"], "11/03/2025")
+        self.assertEqual(second["attempted"], 1000)  # days 3 and 4, tracked players only
+        self.assertEqual(second["inserted"], 500)
+        self.assertEqual(second["rows_by_player"][1000], 2)
+        self.assertEqual(self._rows("SELECT COUNT(*) FROM game_logs")[0][0], 2000)
+        self.assertEqual(
+            self._rows("SELECT COUNT(*) FROM game_logs WHERE player_id = 9999")[0][0], 0,
+        )
+        self.assertEqual(
+            self._rows(
+                "SELECT points FROM game_logs WHERE player_id = 1000 AND game_date LIKE ?",
+                ("2025-11-03%",),
+            )[0][0],
+            44,
+        )
+        # Only the corrected row is stamped; identical day-3 re-pulls are not.
+        self.assertEqual(
+            self._rows("SELECT player_id, game_date FROM game_logs WHERE updated_at IS NOT NULL"),
+            [(1000, "2025-11-03T00:00:00")],
+        )
+
+    def test_one_request_per_season_with_its_own_watermark(self):
+        _FakePlayerGameLogs.league = [
+            _log_row(1, 5, season="2024-25"), _log_row(1, 9, season="2024-25"),
+            _log_row(1, 2, season="2025-26"),
+        ]
+        with DatabaseManager(db_path=self.db_path) as db:
+            db.insert_game_logs(nba_results_ingestion.transform_player_logs_frame(
+                pd.DataFrame([_log_row(1, 5, season="2024-25")])
+            ))
+
+        summary = refresh_player_game_logs_incremental(
+            seasons=["2025-26", "2024-25"], db_path=self.db_path,
+        )
+
+        self.assertEqual(summary["requests"], 2)
+        self.assertEqual(
+            [season["date_from"] for season in summary["seasons"]], [None, "2024-11-05"],
+        )
+        self.assertEqual(summary["inserted"], 2)
+        self.assertEqual(self._rows("SELECT COUNT(*) FROM game_logs")[0][0], 3)
+
+    def test_hourly_refresh_keeps_tracked_players_only(self):
+        _FakePlayerGameLogs.league = [_log_row(pid, 1) for pid in (1, 2)]
+        with DatabaseManager(db_path=self.db_path) as db:
+            db.insert_game_logs(nba_results_ingestion.transform_player_logs_frame(
+                pd.DataFrame([_log_row(1, 1)])
+            ))
+        _FakePlayerGameLogs.league += [_log_row(pid, 2) for pid in (1, 2)]
+
+        with patch.object(nba_results_ingestion, "current_season", return_value="2025-26"):
+            result = hourly_update._run_game_log_refresh(self.db_path)
+
+        self.assertEqual(result, {"players_refreshed": 1, "requests": 1, "rows_inserted": 1})
+        self.assertEqual(len(_FakePlayerGameLogs.calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
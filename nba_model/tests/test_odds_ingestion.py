@@ -1,12 +1,21 @@
 """Unit tests for odds ingestion validation, retries, and summaries."""
 
+import json
+import tempfile
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import requests
 
+from nba_model.data.database.db_manager import DatabaseManager
+from nba_model.model import odds_ingestion
 from nba_model.model.odds_ingestion import (
     _get_json,
+    _resolve_player_id,
     fetch_and_store_betting_lines,
     validate_betting_line_records,
 )
@@ -148,5 +157,160 @@ class OddsIngestionSummaryTests(unittest.TestCase):
         db.insert_player.assert_called_once_with(2544, "LeBron James")
 
 
+# Recorded shape of The Odds API /events/{id}/odds responses.
+def _recorded_event_payload(event_id, home, away, players):
+    outcomes = []
+    for i, name in enumerate(players):
+        outcomes.append({"name": "Over", "description": name, "price": -115, "point": 20.5 + i})
+        outcomes.append({"name": "Under", "description": name, "price": -105, "point": 20.5 + i})
+    return {
+        "id": event_id,
+        "sport_key": "basketball_nba",
+        "commence_time": "2026-03-02T00:10:00Z",
+        "home_team": home,
+        "away_team": away,
+        "bookmakers": [{
+            "key": "draftkings",
+            "title": "DraftKings",
+            "markets": [{"key": "player_points", "outcomes": outcomes}],
+        }],
+    }
+
+
+_RECORDED_EVENTS = {
+    f"evt{i}": _recorded_event_payload(f"evt{i}", home, away, players)
+    for i, (home, away, players) in enumerate([
+        ("Los Angeles Lakers", "Denver Nuggets", ["LeBron James", "Nikola Jokic"]),
+        ("Golden State Warriors", "Boston Celtics", ["Stephen Curry", "Jayson Tatum"]),
+        ("Dallas Mavericks", "Phoenix Suns", ["Kyrie Irving", "Devin Booker"]),
+        ("Portland Trail Blazers", "Miami Heat", ["Damian Lillard", "Bam Adebayo"]),
+        ("Orlando Magic", "Washington Wizards", ["Paolo Banchero", "Kelly Oubre"]),
+        ("New York Knicks", "Utah Jazz", ["Jalen Brunson", "Nobody Real"]),
+    ])
+}
+
+
+class _FakeOddsHandler(BaseHTTPRequestHandler):
+    """Serves the recorded events after ``DELAY``; counts hits and peak overlap."""
+
+    DELAY = 0.15
+    lock = threading.Lock()
+    hits: dict = {}
+    in_flight = 0
+    peak = 0
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        cls = type(self)
+        with cls.lock:
+            cls.hits[path] = cls.hits.get(path, 0) + 1
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+        try:
+            time.sleep(self.DELAY)
+            if path == "/v4/sports/basketball_nba/events":
+                body = [{"id": event_id} for event_id in _RECORDED_EVENTS]
+            else:
+                event_id = path.split("/")[-2]
+                body = _RECORDED_EVENTS.get(event_id)
+            if body is None:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            data = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+class OddsIngestionEventFetchTests(unittest.TestCase):
+    """Per-event odds are fetched concurrently and cached per snapshot hour."""
+
+    def setUp(self):
+        _FakeOddsHandler.hits = {}
+        _FakeOddsHandler.peak = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeOddsHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{self.server.server_address[1]}/v4"
+        self.base_patch = patch.object(odds_ingestion, "BASE_URL", base_url)
+        self.base_patch.start()
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.base_patch.stop()
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmpdir.cleanup()
+
+    def _ingest(self, **kwargs):
+        return fetch_and_store_betting_lines(
+            api_key="dummy",
+            markets=["player_points"],
+            db_path=str(Path(self.tmpdir.name) / "nba_data.db"),
+            sleep_seconds=0.0,
+            request_retries=0,
+            **kwargs,
+        )
+
+    def _event_odds_hits(self):
+        return sum(n for path, n in _FakeOddsHandler.hits.items() if path.endswith("/odds"))
+
+    def test_concurrent_fetch_and_hourly_cache(self):
+        cache_dir = str(Path(self.tmpdir.name) / "odds_cache")
+        first = self._ingest(max_concurrency=3, cache_dir=cache_dir)
+
+        self.assertEqual(first["ingestion_mode"], "event_odds")
+        self.assertEqual(first["event_odds_failures"], 0)
+        self.assertEqual(first["event_cache_hits"], 0)
+        self.assertEqual(self._event_odds_hits(), 6)
+        # Six slow events, never more than three in flight.
+        self.assertEqual(_FakeOddsHandler.peak, 3)
+        self.assertEqual(first["unresolved_player_names"], ["Nobody Real"])
+        self.assertEqual(first["db_inserted"], 11)
+
+        rerun = self._ingest(max_concurrency=3, cache_dir=cache_dir)
+        self.assertEqual(self._event_odds_hits(), 6)
+        self.assertEqual(rerun["event_cache_hits"], 6)
+        self.assertEqual(rerun["records_valid"], first["records_valid"])
+
+        with DatabaseManager(db_path=str(Path(self.tmpdir.name) / "nba_data.db")) as db:
+            count = db.conn.execute("SELECT COUNT(*) FROM betting_lines").fetchone()[0]
+        self.assertEqual(count, 11)
+
+    def test_without_cache_every_run_calls_api(self):
+        self._ingest(max_concurrency=2)
+        summary = self._ingest(max_concurrency=2)
+        self.assertEqual(summary["event_cache_hits"], 0)
+        self.assertEqual(self._event_odds_hits(), 12)
+        self.assertLessEqual(_FakeOddsHandler.peak, 2)
+
+    def test_resolve_player_id_uses_prebuilt_index(self):
+        with patch.object(
+            odds_ingestion.static_players, "find_players_by_full_name",
+            side_effect=AssertionError("per-name lookup"),
+        ):
+            cache = {}
+            self.assertEqual(_resolve_player_id("LeBron James", cache), 2544)
+            self.assertEqual(
+                _resolve_player_id("Kelly Oubre", cache),
+                _resolve_player_id("Kelly Oubre Jr.", cache),
+            )
+            self.assertEqual(
+                _resolve_player_id("CJ McCollum", cache),
+                _resolve_player_id("C.J. McCollum", cache),
+            )
+            self.assertIsNone(_resolve_player_id("Nobody Real", cache))
+        self.assertIsNotNone(cache["Kelly Oubre"])
+
+
 if __name__ == "__main__":
     unittest.main()
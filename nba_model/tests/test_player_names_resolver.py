@@ -1,8 +1,14 @@
 """Tests for the shared player-name resolver used by every scraper."""
 
+import sqlite3
+import tempfile
 import unittest
+from pathlib import Path
 
 from nba_model.scrapers.player_names import (
+    PlayerNameIndex,
+    clear_player_name_index_cache,
+    get_player_name_index,
     normalize_name_key,
     resolve_player_name,
 )
@@ -111,5 +117,51 @@ class UnknownTests(unittest.TestCase):
         self.assertIsNone(resolve_player_name("Jalen Brunson", []))
 
 
+class PlayerNameIndexTests(unittest.TestCase):
+    RAW = [
+        "Jalen Brunson", "JALEN BRUNSON", "C.J. McCollum", "tim hardaway jr.",
+        "J. Brunson", "M. Bridges", "Wembanyama", "Bridges", "Brunson, Jalen",
+        "McCollum, C.J.", "Foo Bar", "", None,
+    ]
+
+    def tearDown(self):
+        clear_player_name_index_cache()
+
+    def test_index_matches_resolve_player_name(self):
+        index = PlayerNameIndex(SAMPLE)
+        for raw in self.RAW:
+            self.assertEqual(index.resolve(raw), resolve_player_name(raw, SAMPLE), raw)
+        # Memoized answers (hits and misses) are stable on repeat.
+        self.assertEqual(index.resolve("J. Brunson"), "Jalen Brunson")
+        self.assertIsNone(index.resolve("M. Bridges"))
+
+    def test_index_cached_per_db_and_sport(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = str(Path(tmpdir) / "nba_data.db")
+            conn = sqlite3.connect(db_path)
+            conn.execute(
+                "CREATE TABLE nba_active_players_ref (player_name TEXT, synced_at_utc TEXT)")
+            conn.execute(
+                "INSERT INTO nba_active_players_ref VALUES ('Jalen Brunson', '2025-10-01')")
+            conn.commit()
+            index = get_player_name_index(db_path)
+            self.assertEqual(index.resolve("J. Brunson"), "Jalen Brunson")
+            self.assertIs(get_player_name_index(db_path), index)
+            self.assertEqual(len(get_player_name_index(db_path, sport="mlb")), 0)
+
+            # A re-sync moves the roster fingerprint; the next lookup reloads.
+            conn.execute(
+                "INSERT INTO nba_active_players_ref VALUES ('Victor Wembanyama', '2025-10-02')")
+            conn.commit()
+            conn.close()
+            refreshed = get_player_name_index(db_path)
+            self.assertIsNot(refreshed, index)
+            self.assertEqual(refreshed.resolve("Wembanyama"), "Victor Wembanyama")
+            self.assertIs(get_player_name_index(db_path), refreshed)
+
+            clear_player_name_index_cache()
+            self.assertIsNot(get_player_name_index(db_path), refreshed)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -183,6 +183,30 @@ class RunPublishTests(unittest.TestCase):
         self.assertTrue(report["committed"])
         self.assertFalse(report["pushed"])
 
+    def test_compact_web_text_moves_inline_text_before_publish(self):
+        from nba_model.data.database.db_manager import DatabaseManager
+
+        with tempfile.TemporaryDirectory() as tmp:
+            db = str(Path(tmp) / "x.db")
+            with DatabaseManager(db_path=db) as dbm:
+                dbm.conn.execute(
+                    "INSERT INTO web_text_snapshots (source_url, fetched_at_utc, "
+                    "text_content) VALUES ('https://a.example', '2026-05-08', ?)",
+                    ("legacy page text " * 200,),
+                )
+                dbm.conn.commit()
+            report = publish_db.run_publish(
+                db_path=db, repo_root=tmp,
+                backup_dir=str(Path(tmp) / "backups"), git_runner=FakeGit(),
+                compact_web_text=True, log=lambda *_: None,
+            )
+            with DatabaseManager(db_path=db) as dbm:
+                inline = dbm.conn.execute(
+                    "SELECT LENGTH(text_content) FROM web_text_snapshots"
+                ).fetchone()[0]
+        self.assertEqual(report["compaction"]["rows_compacted"], 1)
+        self.assertTrue(report["compaction"]["vacuumed"])
+        self.assertEqual(inline, 0)
 
 if __name__ == "__main__":
     unittest.main()
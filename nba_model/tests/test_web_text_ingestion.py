@@ -1,12 +1,17 @@
 """Unit tests for direct web text ingestion and active-player sync helpers."""
 
 import tempfile
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from nba_model.data.database.db_manager import DatabaseManager
+from nba_model.model import web_text_ingestion as wti
 from nba_model.model.web_text_ingestion import (
+    CdpFetchSession,
     _build_parser,
     _check_session_content,
     _detect_login_wall_early,
@@ -21,22 +26,69 @@ from nba_model.scrapers import get_scraper_for_url
 from nba_model.scrapers.base import BookScraper
 
 
-class WebTextIngestionTests(unittest.TestCase):
-    @patch("nba_model.model.web_text_ingestion.requests.get")
-    def test_fetch_and_store_reuses_recent_snapshot(self, mock_get):
-        response = MagicMock()
-        response.status_code = 200
-        response.headers = {"Content-Type": "text/html; charset=utf-8"}
-        response.text = (
+class _FixtureSiteHandler(BaseHTTPRequestHandler):
+    """Local book site: serves ``pages`` and honours If-None-Match /
+    If-Modified-Since, logging each request's path and response status."""
+
+    pages: dict = {}
+    log: list = []
+
+    def do_GET(self):
+        content_type, body, etag, last_modified = self.pages.get(
+            self.path, ("text/plain", None, None, None),
+        )
+        if body is None:
+            status = 404
+        elif (etag and self.headers.get("If-None-Match") == etag) or (
+            last_modified and self.headers.get("If-Modified-Since") == last_modified
+        ):
+            status = 304
+        else:
+            status = 200
+        self.log.append((self.path, status, self.headers.get("If-None-Match")))
+        payload = body.encode() if status == 200 else b""
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        if last_modified:
+            self.send_header("Last-Modified", last_modified)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class _FixtureSiteTestCase(unittest.TestCase):
+    def setUp(self):
+        _FixtureSiteHandler.pages = {}
+        _FixtureSiteHandler.log = []
+        self.site = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureSiteHandler)
+        threading.Thread(target=self.site.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.site.server_address[1]}"
+
+    def tearDown(self):
+        self.site.shutdown()
+        self.site.server_close()
+
+    def serve(self, path, body, content_type="text/plain", etag=None, last_modified=None):
+        _FixtureSiteHandler.pages[path] = (content_type, body, etag, last_modified)
+        return self.base_url + path
+
+
+class WebTextIngestionTests(_FixtureSiteTestCase):
+    def test_fetch_and_store_reuses_recent_snapshot(self):
+        url = self.serve(
+            "/odds-page",
             "<html><body>DraftKings points line 27.5"
-            "<script>ignore me</script><style>ignore me</style></body></html>"
+            "<script>ignore me</script><style>ignore me</style></body></html>",
+            content_type="text/html; charset=utf-8",
         )
-        response.raise_for_status.return_value = None
-        mock_get.return_value = response
 
         with tempfile.TemporaryDirectory() as tmpdir:
             db_path = str(Path(tmpdir) / "nba_data.db")
-            url = "https://example.com/odds-page"
 
             first = fetch_and_store_web_text(
                 urls=[url],
@@ -54,9 +106,12 @@ class WebTextIngestionTests(unittest.TestCase):
             )
 
             with DatabaseManager(db_path=db_path) as db:
-                rows = db.conn.execute(
-                    "SELECT source_url, text_content FROM web_text_snapshots"
-                ).fetchall()
+                rows = [
+                    (snap["source_url"], snap["text_content"])
+                    for snap in db.get_recent_web_text_snapshots(
+                        max_snapshots_per_url=100,
+                    )
+                ]
 
         self.assertEqual(first["status"], "success")
         self.assertEqual(first["fetched_count"], 1)
@@ -68,20 +123,13 @@ class WebTextIngestionTests(unittest.TestCase):
         self.assertEqual(rows[0][0], url)
         self.assertIn("DraftKings points line 27.5", rows[0][1])
         self.assertNotIn("ignore me", rows[0][1])
-        mock_get.assert_called_once()
+        self.assertEqual(len(_FixtureSiteHandler.log), 1)
 
-    @patch("nba_model.model.web_text_ingestion.requests.get")
-    def test_fetch_and_store_force_poll_ignores_window(self, mock_get):
-        response = MagicMock()
-        response.status_code = 200
-        response.headers = {"Content-Type": "text/plain"}
-        response.text = "Book text snapshot"
-        response.raise_for_status.return_value = None
-        mock_get.return_value = response
+    def test_fetch_and_store_force_poll_ignores_window(self):
+        url = self.serve("/book-lines", "Book text snapshot")
 
         with tempfile.TemporaryDirectory() as tmpdir:
             db_path = str(Path(tmpdir) / "nba_data.db")
-            url = "https://example.com/book-lines"
 
             first = fetch_and_store_web_text(
                 urls=[url],
@@ -107,7 +155,55 @@ class WebTextIngestionTests(unittest.TestCase):
         self.assertEqual(second["fetched_count"], 1)
         self.assertEqual(second["skipped_recent_count"], 0)
         self.assertEqual(total_rows, 2)
-        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(len(_FixtureSiteHandler.log), 2)
+
+    def test_conditional_get_stores_unchanged_snapshot(self):
+        lines_url = self.serve("/lines", "Jalen Brunson 26.5 points", etag='"v1"')
+        news_url = self.serve(
+            "/news", "Injury report", last_modified="Mon, 19 Oct 2026 12:00:00 GMT",
+        )
+        fetch = dict(min_hours_between_polls=None, force_poll=True, request_retries=0)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = str(Path(tmpdir) / "nba_data.db")
+            first = fetch_and_store_web_text([lines_url, news_url], db_path=db_path, **fetch)
+            second = fetch_and_store_web_text([lines_url, news_url], db_path=db_path, **fetch)
+            self.serve("/lines", "Jalen Brunson 27.5 points", etag='"v2"')
+            third = fetch_and_store_web_text([lines_url], db_path=db_path, **fetch)
+
+            with DatabaseManager(db_path=db_path) as db:
+                texts = [
+                    snap["text_content"]
+                    for snap in db.get_recent_web_text_snapshots(
+                        source_urls=[lines_url], max_snapshots_per_url=10,
+                    )
+                ]
+                n_blobs = db.conn.execute("SELECT COUNT(*) FROM web_text_blobs").fetchone()[0]
+                validators = db.get_web_fetch_validators([lines_url, news_url])
+
+        self.assertEqual(first["fetched_count"], 2)
+        self.assertEqual((second["fetched_count"], second["unchanged_count"]), (0, 2))
+        self.assertEqual(second["status"], "success")
+        self.assertEqual(
+            [row["status"] for row in second["results"]], ["unchanged", "unchanged"],
+        )
+        self.assertEqual(second["db_inserted"], 2)
+        self.assertEqual(third["fetched_count"], 1)
+        self.assertEqual(
+            [entry[1:] for entry in _FixtureSiteHandler.log if entry[0] == "/lines"],
+            [(200, None), (304, '"v1"'), (200, '"v1"')],
+        )
+        # Newest first: the changed page, then the 304 re-store of v1.
+        self.assertEqual(
+            texts,
+            ["Jalen Brunson 27.5 points", "Jalen Brunson 26.5 points",
+             "Jalen Brunson 26.5 points"],
+        )
+        self.assertEqual(n_blobs, 3)
+        self.assertEqual(validators[lines_url]["etag"], '"v2"')
+        self.assertEqual(
+            validators[news_url]["last_modified"], "Mon, 19 Oct 2026 12:00:00 GMT",
+        )
 
     @patch("nba_model.model.web_text_ingestion.requests.get")
     @patch("nba_model.model.web_text_ingestion._fetch_url_text_with_browser")
@@ -139,9 +235,12 @@ class WebTextIngestionTests(unittest.TestCase):
             )
 
             with DatabaseManager(db_path=db_path) as db:
-                rows = db.conn.execute(
-                    "SELECT source_url, text_content FROM web_text_snapshots"
-                ).fetchall()
+                rows = [
+                    (snap["source_url"], snap["text_content"])
+                    for snap in db.get_recent_web_text_snapshots(
+                        max_snapshots_per_url=100,
+                    )
+                ]
 
         self.assertEqual(summary["status"], "success")
         self.assertEqual(summary["fetch_mode"], "browser")
@@ -176,6 +275,33 @@ class ScrollAndCdpPlumbingTests(unittest.TestCase):
         self.assertIsNotNone(dk)
         self.assertTrue(dk.scroll_page)
 
+    def test_settle_wait_ends_on_dom_quiescence(self):
+        page = MagicMock()
+        page.inner_text.return_value = ""
+        page.evaluate.return_value = 120.0
+        waited = wti._wait_for_dynamic_content(page, "https://example.com/board", 4.0)
+        # One observer wait capped at the old fixed sleep, no fixed sleep.
+        script, args = page.evaluate.call_args.args
+        self.assertIs(script, wti._DOM_QUIESCENCE_SCRIPT)
+        self.assertEqual(args["maxMs"], 4000)
+        page.wait_for_timeout.assert_not_called()
+        self.assertIsInstance(waited, float)
+        self.assertLess(waited, 1.0)
+
+    def test_settle_wait_falls_back_to_fixed_sleep(self):
+        page = MagicMock()
+        page.evaluate.side_effect = RuntimeError("Execution context was destroyed")
+        wti._wait_for_dom_quiescence(page, 2.5)
+        page.wait_for_timeout.assert_called_once_with(2500)
+
+    def test_scroll_stops_early_and_shares_settle_budget(self):
+        page = MagicMock()
+        page.evaluate.side_effect = [{"steps": 1, "ms": 1200.0}, 90.0]
+        wti._scroll_page_for_lazy_content(page)
+        scroll_call, settle_call = page.evaluate.call_args_list
+        self.assertIs(scroll_call.args[0], wti._ADAPTIVE_SCROLL_SCRIPT)
+        self.assertEqual(settle_call.args[1]["maxMs"], wti._SCROLL_SETTLE_MS - 1200)
+
     @patch("nba_model.model.web_text_ingestion.requests.get")
     @patch("nba_model.model.web_text_ingestion._fetch_url_text_via_cdp")
     def test_chrome_debug_port_routes_through_cdp(self, mock_cdp, mock_get):
@@ -486,9 +612,12 @@ class ScrollAndCdpPlumbingTests(unittest.TestCase):
             )
 
             with DatabaseManager(db_path=db_path) as db:
-                rows = db.conn.execute(
-                    "SELECT source_url, text_content FROM web_text_snapshots"
-                ).fetchall()
+                rows = [
+                    (snap["source_url"], snap["text_content"])
+                    for snap in db.get_recent_web_text_snapshots(
+                        max_snapshots_per_url=100,
+                    )
+                ]
 
         self.assertEqual(summary["status"], "success")
         self.assertEqual(summary["fetch_mode"], "browser")
@@ -561,5 +690,180 @@ class ScrollAndCdpPlumbingTests(unittest.TestCase):
         self.assertEqual(file_lines, ["Active Player 1", "Active Player 2"])
 
 
+class WebTextBlobStorageTests(unittest.TestCase):
+    """Snapshot text is stored once per distinct content, compressed."""
+
+    URL = "https://app.prizepicks.com/board/nba"
+    TEXT = "NBA LeBron James Higher Lower 27.5 Points " * 50
+
+    def _snap(self, fetched_at, text):
+        return {
+            "source_url": self.URL, "fetched_at_utc": fetched_at,
+            "http_status": 200, "content_type": "text/html",
+            "text_content": text, "text_length": len(text),
+            "content_sha256": "caller-hash",
+        }
+
+    def test_unchanged_refetch_reuses_one_compressed_blob(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with DatabaseManager(db_path=str(Path(tmpdir) / "t.db")) as db:
+                first = db.insert_web_text_snapshots(
+                    [self._snap("2026-05-08T00:00:00Z", self.TEXT)])
+                second = db.insert_web_text_snapshots([
+                    self._snap("2026-05-08T01:00:00Z", self.TEXT),
+                    self._snap("2026-05-08T02:00:00Z", self.TEXT + " moved"),
+                ])
+                n_snaps, inline = db.conn.execute(
+                    "SELECT COUNT(*), SUM(LENGTH(text_content)) "
+                    "FROM web_text_snapshots").fetchone()
+                blob_sizes = [r[0] for r in db.conn.execute(
+                    "SELECT LENGTH(payload) FROM web_text_blobs").fetchall()]
+                texts = [s["text_content"] for s in db.get_recent_web_text_snapshots(
+                    max_snapshots_per_url=10)]
+
+        self.assertEqual(first["blobs_inserted"], 1)
+        self.assertEqual(second["inserted"], 2)
+        self.assertEqual(second["blobs_inserted"], 1)
+        self.assertEqual(n_snaps, 3)
+        self.assertEqual(inline, 0)
+        self.assertEqual(len(blob_sizes), 2)
+        self.assertTrue(all(size < len(self.TEXT) / 5 for size in blob_sizes))
+        self.assertEqual(texts, [self.TEXT + " moved", self.TEXT, self.TEXT])
+
+    def test_compact_moves_legacy_inline_rows_into_blobs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with DatabaseManager(db_path=str(Path(tmpdir) / "t.db")) as db:
+                for sid in (1, 2, 3):
+                    db.conn.execute(
+                        "INSERT INTO web_text_snapshots (snapshot_id, source_url, "
+                        "fetched_at_utc, text_content, text_length) VALUES (?, ?, ?, ?, ?)",
+                        (sid, self.URL, f"2026-05-08T0{sid}:00:00Z", self.TEXT,
+                         len(self.TEXT)),
+                    )
+                db.conn.commit()
+                before = db.get_recent_web_text_snapshots(max_snapshots_per_url=10)
+                summary = db.compact_web_text_snapshots(batch_size=2, vacuum=True)
+                again = db.compact_web_text_snapshots()
+                after = db.get_recent_web_text_snapshots(max_snapshots_per_url=10)
+                n_blobs = db.conn.execute(
+                    "SELECT COUNT(*) FROM web_text_blobs").fetchone()[0]
+
+        self.assertEqual(summary["rows_compacted"], 3)
+        self.assertEqual(summary["blobs_inserted"], 1)
+        self.assertEqual(again["rows_compacted"], 0)
+        self.assertEqual(n_blobs, 1)
+        self.assertEqual(
+            [s["text_content"] for s in after],
+            [s["text_content"] for s in before],
+        )
+
+
+class _SlowPageHandler(BaseHTTPRequestHandler):
+    """Stub book page: sleeps ``DELAY`` then echoes the path, tracking overlap."""
+
+    DELAY = 0.3
+    lock = threading.Lock()
+    in_flight: dict = {}
+    peak: dict = {}
+
+    def do_GET(self):
+        host = self.headers.get("Host", "")
+        with self.lock:
+            self.in_flight[host] = self.in_flight.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.in_flight[host])
+        try:
+            time.sleep(self.DELAY)
+            body = f"page {self.path} ".encode() * 20
+            self.send_response(404 if self.path.startswith("/missing") else 200)
+            self.send_header("Content-Type", "text/plain")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with self.lock:
+                self.in_flight[host] -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+class CdpFetchSessionTests(unittest.TestCase):
+    """Concurrent tab-pool fetching against a local stub server.
+
+    The CDP page load is replaced by a plain GET to the stub, so these run
+    without Chrome or Playwright while exercising the session's scheduling.
+    """
+
+    def setUp(self):
+        _SlowPageHandler.in_flight.clear()
+        _SlowPageHandler.peak.clear()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowPageHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        port = self.server.server_address[1]
+        # Two "domains" on one server: the Host header tells them apart.
+        self.urls = [
+            f"http://{host}:{port}/{book}"
+            for host, book in (
+                ("127.0.0.1", "a1"), ("localhost", "b1"), ("127.0.0.1", "a2"),
+                ("localhost", "b2"), ("127.0.0.1", "a3"),
+            )
+        ]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    @staticmethod
+    def _stub_cdp_fetch(url, chrome_debug_port, timeout, max_chars, cdp_session=None):
+        response = wti.requests.get(url, timeout=timeout)
+        response.raise_for_status()
+        text = response.text
+        return wti._cdp_snapshot_record(url, chrome_debug_port, max_chars, None, text)
+
+    def test_map_respects_per_domain_limit_and_order(self):
+        started = time.perf_counter()
+        with CdpFetchSession(9222, max_tabs=4, per_domain_limit=2) as session:
+            outcomes = session.map(
+                lambda url: wti.requests.get(url, timeout=5).text, self.urls,
+            )
+        elapsed = time.perf_counter() - started
+        self.assertEqual([err for _, err in outcomes], [None] * 5)
+        self.assertEqual(
+            [text.split()[1] for text, _ in outcomes], ["/a1", "/b1", "/a2", "/b2", "/a3"],
+        )
+        self.assertEqual(max(_SlowPageHandler.peak.values()), 2)
+        # Three waves of 0.3s at most (a1+a2, then a3), not five serial loads.
+        self.assertLess(elapsed, 5 * _SlowPageHandler.DELAY)
+
+    def test_fetch_and_store_runs_concurrently_in_one_batch(self):
+        bad_url = self.urls[1].replace("/b1", "/missing")
+        with tempfile.TemporaryDirectory() as tmpdir, patch.object(
+            wti, "_fetch_url_text_via_cdp", side_effect=self._stub_cdp_fetch,
+        ), patch.object(
+            DatabaseManager, "insert_web_text_snapshots", autospec=True,
+            side_effect=DatabaseManager.insert_web_text_snapshots,
+        ) as insert:
+            summary = fetch_and_store_web_text(
+                urls=self.urls + [bad_url],
+                db_path=str(Path(tmpdir) / "nba_data.db"),
+                min_hours_between_polls=None, force_poll=True,
+                request_retries=0, request_timeout=5, chrome_debug_port=9222,
+                cdp_max_tabs=4, cdp_per_domain_limit=1,
+            )
+        self.assertEqual(summary["fetched_count"], 5)
+        self.assertEqual(summary["failed_count"], 1)
+        self.assertEqual(summary["db_inserted"], 5)
+        self.assertEqual(insert.call_count, 1)
+        self.assertEqual(
+            [row["url"] for row in summary["results"]], self.urls + [bad_url],
+        )
+        self.assertEqual(summary["results"][-1]["status"], "failed")
+        self.assertEqual(summary["results"][0]["wait_seconds"], 0.0)
+        self.assertEqual(summary["wait_seconds_by_book"], {"unknown": 0.0})
+        self.assertEqual(max(_SlowPageHandler.peak.values()), 1)
+        # Domain-serialized: three loads per host bound the run, not all six.
+        self.assertLess(summary["fetch_wall_seconds"], 6 * _SlowPageHandler.DELAY)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -185,15 +185,17 @@ def fetch_line_movement_snapshots(
         "snapshot_ts_utc", "book", "stat_type",
         "line_value", "over_odds", "under_odds",
     ]
-    query = """
-        SELECT snapshot_ts_utc, book, stat_type, line_value, over_odds, under_odds
-        FROM betting_line_snapshots
-        WHERE player_id = ?
-          AND lower(stat_type) = lower(?)
-          AND snapshot_ts_utc >= datetime('now', ?)
-        ORDER BY book ASC, snapshot_ts_utc ASC
-    """
     with DatabaseManager(db_path=db_path) as db:
+        source = db.line_history_source(
+            "betting_line_snapshots", since_hours=lookback_hours)
+        query = f"""
+            SELECT snapshot_ts_utc, book, stat_type, line_value, over_odds, under_odds
+            FROM {source}
+            WHERE player_id = ?
+              AND lower(stat_type) = lower(?)
+              AND snapshot_ts_utc >= datetime('now', ?)
+            ORDER BY book ASC, snapshot_ts_utc ASC
+        """
         df = pd.read_sql_query(
             query,
             db.conn,
@@ -233,10 +235,13 @@ def fetch_cumulative_line_vs_actual(
             .dt.strftime("%Y-%m-%d").to_numpy(),
             "actual": actual,
         }).dropna(subset=["game_date"])
+        # Oldest game in the window bounds how far back the lines must reach.
+        source = db.line_history_source(
+            "betting_line_snapshots", since=str(actual_df["game_date"].min()))
         lines = pd.read_sql_query(
-            """
+            f"""
             SELECT date(game_date) AS game_date, AVG(line_value) AS line
-            FROM betting_line_snapshots
+            FROM {source}
             WHERE player_id = ? AND lower(stat_type) = lower(?)
             GROUP BY date(game_date)
             """,
@@ -269,10 +274,11 @@ def fetch_clv_proxy_by_book(
     canonical = _canonical_stat_type(stat_type)
     columns = ["book", "open_line", "close_line", "line_delta", "n_snapshots"]
     with DatabaseManager(db_path=db_path) as db:
+        source = db.line_history_source("betting_line_snapshots")
         df = pd.read_sql_query(
-            """
+            f"""
             SELECT book, line_value, snapshot_ts_utc
-            FROM betting_line_snapshots
+            FROM {source}
             WHERE player_id = ? AND lower(stat_type) = lower(?)
             ORDER BY book ASC, snapshot_ts_utc ASC
             """,
@@ -348,9 +354,10 @@ def _fetch_line_movement(
     """
     if not resolved_name:
         return []
-    query = """
+    source = db.line_history_source("web_prop_cards", since_hours=web_lookback_hours)
+    query = f"""
         SELECT book, line_value, observed_at_utc
-        FROM web_prop_cards
+        FROM {source}
         WHERE lower(player_name) = lower(?)
           AND lower(stat_type) = lower(?)
           AND observed_at_utc >= datetime('now', ?)
@@ -977,6 +977,16 @@ def _ev_quick(prob, american_odds) -> Optional[float]:
     return float(prob * (dec - 1.0) - (1.0 - prob))
 
 
+def _materialized_scan(db_path: str, **kwargs) -> Optional[pd.DataFrame]:
+    """Scored slate from the hourly-refreshed ``scored_edges`` table, or
+    ``None`` when this profile isn't materialized / is stale (score live)."""
+    try:
+        result = es.fetch_scored_edges(db_path, **kwargs)
+    except Exception:
+        return None
+    return None if result is None else result["scored"]
+
+
 @st.cache_data(show_spinner=False)
 def _cached_scanner_books(db_path: str) -> list[str]:
     """Distinct books currently in web_prop_cards, unioned with the expected set."""
@@ -1150,37 +1160,43 @@ def _edge_scanner_view(db_path: str, user) -> None:
     # whose model layer hasn't shipped ``full`` degrades to ``chart_mean`` with a
     # caption notice instead of a stack trace.
     effective_mode, notice = esv.resolve_model_mode(requested_mode, es)
-    try:
-        lines = es.fetch_latest_prop_lines(
-            db_path, books=books, stat_types=stats or None,
-        )
-    except Exception as exc:  # noqa: BLE001
-        st.error(f"Edge scan failed: {exc}")
-        return
-    # ``lines`` is now bound, so the chart_mean backstop below can safely retry.
-    try:
-        scored = es.score_prop_edges(
-            lines, db_path=db_path, n_games=int(n_games),
-            model_mode=effective_mode, rolling_window=int(rolling_window),
-        )
-    except (ValueError, TypeError) as exc:
-        # Backstop: model layer rejected the mode -> retry on chart_mean.
-        effective_mode = "chart_mean"
-        notice = (
-            f"Requested model mode unavailable ({exc}); fell back to last-N "
-            "mean (charts)."
-        )
+    # Default profiles are pre-scored hourly; anything else scores live.
+    scored = _materialized_scan(
+        db_path, books=books, stat_types=stats or None, n_games=int(n_games),
+        model_mode=effective_mode, rolling_window=int(rolling_window),
+    )
+    if scored is None:
+        try:
+            lines = es.fetch_latest_prop_lines(
+                db_path, books=books, stat_types=stats or None,
+            )
+        except Exception as exc:  # noqa: BLE001
+            st.error(f"Edge scan failed: {exc}")
+            return
+        # ``lines`` is now bound, so the chart_mean backstop below can safely retry.
         try:
             scored = es.score_prop_edges(
                 lines, db_path=db_path, n_games=int(n_games),
-                model_mode="chart_mean", rolling_window=int(rolling_window),
+                model_mode=effective_mode, rolling_window=int(rolling_window),
             )
-        except Exception as exc2:  # noqa: BLE001
-            st.error(f"Edge scan failed: {exc2}")
+        except (ValueError, TypeError) as exc:
+            # Backstop: model layer rejected the mode -> retry on chart_mean.
+            effective_mode = "chart_mean"
+            notice = (
+                f"Requested model mode unavailable ({exc}); fell back to last-N "
+                "mean (charts)."
+            )
+            try:
+                scored = es.score_prop_edges(
+                    lines, db_path=db_path, n_games=int(n_games),
+                    model_mode="chart_mean", rolling_window=int(rolling_window),
+                )
+            except Exception as exc2:  # noqa: BLE001
+                st.error(f"Edge scan failed: {exc2}")
+                return
+        except Exception as exc:  # noqa: BLE001
+            st.error(f"Edge scan failed: {exc}")
             return
-    except Exception as exc:  # noqa: BLE001
-        st.error(f"Edge scan failed: {exc}")
-        return
     if notice:
         st.caption(f":information_source: {notice}")
 
@@ -1287,6 +1303,7 @@ def _cross_book_view(db_path: str, user) -> None:
     pair can never be arb. So DFS-only rows are line shopping / middle candidates,
     NEVER arb flags. Arb rows come only from ``betting_lines`` (real odds).
     """
+    from nba_model.model import arb_events
     from nba_model.model import cross_book_arb as cba
     from nba_model.web import cross_book_view as cbv
 
@@ -1384,33 +1401,39 @@ def _cross_book_view(db_path: str, user) -> None:
 
     # Model-mode capability check + graceful fallback (shared contract).
     effective_mode, notice = cbv.resolve_model_mode(requested_mode, es)
-    try:
-        lines = es.fetch_latest_prop_lines(
-            db_path, books=books, stat_types=stats or None,
-            since_hours=float(since_hours),
-        )
-        scored = es.score_prop_edges(
-            lines, db_path=db_path, n_games=int(n_games),
-            model_mode=effective_mode, rolling_window=int(rolling_window),
-        )
-    except (ValueError, TypeError) as exc:
-        # Backstop: model layer rejected the mode -> retry on chart_mean.
-        effective_mode = "chart_mean"
-        notice = (
-            f"Requested model mode unavailable ({exc}); fell back to last-N "
-            "mean (charts)."
-        )
+    scored = _materialized_scan(
+        db_path, books=books, stat_types=stats or None,
+        since_hours=float(since_hours), n_games=int(n_games),
+        model_mode=effective_mode, rolling_window=int(rolling_window),
+    )
+    if scored is None:
         try:
+            lines = es.fetch_latest_prop_lines(
+                db_path, books=books, stat_types=stats or None,
+                since_hours=float(since_hours),
+            )
             scored = es.score_prop_edges(
                 lines, db_path=db_path, n_games=int(n_games),
-                model_mode="chart_mean", rolling_window=int(rolling_window),
+                model_mode=effective_mode, rolling_window=int(rolling_window),
             )
-        except Exception as exc2:  # noqa: BLE001
-            st.error(f"Cross-book scan failed: {exc2}")
+        except (ValueError, TypeError) as exc:
+            # Backstop: model layer rejected the mode -> retry on chart_mean.
+            effective_mode = "chart_mean"
+            notice = (
+                f"Requested model mode unavailable ({exc}); fell back to last-N "
+                "mean (charts)."
+            )
+            try:
+                scored = es.score_prop_edges(
+                    lines, db_path=db_path, n_games=int(n_games),
+                    model_mode="chart_mean", rolling_window=int(rolling_window),
+                )
+            except Exception as exc2:  # noqa: BLE001
+                st.error(f"Cross-book scan failed: {exc2}")
+                return
+        except Exception as exc:  # noqa: BLE001
+            st.error(f"Cross-book scan failed: {exc}")
             return
-    except Exception as exc:  # noqa: BLE001
-        st.error(f"Cross-book scan failed: {exc}")
-        return
     if notice:
         st.caption(f":information_source: {notice}")
 
@@ -1511,6 +1534,25 @@ def _cross_book_view(db_path: str, user) -> None:
         )
         st.markdown("---")
 
+    # ---- Write-time event feed (arb_events, appended as lines land) ----
+    try:
+        events = arb_events.fetch_arb_events(db_path, since_hours=float(since_hours))
+    except Exception:  # noqa: BLE001
+        events = pd.DataFrame(columns=arb_events.ARB_EVENT_COLUMNS)
+    if not is_premium and not events.empty:
+        preview = {p.casefold() for p in web_auth.PREVIEW_PLAYERS}
+        events = events[
+            events["player_name"].fillna("").str.casefold().isin(preview)
+        ].reset_index(drop=True)
+    if not events.empty:
+        with st.expander(f"Detected as lines landed ({len(events)})"):
+            st.dataframe(
+                events[["detected_at_utc", "event_type", "player_name",
+                        "stat_type", "game_date", "legs", "line_gap",
+                        "guaranteed_margin"]],
+                use_container_width=True, hide_index=True,
+            )
+
     # ---- Line shopping / middle table ----
     if cross.empty:
         st.warning(
@@ -1545,6 +1587,10 @@ def _cross_book_view(db_path: str, user) -> None:
                 "P(over) @ low", min_value=0.0, max_value=1.0, format="%.2f"),
             "p_over_at_line_max": st.column_config.ProgressColumn(
                 "P(over) @ high", min_value=0.0, max_value=1.0, format="%.2f"),
+            "p_middle": st.column_config.ProgressColumn(
+                "P(middle hits)", min_value=0.0, max_value=1.0, format="%.2f"),
+            "middle_ev": st.column_config.NumberColumn(
+                "Middle EV (2u)", format="%+.3f"),
             "opportunity_type": st.column_config.TextColumn("Type"),
         },
     )
@@ -2156,7 +2202,10 @@ def _single_prop_model_view(*, default_player: str, n_games_default: int) -> Non
 # ---------------------------------------------------------------------------
 def _manual_lines_import_view(*, db_path: str) -> None:
     from datetime import datetime, timezone
-    from nba_model.model.manual_lines import parse_manual_lines_text
+    from nba_model.model.manual_lines import (
+        parse_manual_lines_text,
+        persist_manual_lines_records,
+    )
 
     st.subheader("Manual lines import")
     st.caption(
@@ -2281,7 +2330,7 @@ def _manual_lines_import_view(*, db_path: str) -> None:
                     if pid not in seen:
                         seen[pid] = row["player_name"]
                         db.insert_player(pid, row["player_name"])
-                db.insert_betting_lines_records(plausible_records)
+                persist_manual_lines_records(plausible_records, db=db)
                 after = db.conn.execute(
                     "SELECT COUNT(*) FROM betting_lines"
                 ).fetchone()[0]
@@ -16,7 +16,8 @@ DISPLAY_COLUMNS = [
     "player_name", "stat_type", "n_books",
     "line_min", "line_max", "line_gap",
     "best_over_book", "best_under_book", "consensus_mean",
-    "p_over_at_line_min", "p_over_at_line_max", "opportunity_type",
+    "p_over_at_line_min", "p_over_at_line_max", "p_middle", "middle_ev",
+    "opportunity_type",
 ]
 
 
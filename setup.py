@@ -13,10 +13,12 @@ setup(
         "pandas",
         "numpy",
         "scipy",
+        "pyarrow",
         "nba_api",
         "matplotlib",
         "seaborn",
         "requests",
+        "httpx",
         "python-dotenv",
     ],
 )